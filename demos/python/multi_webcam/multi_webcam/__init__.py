@@ -1,4 +1,5 @@
 # __init__.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
 # This copyright was auto-generated on Fri Nov 11 20:03:39 UTC 2022
 
-from .webcam import GoProWebcamPlayer
\ No newline at end of file
+from .webcam import GoProWebcamPlayer
+from .compositor import Compositor
\ No newline at end of file
@@ -0,0 +1,420 @@
+# compositor.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+from __future__ import annotations
+import math
+import time
+import logging
+import multiprocessing as mp
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Optional
+
+import cv2 as cv
+import numpy as np
+
+logging.getLogger(__name__)
+
+# Per camera header: frames published, decoder finished, failed frame reads
+_PUBLISHED, _FINISHED, _ERRORS = range(3)
+_HEADER_LEN = 3
+# Per slot header: sequence (-1 while being written), height, width
+_SLOT_INTS = 3
+_WRITING = -1
+
+
+class FramePool:
+    """Shared memory frame slots for many cameras
+
+    Each camera has its own ring of slots that its decoder overwrites oldest first. Each slot is guarded by its
+    sequence number so a reader can detect that a slot was overwritten while it was reading it.
+    """
+
+    def __init__(
+        self,
+        cameras: int,
+        slots: int,
+        max_resolution: tuple[int, int],
+        name: Optional[str] = None,
+    ) -> None:
+        """Constructor
+
+        Args:
+            cameras (int): number of cameras
+            slots (int): frame slots per camera
+            max_resolution (tuple[int, int]): largest (width, height) of a frame
+            name (Optional[str]): Attach to an existing pool instead of creating one. Defaults to None.
+        """
+        self.cameras = cameras
+        self.slots = slots
+        self.max_resolution = max_resolution
+        width, height = max_resolution
+        ints = (cameras * _HEADER_LEN + cameras * slots * _SLOT_INTS) * 8
+        floats = cameras * slots * 8
+        self._owner = name is None
+        self._shm = SharedMemory(
+            name=name,
+            create=self._owner,
+            size=ints + floats + cameras * slots * height * width * 3,
+        )
+        buf = self._shm.buf
+        self.header = np.ndarray((cameras, _HEADER_LEN), np.int64, buf)
+        self.slot_ints = np.ndarray((cameras, slots, _SLOT_INTS), np.int64, buf, offset=cameras * _HEADER_LEN * 8)
+        self.timestamps = np.ndarray((cameras, slots), np.float64, buf, offset=ints)
+        self.data = np.ndarray((cameras, slots, height, width, 3), np.uint8, buf, offset=ints + floats)
+        if self._owner:
+            self.header[:] = 0
+            self.slot_ints[:, :, 0] = _WRITING
+
+    @property
+    def name(self) -> str:
+        """Name to attach to the pool from another process
+
+        Returns:
+            str: shared memory name
+        """
+        return self._shm.name
+
+    def write(self, camera: int, frame: np.ndarray, timestamp: float) -> None:
+        """Write a camera's frame over its oldest slot
+
+        Args:
+            camera (int): index of the camera
+            frame (np.ndarray): BGR frame that is no larger than the max resolution
+            timestamp (float): monotonic time that the frame was decoded
+        """
+        sequence = int(self.header[camera, _PUBLISHED])
+        slot = sequence % self.slots
+        height, width = frame.shape[:2]
+        self.slot_ints[camera, slot, 0] = _WRITING
+        self.data[camera, slot, :height, :width] = frame
+        self.timestamps[camera, slot] = timestamp
+        self.slot_ints[camera, slot, 1:] = (height, width)
+        self.slot_ints[camera, slot, 0] = sequence
+        self.header[camera, _PUBLISHED] = sequence + 1
+
+    def close(self) -> None:
+        """Detach from the pool, removing it if this is the pool that created it"""
+        del self.header, self.slot_ints, self.timestamps, self.data
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+def _decode(
+    camera: int,
+    url: str,
+    pool_name: str,
+    cameras: int,
+    slots: int,
+    max_resolution: tuple[int, int],
+    realtime: bool,
+    stop: Any,
+    published: Any,
+) -> None:
+    """Decoder process: decode a stream into the frame pool until it ends or is stopped
+
+    Args:
+        camera (int): index of the camera
+        url (str): stream URL (or video file) to decode
+        pool_name (str): name of the frame pool
+        cameras (int): number of cameras in the pool
+        slots (int): frame slots per camera
+        max_resolution (tuple[int, int]): largest (width, height) of a frame. Larger frames are downscaled.
+        realtime (bool): pace video files at their frame rate (as if they were a live camera)
+        stop (Any): event to stop decoding
+        published (Any): event to set after each frame is written
+    """
+    pool = FramePool(cameras, slots, max_resolution, pool_name)
+    is_stream = url.startswith("udp://")
+    vid = cv.VideoCapture(url + "?overrun_nonfatal=1&fifo_size=50000000" if is_stream else url, cv.CAP_FFMPEG)
+    period = 1 / (vid.get(cv.CAP_PROP_FPS) or 30)
+    start = time.monotonic()
+    width, height = max_resolution
+    try:
+        while not stop.is_set():
+            ret, frame = vid.read()
+            if not ret:
+                if not is_stream:
+                    break
+                pool.header[camera, _ERRORS] += 1
+                continue
+            if realtime and not is_stream:
+                # Frames of a file are "captured" at its frame rate
+                time.sleep(max(0, start + pool.header[camera, _PUBLISHED] * period - time.monotonic()))
+            if frame.shape[1] > width or frame.shape[0] > height:
+                scale = min(width / frame.shape[1], height / frame.shape[0])
+                size = (int(frame.shape[1] * scale), int(frame.shape[0] * scale))
+                frame = cv.resize(frame, size, interpolation=cv.INTER_AREA)
+            pool.write(camera, frame, time.monotonic())
+            published.set()
+    finally:
+        vid.release()
+        pool.header[camera, _FINISHED] = 1
+        published.set()
+        pool.close()
+
+
+@dataclass(frozen=True)
+class Composite:
+    """Frames of all cameras tiled into one image"""
+
+    image: np.ndarray  #: tiled BGR image
+    timestamps: list[Optional[float]]  #: decode time of each camera's frame (None if it has no frame yet)
+    skew: float  #: seconds between the oldest and newest tiled frame
+
+
+@dataclass(frozen=True)
+class CameraStats:
+    """Per camera compositor counters"""
+
+    decoded: int  #: frames decoded
+    composited: int  #: frames that were tiled
+    fps: float  #: frames decoded per second over the last second
+    latency: float  #: average seconds from decoding a frame until it was tiled
+    max_latency: float  #: most seconds from decoding a frame until it was tiled
+    decode_errors: int  #: failed frame reads
+
+
+class _CameraCounters:
+    """Counters that the consumer keeps for each camera"""
+
+    def __init__(self) -> None:
+        self.composited = 0
+        # Frames decoded when the camera was last composited
+        self.seen = 0
+        self.last_sequence = -1
+        self.latency_total = 0.0
+        self.max_latency = 0.0
+        # (time, frames decoded) over the last second
+        self.samples: deque[tuple[float, int]] = deque()
+
+
+class Compositor:
+    """Decode many webcam streams in separate processes and tile their frames into one image
+
+    Each camera's decoder process writes its frames into a shared memory frame pool. The compositor (the single
+    consumer) aligns the cameras' frames by their decode timestamps: it picks the frame of each camera that is closest
+    to the newest time that every camera has a frame for. The frames are (optionally) downscaled straight from shared
+    memory into their tile.
+
+    >>> with Compositor(["udp://0.0.0.0:8554", "udp://0.0.0.0:8555"], tile=(640, 360)) as compositor:
+    >>>     while composite := compositor.compose(timeout=5):
+    >>>         cv.imshow("webcams", composite.image)
+    """
+
+    # Seconds to wait for each decoder to stop (it can be blocked waiting for a stalled stream) before terminating it
+    STOP_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        urls: list[str],
+        max_resolution: tuple[int, int] = (1920, 1080),
+        tile: Optional[tuple[int, int]] = None,
+        slots: int = 3,
+        columns: Optional[int] = None,
+        realtime: bool = False,
+    ) -> None:
+        """Constructor
+
+        Args:
+            urls (list[str]): stream URLs (or video files) to tile
+            max_resolution (tuple[int, int]): largest (width, height) of a decoded frame. Defaults to (1920, 1080).
+            tile (Optional[tuple[int, int]]): (width, height) to downscale each frame to. Defaults to None (the
+                max resolution without scaling).
+            slots (int): frame slots per camera. Defaults to 3.
+            columns (Optional[int]): tiles per row. Defaults to None (as square a grid as possible).
+            realtime (bool): pace video files at their frame rate. Defaults to False.
+        """
+        self.urls = urls
+        self._pool = FramePool(len(urls), slots, max_resolution)
+        self._tile = tile
+        self._columns = columns or math.ceil(math.sqrt(len(urls)))
+        rows = math.ceil(len(urls) / self._columns)
+        width, height = tile or max_resolution
+        self._canvas = np.zeros((rows * height, self._columns * width, 3), np.uint8)
+        self._realtime = realtime
+        self._stop = mp.Event()
+        self._published = mp.Event()
+        self._processes: list[mp.Process] = []
+        self._counters = [_CameraCounters() for _ in urls]
+        self._final: Optional[np.ndarray] = None
+
+    def __enter__(self) -> Compositor:
+        self.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start a decoder process per camera"""
+        pool = self._pool
+        for camera, url in enumerate(self.urls):
+            logging.info(f"Starting decoder for {url}")
+            process = mp.Process(
+                target=_decode,
+                args=(
+                    camera,
+                    url,
+                    pool.name,
+                    pool.cameras,
+                    pool.slots,
+                    pool.max_resolution,
+                    self._realtime,
+                    self._stop,
+                    self._published,
+                ),
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+
+    def stop(self) -> None:
+        """Stop the decoder processes and release the frame pool"""
+        self._stop.set()
+        for url, process in zip(self.urls, self._processes):
+            process.join(self.STOP_TIMEOUT)
+            if process.is_alive():
+                logging.warning(f"Decoder of {url} did not stop within {self.STOP_TIMEOUT} seconds")
+                process.terminate()
+                process.join()
+        self._processes = []
+        if self._final is None:
+            self._final = self._pool.header.copy()
+            self._pool.close()
+
+    @property
+    def is_finished(self) -> bool:
+        """Have all streams ended?
+
+        Returns:
+            bool: True if yes, False if no
+        """
+        return bool(self._header[:, _FINISHED].all())
+
+    @property
+    def _header(self) -> np.ndarray:
+        return self._final if self._final is not None else self._pool.header
+
+    @property
+    def stats(self) -> list[CameraStats]:
+        """Get the counters of each camera
+
+        Returns:
+            list[CameraStats]: counters in the order of the URLs
+        """
+        stats = []
+        for camera, counters in enumerate(self._counters):
+            samples = counters.samples
+            elapsed = samples[-1][0] - samples[0][0] if len(samples) > 1 else 0
+            stats.append(
+                CameraStats(
+                    decoded=int(self._header[camera, _PUBLISHED]),
+                    composited=counters.composited,
+                    fps=(samples[-1][1] - samples[0][1]) / elapsed if elapsed else 0.0,
+                    latency=counters.latency_total / counters.composited if counters.composited else 0.0,
+                    max_latency=counters.max_latency,
+                    decode_errors=int(self._header[camera, _ERRORS]),
+                )
+            )
+        return stats
+
+    def _select(self, camera: int, reference: float) -> Optional[int]:
+        """Find the slot of a camera's frame that is closest to a time
+
+        Args:
+            camera (int): index of the camera
+            reference (float): monotonic time to align to
+
+        Returns:
+            Optional[int]: slot or None if the camera has no frame
+        """
+        sequences = self._pool.slot_ints[camera, :, 0]
+        valid = sequences >= 0
+        if not valid.any():
+            return None
+        distances = np.where(valid, np.abs(self._pool.timestamps[camera] - reference), np.inf)
+        return int(distances.argmin())
+
+    def _draw(self, camera: int, slot: int) -> bool:
+        """Draw a camera's frame into its tile
+
+        Args:
+            camera (int): index of the camera
+            slot (int): slot of the frame
+
+        Returns:
+            bool: True if the frame was drawn, False if it was overwritten while drawing
+        """
+        pool = self._pool
+        sequence, height, width = (int(value) for value in pool.slot_ints[camera, slot])
+        if sequence < 0:
+            return False
+        frame = pool.data[camera, slot, :height, :width]
+        tile_width, tile_height = self._tile or pool.max_resolution
+        row, column = divmod(camera, self._columns)
+        y, x = row * tile_height, column * tile_width
+        if self._tile:
+            self._canvas[y : y + tile_height, x : x + tile_width] = cv.resize(
+                frame, self._tile, interpolation=cv.INTER_AREA
+            )
+        else:
+            self._canvas[y : y + height, x : x + width] = frame
+        return pool.slot_ints[camera, slot, 0] == sequence
+
+    def compose(self, timeout: Optional[float] = None) -> Optional[Composite]:
+        """Wait for a new frame from any camera and tile the time-aligned frames of all cameras
+
+        Args:
+            timeout (Optional[float]): seconds to wait for a new frame. Defaults to None (forever).
+
+        Returns:
+            Optional[Composite]: composite or None if no new frame arrived in time or all streams ended
+        """
+        pool = self._pool
+        while True:
+            self._published.clear()
+            published = pool.header[:, _PUBLISHED].copy()
+            if any(published[camera] > c.seen for camera, c in enumerate(self._counters)):
+                break
+            if self.is_finished or not self._published.wait(timeout):
+                return None
+
+        now = time.monotonic()
+        newest = [
+            pool.timestamps[camera, (count - 1) % pool.slots] if count else None
+            for camera, count in enumerate(published)
+        ]
+        reference = min((t for t in newest if t is not None), default=now)
+        timestamps: list[Optional[float]] = []
+        for camera, counters in enumerate(self._counters):
+            counters.seen = int(published[camera])
+            counters.samples.append((now, counters.seen))
+            while now - counters.samples[0][0] > 1:
+                counters.samples.popleft()
+            # Retry with the newest frame if the selected one is overwritten while drawing
+            for _ in range(pool.slots):
+                if (slot := self._select(camera, reference)) is None:
+                    break
+                sequence = int(pool.slot_ints[camera, slot, 0])
+                timestamp = float(pool.timestamps[camera, slot])
+                if self._draw(camera, slot):
+                    break
+                reference = now
+            else:
+                slot = None
+            if slot is None:
+                timestamps.append(None)
+                continue
+            timestamps.append(timestamp)
+            if sequence > counters.last_sequence:
+                counters.last_sequence = sequence
+                counters.composited += 1
+                latency = time.monotonic() - timestamp
+                counters.latency_total += latency
+                counters.max_latency = max(counters.max_latency, latency)
+        known = [t for t in timestamps if t is not None]
+        skew = max(known) - min(known) if known else 0.0
+        return Composite(self._canvas.copy(), timestamps, skew)
@@ -0,0 +1,89 @@
+# benchmark_compositor.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+from __future__ import annotations
+import time
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+import cv2 as cv
+import numpy as np
+
+from multi_webcam import Compositor
+
+logging.basicConfig(level=logging.WARNING)
+
+
+def write_synthetic_video(path: Path, camera: int, frames: int, resolution: tuple[int, int]) -> None:
+    """Write a video that stands in for a camera
+
+    Args:
+        path (Path): video file to write
+        camera (int): index of the camera (drawn on each frame)
+        frames (int): number of frames
+        resolution (tuple[int, int]): (width, height) of the frames
+    """
+    width, height = resolution
+    writer = cv.VideoWriter(str(path), cv.VideoWriter.fourcc(*"MJPG"), 30, resolution)
+    for index in range(frames):
+        frame = np.full((height, width, 3), (camera * 60) % 255, np.uint8)
+        cv.putText(frame, f"{camera}: {index}", (20, height // 2), cv.FONT_HERSHEY_SIMPLEX, 3, (255, 255, 255), 6)
+        writer.write(frame)
+    writer.release()
+
+
+def main(args: argparse.Namespace):
+    with tempfile.TemporaryDirectory() as directory:
+        urls = []
+        for camera in range(args.cameras):
+            path = Path(directory) / f"camera_{camera}.avi"
+            write_synthetic_video(path, camera, args.frames, (args.width, args.height))
+            urls.append(str(path))
+
+        for realtime in (False, True):
+            composites, skews = 0, []
+            start = time.perf_counter()
+            with Compositor(
+                urls,
+                max_resolution=(args.width, args.height),
+                tile=(args.tile_width, args.tile_height),
+                realtime=realtime,
+            ) as compositor:
+                while composite := compositor.compose(timeout=5):
+                    composites += 1
+                    skews.append(composite.skew)
+                elapsed = time.perf_counter() - start
+                stats = compositor.stats
+
+            mode = "paced at 30 fps" if realtime else "as fast as possible"
+            print(f"\n{args.cameras} synthetic {args.width}x{args.height} cameras ({mode}):")
+            print(f"  {composites / elapsed:.1f} composites / s, median skew {np.median(skews) * 1e3:.1f} ms")
+            for camera, camera_stats in enumerate(stats):
+                print(
+                    f"  camera {camera}: decoded {camera_stats.decoded / elapsed:.1f} fps, "
+                    f"tiled {camera_stats.composited}/{camera_stats.decoded}, "
+                    f"latency {camera_stats.latency * 1e3:.1f} ms (max {camera_stats.max_latency * 1e3:.1f} ms)"
+                )
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure compositor throughput with synthetic video files standing in for webcams."
+    )
+    parser.add_argument("-c", "--cameras", type=int, help="Number of synthetic cameras.", default=4)
+    parser.add_argument("-n", "--frames", type=int, help="Frames per synthetic camera.", default=150)
+    parser.add_argument("--width", type=int, help="Width of the synthetic video.", default=1280)
+    parser.add_argument("--height", type=int, help="Height of the synthetic video.", default=720)
+    parser.add_argument("--tile-width", type=int, help="Width of each tile.", default=480)
+    parser.add_argument("--tile-height", type=int, help="Height of each tile.", default=270)
+    return parser.parse_args()
+
+
+def entrypoint():
+    main(parse_arguments())
+
+
+if __name__ == "__main__":
+    entrypoint()
@@ -0,0 +1,59 @@
+# composite_webcams.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+from __future__ import annotations
+import json
+import logging
+import argparse
+from pathlib import Path
+
+import cv2 as cv
+
+from multi_webcam import Compositor, GoProWebcamPlayer
+
+logging.basicConfig(level=logging.DEBUG)
+
+
+def main(args: argparse.Namespace):
+    with open(args.config) as fp:
+        config = json.load(fp)
+
+    webcams: list[GoProWebcamPlayer] = []
+    # Open webcams and start their streams without a player per webcam
+    for serial, params in config.items():
+        w = GoProWebcamPlayer(serial, params.get("port"))
+        w.open()
+        webcams.append(w)
+        w.webcam.start(w.port, params.get("resolution"), params.get("fov"))
+
+    urls = [GoProWebcamPlayer.STREAM_URL.format(port=w.port) for w in webcams]
+    with Compositor(urls, tile=(args.width, args.height)) as compositor:
+        print("Press 'q' in viewer to quit")
+        while composite := compositor.compose(timeout=10):
+            cv.imshow("webcams", composite.image)
+            if cv.waitKey(1) & 0xFF == ord("q"):
+                break
+        for serial, stats in zip(config, compositor.stats):
+            logging.info(f"{serial}: {stats}")
+    cv.destroyAllWindows()
+
+    for webcam in webcams:
+        webcam.close()
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Configure, enable and start webcams and view them tiled in one window."
+    )
+    parser.add_argument("config", type=Path, help="Location of config json file.")
+    parser.add_argument("--width", type=int, help="Width of each tile.", default=640)
+    parser.add_argument("--height", type=int, help="Height of each tile.", default=360)
+    return parser.parse_args()
+
+
+def entrypoint():
+    main(parse_arguments())
+
+
+if __name__ == "__main__":
+    entrypoint()
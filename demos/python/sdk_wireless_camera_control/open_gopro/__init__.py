@@ -13,11 +13,28 @@ if sys.version_info.major != 3 or not 10 <= sys.version_info.minor < 13:
     raise RuntimeError("Python >= 3.10 and < 3.13 must be used")
 
 import logging
+from typing import TYPE_CHECKING
 
+from open_gopro.lazy import lazy_exports
 from open_gopro.logger import Logger
 
 Logger.addLoggingLevel("TRACE", logging.DEBUG - 5)
 
-from open_gopro.gopro_wired import WiredGoPro
-from open_gopro.gopro_wireless import WirelessGoPro
-from open_gopro.models import GoProResp
+# The exports are imported on first access since importing them loads (almost) the entire package and its dependencies
+if TYPE_CHECKING:
+    from open_gopro.fleet import GoProFleet
+    from open_gopro.gopro_wired import WiredGoPro
+    from open_gopro.gopro_wireless import WirelessGoPro
+    from open_gopro.models import GoProResp
+
+__all__ = ["GoProFleet", "WiredGoPro", "WirelessGoPro", "GoProResp"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "GoProFleet": "open_gopro.fleet",
+        "WiredGoPro": "open_gopro.gopro_wired",
+        "WirelessGoPro": "open_gopro.gopro_wireless",
+        "GoProResp": "open_gopro.models",
+    },
+)
@@ -3,22 +3,67 @@
 
 """Top level API module definition"""
 
-from .api import WiredApi, WirelessApi
-from .ble_commands import BleCommands
-from .ble_settings import BleSettings
-from .ble_statuses import BleStatuses
-from .builders import (
-    BleAsyncResponse,
-    BleProtoCommand,
-    BleReadCommand,
-    BleSettingFacade,
-    BleStatusFacade,
-    BleWriteCommand,
-    HttpSetting,
-    RegisterUnregisterAll,
+from typing import TYPE_CHECKING
+
+from open_gopro.lazy import lazy_exports
+from open_gopro.parser_interface import GlobalParsers
+
+# The messages are imported on first access
+if TYPE_CHECKING:
+    from .api import WiredApi, WirelessApi
+    from .ble_commands import BleCommands
+    from .ble_settings import BleSettings
+    from .ble_statuses import BleStatuses
+    from .builders import (
+        BleAsyncResponse,
+        BleProtoCommand,
+        BleReadCommand,
+        BleSettingFacade,
+        BleStatusFacade,
+        BleWriteCommand,
+        HttpSetting,
+        RegisterUnregisterAll,
+    )
+    from .http_commands import HttpCommands
+    from .http_settings import HttpSettings
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "WiredApi": ".api",
+        "WirelessApi": ".api",
+        "BleCommands": ".ble_commands",
+        "BleSettings": ".ble_settings",
+        "BleStatuses": ".ble_statuses",
+        "BleAsyncResponse": ".builders",
+        "BleProtoCommand": ".builders",
+        "BleReadCommand": ".builders",
+        "BleSettingFacade": ".builders",
+        "BleStatusFacade": ".builders",
+        "BleWriteCommand": ".builders",
+        "HttpSetting": ".builders",
+        "RegisterUnregisterAll": ".builders",
+        "HttpCommands": ".http_commands",
+        "HttpSettings": ".http_settings",
+    },
 )
-from .http_commands import HttpCommands
-from .http_settings import HttpSettings
 
-# We need to ensure the API instantiated so that all parsers are set up.
-WirelessApi(None)  # type: ignore
+
+def _add_global_parsers() -> None:
+    """Add the global parsers of all BLE commands, settings, statuses, and asynchronous responses
+
+    The commands add their parsers when their module is imported. The settings and statuses add their parsers when
+    built, which does not need a communicator.
+    """
+    # pylint: disable=import-outside-toplevel
+    from .ble_commands import BleAsyncResponses
+    from .ble_settings import BleSettings
+    from .ble_statuses import BleStatuses
+
+    BleSettings(None)  # type: ignore
+    BleStatuses(None)  # type: ignore
+    BleAsyncResponses.add_parsers()
+
+
+# We need to ensure that all parsers are set up before any response is parsed
+GlobalParsers.defer(_add_global_parsers)
@@ -5,20 +5,27 @@
 
 from __future__ import annotations
 
-from typing import Final
+from functools import cached_property
+from typing import TYPE_CHECKING, Final
 
 from open_gopro.communicator_interface import GoProHttp, GoProWirelessInterface
 
-from .ble_commands import BleAsyncResponses, BleCommands
-from .ble_settings import BleSettings
-from .ble_statuses import BleStatuses
-from .http_commands import HttpCommands
-from .http_settings import HttpSettings
+if TYPE_CHECKING:
+    from .ble_commands import BleCommands
+    from .ble_settings import BleSettings
+    from .ble_statuses import BleStatuses
+    from .http_commands import HttpCommands
+    from .http_settings import HttpSettings
+
+# The message groups are imported and built on first access since there are hundreds of messages.
+# pylint: disable=import-outside-toplevel
 
 
 class WirelessApi:
     """Implementation of Open GoPro API version 2.0 for Wireless interface (Wifi and BLE)
 
+    Each group of messages is built the first time that it is accessed.
+
     Attributes:
         version (Final[str]): The API version that this object implements
 
@@ -30,17 +37,68 @@ class WirelessApi:
 
     def __init__(self, communicator: GoProWirelessInterface) -> None:
         self._communicator = communicator
-        self.ble_command = BleCommands(communicator)
-        self.ble_setting = BleSettings(communicator)
-        self.ble_status = BleStatuses(communicator)
-        BleAsyncResponses.add_parsers()
-        self.http_command = HttpCommands(communicator)
-        self.http_setting = HttpSettings(communicator)
+
+    @cached_property
+    def ble_command(self) -> BleCommands:
+        """BLE commands
+
+        Returns:
+            BleCommands: commands
+        """
+        from .ble_commands import BleCommands
+
+        return BleCommands(self._communicator)
+
+    @cached_property
+    def ble_setting(self) -> BleSettings:
+        """BLE settings
+
+        Returns:
+            BleSettings: settings
+        """
+        from .ble_settings import BleSettings
+
+        return BleSettings(self._communicator)
+
+    @cached_property
+    def ble_status(self) -> BleStatuses:
+        """BLE statuses
+
+        Returns:
+            BleStatuses: statuses
+        """
+        from .ble_statuses import BleStatuses
+
+        return BleStatuses(self._communicator)
+
+    @cached_property
+    def http_command(self) -> HttpCommands:
+        """HTTP commands
+
+        Returns:
+            HttpCommands: commands
+        """
+        from .http_commands import HttpCommands
+
+        return HttpCommands(self._communicator)
+
+    @cached_property
+    def http_setting(self) -> HttpSettings:
+        """HTTP settings
+
+        Returns:
+            HttpSettings: settings
+        """
+        from .http_settings import HttpSettings
+
+        return HttpSettings(self._communicator)
 
 
 class WiredApi:
     """Implementation of Open GoPro API version 2.0 for Wired interface (USB)
 
+    Each group of messages is built the first time that it is accessed.
+
     Attributes:
         version (Final[str]): The API version that this object implements
 
@@ -52,5 +110,25 @@ class WiredApi:
 
     def __init__(self, communicator: GoProHttp) -> None:
         self._communicator = communicator
-        self.http_command = HttpCommands(communicator)
-        self.http_setting = HttpSettings(communicator)
+
+    @cached_property
+    def http_command(self) -> HttpCommands:
+        """HTTP commands
+
+        Returns:
+            HttpCommands: commands
+        """
+        from .http_commands import HttpCommands
+
+        return HttpCommands(self._communicator)
+
+    @cached_property
+    def http_setting(self) -> HttpSettings:
+        """HTTP settings
+
+        Returns:
+            HttpSettings: settings
+        """
+        from .http_settings import HttpSettings
+
+        return HttpSettings(self._communicator)
@@ -35,7 +35,7 @@ from open_gopro.constants import (
     StatusId,
 )
 from open_gopro.enum import GoProIntEnum
-from open_gopro.logger import Logger
+from open_gopro.logger import DeferredStr, Logger
 from open_gopro.models import GoProResp
 from open_gopro.parser_interface import (
     BytesBuilder,
@@ -500,6 +500,17 @@ class BleSettingFacade(Generic[ValueType]):
         Returns:
             GoProResp[None]: Status of set
         """
+        return await self._communicator._send_ble_message(self._build_set_message(value))
+
+    def _build_set_message(self, value: ValueType) -> BleSettingFacade.BleSettingMessageBase:
+        """Build the message that sets the value of the setting
+
+        Args:
+            value (ValueType): The argument to use to set the setting value.
+
+        Returns:
+            BleSettingFacade.BleSettingMessageBase: set message
+        """
 
         def _build_data(**kwargs: Any) -> bytearray:
             # Special case. Can't use _send_query
@@ -511,13 +522,12 @@ class BleSettingFacade(Generic[ValueType]):
                 pass
             return data
 
-        message = BleSettingFacade.BleSettingMessageBase(
+        return BleSettingFacade.BleSettingMessageBase(
             BleSettingFacade.SETTER_UUID,
             self._identifier,
             self._identifier,
             lambda **_: _build_data(value=value),
         )
-        return await self._communicator._send_ble_message(message)
 
     async def get_value(self) -> GoProResp[ValueType]:
         """Get the settings value.
@@ -762,7 +772,7 @@ class BleStatusFacade(Generic[ValueType]):
             lambda *args: self._build_cmd(QueryCmdId.UNREG_STATUS_VAL_UPDATE),
         )
         if (response := await self._communicator._send_ble_message(message)).ok:
-            self._communicator.register_update(callback, self._identifier)
+            self._communicator.unregister_update(callback, self._identifier)
         return response
 
     def _build_cmd(self, cmd: QueryCmdId) -> bytearray:
@@ -922,5 +932,5 @@ class HttpSetting(HttpMessage, Generic[ValueType]):
         """
         response = await self._communicator._get_json(self, value=value)
         response.identifier = self._identifier
-        logger.info(Logger.build_log_rx_str(response))
+        logger.info(DeferredStr(Logger.build_log_rx_str, response))
         return response
@@ -18,8 +18,10 @@ from open_gopro.api.builders import (
     http_put_json_command,
 )
 from open_gopro.communicator_interface import HttpMessage, HttpMessages, MessageRules
+from open_gopro.downloader import DownloadProgressCb
 from open_gopro.models import (
     CameraInfo,
+    CompactMediaList,
     GoProResp,
     MediaList,
     MediaMetadata,
@@ -77,6 +79,7 @@ class HttpCommands(HttpMessages[HttpMessage]):
     @http_get_json_command(
         endpoint="gopro/media/last_captured",
         parser=Parser(json_parser=PydanticAdapterJsonParser(MediaPath)),
+        rules=MessageRules(read_only_analyzer=MessageRules.always_true),
     )
     async def get_last_captured_media(self) -> GoProResp[MediaPath]:
         """Get the last captured media file.
@@ -132,7 +135,37 @@ class HttpCommands(HttpMessages[HttpMessage]):
         """
 
     @http_get_json_command(
-        endpoint="gopro/camera/info", parser=Parser(json_parser=PydanticAdapterJsonParser(CameraInfo))
+        endpoint="gopro/camera/state",
+        arguments=["status", "setting"],
+        parser=Parser(json_parser=CameraStateJsonParser()),
+        rules=MessageRules(fastpass_analyzer=MessageRules.always_true),
+    )
+    async def get_camera_state_subset(
+        self,
+        *,
+        statuses: list[constants.StatusId] | None = None,
+        settings: list[constants.SettingId] | None = None,
+    ) -> GoProResp[CameraState]:
+        """Get only the requested camera statuses and settings
+
+        Cameras that do not support filtering the camera state return all statuses and settings.
+
+        Args:
+            statuses (list[constants.StatusId] | None): statuses to get. Defaults to None.
+            settings (list[constants.SettingId] | None): settings to get. Defaults to None.
+
+        Returns:
+            GoProResp[CameraState]: requested statuses and settings as JSON
+        """
+        return {  # type: ignore
+            "status": [status.value for status in statuses] if statuses else None,
+            "setting": [setting.value for setting in settings] if settings else None,
+        }
+
+    @http_get_json_command(
+        endpoint="gopro/camera/info",
+        parser=Parser(json_parser=PydanticAdapterJsonParser(CameraInfo)),
+        rules=MessageRules(read_only_analyzer=MessageRules.always_true),
     )
     async def get_camera_info(self) -> GoProResp[CameraInfo]:
         """Get general information about the camera such as firmware version
@@ -141,7 +174,9 @@ class HttpCommands(HttpMessages[HttpMessage]):
             GoProResp[CameraInfo]: status and settings as JSON
         """
 
-    @http_get_json_command(endpoint="gopro/camera/keep_alive")
+    @http_get_json_command(
+        endpoint="gopro/camera/keep_alive", rules=MessageRules(read_only_analyzer=MessageRules.always_true)
+    )
     async def set_keep_alive(self) -> GoProResp[None]:
         """Send the keep alive signal to maintain the connection.
 
@@ -153,6 +188,7 @@ class HttpCommands(HttpMessages[HttpMessage]):
         endpoint="gopro/media/info",
         arguments=["path"],
         parser=Parser(json_parser=PydanticAdapterJsonParser(MediaMetadata)),
+        rules=MessageRules(read_only_analyzer=MessageRules.always_true),
     )
     async def get_media_metadata(self, *, path: str) -> GoProResp[MediaMetadata]:
         """Get media metadata for a file.
@@ -167,6 +203,7 @@ class HttpCommands(HttpMessages[HttpMessage]):
     @http_get_json_command(
         endpoint="gopro/media/list",
         parser=Parser(json_parser=PydanticAdapterJsonParser(MediaList)),
+        rules=MessageRules(read_only_analyzer=MessageRules.always_true),
     )
     async def get_media_list(self) -> GoProResp[MediaList]:
         """Get a list of media on the camera.
@@ -175,6 +212,21 @@ class HttpCommands(HttpMessages[HttpMessage]):
             GoProResp[MediaList]: Media list JSON structure
         """
 
+    @http_get_json_command(
+        endpoint="gopro/media/list",
+        parser=Parser(json_parser=LambdaJsonParser(CompactMediaList.from_json)),
+        identifier="Get Compact Media List",
+        rules=MessageRules(read_only_analyzer=MessageRules.always_true),
+    )
+    async def get_compact_media_list(self) -> GoProResp[CompactMediaList]:
+        """Get a list of media on the camera in a compact form that is much faster to build for large media lists.
+
+        Media items are only built when accessed.
+
+        Returns:
+            GoProResp[CompactMediaList]: Compact media list
+        """
+
     @http_get_json_command(endpoint="gopro/media/turbo_transfer", arguments=["p"])
     async def set_turbo_mode(self, *, mode: constants.Toggle) -> GoProResp[None]:
         """Enable or disable Turbo transfer mode.
@@ -190,6 +242,7 @@ class HttpCommands(HttpMessages[HttpMessage]):
     @http_get_json_command(
         endpoint="gopro/version",
         parser=Parser(json_parser=LambdaJsonParser(lambda data: f"{data['version']}")),
+        rules=MessageRules(read_only_analyzer=MessageRules.always_true),
     )
     async def get_open_gopro_api_version(self) -> GoProResp[str]:
         """Get Open GoPro API version
@@ -199,7 +252,9 @@ class HttpCommands(HttpMessages[HttpMessage]):
         """
 
     # TODO make pydantic model of preset status
-    @http_get_json_command(endpoint="gopro/camera/presets/get")
+    @http_get_json_command(
+        endpoint="gopro/camera/presets/get", rules=MessageRules(read_only_analyzer=MessageRules.always_true)
+    )
     async def get_preset_status(self) -> GoProResp[JsonDict]:
         """Get status of current presets
 
@@ -328,7 +383,9 @@ class HttpCommands(HttpMessages[HttpMessage]):
             "dst": int(is_dst),
         }
 
-    @http_get_json_command(endpoint="gopro/camera/get_date_time")
+    @http_get_json_command(
+        endpoint="gopro/camera/get_date_time", rules=MessageRules(read_only_analyzer=MessageRules.always_true)
+    )
     async def get_date_time(self) -> GoProResp[datetime.datetime]:
         """Get the date and time of the camera (Non timezone / DST aware)
 
@@ -336,7 +393,9 @@ class HttpCommands(HttpMessages[HttpMessage]):
             GoProResp[datetime.datetime]: current date and time on camera
         """
 
-    @http_get_json_command(endpoint="gopro/webcam/version")
+    @http_get_json_command(
+        endpoint="gopro/webcam/version", rules=MessageRules(read_only_analyzer=MessageRules.always_true)
+    )
     async def get_webcam_version(self) -> GoProResp[str]:
         """Get the version of the webcam implementation
 
@@ -477,8 +536,17 @@ class HttpCommands(HttpMessages[HttpMessage]):
         """
         return {"p": control}  # type: ignore
 
-    @http_get_binary_command(endpoint="gopro/media/gpmf", arguments=["path"])
-    async def get_gpmf_data(self, *, camera_file: str, local_file: Path | None = None) -> GoProResp[Path]:
+    @http_get_binary_command(
+        endpoint="gopro/media/gpmf", arguments=["path"], rules=MessageRules(read_only_analyzer=MessageRules.always_true)
+    )
+    async def get_gpmf_data(
+        self,
+        *,
+        camera_file: str,
+        local_file: Path | None = None,
+        expected_size: int | None = None,
+        progress_cb: DownloadProgressCb | None = None,
+    ) -> GoProResp[Path]:
         """Get GPMF data for a file.
 
         If local_file is none, the output location will be the same name as the camera_file.
@@ -486,13 +554,27 @@ class HttpCommands(HttpMessages[HttpMessage]):
         Args:
             camera_file (str): filename on camera to operate on
             local_file (Path | None): Location on computer to write output. Defaults to None.
+            expected_size (int | None): size in bytes to verify the downloaded file against, i.e. the media list
+                item's file_size. Defaults to None (verify against the size reported by the camera).
+            progress_cb (DownloadProgressCb | None): callback to receive download progress. Defaults to None.
 
         Returns:
             GoProResp[Path]: Path to local_file that output was written to
         """
 
-    @http_get_binary_command(endpoint="gopro/media/screennail", arguments=["path"])
-    async def get_screennail(self, *, camera_file: str, local_file: Path | None = None) -> GoProResp[Path]:
+    @http_get_binary_command(
+        endpoint="gopro/media/screennail",
+        arguments=["path"],
+        rules=MessageRules(read_only_analyzer=MessageRules.always_true),
+    )
+    async def get_screennail(
+        self,
+        *,
+        camera_file: str,
+        local_file: Path | None = None,
+        expected_size: int | None = None,
+        progress_cb: DownloadProgressCb | None = None,
+    ) -> GoProResp[Path]:
         """Get screennail for a file.
 
         If local_file is none, the output location will be the same name as the camera_file.
@@ -500,12 +582,19 @@ class HttpCommands(HttpMessages[HttpMessage]):
         Args:
             camera_file (str): filename on camera to operate on
             local_file (Path | None): Location on computer to write output. Defaults to None.
+            expected_size (int | None): size in bytes to verify the downloaded file against, i.e. the media list
+                item's file_size. Defaults to None (verify against the size reported by the camera).
+            progress_cb (DownloadProgressCb | None): callback to receive download progress. Defaults to None.
 
         Returns:
             GoProResp[Path]: Path to local_file that output was written to
         """
 
-    @http_get_binary_command(endpoint="gopro/media/thumbnail", arguments=["path"])
+    @http_get_binary_command(
+        endpoint="gopro/media/thumbnail",
+        arguments=["path"],
+        rules=MessageRules(read_only_analyzer=MessageRules.always_true),
+    )
     async def get_thumbnail(self, *, camera_file: str, local_file: Path | None = None) -> GoProResp[Path]:
         """Get thumbnail for a file.
 
@@ -519,8 +608,19 @@ class HttpCommands(HttpMessages[HttpMessage]):
             GoProResp[Path]: Path to local_file that output was written to
         """
 
-    @http_get_binary_command(endpoint="gopro/media/telemetry", arguments=["path"])
-    async def get_telemetry(self, *, camera_file: str, local_file: Path | None = None) -> GoProResp[Path]:
+    @http_get_binary_command(
+        endpoint="gopro/media/telemetry",
+        arguments=["path"],
+        rules=MessageRules(read_only_analyzer=MessageRules.always_true),
+    )
+    async def get_telemetry(
+        self,
+        *,
+        camera_file: str,
+        local_file: Path | None = None,
+        expected_size: int | None = None,
+        progress_cb: DownloadProgressCb | None = None,
+    ) -> GoProResp[Path]:
         """Download the telemetry data for a camera file and store in a local file.
 
         If local_file is none, the output location will be the same name as the camera_file.
@@ -528,20 +628,41 @@ class HttpCommands(HttpMessages[HttpMessage]):
         Args:
             camera_file (str): filename on camera to operate on
             local_file (Path | None): Location on computer to write output. Defaults to None.
+            expected_size (int | None): size in bytes to verify the downloaded file against, i.e. the media list
+                item's file_size. Defaults to None (verify against the size reported by the camera).
+            progress_cb (DownloadProgressCb | None): callback to receive download progress. Defaults to None.
 
         Returns:
             GoProResp[Path]: Path to local_file that output was written to
         """
 
-    @http_get_binary_command(endpoint="videos/DCIM", components=["path"], identifier="Download File")
-    async def download_file(self, *, camera_file: str, local_file: Path | None = None) -> GoProResp[Path]:
+    @http_get_binary_command(
+        endpoint="videos/DCIM",
+        components=["path"],
+        identifier="Download File",
+        rules=MessageRules(read_only_analyzer=MessageRules.always_true),
+    )
+    async def download_file(
+        self,
+        *,
+        camera_file: str,
+        local_file: Path | None = None,
+        expected_size: int | None = None,
+        progress_cb: DownloadProgressCb | None = None,
+    ) -> GoProResp[Path]:
         """Download a video from the camera to a local file.
 
         If local_file is none, the output location will be the same name as the camera_file.
 
+        Large files are downloaded in concurrent byte ranges. If the download is interrupted, calling this again
+        with the same local_file resumes it.
+
         Args:
             camera_file (str): filename on camera to operate on
             local_file (Path | None): Location on computer to write output. Defaults to None.
+            expected_size (int | None): size in bytes to verify the downloaded file against, i.e. the media list
+                item's file_size. Defaults to None (verify against the size reported by the camera).
+            progress_cb (DownloadProgressCb | None): callback to receive download progress. Defaults to None.
 
         Returns:
             GoProResp[Path]: Path to local_file that output was written to
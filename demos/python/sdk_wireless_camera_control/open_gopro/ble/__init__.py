@@ -6,8 +6,24 @@
 isort:skip_file
 """
 
+from typing import TYPE_CHECKING
+
 from open_gopro.exceptions import FailedToFindDevice, ConnectFailed, ConnectionTerminated, ResponseTimeout
+from open_gopro.lazy import lazy_exports
 from .services import GattDB, Characteristic, Descriptor, Service, BleUUID, UUIDs, CharProps
-from .controller import BleDevice, BleHandle, NotiHandlerType, DisconnectHandlerType, BLEController
+from .controller import (
+    Advertisement,
+    AdvertisementHandlerType,
+    BleDevice,
+    BleHandle,
+    NotiHandlerType,
+    DisconnectHandlerType,
+    BLEController,
+)
 from .client import BleClient
-from .adapters import BleakWrapperController
+
+# The adapter is imported on first access so that bleak is only loaded if it is used
+if TYPE_CHECKING:
+    from .adapters import BleakWrapperController
+
+__getattr__, __dir__ = lazy_exports(__name__, {"BleakWrapperController": ".adapters"})
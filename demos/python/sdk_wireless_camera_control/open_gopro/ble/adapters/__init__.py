@@ -3,4 +3,15 @@
 
 """Adapter Implementations for the Open GoPro BLE Interface"""
 
-from .bleak_wrapper import BleakWrapperController
+from typing import TYPE_CHECKING
+
+from open_gopro.lazy import lazy_exports
+
+# Adapters are imported on first access so that their dependencies (i.e. bleak) are only loaded if they are used
+if TYPE_CHECKING:
+    from .bleak_wrapper import BleakWrapperController
+    from .replay import ReplayBleController
+
+__getattr__, __dir__ = lazy_exports(
+    __name__, {"BleakWrapperController": ".bleak_wrapper", "ReplayBleController": ".replay"}
+)
@@ -20,6 +20,8 @@ from bleak.backends.scanner import AdvertisementData
 from packaging.version import Version
 
 from open_gopro.ble import (
+    Advertisement,
+    AdvertisementHandlerType,
     BLEController,
     BleUUID,
     Characteristic,
@@ -32,6 +34,7 @@ from open_gopro.ble import (
     UUIDs,
 )
 from open_gopro.exceptions import ConnectFailed
+from open_gopro.logger import DeferredStr
 from open_gopro.util import Singleton
 
 logger = logging.getLogger(__name__)
@@ -85,9 +88,9 @@ class BleakWrapperController(BLEController[BleakDevice, bleak.BleakClient], Sing
         Returns:
             bytearray: read data
         """
-        logger.debug(f"Reading from {uuid}")
+        logger.debug("Reading from %s", uuid)
         response = await handle.read_gatt_char(uuid2bleak_string(uuid))
-        logger.debug(f'Received response on BleUUID [{uuid}]: {response.hex( ":")}')
+        logger.debug("Received response on BleUUID [%s]: %s", uuid, DeferredStr(response.hex, ":"))
         return response
 
     async def write(self, handle: bleak.BleakClient, uuid: BleUUID, data: bytes) -> None:
@@ -98,7 +101,7 @@ class BleakWrapperController(BLEController[BleakDevice, bleak.BleakClient], Sing
             uuid (BleUUID): characteristic BleUUID to write to
             data (bytes): data to write
         """
-        logger.debug(f"Writing to {uuid}: {uuid.hex}")
+        logger.debug("Writing to %s: %s", uuid, uuid.hex)
         await handle.write_gatt_char(uuid2bleak_string(uuid), data, response=True)
 
     async def scan(
@@ -148,6 +151,38 @@ class BleakWrapperController(BLEController[BleakDevice, bleak.BleakClient], Sing
         # If there's more than 1, the first one gets lucky.
         return matched_devices[0]
 
+    async def discover(self, handler: AdvertisementHandlerType, service_uuids: list[BleUUID] | None = None) -> None:
+        """Scan continuously, passing each received advertisement to a handler, until cancelled.
+
+        Args:
+            handler (AdvertisementHandlerType): called with the device and advertisement of each received
+                advertisement, including repeated ones
+            service_uuids (list[BleUUID] | None): The list of BleUUID's to filter on. Defaults to None.
+        """
+        uuids = [] if service_uuids is None else [uuid2bleak_string(uuid) for uuid in service_uuids]
+
+        def scan_callback(device: BleakDevice, adv_data: AdvertisementData) -> None:
+            """Pass the advertisement on without bleak types
+
+            Args:
+                device (BleakDevice): advertising device
+                adv_data (AdvertisementData): advertisement (and / or scan response) data
+            """
+            handler(
+                device,
+                Advertisement(
+                    device.address,
+                    adv_data.local_name or device.name,
+                    adv_data.manufacturer_data,
+                    adv_data.service_data,
+                    adv_data.rssi,
+                ),
+            )
+
+        logger.info("Discovering bluetooth devices continuously...")
+        async with bleak.BleakScanner(detection_callback=scan_callback, service_uuids=uuids):
+            await asyncio.Future()
+
     async def connect(self, disconnect_cb: Callable, device: BleakDevice, timeout: int = 15) -> bleak.BleakClient:
         """Connect to a device.
 
@@ -246,6 +281,19 @@ class BleakWrapperController(BLEController[BleakDevice, bleak.BleakClient], Sing
             raise ConnectFailed("BLE", 1, 1) from exception
         return client
 
+    def get_address(self, handle: bleak.BleakClient) -> str:  # type: ignore[override]
+        """Get the address of a connected device that it can later be connected to without scanning.
+
+        Bleak can connect to either a discovered device or its address.
+
+        Args:
+            handle (bleak.BleakClient): connected client
+
+        Returns:
+            str: Bluetooth address (or CoreBluetooth UUID on Mac)
+        """
+        return handle.address
+
     async def pair(self, handle: bleak.BleakClient) -> None:
         """Pair to a device after connection.
 
@@ -0,0 +1,180 @@
+# replay.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""BLE controller that re-serves the BLE traffic of a recorded wire trace"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Callable, Optional, Pattern, Sequence
+
+from open_gopro.ble import (
+    BLEController,
+    BleUUID,
+    DisconnectHandlerType,
+    FailedToFindDevice,
+    GattDB,
+    NotiHandlerType,
+    UUIDs,
+)
+from open_gopro.wire_trace import FrameKind, TraceFrame, load_frames
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayBleController(BLEController[str, str]):
+    """Re-serve the BLE traffic of a wire trace so that a WirelessGoPro can run without a camera
+
+    The recorded device is found by any scan whose token matches (anywhere in) its recorded name. Its recorded GATT
+    table is "discovered". Once notifications are enabled, the recorded notifications are re-served in order at the
+    recorded (or accelerated) pace. Notifications that were recorded after a write are only served after the client
+    has made the same amount of writes to that attribute so that responses are never served before their requests.
+    The content of writes is not checked and notifications are not otherwise held back for the client (i.e. at
+    math.inf speed, a push that was recorded shortly after a response can arrive before the client has handled the
+    response). Reads are answered with the recorded reads of the attribute in order, re-using
+    the last one once they are exhausted.
+
+    The controller is built by the GoPro with its exception handler so pass the trace with a partial:
+
+    >>> adapter = functools.partial(ReplayBleController, trace="session.gpwt", speed=math.inf)
+    >>> gopro = WirelessGoPro(ble_adapter=adapter, enable_wifi=False)
+
+    Args:
+        exception_handler (Optional[Callable]): Used to catch exceptions from the replay task (with the same
+            signature as asyncio's exception handler). Defaults to None.
+        trace (Path | str | Sequence[TraceFrame]): trace file or frames to replay
+        speed (float): how much faster than recorded to serve notifications (i.e. 1.0 for the recorded pace,
+            math.inf for no delays). Defaults to 1.0.
+
+    Raises:
+        ValueError: the trace does not contain a BLE connection
+    """
+
+    def __init__(
+        self,
+        exception_handler: Optional[Callable] = None,
+        *,
+        trace: Path | str | Sequence[TraceFrame],
+        speed: float = 1.0,
+    ) -> None:
+        super().__init__(exception_handler)
+        frames = load_frames(trace)
+        if not (connect := next((frame for frame in frames if frame.kind is FrameKind.CONNECT), None)):
+            raise ValueError("Trace does not contain a BLE connection")
+        connection = json.loads(connect.data)
+        self._device: str = connection["device"]
+        self._gatt_db_dict: dict = connection["gatt_db"]
+        self._gatt_db: GattDB | None = None
+        self._speed = speed
+        self._script = [f for f in frames if f.kind in (FrameKind.BLE_WRITE, FrameKind.BLE_NOTIFICATION)]
+        self._reads: dict[int, deque[bytes]] = defaultdict(deque)
+        for frame in frames:
+            if frame.kind is FrameKind.BLE_READ:
+                self._reads[frame.channel].append(frame.data)
+        self._writes: dict[int, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(0))
+        self._disconnect_cb: DisconnectHandlerType | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_finished(self) -> bool:
+        """Have all of the recorded notifications been served?
+
+        Returns:
+            bool: True if finished, False otherwise
+        """
+        return self._task is not None and self._task.done()
+
+    async def read(self, handle: str, uuid: BleUUID) -> bytes:  # noqa: D102
+        if not (reads := self._reads.get(self._attribute_handle(uuid))):
+            logger.warning(f"No recorded read of {uuid}")
+            return bytes()
+        return reads.popleft() if len(reads) > 1 else reads[0]
+
+    async def write(self, handle: str, uuid: BleUUID, data: bytes) -> None:  # noqa: D102
+        self._writes[self._attribute_handle(uuid)].release()
+
+    async def scan(self, token: Pattern, timeout: int = 5, service_uuids: list[BleUUID] | None = None) -> str:
+        """Find the recorded device if the token matches its name
+
+        Args:
+            token (Pattern): regex to match against the recorded device name
+            timeout (int): unused. Defaults to 5.
+            service_uuids (list[BleUUID] | None): unused. Defaults to None.
+
+        Raises:
+            FailedToFindDevice: the token does not match the recorded device
+
+        Returns:
+            str: recorded device
+        """
+        if not token.search(self._device):
+            raise FailedToFindDevice
+        return self._device
+
+    async def connect(self, disconnect_cb: DisconnectHandlerType, device: str, timeout: int = 15) -> str:  # noqa: D102
+        self._disconnect_cb = disconnect_cb
+        return device
+
+    async def pair(self, handle: str) -> None:  # noqa: D102
+        return
+
+    async def enable_notifications(self, handle: str, handler: NotiHandlerType) -> None:  # noqa: D102
+        self._task = asyncio.create_task(self._serve(handler))
+
+    async def discover_chars(self, handle: str, uuids: type[UUIDs] | None = None) -> GattDB:  # noqa: D102
+        self._gatt_db = GattDB.from_dict(self._gatt_db_dict, uuids)
+        return self._gatt_db
+
+    async def disconnect(self, handle: str) -> None:  # noqa: D102
+        if self._task:
+            self._task.cancel()
+        if self._disconnect_cb:
+            self._disconnect_cb(handle)
+
+    def _attribute_handle(self, uuid: BleUUID) -> int:
+        """Get the attribute handle of a characteristic
+
+        Args:
+            uuid (BleUUID): characteristic
+
+        Raises:
+            RuntimeError: characteristics have not been discovered
+
+        Returns:
+            int: attribute handle
+        """
+        if not self._gatt_db:
+            raise RuntimeError("Characteristics have not been discovered")
+        return self._gatt_db.uuid2handle(uuid)
+
+    async def _serve(self, handler: NotiHandlerType) -> None:
+        """Serve the recorded notifications in order, waiting for each recorded write before continuing
+
+        Failures are passed to the exception handler if there is one.
+
+        Args:
+            handler (NotiHandlerType): notification handler
+
+        Raises:
+            Exception: replay failed and there is no exception handler
+        """
+        try:
+            previous: float | None = None
+            for frame in self._script:
+                if frame.kind is FrameKind.BLE_WRITE:
+                    await self._writes[frame.channel].acquire()
+                elif previous is not None and math.isfinite(self._speed):
+                    await asyncio.sleep(max(0.0, frame.timestamp - previous) / self._speed)
+                previous = frame.timestamp
+                if frame.kind is FrameKind.BLE_NOTIFICATION:
+                    handler(frame.channel, bytearray(frame.data))
+            logger.info("Finished replaying the BLE trace")
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            if not self._exception_handler:
+                raise
+            self._exception_handler(self, {"message": "Failed to replay BLE trace", "exception": e})
@@ -8,10 +8,11 @@ from __future__ import annotations
 import logging
 import re
 from pathlib import Path
-from typing import Generic, Optional, Pattern
+from typing import TYPE_CHECKING, Generic, Optional, Pattern
 
 from open_gopro.ble import BleUUID
 from open_gopro.exceptions import ConnectFailed, FailedToFindDevice
+from open_gopro.util import PhaseTimer
 
 from .controller import (
     BLEController,
@@ -22,6 +23,10 @@ from .controller import (
 )
 from .services import BleUUID, GattDB, UUIDs
 
+if TYPE_CHECKING:
+    from open_gopro.ble_discovery import DiscoveredCamera, DiscoveryService
+    from open_gopro.wire_trace import WireTraceRecorder
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,6 +70,31 @@ class BleClient(Generic[BleHandle, BleDevice]):
         self._handle: Optional[BleHandle] = None
         self._identifier: Optional[str] = None if isinstance(self._target, Pattern) else str(self._target)
         self.uuids = uuids
+        # Set by use_cached to connect without scanning / discovering
+        self._cached: Optional[tuple[BleDevice, str, Optional[GattDB]]] = None
+        self._timer = PhaseTimer()
+        # Set to record connections, reads, and writes to a wire trace
+        self.wire_trace: Optional[WireTraceRecorder] = None
+        # Set to claim the target from a running discovery service instead of scanning for it
+        self.discovery: Optional[DiscoveryService] = None
+        self._claimed: Optional[DiscoveredCamera] = None
+
+    def use_cached(self, device: BleDevice, identifier: str, gatt_db: Optional[GattDB] = None) -> None:
+        """Connect to a previously found device on the next open instead of scanning for the target
+
+        If the GATT table from a previous connection is also passed, characteristic discovery is skipped. If the
+        connection to the cached device fails, the next open falls back to scanning and discovery.
+
+        Args:
+            device (BleDevice): device (or address) from a previous connection (see address)
+            identifier (str): identifier from the previous connection
+            gatt_db (Optional[GattDB]): GATT table from the previous connection. Defaults to None.
+        """
+        self._cached = (device, identifier, gatt_db)
+
+    def clear_cached(self) -> None:
+        """Scan for the target and discover its characteristics on the next open"""
+        self._cached = None
 
     async def _find_device(self, timeout: int = 5, retries: int = 30) -> None:
         """Scan for the target device.
@@ -78,6 +108,12 @@ class BleClient(Generic[BleHandle, BleDevice]):
         """
         self._device = None
         assert isinstance(self._target, Pattern)
+        if self.discovery:
+            # Wait as long as scanning would have
+            self._release_claimed()
+            self._claimed = await self.discovery.claim(self._target, timeout * max(1, retries - 1))
+            self._device = self._claimed.device
+            return
         for retry in range(1, retries):
             try:
                 self._device = await self._controller.scan(self._target, timeout, self._service_uuids)
@@ -96,31 +132,58 @@ class BleClient(Generic[BleHandle, BleDevice]):
         Raises:
             ConnectFailed: The BLE connection was not able to establish
         """
-        # If we need we need to find the device to connect
-        if isinstance(self._target, Pattern):
-            await self._find_device(timeout, retries)
-        # Otherwise we already have it
-        else:
-            self._device = self._target
-        self._identifier = str(self._device)
-
-        logger.info("Establishing the BLE connection")
-        for retry in range(1, retries):
+        self._timer.reset()
+        gatt_table: Optional[GattDB] = None
+        if self._cached:
+            self._device, self._identifier, gatt_table = self._cached
+            logger.info(f"Establishing the BLE connection to cached device {self._device}")
             try:
-                self._handle = await self._controller.connect(self._disconnected_cb, self._device, timeout=timeout)
-                break
-            except ConnectFailed as e:
-                logger.warning(f"Failed to connect. Retrying #{retry}")
-                if retry == retries - 1:
-                    raise ConnectFailed("BLE", timeout, retries) from e
+                with self._timer.phase("connect"):
+                    self._handle = await self._controller.connect(self._disconnected_cb, self._device, timeout=timeout)
+            except ConnectFailed:
+                logger.warning("Failed to connect to cached device. Scanning for it instead.")
+                self._cached = None
+                gatt_table = None
+
+        if self._handle is None:
+            # If we need we need to find the device to connect
+            if isinstance(self._target, Pattern):
+                with self._timer.phase("scan"):
+                    await self._find_device(timeout, retries)
+            # Otherwise we already have it
+            else:
+                self._device = self._target
+            self._identifier = str(self._device)
+
+            logger.info("Establishing the BLE connection")
+            with self._timer.phase("connect"):
+                for retry in range(1, retries):
+                    try:
+                        self._handle = await self._controller.connect(
+                            self._disconnected_cb, self._device, timeout=timeout
+                        )
+                        break
+                    except ConnectFailed as e:
+                        logger.warning(f"Failed to connect. Retrying #{retry}")
+                        if retry == retries - 1:
+                            self._release_claimed()
+                            raise ConnectFailed("BLE", timeout, retries) from e
 
         assert self._handle is not None
         # Attempt to pair
-        await self._controller.pair(self._handle)
-        # Discover characteristics
-        self._gatt_table = await self._controller.discover_chars(self._handle, self.uuids)
+        with self._timer.phase("pair"):
+            await self._controller.pair(self._handle)
+        # Discover characteristics unless they are already known
+        if gatt_table:
+            self._gatt_table = gatt_table
+        else:
+            with self._timer.phase("discover"):
+                self._gatt_table = await self._controller.discover_chars(self._handle, self.uuids)
+        if self.wire_trace:
+            self.wire_trace.ble_connect(str(self._identifier), self._gatt_table)
         # Enable all GATT notifications
-        await self._controller.enable_notifications(self._handle, self._notification_cb)
+        with self._timer.phase("notifications"):
+            await self._controller.enable_notifications(self._handle, self._notification_cb)
 
     async def close(self) -> None:
         """Close the client resource.
@@ -133,6 +196,13 @@ class BleClient(Generic[BleHandle, BleDevice]):
             self._handle = None
         else:
             logger.warning("BLE already disconnected")
+        self._release_claimed()
+
+    def _release_claimed(self) -> None:
+        """Release the device claimed from the discovery service (if any) so that it can be claimed again"""
+        if self.discovery and self._claimed:
+            self.discovery.release(self._claimed)
+        self._claimed = None
 
     async def read(self, uuid: BleUUID) -> bytes:
         """Read byte data from a characteristic (identified by BleUUID)
@@ -143,7 +213,10 @@ class BleClient(Generic[BleHandle, BleDevice]):
         Returns:
             bytes: byte data that was read
         """
-        return await self._controller.read(self._handle, uuid)
+        data = await self._controller.read(self._handle, uuid)
+        if self.wire_trace:
+            self.wire_trace.ble_read(self.gatt_db.uuid2handle(uuid), data)
+        return data
 
     async def write(self, uuid: BleUUID, data: bytes) -> None:
         """Write byte data to a characteristic (identified by BleUUID)
@@ -152,6 +225,8 @@ class BleClient(Generic[BleHandle, BleDevice]):
             uuid (BleUUID): characteristic to write to
             data (bytes): byte data to write
         """
+        if self.wire_trace:
+            self.wire_trace.ble_write(self.gatt_db.uuid2handle(uuid), data)
         await self._controller.write(self._handle, uuid, data)
 
     @property
@@ -168,6 +243,38 @@ class BleClient(Generic[BleHandle, BleDevice]):
             raise RuntimeError("GATT table has not yet been discovered")
         return self._gatt_table
 
+    @property
+    def target(self) -> Pattern | BleDevice:
+        """The regex or device that this client connects to
+
+        Returns:
+            Pattern | BleDevice: target
+        """
+        return self._target
+
+    @property
+    def address(self) -> Optional[BleDevice]:
+        """The address of the connected device that can be passed to use_cached
+
+        Returns:
+            Optional[BleDevice]: address or None if not connected or not supported by the controller
+        """
+        if self._handle is None:
+            return None
+        try:
+            return self._controller.get_address(self._handle)
+        except NotImplementedError:
+            return None
+
+    @property
+    def phase_durations(self) -> dict[str, float]:
+        """How long each phase (scan, connect, pair, discover, notifications) of the last open took
+
+        Returns:
+            dict[str, float]: phase name --> duration in seconds. Skipped phases are not included.
+        """
+        return dict(self._timer.durations)
+
     @property
     def identifier(self) -> Optional[str]:
         """A string that identifies the GoPro
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Callable, Generic, Optional, Pattern, TypeVar
+from typing import Callable, Generic, Mapping, NamedTuple, Optional, Pattern, TypeVar
 
 from .services import BleUUID, GattDB, UUIDs
 
@@ -19,6 +19,19 @@ NotiHandlerType = Callable[[int, bytearray], None]
 DisconnectHandlerType = Callable[[BleDevice], None]
 
 
+class Advertisement(NamedTuple):
+    """An advertisement (and / or scan response) received while discovering"""
+
+    address: str  #: address that identifies the advertising device
+    name: Optional[str]  #: local name if it was received
+    manufacturer_data: Mapping[int, bytes]  #: manufacturer specific data indexed by company ID
+    service_data: Mapping[str, bytes]  #: service data indexed by 128-bit service UUID string
+    rssi: Optional[int] = None  #: received signal strength (dBm)
+
+
+AdvertisementHandlerType = Callable[[BleDevice, Advertisement], None]
+
+
 class BLEController(ABC, Generic[BleDevice, BleHandle]):
     """Interface definition for a BLE driver to be used by GoPro."""
 
@@ -60,6 +73,21 @@ class BLEController(ABC, Generic[BleDevice, BleHandle]):
             BleDevice: discovered device (shall not be multiple devices)
         """
 
+    async def discover(self, handler: AdvertisementHandlerType, service_uuids: list[BleUUID] | None = None) -> None:
+        """Scan continuously, passing each received advertisement to a handler, until cancelled.
+
+        Controllers that can scan continuously should override this.
+
+        Args:
+            handler (AdvertisementHandlerType): called with the device and advertisement of each received
+                advertisement, including repeated ones
+            service_uuids (list[BleUUID] | None): The list of BleUUID's to filter on. Defaults to None.
+
+        Raises:
+            NotImplementedError: the controller does not support continuous discovery
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support continuous discovery")
+
     @abstractmethod
     async def connect(self, disconnect_cb: DisconnectHandlerType, device: BleDevice, timeout: int = 15) -> BleHandle:
         """Connect to a BLE device.
@@ -73,6 +101,22 @@ class BLEController(ABC, Generic[BleDevice, BleHandle]):
             BleHandle: handle that has been connected to
         """
 
+    def get_address(self, handle: BleHandle) -> BleDevice:
+        """Get the address of a connected device that it can later be connected to without scanning.
+
+        Controllers that can connect directly to an address should override this.
+
+        Args:
+            handle (BleHandle): connected handle
+
+        Raises:
+            NotImplementedError: the controller can not connect directly to an address
+
+        Returns:
+            BleDevice: device address to pass to connect
+        """
+        raise NotImplementedError(f"{type(self).__name__} can not connect directly to an address")
+
     @abstractmethod
     async def pair(self, handle: BleHandle) -> None:
         """Pair to an already connected handle.
@@ -328,6 +328,10 @@ class Service:
 class GattDB:
     """The attribute table to store / look up BLE services, characteristics, and attributes.
 
+    Characteristics are indexed by handle and BleUUID so that lookups (i.e. handle2uuid for every received
+    notification) do not search the table. The indexes are rebuilt when services are set. If characteristics are
+    added to a service that is already in the table, reindex must be called.
+
     Args:
         init_services (list[Service]): A list of services known at instantiation time. Can be updated later
             with the services property
@@ -340,18 +344,10 @@ class GattDB:
             self._db = db
 
         def __getitem__(self, key: BleUUID) -> Characteristic:
-            for service in self._db.services.values():
-                for char in service.characteristics.values():
-                    if char.uuid == key:
-                        return char
-            raise KeyError
+            return self._db._uuid_index[key]
 
         def __contains__(self, key: object) -> bool:
-            for service in self._db.services.values():
-                for char in service.characteristics.values():
-                    if char.uuid == key:
-                        return True
-            return False
+            return key in self._db._uuid_index
 
         @no_type_check
         def __iter__(self) -> Iterator[Characteristic]:
@@ -407,6 +403,8 @@ class GattDB:
 
     def __init__(self, init_services: list[Service]) -> None:
         self._services: dict[BleUUID, Service] = {}
+        self._handle_index: dict[int, Characteristic] = {}
+        self._uuid_index: dict[BleUUID, Characteristic] = {}
         # Mypy should eventually support this: see https://github.com/python/mypy/issues/3004
         self.services = init_services  # type: ignore
         self.characteristics = self.CharacteristicView(self)
@@ -424,6 +422,19 @@ class GattDB:
     def services(self, services: list[Service]) -> None:
         for service in services:
             self._services[service.uuid] = service
+        self.reindex()
+
+    def reindex(self) -> None:
+        """Rebuild the handle and BleUUID indexes from the current services
+
+        If a BleUUID is in more than one service, it is indexed to the characteristic in the first service.
+        """
+        self._handle_index = {}
+        self._uuid_index = {}
+        for service in self._services.values():
+            for char in service.characteristics.values():
+                self._handle_index.setdefault(char.handle, char)
+                self._uuid_index.setdefault(char.uuid, char)
 
     def handle2uuid(self, handle: int) -> BleUUID:
         """Get a BleUUID from a handle.
@@ -437,11 +448,10 @@ class GattDB:
         Returns:
             BleUUID: The found BleUUID
         """
-        for s in self.services.values():
-            for c in s.characteristics.values():
-                if c.handle == handle:
-                    return c.uuid
-        raise KeyError(f"Matching BleUUID not found for handle {handle}")
+        try:
+            return self._handle_index[handle].uuid
+        except KeyError as e:
+            raise KeyError(f"Matching BleUUID not found for handle {handle}") from e
 
     def uuid2handle(self, ble_uuid: BleUUID) -> int:
         """Convert a handle to a BleUUID
@@ -454,6 +464,95 @@ class GattDB:
         """
         return self.characteristics[ble_uuid].handle
 
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize the attribute table so that it can be stored (i.e. as JSON) and later rebuilt with from_dict
+
+        The serialized form is compact: each BleUUID is stored once and referenced by its index and each attribute is
+        a positional list:
+
+        - service: [uuid, start handle, end handle, [characteristic, ...]]
+        - characteristic: [uuid, handle, props, descriptor handle, [descriptor, ...]]
+        - descriptor: [uuid, handle, hex value or None]
+
+        Returns:
+            dict[str, Any]: JSON-serializable representation
+        """
+        uuids: dict[BleUUID, int] = {}
+
+        def index(ble_uuid: BleUUID) -> int:
+            return uuids.setdefault(ble_uuid, len(uuids))
+
+        services = [
+            [
+                index(service.uuid),
+                service.start_handle,
+                service.end_handle,
+                [
+                    [
+                        index(char.uuid),
+                        char.handle,
+                        int(char.props),
+                        char.descriptor_handle,
+                        [
+                            [
+                                index(descriptor.uuid),
+                                descriptor.handle,
+                                descriptor.value.hex() if descriptor.value is not None else None,
+                            ]
+                            for descriptor in char.descriptors.values()
+                        ],
+                    ]
+                    for char in service.characteristics.values()
+                ],
+            ]
+            for service in self.services.values()
+        ]
+        return {"uuids": [[ble_uuid.hex, ble_uuid.name] for ble_uuid in uuids], "services": services}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], uuids: type[UUIDs] | None = None) -> GattDB:
+        """Rebuild an attribute table that was serialized with as_dict
+
+        Args:
+            data (dict[str, Any]): serialized attribute table
+            uuids (type[UUIDs] | None): Additional BleUUID information to use so that known UUIDs are rebuilt as
+                the same objects as during discovery. Defaults to None.
+
+        Returns:
+            GattDB: rebuilt attribute table
+        """
+        table = [
+            uuids[uuid_hex] if uuids and uuid_hex in uuids else BleUUID(name, hex=uuid_hex)
+            for uuid_hex, name in data["uuids"]
+        ]
+        return cls(
+            [
+                Service(
+                    uuid=table[service_uuid],
+                    start_handle=start_handle,
+                    end_handle=end_handle,
+                    init_chars=[
+                        Characteristic(
+                            handle=handle,
+                            uuid=table[char_uuid],
+                            props=CharProps(props),
+                            descriptor_handle=descriptor_handle,
+                            init_descriptors=[
+                                Descriptor(
+                                    handle=attribute_handle,
+                                    uuid=table[descriptor_uuid],
+                                    value=bytes.fromhex(value) if value is not None else None,
+                                )
+                                for descriptor_uuid, attribute_handle, value in descriptors
+                            ],
+                        )
+                        for char_uuid, handle, props, descriptor_handle, descriptors in chars
+                    ],
+                )
+                for service_uuid, start_handle, end_handle, chars in data["services"]
+            ]
+        )
+
     def dump_to_csv(self, file: Path = Path("attributes.csv")) -> None:
         """Dump discovered services to a csv file.
 
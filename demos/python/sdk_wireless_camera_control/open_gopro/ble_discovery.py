@@ -0,0 +1,331 @@
+# ble_discovery.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Discover many GoPros continuously with one scanner and keep a registry of them
+
+Instead of each camera scanning for itself, run one discovery service and pass it to each camera:
+
+>>> async with DiscoveryService(BleakWrapperController()) as discovery:
+>>>     fleet = GoProFleet(WirelessGoPro(target, ble_discovery=discovery) for target in targets)
+>>>     async with fleet:
+>>>         ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Final, Generic, Pattern
+
+from open_gopro.ble import (
+    Advertisement,
+    BLEController,
+    BleDevice,
+    BleUUID,
+    FailedToFindDevice,
+)
+from open_gopro.constants import GoProUUID
+
+logger = logging.getLogger(__name__)
+
+GOPRO_COMPANY_ID: Final = 0x02F2
+"""Bluetooth SIG company identifier of the GoPro manufacturer data"""
+
+GOPRO_SERVICE_DATA_UUID: Final = str(uuid.UUID(int=GoProUUID.S_CONTROL_QUERY.int))
+"""128-bit UUID string of the GoPro service data"""
+
+MANUFACTURER_DATA_LEN: Final = 12
+"""Length of the GoPro manufacturer data (not including the company ID)"""
+
+
+@dataclass(frozen=True)
+class CameraStatus:
+    """Camera status and capabilities from the GoPro manufacturer data of an advertisement
+
+    The fields are named as in GoProAdvData.
+    """
+
+    schema_version: int
+    processor_state: bool
+    wifi_ap_state: bool
+    peripheral_pairing_state: bool
+    central_role_enabled: bool
+    is_new_media_available: bool
+    camera_id: int
+    supports_cnc: bool
+    supports_ble_metadata: bool
+    supports_wideband_audio: bool
+    supports_concurrent_master_slave: bool
+    supports_onboarding: bool
+    supports_new_media_available: bool
+    id_hash: bytes
+    is_media_upload_available: bool
+    is_media_upload_new_media_available: bool
+    is_media_upload_battery_ok: bool
+    is_media_upload_sd_card_ok: bool
+    is_media_upload_busy: bool
+    is_media_upload_paused: bool
+
+    @property
+    def busy(self) -> bool:
+        """Is the camera busy offloading media?
+
+        Returns:
+            bool: True if busy, False otherwise
+        """
+        return self.is_media_upload_busy
+
+
+@functools.lru_cache(maxsize=256)
+def decode_manufacturer_data(data: bytes) -> CameraStatus:
+    """Decode GoPro manufacturer data (as manuf_data_struct does)
+
+    Cameras repeat the same advertisement so the decoded statuses are memoized.
+
+    Args:
+        data (bytes): manufacturer data (not including the company ID)
+
+    Raises:
+        ValueError: data is too short
+
+    Returns:
+        CameraStatus: decoded status
+    """
+    if len(data) < MANUFACTURER_DATA_LEN:
+        raise ValueError(f"Manufacturer data is {len(data)} bytes. Expected {MANUFACTURER_DATA_LEN}")
+    status, capabilities, offload = data[1], data[3], data[11]
+    return CameraStatus(
+        schema_version=data[0],
+        processor_state=bool(status & 0x80),
+        wifi_ap_state=bool(status & 0x40),
+        peripheral_pairing_state=bool(status & 0x20),
+        central_role_enabled=bool(status & 0x10),
+        is_new_media_available=bool(status & 0x08),
+        camera_id=data[2],
+        supports_cnc=bool(capabilities & 0x80),
+        supports_ble_metadata=bool(capabilities & 0x40),
+        supports_wideband_audio=bool(capabilities & 0x20),
+        supports_concurrent_master_slave=bool(capabilities & 0x10),
+        supports_onboarding=bool(capabilities & 0x08),
+        supports_new_media_available=bool(capabilities & 0x04),
+        id_hash=data[5:11],
+        is_media_upload_available=bool(offload & 0x80),
+        is_media_upload_new_media_available=bool(offload & 0x40),
+        is_media_upload_battery_ok=bool(offload & 0x20),
+        is_media_upload_sd_card_ok=bool(offload & 0x10),
+        is_media_upload_busy=bool(offload & 0x08),
+        is_media_upload_paused=bool(offload & 0x04),
+    )
+
+
+@dataclass
+class DiscoveredCamera(Generic[BleDevice]):
+    """A camera in the discovery registry, updated with each of its advertisements"""
+
+    device: BleDevice  #: device to connect to
+    address: str  #: address that identifies the camera
+    name: str | None = None  #: local name (from the scan response)
+    status: CameraStatus | None = None  #: status from the last manufacturer data
+    ap_mac_address: str | None = None  #: partial access point MAC address (from the scan response)
+    partial_serial_number: str | None = None  #: last 4 digits of the serial number (from the scan response)
+    rssi: int | None = None  #: signal strength of the last advertisement
+    last_seen: float = 0.0  #: monotonic time of the last advertisement
+    claimed: bool = False  #: is a client using this camera?
+    _manufacturer_data: bytes | None = field(default=None, repr=False)
+    _service_data: bytes | None = field(default=None, repr=False)
+
+    @property
+    def is_new_media_available(self) -> bool | None:
+        """Does the camera have new media?
+
+        Returns:
+            bool | None: True if it does, False if it doesn't, None if its status is unknown
+        """
+        return self.status.is_new_media_available if self.status else None
+
+    @property
+    def busy(self) -> bool | None:
+        """Is the camera busy offloading media?
+
+        Returns:
+            bool | None: True if it is, False if it isn't, None if its status is unknown
+        """
+        return self.status.busy if self.status else None
+
+
+@dataclass(frozen=True)
+class DiscoveryStats:
+    """Discovery service instrumentation"""
+
+    cameras: int  #: cameras in the registry
+    advertisements: int  #: advertisements received
+    decoded: int  #: advertisements that changed a camera and were decoded
+    duplicates: int  #: advertisements that were the same as the previous one from their camera
+
+
+class DiscoveryService(Generic[BleDevice]):
+    """Scan continuously with one scanner and keep a registry of discovered cameras that clients can claim
+
+    Each advertisement only updates the parts of its camera that changed: an advertisement that repeats the previous
+    one from the camera is only counted. Clients (see BleClient.discovery) claim a matching camera from the registry
+    instead of scanning. A claimed camera can not be claimed by another client until it is released.
+
+    Args:
+        controller (BLEController): controller to discover with. It must support continuous discovery.
+        service_uuids (list[BleUUID] | None): service UUIDs to filter on. Defaults to the GoPro service.
+        expiry (float): seconds after its last advertisement that a camera can no longer be claimed. Defaults to 30.
+    """
+
+    def __init__(
+        self, controller: BLEController, service_uuids: list[BleUUID] | None = None, expiry: float = 30
+    ) -> None:
+        self._controller = controller
+        self._service_uuids = [GoProUUID.S_CONTROL_QUERY] if service_uuids is None else service_uuids
+        self._expiry = expiry
+        self._cameras: dict[str, DiscoveredCamera[BleDevice]] = {}
+        # Set (and replaced) whenever the registry changes
+        self._changed = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._advertisements = 0
+        self._decoded = 0
+
+    async def __aenter__(self) -> DiscoveryService:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        """Start discovering"""
+        if not self._task or self._task.done():
+            self._task = asyncio.create_task(self._controller.discover(self._handle_advertisement, self._service_uuids))
+
+    async def stop(self) -> None:
+        """Stop discovering. The registry is kept."""
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    @property
+    def is_running(self) -> bool:
+        """Is the service currently discovering?
+
+        Returns:
+            bool: True if it is, False otherwise
+        """
+        return bool(self._task and not self._task.done())
+
+    @property
+    def cameras(self) -> list[DiscoveredCamera[BleDevice]]:
+        """Get the cameras that have advertised within the expiry
+
+        Returns:
+            list[DiscoveredCamera[BleDevice]]: cameras in the order they were discovered
+        """
+        now = time.monotonic()
+        return [camera for camera in self._cameras.values() if now - camera.last_seen <= self._expiry]
+
+    @property
+    def stats(self) -> DiscoveryStats:
+        """Get the discovery instrumentation
+
+        Returns:
+            DiscoveryStats: current statistics
+        """
+        return DiscoveryStats(
+            cameras=len(self._cameras),
+            advertisements=self._advertisements,
+            decoded=self._decoded,
+            duplicates=self._advertisements - self._decoded,
+        )
+
+    async def claim(self, token: Pattern, timeout: float | None = None) -> DiscoveredCamera[BleDevice]:
+        """Wait for an unclaimed camera whose name matches a regex and claim it
+
+        Args:
+            token (Pattern): regex to match (from the start of) the camera name
+            timeout (float | None): seconds to wait for a matching camera. Defaults to None (forever).
+
+        Raises:
+            FailedToFindDevice: no matching camera was discovered in time
+
+        Returns:
+            DiscoveredCamera[BleDevice]: claimed camera
+        """
+
+        async def find() -> DiscoveredCamera[BleDevice]:
+            while True:
+                changed = self._changed
+                for camera in self.cameras:
+                    if not camera.claimed and camera.name and token.match(camera.name):
+                        return camera
+                await changed.wait()
+
+        try:
+            camera = await asyncio.wait_for(find(), timeout)
+        except asyncio.TimeoutError as e:
+            raise FailedToFindDevice from e
+        camera.claimed = True
+        logger.info(f"Claimed discovered device {camera.name} ({camera.address})")
+        return camera
+
+    def release(self, camera: DiscoveredCamera[BleDevice]) -> None:
+        """Release a claimed camera so that it can be claimed again
+
+        Args:
+            camera (DiscoveredCamera[BleDevice]): camera to release
+        """
+        camera.claimed = False
+        self._notify_changed()
+
+    def _notify_changed(self) -> None:
+        """Wake all claims that are waiting for the registry to change"""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _handle_advertisement(self, device: BleDevice, advertisement: Advertisement) -> None:
+        """Update the registry with an advertisement, only decoding what changed
+
+        Args:
+            device (BleDevice): advertising device
+            advertisement (Advertisement): received advertisement
+        """
+        self._advertisements += 1
+        if changed := not (camera := self._cameras.get(advertisement.address)):
+            camera = self._cameras[advertisement.address] = DiscoveredCamera(device, advertisement.address)
+            logger.info(f"Discovered: {advertisement.address}")
+        camera.last_seen = time.monotonic()
+        if advertisement.rssi is not None:
+            camera.rssi = advertisement.rssi
+
+        if advertisement.name and advertisement.name != camera.name:
+            camera.name = advertisement.name
+            changed = True
+        if (
+            manufacturer_data := advertisement.manufacturer_data.get(GOPRO_COMPANY_ID)
+        ) is not None and manufacturer_data != camera._manufacturer_data:
+            camera._manufacturer_data = manufacturer_data
+            try:
+                camera.status = decode_manufacturer_data(bytes(manufacturer_data))
+            except ValueError as e:
+                logger.warning(f"Failed to decode manufacturer data from {advertisement.address}: {e}")
+            changed = True
+        if (
+            service_data := advertisement.service_data.get(GOPRO_SERVICE_DATA_UUID)
+        ) is not None and service_data != camera._service_data:
+            camera._service_data = service_data
+            camera.ap_mac_address = service_data[:4].hex(":")
+            camera.partial_serial_number = service_data[4:].decode("utf-8", errors="replace")
+            changed = True
+
+        if changed:
+            self._decoded += 1
+            self._notify_changed()
@@ -0,0 +1,109 @@
+# ble_fragment.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Fragment BLE messages into packets"""
+
+from __future__ import annotations
+
+import functools
+import logging
+from typing import Final
+
+from open_gopro.models import GoProBlePacketHeader
+
+logger = logging.getLogger(__name__)
+
+MAX_BLE_PKT_LEN: Final = 20
+"""Most bytes (including the header) per packet"""
+
+MAX_EXT_13_LEN: Final = 2**13 - 1
+"""Payloads shorter than this are sent with an extended 13-bit header. Longer ones use an extended 16-bit header."""
+
+MAX_EXT_16_LEN: Final = 2**16 - 1
+"""Payloads must be shorter than this"""
+
+MAX_CACHED_LEN: Final = 256
+"""Payloads up to this length are memoized"""
+
+CACHE_SIZE: Final = 512
+"""Most payloads to memoize"""
+
+_CONTINUATION: Final = 0x80
+_EXT_13: Final = GoProBlePacketHeader.EXT_13.value << 5
+_EXT_16: Final = GoProBlePacketHeader.EXT_16.value << 5
+
+
+def fragment(data: bytes | bytearray | memoryview) -> tuple[bytes, ...]:
+    """Fragment a payload into packets of at most MAX_BLE_PKT_LEN bytes
+
+    The first packet starts with an extended 13-bit (or 16-bit for long payloads) length header and each following
+    packet starts with a continuation header.
+
+    Most messages (i.e. shutter, keep alive, and status / setting queries) always have the same payload so the
+    packets of short payloads are memoized. The returned packets must not be modified. Payloads must be shorter
+    than MAX_EXT_16_LEN bytes.
+
+    Args:
+        data (bytes | bytearray | memoryview): payload to fragment
+
+    Returns:
+        tuple[bytes, ...]: packets (none if the payload is empty)
+    """
+    if len(data) <= MAX_CACHED_LEN:
+        return _fragment_cached(bytes(data))
+    return _fragment(data)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _fragment_cached(data: bytes) -> tuple[bytes, ...]:
+    """Memoized fragment
+
+    Args:
+        data (bytes): payload to fragment
+
+    Returns:
+        tuple[bytes, ...]: packets
+    """
+    return _fragment(data)
+
+
+def _fragment(data: bytes | bytearray | memoryview) -> tuple[bytes, ...]:
+    """Fragment a payload into packets by writing each header and chunk into one preallocated buffer
+
+    Every packet but the last is exactly MAX_BLE_PKT_LEN bytes so the packets are consecutive slices of the buffer.
+
+    Args:
+        data (bytes | bytearray | memoryview): payload to fragment
+
+    Raises:
+        ValueError: data is too long
+
+    Returns:
+        tuple[bytes, ...]: packets
+    """
+    if not (length := len(data)):
+        return ()
+    if length < MAX_EXT_13_LEN:
+        header: tuple[int, ...] = (_EXT_13 | (length >> 8), length & 0xFF)
+    elif length < MAX_EXT_16_LEN:
+        header = (_EXT_16, length >> 8, length & 0xFF)
+    else:
+        raise ValueError(f"Data length {length} is too long")
+
+    # Most messages fit in one packet
+    if length <= (first := MAX_BLE_PKT_LEN - len(header)):
+        return (bytes(header) + data,)
+    # Each continuation packet carries one header byte and MAX_BLE_PKT_LEN - 1 payload bytes
+    continuations = -(-(length - first) // (MAX_BLE_PKT_LEN - 1))
+    buffer = bytearray(len(header) + length + continuations)
+    output, source = memoryview(buffer), memoryview(data).cast("B")
+    output[: len(header)] = bytes(header)
+    output[len(header) : len(header) + first] = source[:first]
+    written, read = len(header) + first, first
+    while read < length:
+        chunk = min(length - read, MAX_BLE_PKT_LEN - 1)
+        output[written] = _CONTINUATION
+        output[written + 1 : written + 1 + chunk] = source[read : read + chunk]
+        written += 1 + chunk
+        read += chunk
+    return tuple(bytes(output[start : start + MAX_BLE_PKT_LEN]) for start in range(0, len(buffer), MAX_BLE_PKT_LEN))
@@ -0,0 +1,158 @@
+# ble_ingest.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Buffer received BLE notifications and hand them to the event loop in batches"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Final
+
+logger = logging.getLogger(__name__)
+
+Notification = tuple[int, bytearray]
+"""Attribute handle that a notification was received on and its data"""
+
+
+@dataclass(frozen=True)
+class IngestStats:
+    """Notification ingestion instrumentation"""
+
+    packets: int  #: notifications that have been handled
+    batches: int  #: batches that the notifications were handled in
+    depth: int  #: notifications currently waiting to be handled
+    max_depth: int  #: most notifications that were waiting to be handled at once
+    mean_latency: float  #: mean seconds from receiving a notification until it was handled
+    max_latency: float  #: most seconds from receiving a notification until it was handled
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Mean notifications handled per batch
+
+        Returns:
+            float: batch size
+        """
+        return self.packets / self.batches if self.batches else 0
+
+
+class NotificationIngest:
+    """Buffer of received BLE notifications that is drained in batches by one long-lived task
+
+    Notifications can be put from any thread (i.e. the BLE backend's callback thread). Each is appended to a
+    buffer and the event loop is only woken if a drain is not already pending, so a burst of notifications costs one
+    cross-thread wakeup instead of one task per notification. The consumer task is started on the first
+    notification.
+
+    Notifications are handled in the order that they were received, so packets on each characteristic are always
+    accumulated in order. Batches are limited to max_batch notifications and the consumer yields between batches so
+    that a flood of notifications does not starve the rest of the event loop.
+
+    Attributes:
+        DEFAULT_MAX_BATCH (Final[int]): default most notifications to handle per batch
+
+    Args:
+        handler (Callable[[list[Notification]], None]): called in the event loop with each batch of notifications.
+            It must not block.
+        max_batch (int): most notifications to handle per batch. Defaults to DEFAULT_MAX_BATCH.
+    """
+
+    DEFAULT_MAX_BATCH: Final[int] = 256
+
+    def __init__(self, handler: Callable[[list[Notification]], None], max_batch: int = DEFAULT_MAX_BATCH) -> None:
+        self._handler = handler
+        self._max_batch = max_batch
+        # Appending and popping from opposite ends of a deque is thread-safe
+        self._buffer: deque[tuple[float, int, bytearray]] = deque()
+        self._consumer: asyncio.Task | None = None
+        self._ready = asyncio.Event()
+        self._wake_pending = False
+        self._packets = 0
+        self._batches = 0
+        self._max_depth = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    @property
+    def stats(self) -> IngestStats:
+        """Get the ingestion instrumentation
+
+        Returns:
+            IngestStats: current statistics
+        """
+        return IngestStats(
+            packets=self._packets,
+            batches=self._batches,
+            depth=len(self._buffer),
+            max_depth=self._max_depth,
+            mean_latency=self._total_latency / self._packets if self._packets else 0,
+            max_latency=self._max_latency,
+        )
+
+    def put(self, loop: asyncio.AbstractEventLoop, handle: int, data: bytearray) -> None:
+        """Receive a notification. This is thread-safe.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): event loop to handle the notification in
+            handle (int): attribute handle that the notification was received on
+            data (bytearray): received data
+        """
+        self._buffer.append((time.perf_counter(), handle, data))
+        if (depth := len(self._buffer)) > self._max_depth:
+            self._max_depth = depth
+        # A pending wake will drain this notification since the flag is cleared before draining
+        if not self._wake_pending:
+            self._wake_pending = True
+            loop.call_soon_threadsafe(self._wake)
+
+    async def stop(self) -> None:
+        """Stop the consumer task and discard any notifications that have not been handled"""
+        if self._consumer:
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+            self._consumer = None
+        self._buffer.clear()
+        self._wake_pending = False
+
+    def _wake(self) -> None:
+        """Wake the consumer task (starting it if needed) from the event loop"""
+        loop = asyncio.get_running_loop()
+        if not self._consumer or self._consumer.done() or self._consumer.get_loop() is not loop:
+            self._ready = asyncio.Event()
+            self._consumer = loop.create_task(self._consume())
+        self._ready.set()
+
+    async def _consume(self) -> None:
+        """Drain the buffer each time it is woken"""
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            self._wake_pending = False
+            while self._buffer:
+                self._drain()
+                await asyncio.sleep(0)
+
+    def _drain(self) -> None:
+        """Handle the oldest buffered notifications as one batch"""
+        if not (count := min(len(self._buffer), self._max_batch)):
+            return
+        batch: list[Notification] = []
+        now = time.perf_counter()
+        for _ in range(count):
+            received, handle, data = self._buffer.popleft()
+            batch.append((handle, data))
+            latency = now - received
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+        self._packets += count
+        self._batches += 1
+        try:
+            self._handler(batch)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.exception(f"Failed to handle notifications: {repr(e)}")
@@ -0,0 +1,172 @@
+# ble_multiplexer.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Track outstanding BLE requests so that requests on independent characteristics can be pipelined"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Final
+
+from open_gopro.ble import BleUUID
+from open_gopro.constants import GoProUUID
+from open_gopro.models import GoProResp
+from open_gopro.types import ResponseType
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_UUIDS: Final[dict[BleUUID, BleUUID]] = {
+    GoProUUID.CQ_COMMAND: GoProUUID.CQ_COMMAND_RESP,
+    GoProUUID.CQ_SETTINGS: GoProUUID.CQ_SETTINGS_RESP,
+    GoProUUID.CQ_QUERY: GoProUUID.CQ_QUERY_RESP,
+    GoProUUID.CQ_SENSOR: GoProUUID.CQ_SENSOR_RESP,
+    GoProUUID.CM_NET_MGMT_COMM: GoProUUID.CN_NET_MGMT_RESP,
+}
+"""Characteristic that the responses to each request characteristic are notified on"""
+
+
+def response_uuid(uuid: BleUUID) -> BleUUID:
+    """Get the characteristic that responses to a request characteristic are received on
+
+    Args:
+        uuid (BleUUID): characteristic that the request is written to
+
+    Returns:
+        BleUUID: response characteristic (the request characteristic itself if it is not a known request
+        characteristic)
+    """
+    return RESPONSE_UUIDS.get(uuid, uuid)
+
+
+class BleRequestMultiplexer:
+    """Match BLE responses to their outstanding requests per response characteristic and identifier
+
+    Requests are limited to a pipeline depth per request characteristic. Since the camera processes each
+    characteristic's requests in order, responses with the same identifier on the same characteristic are matched
+    in the order their requests were sent. Responses on different characteristics, or with different identifiers,
+    can be matched in any order.
+
+    Attributes:
+        DEFAULT_DEPTH (Final[int]): default maximum outstanding requests per characteristic
+
+    Args:
+        depth (int): default maximum outstanding requests per characteristic. Defaults to DEFAULT_DEPTH.
+        depths (dict[BleUUID, int] | None): per-characteristic overrides of the maximum outstanding requests.
+            Defaults to None.
+    """
+
+    DEFAULT_DEPTH: Final[int] = 1
+
+    def __init__(self, depth: int = DEFAULT_DEPTH, depths: dict[BleUUID, int] | None = None) -> None:
+        self._depth = depth
+        self._depths = depths or {}
+        self._slots: dict[BleUUID, asyncio.Semaphore] = {}
+        # (response UUID, identifier value) --> futures of requests waiting for that response, in send order
+        self._pending: defaultdict[tuple[BleUUID, ResponseType | int], deque[asyncio.Future[GoProResp]]] = defaultdict(
+            deque
+        )
+
+    @staticmethod
+    def _key(uuid: BleUUID, identifier: ResponseType) -> tuple[BleUUID, ResponseType | int]:
+        """Build the key that a request's response is matched on
+
+        Enum identifiers are matched by value since some responses are identified with a different enum than their
+        request (i.e. CmdId.REGISTER_ALL_STATUSES is responded to with QueryCmdId.REG_STATUS_VAL_UPDATE) and
+        GoProIntEnum hashes include the member name.
+
+        Args:
+            uuid (BleUUID): response characteristic
+            identifier (ResponseType): request / response identifier
+
+        Returns:
+            tuple[BleUUID, ResponseType | int]: matching key
+        """
+        return (uuid, int(identifier) if isinstance(identifier, int) else identifier)
+
+    def depth(self, uuid: BleUUID) -> int:
+        """Get the maximum outstanding requests on a characteristic
+
+        Args:
+            uuid (BleUUID): request characteristic
+
+        Returns:
+            int: pipeline depth
+        """
+        return self._depths.get(uuid, self._depth)
+
+    @property
+    def outstanding(self) -> int:
+        """Number of requests that are waiting for a response
+
+        Returns:
+            int: request count
+        """
+        return sum(len(futures) for futures in self._pending.values())
+
+    @asynccontextmanager
+    async def slot(self, uuid: BleUUID) -> AsyncIterator[None]:
+        """Hold one of a characteristic's pipeline slots, waiting for one to become available if needed
+
+        Args:
+            uuid (BleUUID): request characteristic
+
+        Yields:
+            None: the slot is held until the context exits
+        """
+        if (slot := self._slots.get(uuid)) is None:
+            slot = self._slots[uuid] = asyncio.Semaphore(self.depth(uuid))
+        async with slot:
+            yield
+
+    def expect(self, uuid: BleUUID, identifier: ResponseType) -> asyncio.Future[GoProResp]:
+        """Register a request that is about to be written
+
+        Args:
+            uuid (BleUUID): characteristic that the request will be written to
+            identifier (ResponseType): identifier of the expected response
+
+        Returns:
+            asyncio.Future[GoProResp]: completed with the response once it is received
+        """
+        future: asyncio.Future[GoProResp] = asyncio.get_running_loop().create_future()
+        self._pending[self._key(response_uuid(uuid), identifier)].append(future)
+        return future
+
+    def discard(self, future: asyncio.Future[GoProResp]) -> None:
+        """Stop waiting for a request's response (i.e. after it has timed out)
+
+        A response that arrives later will then not be matched to a subsequent request with the same identifier.
+
+        Args:
+            future (asyncio.Future[GoProResp]): future returned from expect
+        """
+        for key, futures in self._pending.items():
+            if future in futures:
+                futures.remove(future)
+                if not futures:
+                    del self._pending[key]
+                return
+
+    def resolve(self, uuid: BleUUID, response: GoProResp) -> bool:
+        """Complete the oldest outstanding request that is waiting for this response
+
+        Args:
+            uuid (BleUUID): characteristic that the response was received on
+            response (GoProResp): parsed response
+
+        Returns:
+            bool: True if the response was awaited by a request, False otherwise (i.e. it is asynchronous)
+        """
+        key = self._key(uuid, response.identifier)
+        if not (futures := self._pending.get(key)):
+            return False
+        future = futures.popleft()
+        if not futures:
+            del self._pending[key]
+        if future.done():  # The requester has stopped waiting
+            return False
+        future.set_result(response)
+        return True
@@ -0,0 +1,380 @@
+# command_metrics.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Per-command latency, lock contention, retry, and queue depth instrumentation of a camera
+
+Each message that is sent is timed in phases:
+
+- wait: waiting for the camera to be ready (i.e. for the ready lock)
+- slot: waiting for a BLE pipeline slot of the message's characteristic
+- transmit: writing the BLE packets / sending the HTTP request and receiving its response
+- response: waiting for the BLE response after the request was written (including reassembly)
+- parse: building the response from the received BLE packets / HTTP response
+- encoding: waiting for encoding to start after a command that starts encoding
+- total: the complete send
+
+The ready lock of a wireless camera is recorded as the "ready_lock" lock (waited for and held by messages). The
+sampled queues are "messages" (messages already being sent when a message is sent), "ble_requests" (BLE requests
+waiting for their response when a BLE request is written), and "ble_notifications" (BLE notifications handled per
+batch).
+
+Metrics are not collected until they are enabled:
+
+>>> gopro = WirelessGoPro(command_metrics=True)
+>>> ...
+>>> snapshot = gopro.command_metrics.snapshot()
+>>> print(snapshot.commands[("CmdId.SET_SHUTTER", "total")].percentile(99))
+>>> print(to_openmetrics({gopro.identifier: gopro.command_metrics}))
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Final, Iterator, Mapping
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """HDR-style histogram with a bounded relative error across any range of values
+
+    Values are quantized to the resolution and counted in buckets whose width doubles every 2 ** (SUB_BUCKET_BITS - 1)
+    buckets, so each bucket's bounds are within 1 / 2 ** (SUB_BUCKET_BITS - 1) of the values counted in it. Values
+    below 2 ** SUB_BUCKET_BITS resolutions are counted exactly. Recording is constant-time and only buckets that have
+    been recorded to use memory.
+
+    Attributes:
+        SUB_BUCKET_BITS (Final[int]): bits of precision kept for each value, which bounds the relative error
+
+    Args:
+        resolution (float): smallest distinguishable value (i.e. 1e-6 for microseconds). Defaults to 1e-6.
+    """
+
+    SUB_BUCKET_BITS: Final[int] = 6
+
+    def __init__(self, resolution: float = 1e-6) -> None:
+        self.resolution = resolution
+        self._buckets: Counter[int] = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"LatencyHistogram(count={self.count}, mean={self.mean:g}, p50={self.percentile(50):g}, "
+            f"p99={self.percentile(99):g}, max={self.max:g})"
+        )
+
+    @classmethod
+    def _index(cls, quantized: int) -> int:
+        """Get the bucket that a quantized value is counted in
+
+        Args:
+            quantized (int): value in resolutions
+
+        Returns:
+            int: bucket index
+        """
+        if (shift := quantized.bit_length() - cls.SUB_BUCKET_BITS) <= 0:
+            return quantized
+        return (shift << cls.SUB_BUCKET_BITS) + (quantized >> shift)
+
+    @classmethod
+    def _bounds(cls, index: int) -> tuple[int, int]:
+        """Get the quantized range of values that a bucket counts
+
+        Args:
+            index (int): bucket index
+
+        Returns:
+            tuple[int, int]: lower (inclusive) and upper (exclusive) bound in resolutions
+        """
+        shift, mantissa = index >> cls.SUB_BUCKET_BITS, index & ((1 << cls.SUB_BUCKET_BITS) - 1)
+        return mantissa << shift, (mantissa + 1) << shift
+
+    @property
+    def mean(self) -> float:
+        """Mean of the recorded values
+
+        Returns:
+            float: mean (0 if nothing was recorded)
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def record(self, value: float) -> None:
+        """Count a value
+
+        Args:
+            value (float): value to count. Negative values are counted as 0.
+        """
+        value = max(value, 0.0)
+        self._buckets[self._index(int(value / self.resolution))] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add the counts of another histogram with the same resolution
+
+        Args:
+            other (LatencyHistogram): histogram to add
+
+        Raises:
+            ValueError: the histograms have different resolutions
+        """
+        if other.resolution != self.resolution:
+            raise ValueError("Can not merge histograms with different resolutions")
+        self._buckets.update(other._buckets)
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percentile: float) -> float:
+        """Get the value that a percentage of the recorded values are at or below
+
+        Args:
+            percentile (float): percentage in [0, 100]
+
+        Returns:
+            float: upper bound of the bucket that the percentile is in, limited to the recorded range. 0 if nothing
+            was recorded.
+        """
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(self.count * percentile / 100))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= target:
+                return min(max(self._bounds(index)[1] * self.resolution, self.min), self.max)
+        return self.max
+
+    def buckets(self) -> Iterator[tuple[float, float, int]]:
+        """Iterate the buckets that have been recorded to in ascending order
+
+        Yields:
+            tuple[float, float, int]: lower (inclusive) bound, upper (exclusive) bound, and count of each bucket
+        """
+        for index in sorted(self._buckets):
+            lower, upper = self._bounds(index)
+            yield lower * self.resolution, upper * self.resolution, self._buckets[index]
+
+    def cumulative(self, bounds: tuple[float, ...]) -> list[int]:
+        """Get the amount of values at or below each bound, to the precision of the buckets
+
+        Args:
+            bounds (tuple[float, ...]): ascending bounds
+
+        Returns:
+            list[int]: count for each bound
+        """
+        counts = [0] * len(bounds)
+        for lower, _, count in self.buckets():
+            for i, bound in enumerate(bounds):
+                if lower <= bound:
+                    counts[i] += count
+        return counts
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Copy of a camera's metrics at a point in time"""
+
+    commands: dict[tuple[str, str], LatencyHistogram]  #: (command, phase) --> seconds
+    locks: dict[tuple[str, str], LatencyHistogram]  #: (lock, "wait" or "hold") --> seconds
+    depths: dict[str, LatencyHistogram]  #: queue --> depth sampled each time the queue was used
+    retries: dict[str, int]  #: command --> amount of retried sends
+
+
+class CommandMetrics:
+    """Collect the metrics of one camera
+
+    All recording methods return immediately unless the metrics are enabled, so instrumented code does not need to
+    check. It can be enabled or disabled at any time.
+
+    Args:
+        enabled (bool): collect metrics. Defaults to False.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        #: messages currently being sent (maintained by the GoPro while enabled)
+        self.in_flight = 0
+        self._commands: dict[tuple[str, str], LatencyHistogram] = {}
+        self._locks: dict[tuple[str, str], LatencyHistogram] = {}
+        self._depths: dict[str, LatencyHistogram] = {}
+        self._retries: Counter[str] = Counter()
+
+    def record(self, command: Any, phase: str, seconds: float) -> None:
+        """Record how long a phase of sending a command took
+
+        Args:
+            command (Any): command identifier
+            phase (str): phase name
+            seconds (float): duration
+        """
+        if self.enabled:
+            key = (str(command), phase)
+            if (histogram := self._commands.get(key)) is None:
+                histogram = self._commands[key] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def record_lock(self, lock: str, kind: str, seconds: float) -> None:
+        """Record how long a lock was waited for or held
+
+        Args:
+            lock (str): lock name
+            kind (str): "wait" or "hold"
+            seconds (float): duration
+        """
+        if self.enabled:
+            if (histogram := self._locks.get((lock, kind))) is None:
+                histogram = self._locks[(lock, kind)] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def record_depth(self, queue: str, depth: int) -> None:
+        """Record the depth of a queue
+
+        Args:
+            queue (str): queue name
+            depth (int): amount of items in the queue
+        """
+        if self.enabled:
+            if (histogram := self._depths.get(queue)) is None:
+                histogram = self._depths[queue] = LatencyHistogram(resolution=1)
+            histogram.record(depth)
+
+    def record_retry(self, command: Any) -> None:
+        """Count a retried send of a command
+
+        Args:
+            command (Any): command identifier
+        """
+        if self.enabled:
+            self._retries[str(command)] += 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Copy the current metrics
+
+        Returns:
+            MetricsSnapshot: copied metrics
+        """
+        return MetricsSnapshot(
+            commands=copy.deepcopy(self._commands),
+            locks=copy.deepcopy(self._locks),
+            depths=copy.deepcopy(self._depths),
+            retries=dict(self._retries),
+        )
+
+    def reset(self) -> None:
+        """Discard all collected metrics"""
+        self._commands.clear()
+        self._locks.clear()
+        self._depths.clear()
+        self._retries.clear()
+
+
+LATENCY_BOUNDS: Final = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Exported bucket bounds (seconds) of the latency histograms"""
+
+DEPTH_BOUNDS: Final = (0.0, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0, 128.0, 256.0)
+"""Exported bucket bounds of the queue depth histograms"""
+
+
+def _escape(value: str) -> str:
+    """Escape an OpenMetrics label value
+
+    Args:
+        value (str): label value
+
+    Returns:
+        str: escaped value
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(name: str, labels: str, histogram: LatencyHistogram, bounds: tuple[float, ...]) -> list[str]:
+    """Build the samples of one histogram
+
+    Args:
+        name (str): metric family name
+        labels (str): label set (without braces)
+        histogram (LatencyHistogram): histogram to export
+        bounds (tuple[float, ...]): bucket bounds
+
+    Returns:
+        list[str]: sample lines
+    """
+    lines = [
+        f'{name}_bucket{{{labels},le="{bound:g}"}} {count}'
+        for bound, count in zip(bounds, histogram.cumulative(bounds))
+    ]
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    lines.append(f"{name}_sum{{{labels}}} {histogram.total:g}")
+    return lines
+
+
+def to_openmetrics(cameras: Mapping[str, CommandMetrics | MetricsSnapshot]) -> str:
+    """Export the metrics of cameras in the OpenMetrics text format
+
+    Histogram buckets are counted to the precision of the collected histograms.
+
+    Args:
+        cameras (Mapping[str, CommandMetrics | MetricsSnapshot]): camera label --> its metrics
+
+    Returns:
+        str: exposition (terminated with "# EOF")
+    """
+    snapshots = {
+        _escape(camera): metrics.snapshot() if isinstance(metrics, CommandMetrics) else metrics
+        for camera, metrics in cameras.items()
+    }
+    lines = [
+        "# TYPE gopro_command_seconds histogram",
+        "# UNIT gopro_command_seconds seconds",
+        "# HELP gopro_command_seconds Duration of each phase of sending a command.",
+    ]
+    for camera, snapshot in snapshots.items():
+        for (command, phase), histogram in snapshot.commands.items():
+            labels = f'camera="{camera}",command="{_escape(command)}",phase="{_escape(phase)}"'
+            lines.extend(_histogram_lines("gopro_command_seconds", labels, histogram, LATENCY_BOUNDS))
+    lines.extend(
+        [
+            "# TYPE gopro_lock_seconds histogram",
+            "# UNIT gopro_lock_seconds seconds",
+            "# HELP gopro_lock_seconds Time spent waiting for or holding a lock.",
+        ]
+    )
+    for camera, snapshot in snapshots.items():
+        for (lock, kind), histogram in snapshot.locks.items():
+            labels = f'camera="{camera}",lock="{_escape(lock)}",kind="{_escape(kind)}"'
+            lines.extend(_histogram_lines("gopro_lock_seconds", labels, histogram, LATENCY_BOUNDS))
+    lines.extend(
+        [
+            "# TYPE gopro_queue_depth histogram",
+            "# HELP gopro_queue_depth Depth of a queue each time it was used.",
+        ]
+    )
+    for camera, snapshot in snapshots.items():
+        for queue, histogram in snapshot.depths.items():
+            labels = f'camera="{camera}",queue="{_escape(queue)}"'
+            lines.extend(_histogram_lines("gopro_queue_depth", labels, histogram, DEPTH_BOUNDS))
+    lines.extend(
+        [
+            "# TYPE gopro_command_retries counter",
+            "# HELP gopro_command_retries Retried sends of a command.",
+        ]
+    )
+    for camera, snapshot in snapshots.items():
+        for command, retries in snapshot.retries.items():
+            lines.append(f'gopro_command_retries_total{{camera="{camera}",command="{_escape(command)}"}} {retries}')
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
@@ -11,11 +11,9 @@ import logging
 import re
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Generic, Iterator, Pattern, Protocol, TypeVar
+from typing import Any, Generic, Pattern, Protocol, TypeVar
 from urllib.parse import urlencode
 
-from construct import Bit, BitsInteger, BitStruct, Const, Construct, Padding
-
 from open_gopro.ble import (
     BleClient,
     BLEController,
@@ -25,8 +23,9 @@ from open_gopro.ble import (
     DisconnectHandlerType,
     NotiHandlerType,
 )
+from open_gopro.ble_fragment import fragment
 from open_gopro.constants import GoProUUID
-from open_gopro.models import GoProBlePacketHeader, GoProResp
+from open_gopro.models import GoProResp
 from open_gopro.parser_interface import (
     BytesParser,
     BytesTransformer,
@@ -52,6 +51,8 @@ class MessageRules:
         fastpass_analyzer (Analyzer): Analyzer to decide if the message is fastpass. Defaults to always_false.
         wait_for_encoding_analyzer (Analyzer): Analyzer to decide if the message should wait for encoding.
             Defaults to always_false.
+        read_only_analyzer (Analyzer): Analyzer to decide if the message only reads from the camera (and so can not
+            change whether it is ready). Defaults to always_false.
     """
 
     class Analyzer(Protocol):
@@ -71,10 +72,14 @@ class MessageRules:
     always_true: Analyzer = lambda **kwargs: True
 
     def __init__(
-        self, fastpass_analyzer: Analyzer = always_false, wait_for_encoding_analyzer: Analyzer = always_false
+        self,
+        fastpass_analyzer: Analyzer = always_false,
+        wait_for_encoding_analyzer: Analyzer = always_false,
+        read_only_analyzer: Analyzer = always_false,
     ) -> None:
         self._analyze_fastpass = fastpass_analyzer
         self._analyze_wait_for_encoding = wait_for_encoding_analyzer
+        self._analyze_read_only = read_only_analyzer
 
     def is_fastpass(self, **kwargs: Any) -> bool:
         """Is this command fastpass?
@@ -98,6 +103,17 @@ class MessageRules:
         """
         return self._analyze_wait_for_encoding(**kwargs)
 
+    def is_read_only(self, **kwargs: Any) -> bool:
+        """Does this message only read from the camera?
+
+        Args:
+            **kwargs (Any) : Arguments passed into the message
+
+        Returns:
+            bool: result of rule check
+        """
+        return self._analyze_read_only(**kwargs)
+
 
 ##############################################################################################################
 ####### Communicators / Clients
@@ -288,60 +304,17 @@ class GoProBle(BaseGoProCommunicator, Generic[BleHandle, BleDevice]):
             GoProResp: response parsed from bytes read from characteristic
         """
 
-    # TODO this should be somewhere else
     @classmethod
-    def _fragment(cls, data: bytes) -> Iterator[bytes]:
+    def _fragment(cls, data: bytes | bytearray) -> tuple[bytes, ...]:
         """Fragment data in to MAX_BLE_PKT_LEN length packets
 
         Args:
-            data (bytes): data to fragment
-
-        Raises:
-            ValueError: data is too long
+            data (bytes | bytearray): data to fragment
 
-        Yields:
-            bytes: packet as bytes
+        Returns:
+            tuple[bytes, ...]: packets. These are shared between calls with the same data so must not be modified.
         """
-        MAX_BLE_PKT_LEN = 20
-
-        extended_13_header = BitStruct(
-            "continuation" / Const(0, Bit),
-            "header" / Const(GoProBlePacketHeader.EXT_13.value, BitsInteger(2)),
-            "length" / BitsInteger(13),
-        )
-
-        extended_16_header = BitStruct(
-            "continuation" / Const(0, Bit),
-            "header" / Const(GoProBlePacketHeader.EXT_16.value, BitsInteger(2)),
-            "padding" / Padding(5),
-            "length" / BitsInteger(16),
-        )
-
-        continuation_header = BitStruct(
-            "continuation" / Const(1, Bit),
-            "padding" / Padding(7),
-        )
-
-        header: Construct
-        if (data_len := len(data)) < (2**13 - 1):
-            header = extended_13_header
-        elif data_len < (2**16 - 1):
-            header = extended_16_header
-        else:
-            raise ValueError(f"Data length {data_len} is too long")
-
-        assert header
-        while data:
-            if header == continuation_header:
-                packet = bytearray(header.build({}))
-            else:
-                packet = bytearray(header.build({"length": data_len}))
-                header = continuation_header
-
-            bytes_remaining = MAX_BLE_PKT_LEN - len(packet)
-            current, data = (data[:bytes_remaining], data[bytes_remaining:])
-            packet.extend(current)
-            yield bytes(packet)
+        return fragment(data)
 
 
 class GoProWiredInterface(BaseGoProCommunicator):
@@ -537,6 +510,7 @@ class HttpMessage(Message):
                     if kwargs[k] is not None
                 },
                 safe="/",
+                doseq=True,
             )
         ):
             url += "?" + arg_part
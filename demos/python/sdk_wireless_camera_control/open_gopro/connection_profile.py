@@ -0,0 +1,165 @@
+# connection_profile.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Persistent per-camera connection profiles used to reconnect without rediscovering the camera"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Pattern
+
+from open_gopro.models import CohnInfo
+from open_gopro.types import JsonDict
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CohnProfile:
+    """Camera on the Home Network credentials from a previous connection"""
+
+    ip_address: str  #: camera's IP address on the home network
+    username: str  #: basic auth username
+    password: str  #: basic auth password
+    certificate: str  #: camera's SSL certificate
+
+    @classmethod
+    def from_cohn_info(cls, info: CohnInfo) -> CohnProfile:
+        """Build from the COHN info of an open camera
+
+        Args:
+            info (CohnInfo): COHN info to store
+
+        Returns:
+            CohnProfile: storable COHN credentials
+        """
+        return cls(info.ip_address, info.username, info.password, info.certificate)
+
+
+@dataclass
+class ConnectionProfile:
+    """Everything that was discovered about a camera while opening it that can be reused on the next open"""
+
+    identifier: str  #: BLE identifier of the camera (also matched against the target when searching)
+    address: Any = None  #: BLE controller specific address to connect to without scanning
+    gatt_db: JsonDict | None = None  #: serialized GATT table (see GattDB.as_dict)
+    api_version: str | None = None  #: Open GoPro API version
+    ssid: str | None = None  #: camera access point SSID
+    password: str | None = None  #: camera access point password
+    cohn: CohnProfile | None = None  #: Camera on the Home Network credentials
+    updated: float = field(default_factory=time.time)  #: time (seconds since epoch) that the profile was saved
+
+    @classmethod
+    def from_dict(cls, data: JsonDict) -> ConnectionProfile:
+        """Build from a dict that was stored with asdict
+
+        Args:
+            data (JsonDict): stored profile
+
+        Returns:
+            ConnectionProfile: profile
+        """
+        cohn = data.pop("cohn", None)
+        return cls(**data, cohn=CohnProfile(**cohn) if cohn else None)
+
+
+class ConnectionProfileStore:
+    """Directory of JSON connection profiles, one file per camera
+
+    Note that profiles contain the camera's access point and COHN credentials in plain text.
+
+    Args:
+        directory (Path | str): directory to store profiles in. It is created if it does not exist.
+    """
+
+    def __init__(self, directory: Path | str) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, identifier: str) -> Path:
+        """Get the file that a camera's profile is stored in
+
+        Args:
+            identifier (str): BLE identifier of the camera
+
+        Returns:
+            Path: profile file (with any characters that are not safe in a file name replaced)
+        """
+        return self._directory / f"{re.sub(r'[^A-Za-z0-9_-]', '_', identifier)}.json"
+
+    def load(self, identifier: str) -> ConnectionProfile | None:
+        """Load a camera's profile
+
+        Args:
+            identifier (str): BLE identifier of the camera
+
+        Returns:
+            ConnectionProfile | None: profile or None if there is no (valid) profile for this camera
+        """
+        return self._read(self._path(identifier))
+
+    def find(self, target: Pattern | None = None) -> ConnectionProfile | None:
+        """Find the most recently saved profile of a camera whose identifier matches a target
+
+        Args:
+            target (Pattern | None): regex to search identifiers for. Defaults to None (match any camera).
+
+        Returns:
+            ConnectionProfile | None: matching profile or None if no profile matches
+        """
+        profiles = [
+            profile
+            for path in self._directory.glob("*.json")
+            if (profile := self._read(path)) and (target is None or target.search(profile.identifier))
+        ]
+        return max(profiles, key=lambda profile: profile.updated, default=None)
+
+    def save(self, profile: ConnectionProfile) -> None:
+        """Save a camera's profile, replacing any previous profile for the camera
+
+        Profiles contain credentials so the file is only readable and writable by its owner.
+
+        Args:
+            profile (ConnectionProfile): profile to save
+        """
+        profile.updated = time.time()
+        path = self._path(profile.identifier)
+        temp = path.with_suffix(".tmp")
+        temp.unlink(missing_ok=True)
+        with os.fdopen(os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as fp:
+            fp.write(json.dumps(asdict(profile)))
+        # Replace atomically so that a concurrent open never reads a partial profile
+        os.replace(temp, path)
+        logger.debug(f"Saved connection profile for {profile.identifier}")
+
+    def remove(self, identifier: str) -> None:
+        """Remove a camera's profile (i.e. if it has been reset or re-paired)
+
+        Args:
+            identifier (str): BLE identifier of the camera
+        """
+        self._path(identifier).unlink(missing_ok=True)
+
+    @staticmethod
+    def _read(path: Path) -> ConnectionProfile | None:
+        """Read a profile from a file
+
+        Args:
+            path (Path): profile file
+
+        Returns:
+            ConnectionProfile | None: profile or None if the file does not exist or is not a valid profile
+        """
+        try:
+            return ConnectionProfile.from_dict(json.loads(path.read_text()))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Ignoring invalid connection profile {path}: {repr(e)}")
+            return None
@@ -6,12 +6,12 @@
 from __future__ import annotations
 
 import logging
-import queue
-import threading
-from typing import Any, Callable
+from typing import Callable
 
 import cv2
 
+from open_gopro.frame_source import FrameSource
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,52 +22,15 @@ def display_video_blocking(source: str, printer: Callable = print) -> None:
         source (str): video source to display
         printer (Callable): used to display output message. Defaults to print.
     """
-    BufferlessVideoCapture(source, printer)
-
-
-class BufferlessVideoCapture(threading.Thread):
-    """Buffer-less video capture to only display the most recent frame
-
-    Open a video source to display it, and block until the user stops it by sending 'q'
-
-    Args:
-        source (str): video source to display
-        printer (Callable): used to display output message. Defaults to print.
-    """
-
-    def __init__(self, source: str, printer: Callable = print) -> None:
-        self.printer = printer
-        self.printer("Starting viewer...")
-        self.cap = cv2.VideoCapture(source + "?overrun_nonfatal=1&fifo_size=50000000", cv2.CAP_FFMPEG)
-        self.q: queue.Queue[Any] = queue.Queue()
-        super().__init__(daemon=True)
-        self.start()
-        self.printer("Viewer started")
-        self.printer("Press 'q' in viewer to quit")
-        while True:
-            try:
-                frame = self.q.get()
-                cv2.imshow("frame", frame)
-                if cv2.waitKey(1) & 0xFF == ord("q"):
-                    break
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.warning(e)
-                break
-        self.cap.release()
-        cv2.destroyAllWindows()
-
-    def run(self) -> None:
-        """Read frames as soon as they are available, keeping only most recent one"""
-        while True:
-            try:
-                ret, frame = self.cap.read()
-                if not ret:
-                    self.printer("Received empty frame.")
-                    continue
-                if not self.q.empty():
-                    self.q.get_nowait()  # discard previous (unprocessed) frame
-                self.q.put(frame)
-            except queue.Empty:
-                pass
-            except:  # pylint: disable=bare-except
+    printer("Starting viewer...")
+    with FrameSource(source) as frames:
+        printer("Viewer started")
+        printer("Press 'q' in viewer to quit")
+        while not frames.is_finished:
+            # Keep the window responsive while waiting for frames
+            if frame := frames.read(timeout=0.1):
+                cv2.imshow("frame", frame.image)
+            if cv2.waitKey(1) & 0xFF == ord("q"):
                 break
+        printer(f"Viewer stopped: {frames.stats}")
+    cv2.destroyAllWindows()
@@ -0,0 +1,253 @@
+# downloader.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Parallel, resumable media download engine"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Final, TypeAlias
+
+from open_gopro.exceptions import DownloadFailed
+from open_gopro.http_transport import HttpTransport
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DownloadProgress:
+    """Snapshot of the progress of a file download"""
+
+    file: Path  #: local file being downloaded to
+    downloaded: int  #: bytes downloaded so far (including bytes resumed from a previous attempt)
+    total: int | None  #: total size in bytes if known
+    elapsed: float  #: seconds since the download started
+    resumed: int = 0  #: bytes that were already downloaded by a previous attempt
+
+    @property
+    def throughput(self) -> float:
+        """Average throughput of this download attempt
+
+        Returns:
+            float: throughput in bytes / second
+        """
+        return (self.downloaded - self.resumed) / self.elapsed if self.elapsed else 0.0
+
+
+DownloadProgressCb: TypeAlias = Callable[[DownloadProgress], None]
+"""Callback definition for download progress reports"""
+
+
+class RangedDownloader:
+    """Download a file by splitting it into concurrent HTTP Range requests
+
+    The output file is preallocated (sparsely where the filesystem allows) and a manifest of completed parts is
+    persisted next to it so that an interrupted download resumes where it left off. Resources that are smaller than
+    one part, or that do not support range requests, are downloaded with a single streamed request.
+
+    The amount of simultaneous part requests is bounded by the transport's per-host concurrency cap.
+
+    Attributes:
+        DEFAULT_PART_SIZE (Final[int]): default size in bytes of each range request
+        MANIFEST_SUFFIX (Final[str]): suffix appended to the output file's name for its manifest of completed parts
+
+    Args:
+        transport (HttpTransport): transport used to send requests
+        part_size (int): size in bytes of each range request. Defaults to DEFAULT_PART_SIZE.
+        progress_cb (DownloadProgressCb | None): called from the event loop as data is received. Defaults to None.
+    """
+
+    DEFAULT_PART_SIZE: Final[int] = 16 * 1024 * 1024
+    MANIFEST_SUFFIX: Final[str] = ".download.json"
+
+    def __init__(
+        self,
+        transport: HttpTransport,
+        part_size: int = DEFAULT_PART_SIZE,
+        progress_cb: DownloadProgressCb | None = None,
+    ) -> None:
+        self._transport = transport
+        self._part_size = part_size
+        self._progress_cb = progress_cb
+
+    @classmethod
+    def manifest_path(cls, file: Path) -> Path:
+        """Get the location of the resume manifest for a local file
+
+        Args:
+            file (Path): local file being downloaded to
+
+        Returns:
+            Path: location of manifest
+        """
+        return file.with_name(file.name + cls.MANIFEST_SUFFIX)
+
+    async def download(
+        self, url: str, file: Path, *, timeout: float, expected_size: int | None = None, **kwargs: Any
+    ) -> Path:
+        """Download a resource to a local file
+
+        Args:
+            url (str): full URL of resource
+            file (Path): local file to write to
+            timeout (float): time in seconds to wait for each response / chunk
+            expected_size (int | None): size in bytes that the file must be once downloaded (i.e. from the media
+                list). Defaults to None (verify against the size reported by the server).
+            **kwargs (Any): additional request arguments (headers, verify, etc.)
+
+        Raises:
+            DownloadFailed: the downloaded size does not match the expected size
+
+        Returns:
+            Path: the downloaded file
+        """
+        start = time.perf_counter()
+        size, supports_ranges = await self._transport.probe(url, timeout=timeout, **kwargs)
+        if expected_size is not None and size is not None and size != expected_size:
+            raise DownloadFailed(str(file), f"server reports {size} bytes but {expected_size} were expected")
+        size = size if size is not None else expected_size
+        progress = _ProgressTracker(file, size, start, self._progress_cb)
+
+        if size is None or not supports_ranges or size <= self._part_size:
+            await self._transport.download(url, file, timeout=timeout, on_chunk=progress.threadsafe_add, **kwargs)
+        else:
+            await self._download_parts(url, file, size, progress, timeout=timeout, **kwargs)
+
+        if size is not None and (actual := file.stat().st_size) != size:
+            raise DownloadFailed(str(file), f"received {actual} bytes but {size} were expected")
+        self.manifest_path(file).unlink(missing_ok=True)
+        progress.report()
+        return file
+
+    async def _download_parts(self, url: str, file: Path, size: int, progress: _ProgressTracker, **kwargs: Any) -> None:
+        """Download a resource in concurrent ranged parts, resuming from a previous manifest if possible
+
+        Args:
+            url (str): full URL of resource
+            file (Path): local file to write to
+            size (int): total size of resource in bytes
+            progress (_ProgressTracker): progress tracker
+            **kwargs (Any): additional request arguments
+        """
+        manifest_file = self.manifest_path(file)
+        parts = [(first, min(first + self._part_size, size) - 1) for first in range(0, size, self._part_size)]
+        completed = self._load_manifest(manifest_file, url, size)
+        if completed and file.exists() and file.stat().st_size == size:
+            logger.info(f"Resuming download of {file} with {len(completed)} / {len(parts)} parts complete")
+        else:
+            completed = set()
+            with open(file, "wb") as f:
+                f.truncate(size)
+        progress.resume(sum(last - first + 1 for index, (first, last) in enumerate(parts) if index in completed))
+
+        def save_manifest() -> None:
+            tmp = manifest_file.with_suffix(".tmp")
+            tmp.write_text(
+                json.dumps({"url": url, "size": size, "part_size": self._part_size, "completed": sorted(completed)})
+            )
+            tmp.replace(manifest_file)
+
+        aborted = threading.Event()
+
+        def on_chunk(size: int) -> None:
+            # Parts that are already streaming in a worker thread can't be cancelled so stop them at their next chunk
+            if aborted.is_set():
+                raise InterruptedError("Download aborted")
+            progress.threadsafe_add(size)
+
+        async def download_part(index: int) -> None:
+            await self._transport.download(url, file, byte_range=parts[index], on_chunk=on_chunk, **kwargs)
+            completed.add(index)
+            save_manifest()
+
+        save_manifest()
+        tasks = [asyncio.create_task(download_part(index)) for index in range(len(parts)) if index not in completed]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop the other parts so that nothing is written to the file or manifest after the download has failed
+            aborted.set()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def _load_manifest(self, manifest_file: Path, url: str, size: int) -> set[int]:
+        """Load the completed parts from a resume manifest if it matches this download
+
+        Args:
+            manifest_file (Path): manifest location
+            url (str): full URL of resource
+            size (int): total size of resource in bytes
+
+        Returns:
+            set[int]: indices of completed parts. Empty if there is no matching manifest.
+        """
+        try:
+            manifest = json.loads(manifest_file.read_text())
+        except (OSError, ValueError):
+            return set()
+        if (manifest.get("url"), manifest.get("size"), manifest.get("part_size")) != (url, size, self._part_size):
+            return set()
+        return set(manifest.get("completed", []))
+
+
+class _ProgressTracker:
+    """Accumulate received bytes and forward progress reports to the event loop
+
+    Args:
+        file (Path): local file being downloaded to
+        total (int | None): total size in bytes if known
+        start (float): perf_counter time when the download started
+        callback (DownloadProgressCb | None): user progress callback
+    """
+
+    def __init__(self, file: Path, total: int | None, start: float, callback: DownloadProgressCb | None) -> None:
+        self._file = file
+        self._total = total
+        self._start = start
+        self._callback = callback
+        self._downloaded = 0
+        self._resumed = 0
+        self._loop = asyncio.get_running_loop()
+
+    def resume(self, size: int) -> None:
+        """Account for bytes that were downloaded by a previous attempt
+
+        Args:
+            size (int): amount of bytes already downloaded
+        """
+        self._resumed = size
+        self.add(size)
+
+    def add(self, size: int) -> None:
+        """Account for received bytes. Must be called from the event loop.
+
+        Args:
+            size (int): amount of bytes received
+        """
+        self._downloaded += size
+        self.report()
+
+    def threadsafe_add(self, size: int) -> None:
+        """Account for received bytes from any thread
+
+        Args:
+            size (int): amount of bytes received
+        """
+        self._loop.call_soon_threadsafe(self.add, size)
+
+    def report(self) -> None:
+        """Send the current progress to the user callback"""
+        if self._callback:
+            self._callback(
+                DownloadProgress(
+                    self._file, self._downloaded, self._total, time.perf_counter() - self._start, self._resumed
+                )
+            )
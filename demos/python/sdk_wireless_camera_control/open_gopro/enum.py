@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 from enum import Enum, EnumMeta, IntEnum
-from typing import Any, Iterator, Protocol, TypeVar, no_type_check
+from typing import Any, Iterator, Mapping, Protocol, TypeVar, no_type_check
 
 T = TypeVar("T")
 
@@ -23,19 +23,19 @@ class ProtobufDescriptor(Protocol):
         """
 
     @property
-    def values_by_name(self) -> dict:
+    def values_by_name(self) -> Mapping:
         """Get the enum values by name
 
         Returns:
-            dict: Dict of enum values mapped by name
+            Mapping: Dict of enum values mapped by name
         """
 
     @property
-    def values_by_number(self) -> dict:
+    def values_by_number(self) -> Mapping:
         """Get the enum values by number
 
         Returns:
-            dict: dict of enum numbers mapped by number
+            Mapping: dict of enum numbers mapped by number
         """
 
 
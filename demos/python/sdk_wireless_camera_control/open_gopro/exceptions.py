@@ -78,5 +78,12 @@ class InterfaceConfigFailure(GoProError):
     """An error has occurred while setting up the communication interface"""
 
 
+class DownloadFailed(GoProError):
+    """A file download did not complete successfully."""
+
+    def __init__(self, file: str, message: str) -> None:
+        super().__init__(f"Download of {file} failed: {message}")
+
+
 ExceptionHandler = Callable[[Exception], None]
 """Exception handler callback type"""
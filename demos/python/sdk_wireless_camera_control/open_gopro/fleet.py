@@ -0,0 +1,355 @@
+# fleet.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Control many cameras as one"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Final, Generic, Iterable, Iterator, TypeVar
+
+from open_gopro.command_metrics import CommandMetrics
+from open_gopro.gopro_base import GoProBase
+from open_gopro.models import GoProResp
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class CameraResult(Generic[T]):
+    """The outcome of an operation on one camera of a fleet"""
+
+    gopro: GoProBase  #: camera that the operation was performed on
+    value: T | None = None  #: value returned by the operation if it succeeded
+    error: BaseException | None = None  #: exception raised by the operation (including timeout) if it failed
+    sent: float = 0.0  #: perf_counter time when the operation was started
+    completed: float = 0.0  #: perf_counter time when the operation finished
+
+    @property
+    def ok(self) -> bool:
+        """Did the operation succeed?
+
+        If the operation returned a response, this is also the response's status.
+
+        Returns:
+            bool: True if succeeded, False otherwise
+        """
+        if self.error is not None:
+            return False
+        return self.value.ok if isinstance(self.value, GoProResp) else True
+
+    @property
+    def latency(self) -> float:
+        """Time from the start of the operation until it finished
+
+        Returns:
+            float: latency in seconds
+        """
+        return self.completed - self.sent
+
+    @property
+    def identifier(self) -> str:
+        """Identifier of the camera, if known
+
+        Returns:
+            str: camera identifier or "unknown" if the camera has not yet been opened
+        """
+        try:
+            return self.gopro.identifier
+        except Exception:  # pylint: disable=broad-exception-caught
+            return "unknown"
+
+
+@dataclass
+class FleetResult(Generic[T]):
+    """The outcome of an operation across a fleet, with one result per camera in fleet order"""
+
+    results: list[CameraResult[T]] = field(default_factory=list)  #: per-camera results
+
+    def __iter__(self) -> Iterator[CameraResult[T]]:
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __getitem__(self, index: int) -> CameraResult[T]:
+        return self.results[index]
+
+    @property
+    def ok(self) -> bool:
+        """Did the operation succeed on every camera?
+
+        Returns:
+            bool: True if all succeeded, False otherwise
+        """
+        return all(result.ok for result in self.results)
+
+    @property
+    def failed(self) -> list[CameraResult[T]]:
+        """The results of cameras where the operation failed
+
+        Returns:
+            list[CameraResult[T]]: failed results
+        """
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def latencies(self) -> list[float]:
+        """Per-camera latency in seconds, in fleet order
+
+        Returns:
+            list[float]: latencies
+        """
+        return [result.latency for result in self.results]
+
+    @property
+    def dispatch_skew(self) -> float:
+        """Spread between the first and last camera's operation start
+
+        Returns:
+            float: skew in seconds
+        """
+        return _spread([result.sent for result in self.results])
+
+    @property
+    def skew(self) -> float:
+        """Spread between the first and last camera's operation completion, considering only successful cameras
+
+        Returns:
+            float: skew in seconds
+        """
+        return _spread([result.completed for result in self.results if result.ok])
+
+
+class _FanOut:
+    """Attribute proxy that resolves the same attribute path on every camera and calls it concurrently
+
+    Args:
+        fleet (GoProFleet): fleet to fan out to
+        resolve (Callable[[GoProBase], Any]): get the target object from one camera
+    """
+
+    def __init__(self, fleet: GoProFleet, resolve: Callable[[GoProBase], Any]) -> None:
+        self._fleet = fleet
+        self._resolve = resolve
+
+    def __getattr__(self, name: str) -> _FanOut:
+        resolve = self._resolve
+
+        def resolve_attribute(gopro: GoProBase) -> Any:
+            return getattr(resolve(gopro), name)
+
+        return _FanOut(self._fleet, resolve_attribute)
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> FleetResult:
+        return await self._fleet.run(lambda gopro: self._resolve(gopro)(*args, **kwargs))
+
+
+class GoProFleet:
+    """Open, command and close many cameras concurrently
+
+    Commands are fanned out to every camera by accessing them through the fleet's ``ble_command``, ``ble_setting``,
+    ``ble_status``, ``http_command`` and ``http_setting`` attributes, exactly as they would be accessed on a single
+    camera. For example:
+
+    .. code-block:: python
+
+        async with GoProFleet([WirelessGoPro(target) for target in targets]) as fleet:
+            result = await fleet.ble_command.set_shutter(shutter=Toggle.ENABLE)
+            print(f"skew: {result.skew * 1000:.1f} ms, latencies: {result.latencies}")
+
+    Each call is started on every camera in the same event loop iteration and returns a FleetResult with each
+    camera's value (or error), latency, and the skew across cameras. An operation failing or timing out on one
+    camera does not affect the others.
+
+    Attributes:
+        DEFAULT_MAX_OPEN_CONCURRENCY (Final[int]): default maximum cameras to open simultaneously
+        DEFAULT_TIMEOUT (Final[float]): default per-camera timeout in seconds for fanned out operations
+
+    Args:
+        gopros (Iterable[GoProBase]): cameras to control. They are not yet opened.
+        max_open_concurrency (int): maximum cameras to open simultaneously. Defaults to
+            DEFAULT_MAX_OPEN_CONCURRENCY.
+        timeout (float | None): per-camera timeout in seconds for fanned out operations. Defaults to
+            DEFAULT_TIMEOUT. None to wait indefinitely.
+    """
+
+    DEFAULT_MAX_OPEN_CONCURRENCY: Final[int] = 4
+    DEFAULT_TIMEOUT: Final[float] = 10.0
+
+    def __init__(
+        self,
+        gopros: Iterable[GoProBase],
+        max_open_concurrency: int = DEFAULT_MAX_OPEN_CONCURRENCY,
+        timeout: float | None = DEFAULT_TIMEOUT,
+    ) -> None:
+        self._gopros = list(gopros)
+        self._max_open_concurrency = max_open_concurrency
+        self._timeout = timeout
+
+    async def __aenter__(self) -> GoProFleet:
+        await self.open()
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    def __len__(self) -> int:
+        return len(self._gopros)
+
+    def __iter__(self) -> Iterator[GoProBase]:
+        return iter(self._gopros)
+
+    @property
+    def gopros(self) -> list[GoProBase]:
+        """The cameras in this fleet
+
+        Returns:
+            list[GoProBase]: cameras in fleet order
+        """
+        return self._gopros
+
+    @property
+    def command_metrics(self) -> dict[str, CommandMetrics]:
+        """Each camera's command metrics (i.e. to export with open_gopro.command_metrics.to_openmetrics)
+
+        Returns:
+            dict[str, CommandMetrics]: camera identifier (or fleet index if it is not yet known) --> its metrics
+        """
+        metrics: dict[str, CommandMetrics] = {}
+        for index, gopro in enumerate(self._gopros):
+            identifier = CameraResult(gopro).identifier
+            metrics[str(index) if identifier == "unknown" else identifier] = gopro.command_metrics
+        return metrics
+
+    @property
+    def ble_command(self) -> Any:
+        """Fan out to each camera's BLE commands
+
+        Returns:
+            Any: proxy whose calls return a FleetResult
+        """
+        return _FanOut(self, lambda gopro: gopro.ble_command)
+
+    @property
+    def ble_setting(self) -> Any:
+        """Fan out to each camera's BLE settings
+
+        Returns:
+            Any: proxy whose calls return a FleetResult
+        """
+        return _FanOut(self, lambda gopro: gopro.ble_setting)
+
+    @property
+    def ble_status(self) -> Any:
+        """Fan out to each camera's BLE statuses
+
+        Returns:
+            Any: proxy whose calls return a FleetResult
+        """
+        return _FanOut(self, lambda gopro: gopro.ble_status)
+
+    @property
+    def http_command(self) -> Any:
+        """Fan out to each camera's HTTP commands
+
+        Returns:
+            Any: proxy whose calls return a FleetResult
+        """
+        return _FanOut(self, lambda gopro: gopro.http_command)
+
+    @property
+    def http_setting(self) -> Any:
+        """Fan out to each camera's HTTP settings
+
+        Returns:
+            Any: proxy whose calls return a FleetResult
+        """
+        return _FanOut(self, lambda gopro: gopro.http_setting)
+
+    async def open(self, timeout: int = 15, retries: int = 5) -> FleetResult[None]:
+        """Open all cameras with bounded concurrency
+
+        Cameras that fail to open are reported in the result and left closed.
+
+        Args:
+            timeout (int): per-camera connection timeout passed to each camera's open. Defaults to 15.
+            retries (int): per-camera connection retries passed to each camera's open. Defaults to 5.
+
+        Returns:
+            FleetResult[None]: per-camera open results
+        """
+        limit = asyncio.Semaphore(self._max_open_concurrency)
+
+        async def open_gopro(gopro: GoProBase) -> None:
+            async with limit:
+                await gopro.open(timeout=timeout, retries=retries)
+
+        result = await self._run(open_gopro, timeout=None)
+        for failure in result.failed:
+            logger.error(f"Failed to open camera {self._gopros.index(failure.gopro)}: {repr(failure.error)}")
+        return result
+
+    async def close(self) -> FleetResult[None]:
+        """Close all cameras concurrently
+
+        Returns:
+            FleetResult[None]: per-camera close results
+        """
+        return await self._run(lambda gopro: gopro.close(), timeout=None)
+
+    async def run(self, operation: Callable[[GoProBase], Awaitable[T]]) -> FleetResult[T]:
+        """Run an operation on every camera concurrently using the fleet's per-camera timeout
+
+        Args:
+            operation (Callable[[GoProBase], Awaitable[T]]): get the operation to await for one camera
+
+        Returns:
+            FleetResult[T]: per-camera results in fleet order
+        """
+        return await self._run(operation, self._timeout)
+
+    async def _run(self, operation: Callable[[GoProBase], Awaitable[T]], timeout: float | None) -> FleetResult[T]:
+        """Run an operation on every camera concurrently
+
+        Args:
+            operation (Callable[[GoProBase], Awaitable[T]]): get the operation to await for one camera
+            timeout (float | None): per-camera timeout in seconds. None to wait indefinitely.
+
+        Returns:
+            FleetResult[T]: per-camera results in fleet order
+        """
+        results = [CameraResult[T](gopro) for gopro in self._gopros]
+
+        async def run_one(result: CameraResult[T]) -> None:
+            result.sent = time.perf_counter()
+            try:
+                result.value = await asyncio.wait_for(operation(result.gopro), timeout)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                result.error = e
+            result.completed = time.perf_counter()
+
+        await asyncio.gather(*[run_one(result) for result in results])
+        fleet_result = FleetResult(results)
+        logger.debug(
+            f"Fleet operation finished on {len(results) - len(fleet_result.failed)} / {len(results)} cameras with "
+            f"{fleet_result.skew * 1000:.1f} ms skew"
+        )
+        return fleet_result
+
+
+def _spread(times: list[float]) -> float:
+    """Get the difference between the latest and earliest time
+
+    Args:
+        times (list[float]): times to compare
+
+    Returns:
+        float: spread in seconds (0 if there are no times)
+    """
+    return max(times) - min(times) if times else 0.0
@@ -0,0 +1,394 @@
+# frame_source.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Decode a preview / webcam stream off the main thread and read its most recent frames as NumPy arrays
+
+This requires the gui extra (i.e. OpenCV and NumPy). Start the stream (i.e. with set_preview_stream or webcam_start)
+and then read frames in your own pipeline:
+
+>>> with FrameSource.preview() as source:
+>>>     while frame := source.read(timeout=5):
+>>>         process(frame.image)
+>>>     print(source.stats)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing as mp
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, AsyncIterator, Final
+
+import numpy as np
+
+from open_gopro.command_metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Ring header: frames published, decode errors, decoder finished
+_PUBLISHED, _ERRORS, _FINISHED = range(3)
+_HEADER_LEN: Final = 3
+# Slot header: sequence (-1 while being written), height, width
+_SLOT_INTS: Final = 3
+# Slot timestamps: monotonic time decoded, stream presentation time
+_SLOT_FLOATS: Final = 2
+_WRITING: Final = -1
+
+
+@dataclass(frozen=True)
+class Frame:
+    """A decoded frame"""
+
+    image: np.ndarray  #: BGR image of shape (height, width, 3)
+    sequence: int  #: number of frames decoded before this one
+    timestamp: float  #: monotonic time (comparable across processes) that the frame was decoded
+    pts: float  #: presentation time (seconds) in the stream
+
+
+@dataclass(frozen=True)
+class FrameStats:
+    """Frame source instrumentation"""
+
+    decoded: int  #: frames decoded
+    delivered: int  #: frames returned by read
+    dropped: int  #: frames that were replaced by a newer frame before they were read
+    decode_errors: int  #: failed frame reads from the stream
+    latency: LatencyHistogram  #: seconds from decoding each delivered frame until it was read
+    stream_lag: float  #: seconds that decoding has fallen behind the stream's presentation times since the start
+
+
+class FrameRing:
+    """Drop-oldest ring of fixed-size frame slots in shared memory
+
+    There is one writer (the decoder). Each slot is guarded by its sequence number (a seqlock) so that a reader never
+    returns a frame that was partially overwritten. Frames may be smaller than the slot size.
+
+    Args:
+        slots (int): number of frames that can be held
+        max_resolution (tuple[int, int]): largest (width, height) of a frame
+        name (str | None): attach to an existing ring with this name instead of creating one. Defaults to None.
+    """
+
+    def __init__(self, slots: int, max_resolution: tuple[int, int], name: str | None = None) -> None:
+        self.slots = slots
+        self.max_resolution = max_resolution
+        width, height = max_resolution
+        ints = (_HEADER_LEN + slots * _SLOT_INTS) * 8
+        floats = slots * _SLOT_FLOATS * 8
+        self._owner = name is None
+        self._shm = SharedMemory(name=name, create=self._owner, size=ints + floats + slots * height * width * 3)
+        buffer = self._shm.buf
+        self._header = np.ndarray((_HEADER_LEN,), np.int64, buffer)
+        self._slot_ints = np.ndarray((slots, _SLOT_INTS), np.int64, buffer, offset=_HEADER_LEN * 8)
+        self._slot_floats = np.ndarray((slots, _SLOT_FLOATS), np.float64, buffer, offset=ints)
+        self._data = np.ndarray((slots, height, width, 3), np.uint8, buffer, offset=ints + floats)
+        if self._owner:
+            self._header[:] = 0
+            self._slot_ints[:, 0] = _WRITING
+
+    @property
+    def name(self) -> str:
+        """Name to attach to this ring from another process
+
+        Returns:
+            str: shared memory name
+        """
+        return self._shm.name
+
+    @property
+    def published(self) -> int:
+        """Frames written so that the newest frame's sequence is published - 1
+
+        Returns:
+            int: frames written
+        """
+        return int(self._header[_PUBLISHED])
+
+    def write(self, image: np.ndarray, timestamp: float, pts: float) -> int:
+        """Write a frame over the oldest slot
+
+        Args:
+            image (np.ndarray): BGR image that is no larger than the max resolution
+            timestamp (float): monotonic time that the frame was decoded
+            pts (float): presentation time in the stream
+
+        Returns:
+            int: sequence of the frame
+        """
+        sequence = int(self._header[_PUBLISHED])
+        slot = sequence % self.slots
+        height, width = image.shape[:2]
+        self._slot_ints[slot, 0] = _WRITING
+        self._data[slot, :height, :width] = image
+        self._slot_floats[slot] = (timestamp, pts)
+        self._slot_ints[slot, 1:] = (height, width)
+        self._slot_ints[slot, 0] = sequence
+        self._header[_PUBLISHED] = sequence + 1
+        return sequence
+
+    def read(self, sequence: int) -> Frame | None:
+        """Copy a frame out of its slot
+
+        Args:
+            sequence (int): sequence of the frame to read
+
+        Returns:
+            Frame | None: frame or None if it has been (or is being) overwritten
+        """
+        slot = sequence % self.slots
+        if self._slot_ints[slot, 0] != sequence:
+            return None
+        height, width = (int(value) for value in self._slot_ints[slot, 1:])
+        timestamp, pts = (float(value) for value in self._slot_floats[slot])
+        image = self._data[slot, :height, :width].copy()
+        if self._slot_ints[slot, 0] != sequence:
+            return None
+        return Frame(image, sequence, timestamp, pts)
+
+    def close(self) -> None:
+        """Detach from the ring, removing it if this is the ring that created it"""
+        # The arrays must be released before the shared memory can be closed
+        del self._header, self._slot_ints, self._slot_floats, self._data
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+def _decode(
+    source: str, ring_name: str, slots: int, max_resolution: tuple[int, int], stop: Any, published: Any
+) -> None:
+    """Decode a stream into a frame ring until it ends or is stopped. This is run in the decoder process / thread.
+
+    Args:
+        source (str): stream URL (or file) to decode
+        ring_name (str): name of the frame ring to write to
+        slots (int): slots in the frame ring
+        max_resolution (tuple[int, int]): largest (width, height) of a frame. Larger frames are downscaled.
+        stop (Any): event to stop decoding
+        published (Any): event that is set after each frame is written
+    """
+    import cv2  # pylint: disable=import-outside-toplevel
+
+    ring = FrameRing(slots, max_resolution, ring_name)
+    url = source + "?overrun_nonfatal=1&fifo_size=50000000" if source.startswith("udp://") else source
+    capture = cv2.VideoCapture(url, cv2.CAP_FFMPEG)
+    width, height = max_resolution
+    try:
+        while not stop.is_set():
+            if not capture.grab():
+                if not capture.isOpened() or not source.startswith("udp://"):
+                    break
+                ring._header[_ERRORS] += 1
+                continue
+            ok, image = capture.retrieve()
+            timestamp = time.monotonic()
+            if not ok:
+                ring._header[_ERRORS] += 1
+                continue
+            if image.shape[1] > width or image.shape[0] > height:
+                scale = min(width / image.shape[1], height / image.shape[0])
+                image = cv2.resize(
+                    image, (int(image.shape[1] * scale), int(image.shape[0] * scale)), interpolation=cv2.INTER_AREA
+                )
+            ring.write(image, timestamp, capture.get(cv2.CAP_PROP_POS_MSEC) / 1000)
+            published.set()
+    finally:
+        capture.release()
+        ring._header[_FINISHED] = 1
+        published.set()
+        ring.close()
+
+
+class FrameSource:
+    """Decode a video stream in a separate process (or thread) into a shared memory ring of the newest frames
+
+    Frames are decoded as fast as the stream provides them. When the application reads slower than that, the oldest
+    unread frames are dropped so that read always returns the newest available frame (after the previously read one).
+
+    The timestamps of each frame are recorded by the decoder so the latency from decoding a frame until the application
+    reads it and the amount of frames that were dropped are available from ``stats``. The stream lag measures how much
+    slower than real time the stream is being decoded (i.e. how much buffering adds to the glass to app latency).
+
+    Attributes:
+        PREVIEW_URL (Final[str]): URL format of the preview stream, which is sent to this host
+        WEBCAM_URL (Final[str]): URL format of the webcam stream, which can be received on any interface
+        STOP_TIMEOUT (Final[float]): time in seconds to wait for the decoder to stop when closing
+
+    Args:
+        source (str): stream URL (or video file) that OpenCV's FFMPEG backend can open
+        slots (int): number of newest frames to hold. Defaults to 4.
+        max_resolution (tuple[int, int]): largest (width, height) of frames. Larger frames are downscaled.
+            Defaults to (1920, 1080).
+        use_process (bool): decode in a separate process (True) or a thread (False). Defaults to True.
+    """
+
+    PREVIEW_URL: Final[str] = "udp://127.0.0.1:{port}"
+    WEBCAM_URL: Final[str] = "udp://0.0.0.0:{port}"
+    STOP_TIMEOUT: Final[float] = 5.0
+
+    def __init__(
+        self,
+        source: str,
+        slots: int = 4,
+        max_resolution: tuple[int, int] = (1920, 1080),
+        use_process: bool = True,
+    ) -> None:
+        self.source = source
+        self._ring = FrameRing(slots, max_resolution)
+        # Ring header once the ring has been closed
+        self._closed_header: tuple[int, ...] | None = None
+        self._use_process = use_process
+        self._stop = mp.Event() if use_process else threading.Event()
+        self._published = mp.Event() if use_process else threading.Event()
+        self._decoder: mp.Process | threading.Thread | None = None
+        self._next = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._latency = LatencyHistogram()
+        self._min_offset = float("inf")
+        self._last_offset = 0.0
+
+    @classmethod
+    def preview(cls, port: int = 8554, **kwargs: Any) -> FrameSource:
+        """Read frames from a preview stream (see set_preview_stream)
+
+        Args:
+            port (int): port that the preview stream was started on. Defaults to 8554.
+            **kwargs (Any): passed to FrameSource
+
+        Returns:
+            FrameSource: frame source
+        """
+        return cls(cls.PREVIEW_URL.format(port=port), **kwargs)
+
+    @classmethod
+    def webcam(cls, port: int = 8554, **kwargs: Any) -> FrameSource:
+        """Read frames from a webcam stream (see webcam_start)
+
+        Args:
+            port (int): port that the webcam was started on. Defaults to 8554.
+            **kwargs (Any): passed to FrameSource
+
+        Returns:
+            FrameSource: frame source
+        """
+        return cls(cls.WEBCAM_URL.format(port=port), **kwargs)
+
+    def __enter__(self) -> FrameSource:
+        self.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Start decoding"""
+        args = (self.source, self._ring.name, self._ring.slots, self._ring.max_resolution, self._stop, self._published)
+        self._decoder = (
+            mp.Process(target=_decode, args=args, daemon=True)
+            if self._use_process
+            else threading.Thread(target=_decode, args=args, daemon=True)
+        )
+        self._decoder.start()
+
+    def close(self) -> None:
+        """Stop decoding and release the frame ring
+
+        The decoder is given STOP_TIMEOUT seconds to stop (it can be blocked waiting for a stalled stream). After that,
+        a decoder process is terminated while a decoder thread (which is a daemon) is abandoned.
+        """
+        self._stop.set()
+        if self._decoder:
+            self._decoder.join(self.STOP_TIMEOUT)
+            if self._decoder.is_alive():
+                logger.warning(f"Decoder of {self.source} did not stop within {self.STOP_TIMEOUT} seconds")
+                if isinstance(self._decoder, mp.Process):
+                    self._decoder.terminate()
+                    self._decoder.join()
+            self._decoder = None
+        if self._closed_header is None:
+            self._closed_header = tuple(int(value) for value in self._ring._header)
+            self._ring.close()
+
+    def _header(self, field: int) -> int:
+        """Get a ring header field, which is kept after closing
+
+        Args:
+            field (int): index of the field
+
+        Returns:
+            int: value
+        """
+        return self._closed_header[field] if self._closed_header else int(self._ring._header[field])
+
+    @property
+    def is_finished(self) -> bool:
+        """Has the stream ended (or the decoder stopped)?
+
+        Returns:
+            bool: True if it has, False otherwise
+        """
+        return bool(self._header(_FINISHED))
+
+    @property
+    def stats(self) -> FrameStats:
+        """Get the frame source instrumentation
+
+        Returns:
+            FrameStats: current statistics
+        """
+        return FrameStats(
+            decoded=self._header(_PUBLISHED),
+            delivered=self._delivered,
+            dropped=self._dropped,
+            decode_errors=self._header(_ERRORS),
+            latency=self._latency,
+            stream_lag=self._last_offset - self._min_offset if self._delivered else 0.0,
+        )
+
+    def read(self, timeout: float | None = None) -> Frame | None:
+        """Wait for a frame newer than the last read frame and return the newest one
+
+        Args:
+            timeout (float | None): seconds to wait for a new frame. Defaults to None (forever).
+
+        Returns:
+            Frame | None: newest frame or None if no new frame arrived in time or the stream ended
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self._published.clear()
+            if (published := self._ring.published) > self._next:
+                # Newer frames can replace the newest one while it is being read
+                if frame := self._ring.read(published - 1):
+                    self._dropped += frame.sequence - self._next
+                    self._next = frame.sequence + 1
+                    self._delivered += 1
+                    self._latency.record(time.monotonic() - frame.timestamp)
+                    self._last_offset = frame.timestamp - frame.pts
+                    self._min_offset = min(self._min_offset, self._last_offset)
+                    return frame
+                continue
+            if self.is_finished:
+                return None
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if (remaining is not None and remaining <= 0) or not self._published.wait(remaining):
+                return None
+
+    async def frames(self, timeout: float | None = None) -> AsyncIterator[Frame]:
+        """Asynchronously read the newest frames until none arrive in time or the stream ends
+
+        Each read runs in a worker thread so that the event loop is not blocked.
+
+        Args:
+            timeout (float | None): seconds to wait for each frame. Defaults to None (forever).
+
+        Yields:
+            Frame: newest frame
+        """
+        while frame := await asyncio.to_thread(self.read, timeout):
+            yield frame
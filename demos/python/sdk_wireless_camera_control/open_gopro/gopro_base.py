@@ -10,22 +10,17 @@ import enum
 import json
 import logging
 import threading
+import time
 import traceback
 from abc import abstractmethod
-from typing import Any, Awaitable, Callable, Final, Generic, TypeVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Final, Generic, TypeVar
 
 import requests
 import wrapt
 
-from open_gopro.api import (
-    BleCommands,
-    BleSettings,
-    BleStatuses,
-    HttpCommands,
-    HttpSettings,
-    WiredApi,
-    WirelessApi,
-)
+from open_gopro.api import WiredApi, WirelessApi
+from open_gopro.command_metrics import CommandMetrics
 from open_gopro.communicator_interface import (
     GoProHttp,
     HttpMessage,
@@ -33,12 +28,24 @@ from open_gopro.communicator_interface import (
     MessageRules,
 )
 from open_gopro.constants import ErrorCode
+from open_gopro.downloader import RangedDownloader
 from open_gopro.exceptions import GoProNotOpened, ResponseTimeout
-from open_gopro.logger import Logger
+from open_gopro.http_transport import HttpTransport, RequestsHttpTransport
+from open_gopro.logger import DeferredStr, Logger
 from open_gopro.models import GoProResp
 from open_gopro.parsers.response import RequestsHttpRespBuilderDirector
 from open_gopro.types import JsonDict
 from open_gopro.util import pretty_print
+from open_gopro.wire_trace import RecordingHttpTransport, WireTraceRecorder
+
+if TYPE_CHECKING:
+    from open_gopro.api import (
+        BleCommands,
+        BleSettings,
+        BleStatuses,
+        HttpCommands,
+        HttpSettings,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -108,18 +115,60 @@ async def enforce_message_rules(wrapped: MessageMethodType, instance: GoProBase,
     Returns:
         GoProResp: common response object
     """
-    return await instance._enforce_message_rules(wrapped, *args, **kwargs)
+    if not (metrics := instance._metrics).enabled:
+        return await instance._enforce_message_rules(wrapped, *args, **kwargs)
+    message: Message = kwargs["message"] if "message" in kwargs else args[0]
+    metrics.record_depth("messages", metrics.in_flight)
+    metrics.in_flight += 1
+    start = time.perf_counter()
+    try:
+        return await instance._enforce_message_rules(wrapped, *args, **kwargs)
+    finally:
+        metrics.in_flight -= 1
+        metrics.record(message._identifier, "total", time.perf_counter() - start)
 
 
 class GoProBase(GoProHttp, Generic[ApiType]):
-    """The base class for communicating with all GoPro Clients"""
+    """The base class for communicating with all GoPro Clients
+
+    Args:
+        **kwargs (Any): additional keyword arguments. The HTTP transport can be configured with:
+            - http_transport (HttpTransport): transport used to send all HTTP messages. Defaults to a
+              RequestsHttpTransport
+            - http_max_concurrency (int): maximum simultaneous HTTP requests to the camera when using the default
+              transport. Defaults to RequestsHttpTransport.DEFAULT_MAX_CONCURRENCY
+            - download_part_size (int): size in bytes of each concurrent range request when downloading files.
+              Defaults to RangedDownloader.DEFAULT_PART_SIZE
+            - wire_trace (Path | str | WireTraceRecorder): record the camera's traffic to this wire trace file (or
+              recorder). A recorder that the GoPro created from a file is closed when the GoPro is closed while a
+              passed recorder is only flushed. Defaults to None (don't record).
+            - command_metrics (bool): collect per-command latency, lock contention, retry, and queue depth metrics
+              (see open_gopro.command_metrics). They can also be enabled later. Defaults to False.
+
+    Attributes:
+        HTTP_TIMEOUT (Final[int]): default time in seconds to wait for an HTTP response
+        HTTP_GET_RETRIES (Final[int]): most attempts to send an HTTP request
+    """
 
-    HTTP_TIMEOUT: Final = 5
-    HTTP_GET_RETRIES: Final = 5
+    HTTP_TIMEOUT: Final[int] = 5
+    HTTP_GET_RETRIES: Final[int] = 5
 
     def __init__(self, **kwargs: Any) -> None:
         self._should_maintain_state = kwargs.get("maintain_state", True)
         self._exception_cb = kwargs.get("exception_cb", None)
+        self._http_transport: HttpTransport = kwargs.get("http_transport") or RequestsHttpTransport(
+            max_concurrency=kwargs.get("http_max_concurrency", RequestsHttpTransport.DEFAULT_MAX_CONCURRENCY)
+        )
+        self._download_part_size = kwargs.get("download_part_size", RangedDownloader.DEFAULT_PART_SIZE)
+        trace = kwargs.get("wire_trace")
+        self._wire_trace: WireTraceRecorder | None = (
+            WireTraceRecorder(trace) if isinstance(trace, (Path, str)) else trace
+        )
+        # Recorders created here are closed with the GoPro. Passed recorders are only flushed.
+        self._owns_wire_trace = isinstance(trace, (Path, str))
+        if self._wire_trace:
+            self._http_transport = RecordingHttpTransport(self._http_transport, self._wire_trace)
+        self._metrics = CommandMetrics(kwargs.get("command_metrics", False))
 
     async def __aenter__(self: GoPro) -> GoPro:
         await self.open()
@@ -170,6 +219,17 @@ class GoProBase(GoProHttp, Generic[ApiType]):
         """
         return self._api.version
 
+    @property
+    def command_metrics(self) -> CommandMetrics:
+        """Per-command latency, lock contention, retry, and queue depth metrics
+
+        Set enabled to start or stop collecting them.
+
+        Returns:
+            CommandMetrics: this camera's metrics
+        """
+        return self._metrics
+
     @property
     @abstractmethod
     def http_command(self) -> HttpCommands:
@@ -305,6 +365,15 @@ class GoProBase(GoProHttp, Generic[ApiType]):
         else:
             logger.error(f"Caught unknown message: {context['message']} from {source}")
 
+    def _close_wire_trace(self) -> None:
+        """Close the wire trace recorder if this instance created it. Otherwise only flush it."""
+        if not self._wire_trace:
+            return
+        if self._owns_wire_trace:
+            self._wire_trace.close()
+        else:
+            self._wire_trace.flush()
+
     class _InternalState(enum.IntFlag):
         """State used to manage whether the GoPro instance is ready or not."""
 
@@ -372,20 +441,38 @@ class GoProBase(GoProHttp, Generic[ApiType]):
             request_args["verify"] = str(message._certificate)
         return request_args
 
+    @staticmethod
+    def _dump_json(http_response: requests.Response) -> str:
+        """Format the raw JSON of an HTTP response for logging
+
+        Args:
+            http_response (requests.Response): received response
+
+        Returns:
+            str: indented JSON
+        """
+        return json.dumps(http_response.json() if http_response.text else {}, indent=4)
+
     @enforce_message_rules
     async def _get_json(
         self, message: HttpMessage, *, timeout: int = HTTP_TIMEOUT, rules: MessageRules = MessageRules(), **kwargs: Any
     ) -> GoProResp:
         url = self._base_url + message.build_url(**kwargs)
-        logger.debug(f"Sending:  {url}")
-        logger.info(Logger.build_log_tx_str(pretty_print(message._as_dict(**kwargs))))
+        logger.debug("Sending:  %s", url)
+        logger.info(DeferredStr(lambda: Logger.build_log_tx_str(pretty_print(message._as_dict(**kwargs)))))
         for retry in range(1, GoProBase.HTTP_GET_RETRIES + 1):
             try:
-                http_response = requests.get(url, timeout=timeout, **self._build_http_request_args(message))
-                logger.trace(f"received raw json: {json.dumps(http_response.json() if http_response.text else {}, indent=4)}")  # type: ignore
+                sent = time.perf_counter()
+                http_response = await self._http_transport.get(
+                    url, timeout=timeout, **self._build_http_request_args(message)
+                )
+                received = time.perf_counter()
+                self._metrics.record(message._identifier, "transmit", received - sent)
+                logger.trace("received raw json: %s", DeferredStr(self._dump_json, http_response))  # type: ignore
                 if not http_response.ok:
                     logger.warning(f"Received non-success status {http_response.status_code}: {http_response.reason}")
                 response = RequestsHttpRespBuilderDirector(http_response, message._parser)()
+                self._metrics.record(message._identifier, "parse", time.perf_counter() - received)
                 break
             except requests.exceptions.ConnectionError as e:
                 # This appears to only occur after initial connection after pairing
@@ -394,11 +481,12 @@ class GoProBase(GoProHttp, Generic[ApiType]):
                 await asyncio.sleep(2)
             except Exception as e:  # pylint: disable=broad-exception-caught
                 logger.critical(f"Unexpected error: {repr(e)}")
+            self._metrics.record_retry(message._identifier)
             logger.warning(f"Retrying #{retry} to send the command...")
         else:
             raise ResponseTimeout(GoProBase.HTTP_GET_RETRIES)
 
-        logger.info(Logger.build_log_rx_str(pretty_print(response._as_dict())))
+        logger.info(DeferredStr(Logger.build_log_rx_str, response))
         return response
 
     @enforce_message_rules
@@ -406,14 +494,15 @@ class GoProBase(GoProHttp, Generic[ApiType]):
         self, message: HttpMessage, *, timeout: int = HTTP_TIMEOUT, rules: MessageRules = MessageRules(), **kwargs: Any
     ) -> GoProResp:
         url = self._base_url + message.build_url(path=kwargs["camera_file"])
-        logger.debug(f"Sending:  {url}")
-        with requests.get(url, stream=True, timeout=timeout, **self._build_http_request_args(message)) as request:
-            request.raise_for_status()
-            file = kwargs["local_file"]
-            with open(file, "wb") as f:
-                logger.debug(f"receiving stream to {file}...")
-                for chunk in request.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        logger.debug("Sending:  %s", url)
+        downloader = RangedDownloader(self._http_transport, self._download_part_size, kwargs.get("progress_cb"))
+        file = await downloader.download(
+            url,
+            kwargs["local_file"],
+            timeout=timeout,
+            expected_size=kwargs.get("expected_size"),
+            **self._build_http_request_args(message),
+        )
 
         return GoProResp(protocol=GoProResp.Protocol.HTTP, status=ErrorCode.SUCCESS, data=file, identifier=url)
 
@@ -423,14 +512,20 @@ class GoProBase(GoProHttp, Generic[ApiType]):
     ) -> GoProResp:
         url = self._base_url + message.build_url(**kwargs)
         body = message.build_body(**kwargs)
-        logger.debug(f"Sending:  {url} with body: {json.dumps(body, indent=4)}")
+        logger.debug("Sending:  %s with body: %s", url, DeferredStr(json.dumps, body, indent=4))
         for retry in range(1, GoProBase.HTTP_GET_RETRIES + 1):
             try:
-                http_response = requests.put(url, timeout=timeout, json=body, **self._build_http_request_args(message))
-                logger.trace(f"received raw json: {json.dumps(http_response.json() if http_response.text else {}, indent=4)}")  # type: ignore
+                sent = time.perf_counter()
+                http_response = await self._http_transport.put(
+                    url, timeout=timeout, json=body, **self._build_http_request_args(message)
+                )
+                received = time.perf_counter()
+                self._metrics.record(message._identifier, "transmit", received - sent)
+                logger.trace("received raw json: %s", DeferredStr(self._dump_json, http_response))  # type: ignore
                 if not http_response.ok:
                     logger.warning(f"Received non-success status {http_response.status_code}: {http_response.reason}")
                 response = RequestsHttpRespBuilderDirector(http_response, message._parser)()
+                self._metrics.record(message._identifier, "parse", time.perf_counter() - received)
                 break
             except requests.exceptions.ConnectionError as e:
                 # This appears to only occur after initial connection after pairing
@@ -439,6 +534,7 @@ class GoProBase(GoProHttp, Generic[ApiType]):
                 await asyncio.sleep(2)
             except Exception as e:  # pylint: disable=broad-exception-caught
                 logger.critical(f"Unexpected error: {repr(e)}")
+            self._metrics.record_retry(message._identifier)
             logger.warning(f"Retrying #{retry} to send the command...")
         else:
             raise ResponseTimeout(GoProBase.HTTP_GET_RETRIES)
@@ -5,20 +5,13 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-from typing import Any, Callable, Final
+import time
+from typing import TYPE_CHECKING, Any, Callable, Final
 
 import open_gopro.wifi.mdns_scanner  # Imported this way for pytest monkeypatching
 from open_gopro import constants
-from open_gopro.api import (
-    BleCommands,
-    BleSettings,
-    BleStatuses,
-    HttpCommands,
-    HttpSettings,
-    WiredApi,
-)
+from open_gopro.api import WiredApi
 from open_gopro.communicator_interface import GoProWiredInterface, Message, MessageRules
 from open_gopro.constants import StatusId
 from open_gopro.exceptions import (
@@ -29,6 +22,16 @@ from open_gopro.exceptions import (
 from open_gopro.gopro_base import GoProBase
 from open_gopro.models import GoProResp
 from open_gopro.types import CameraState, UpdateCb, UpdateType
+from open_gopro.wired_readiness import READY_STATE, WiredReadiness
+
+if TYPE_CHECKING:
+    from open_gopro.api import (
+        BleCommands,
+        BleSettings,
+        BleStatuses,
+        HttpCommands,
+        HttpSettings,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +50,11 @@ class WiredGoPro(GoProBase[WiredApi], GoProWiredInterface):
     This class also handles:
         - ensuring camera is ready / not encoding before transferring data
 
+    Readiness is checked by polling only the encoding and busy statuses. The polled values are trusted for
+    ``state_freshness`` seconds (keyword argument, defaults to 0.5. Set to 0 to poll before every command). While
+    waiting for the camera to become ready, the poll period backs off up to ``poll_period`` seconds (keyword
+    argument, defaults to 2).
+
     It can be used via context manager:
 
     >>> async with WiredGoPro() as gopro:
@@ -75,9 +83,12 @@ class WiredGoPro(GoProBase[WiredApi], GoProWiredInterface):
         # We currently only support version 2.0
         self._wired_api = WiredApi(self)
         self._open = False
-        self._poll_period = kwargs.get("poll_period", 2)
-        self._encoding = False
-        self._busy = False
+        self._poll_period = kwargs.get("poll_period", WiredReadiness.DEFAULT_MAX_POLL_PERIOD)
+        self._readiness = WiredReadiness(
+            self,
+            freshness=kwargs.get("state_freshness", WiredReadiness.DEFAULT_FRESHNESS),
+            max_poll_period=self._poll_period,
+        )
 
     async def open(self, timeout: int = 10, retries: int = 1) -> None:
         """Connect to the Wired GoPro Client and prepare it for communication
@@ -111,12 +122,14 @@ class WiredGoPro(GoProBase[WiredApi], GoProWiredInterface):
         logger.info(f"Using Open GoPro API version {version}")
 
         # Wait for initial ready state
-        await self._wait_for_state({StatusId.ENCODING: False, StatusId.BUSY: False})
+        await self._wait_for_state(READY_STATE)
 
         self._open = True
 
     async def close(self) -> None:
         """Gracefully close the GoPro Client connection"""
+        await self._http_transport.close()
+        self._close_wire_trace()
 
     @property
     async def is_ready(self) -> bool:
@@ -125,10 +138,17 @@ class WiredGoPro(GoProBase[WiredApi], GoProWiredInterface):
         Returns:
             bool: yes if ready, no otherwise
         """
-        current_state = (await self.http_command.get_camera_state()).data
-        self._encoding = bool(current_state[StatusId.ENCODING])
-        self._busy = bool(current_state[StatusId.BUSY])
-        return not (self._encoding or self._busy)
+        current_state = await self._readiness.refresh()
+        return not (current_state[StatusId.ENCODING] or current_state[StatusId.BUSY])
+
+    @property
+    def command_rate(self) -> float:
+        """Rate that rule-enforced commands have recently been completed at
+
+        Returns:
+            float: commands / second
+        """
+        return self._readiness.command_rate
 
     @property
     def identifier(self) -> str:
@@ -294,9 +314,12 @@ class WiredGoPro(GoProBase[WiredApi], GoProWiredInterface):
         if self._should_maintain_state and self.is_open and not rules.is_fastpass(**kwargs):
             # Wait for not encoding and not busy
             logger.trace("Waiting for camera to be ready to receive messages.")  # type: ignore
-            await self._wait_for_state({StatusId.ENCODING: False, StatusId.BUSY: False})
+            start = time.perf_counter()
+            await self._wait_for_state(READY_STATE)
+            self._metrics.record(message._identifier, "wait", time.perf_counter() - start)
             logger.trace("Camera is ready to receive messages")  # type: ignore
             response = await wrapped(message, **kwargs)
+            self._readiness.command_completed(response.ok, rules.is_read_only(**kwargs))
         else:  # Either we're not maintaining state, we're not opened yet, or this is a fastpass message
             response = await wrapped(message, **kwargs)
 
@@ -307,24 +330,18 @@ class WiredGoPro(GoProBase[WiredApi], GoProWiredInterface):
                 if rules.should_wait_for_encoding_start(**kwargs):
                     logger.trace("Waiting to receive encoding started.")  # type: ignore
                     # Wait for encoding to start
+                    start = time.perf_counter()
                     await self._wait_for_state({StatusId.ENCODING: True})
+                    self._metrics.record(message._identifier, "encoding", time.perf_counter() - start)
         return response
 
     async def _wait_for_state(self, check: CameraState) -> None:
-        """Poll the current state until a variable amount of states are all equal to desired values
+        """Wait until a variable amount of states are all equal to desired values
 
         Args:
             check (CameraState): dict{setting / status: value} of settings / statuses and values to wait for
         """
-        while True:
-            state = (await self.http_command.get_camera_state()).data
-            for key, value in check.items():
-                if state.get(key) != value:
-                    logger.trace(f"Not ready ==> {key} != {value}")  # type: ignore
-                    await asyncio.sleep(self._poll_period)
-                    break  # Get new state and try again
-            else:
-                return  # Everything matches. Exit
+        await self._readiness.wait_for(check)
 
     @property
     def _api(self) -> WiredApi:
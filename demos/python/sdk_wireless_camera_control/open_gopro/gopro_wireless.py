@@ -6,23 +6,21 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import enum
 import logging
-import queue
+import time
 from collections import defaultdict
-from copy import deepcopy
-from typing import Any, Callable, Final, Pattern
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Final, Pattern
 
+import open_gopro.ble
+import open_gopro.wifi
 from open_gopro import proto
-from open_gopro.api import (
-    BleCommands,
-    BleSettings,
-    BleStatuses,
-    HttpCommands,
-    HttpSettings,
-    WirelessApi,
-)
-from open_gopro.ble import BleakWrapperController, BleUUID
+from open_gopro.api import WirelessApi
+from open_gopro.ble import BleUUID, GattDB
+from open_gopro.ble_ingest import IngestStats, Notification, NotificationIngest
+from open_gopro.ble_multiplexer import BleRequestMultiplexer
 from open_gopro.communicator_interface import (
     BleMessage,
     GoProBle,
@@ -31,6 +29,11 @@ from open_gopro.communicator_interface import (
     Message,
     MessageRules,
 )
+from open_gopro.connection_profile import (
+    CohnProfile,
+    ConnectionProfile,
+    ConnectionProfileStore,
+)
 from open_gopro.constants import ActionId, GoProUUID, StatusId
 from open_gopro.constants.settings import SettingId
 from open_gopro.exceptions import (
@@ -46,12 +49,22 @@ from open_gopro.gopro_base import (
     GoProMessageInterface,
     enforce_message_rules,
 )
-from open_gopro.logger import Logger
+from open_gopro.keep_alive import KEEP_ALIVE_VALUE, KeepAliveScheduler
+from open_gopro.logger import DeferredStr, Logger
 from open_gopro.models import CohnInfo, GoProResp
 from open_gopro.parsers.response import BleRespBuilder
-from open_gopro.types import ResponseType, UpdateCb, UpdateType
-from open_gopro.util import SnapshotQueue, get_current_dst_aware_time, pretty_print
-from open_gopro.wifi import WifiCli
+from open_gopro.types import UpdateCb, UpdateType
+from open_gopro.util import PhaseTimer, get_current_dst_aware_time, pretty_print
+
+if TYPE_CHECKING:
+    from open_gopro.api import (
+        BleCommands,
+        BleSettings,
+        BleStatuses,
+        HttpCommands,
+        HttpSettings,
+    )
+    from open_gopro.state_mirror import CameraStateMirror
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +94,26 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
 
     - ensuring camera is ready / not encoding before transferring data
     - sending keep alive signal periodically
+    - pipelining BLE requests on independent characteristics
+
+    BLE requests on different characteristics (i.e. a setting, a command and a query) are sent without waiting for
+    each other's responses. By default, only one request per characteristic is outstanding at a time. This can be
+    changed with the ``ble_pipeline_depth`` (all characteristics) and ``ble_pipeline_depths`` (per characteristic
+    BleUUID) keyword arguments.
+
+    The keep alives of many cameras can be sent from one task by passing the same KeepAliveScheduler to each of them
+    with the ``keep_alive_scheduler`` keyword argument. Keep alives are then only sent to cameras that have not had a
+    BLE response within the scheduler's interval.
+
+    Many cameras can be found by one continuous scan by passing the same running DiscoveryService to each of them with
+    the ``ble_discovery`` keyword argument. Each open then claims its target from the service instead of scanning.
+
+    Reconnects can be warm-started by passing a ConnectionProfileStore (or a directory to store profiles in) with the
+    ``connection_profiles`` keyword argument. After each successful open, the camera's address, GATT table, API
+    version, and access point / COHN credentials are saved. The next open of a matching target connects to the saved
+    address without scanning, skips characteristic discovery, and uses the saved values instead of reading them from
+    the camera. If the warm start fails, the profile is discarded and the camera is discovered from scratch. The
+    duration of each phase of the last open is available from ``open_phase_durations``.
 
     If no target arg is passed in, the first discovered BLE GoPro device will be connected to.
 
@@ -134,11 +167,19 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
         GoProBase.__init__(self, **kwargs)
         # Store initialization information
         self._should_enable_wifi = enable_wifi
-        ble_adapter = kwargs.get("ble_adapter", BleakWrapperController)
-        wifi_adapter = kwargs.get("wifi_adapter", WifiCli)
+        # The default adapters (and their dependencies) are only imported if they are used
+        ble_adapter = kwargs.get("ble_adapter") or open_gopro.ble.BleakWrapperController
+        wifi_adapter = kwargs.get("wifi_adapter") or open_gopro.wifi.WifiCli
         # Set up API delegate
         self._wireless_api = WirelessApi(self)
+        # Keep alive message (and its packets) sent by the keep alive scheduler
+        self._keep_alive_message = self.ble_setting.led._build_set_message(KEEP_ALIVE_VALUE)  # type: ignore
+        self._keep_alive_packets = list(self._fragment(self._keep_alive_message._build_data()))
         self._keep_alive_interval = kwargs.get("keep_alive_interval", 3)
+        # Shared keep alive scheduler. If not set, this instance sends its own keep alives from a task.
+        self._keep_alive_scheduler: KeepAliveScheduler | None = kwargs.get("keep_alive_scheduler")
+        # Monotonic time of the last BLE response
+        self._last_exchange = 0.0
 
         try:
             # Initialize GoPro Communication Client
@@ -155,16 +196,24 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
                 "Could not find a suitable Wifi Interface. If there is an available Wifi interface, try passing it manually with the 'wifi_interface' argument."
             )
             raise e
+        self._ble.wire_trace = self._wire_trace
+        self._ble.discovery = kwargs.get("ble_discovery")
 
         # Builders for currently accumulating synchronous responses, indexed by GoProUUID. This assumes there
         # can only be one active response per BleUUID
         self._active_builders: dict[BleUUID, BleRespBuilder] = {}
-        # Responses that we are waiting for.
-        self._sync_resp_wait_q: SnapshotQueue[ResponseType] = SnapshotQueue()
-        # Synchronous response that has been parsed and are ready for their sender to receive as the response.
-        self._sync_resp_ready_q: SnapshotQueue[GoProResp] = SnapshotQueue()
+        # Received notifications waiting to be accumulated by the event loop
+        self._notifications = NotificationIngest(self._ingest_notifications)
+        # Listener notification tasks that have not yet completed
+        self._listener_tasks: set[asyncio.Task] = set()
+        # Outstanding synchronous requests that are waiting for their response
+        self._ble_requests = BleRequestMultiplexer(
+            kwargs.get("ble_pipeline_depth", BleRequestMultiplexer.DEFAULT_DEPTH), kwargs.get("ble_pipeline_depths")
+        )
 
         self._listeners: dict[UpdateType | GoProBle._CompositeRegisterType, set[UpdateCb]] = defaultdict(set)
+        # Attached by CameraStateMirror.attach
+        self._state_mirror: CameraStateMirror | None = None
 
         # TO be set up when opening in async context
         self._loop: asyncio.AbstractEventLoop
@@ -176,6 +225,10 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
             self._state_tasks: list[asyncio.Task] = []
             self._lock_owner: WirelessGoPro._LockOwner | None = WirelessGoPro._LockOwner.STATE_MANAGER
             self._ready_lock: asyncio.Lock
+            # Messages currently holding the ready lock as the rule enforcer
+            self._ble_messaging_count = 0
+            # perf_counter time when the rule enforcer acquired the ready lock
+            self._ready_lock_acquired = 0.0
             self._keep_alive_task: asyncio.Task
             self._encoding: bool
             self._busy: bool
@@ -183,6 +236,15 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
 
         self._cohn: CohnInfo | None = None
 
+        profiles = kwargs.get("connection_profiles")
+        self._profiles: ConnectionProfileStore | None = (
+            ConnectionProfileStore(profiles) if isinstance(profiles, (str, Path)) else profiles
+        )
+        # Profile that the current open was warm-started from
+        self._profile: ConnectionProfile | None = None
+        self._ap_credentials: tuple[str, str] | None = None
+        self._open_timer = PhaseTimer()
+
     @property
     def identifier(self) -> str:
         """Get a unique identifier for this instance.
@@ -212,6 +274,37 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
         # We can't rely on the BLE Client since it can be connected but not ready
         return self._is_ble_connected
 
+    @property
+    def open_phase_durations(self) -> dict[str, float]:
+        """How long each phase of the last open took
+
+        The BLE phases are scan, connect, pair, discover, and notifications. These are followed by state (registering
+        for encoding / busy), init (client info, time, and API version), and wifi. Phases that were skipped (i.e. when
+        warm-started from a connection profile) are not included.
+
+        Returns:
+            dict[str, float]: phase name --> duration in seconds
+        """
+        return self._ble.phase_durations | self._open_timer.durations
+
+    @property
+    def notification_stats(self) -> IngestStats:
+        """Get the instrumentation of received BLE notifications (i.e. queue depth and drain latency)
+
+        Returns:
+            IngestStats: current statistics
+        """
+        return self._notifications.stats
+
+    @property
+    def state_mirror(self) -> CameraStateMirror | None:
+        """Get the camera state mirror that status / setting reads are currently answered from
+
+        Returns:
+            CameraStateMirror | None: attached mirror or None if one is not attached
+        """
+        return self._state_mirror
+
     @property
     def is_http_connected(self) -> bool:
         """Are we connected via HTTP to the GoPro device?
@@ -292,40 +385,57 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
         # If we are to perform BLE housekeeping
         if self._should_maintain_state:
             self._ready_lock = asyncio.Lock()
-            self._keep_alive_task = asyncio.create_task(self._periodic_keep_alive())
+            self._ble_messaging_count = 0
+            if not self._keep_alive_scheduler:
+                self._keep_alive_task = asyncio.create_task(self._periodic_keep_alive())
             self._encoding = True
             self._busy = True
             self._encoding_started = asyncio.Event()
 
+        self._open_timer.reset()
+        self._profile = self._load_profile()
         RETRIES = 5
         for retry in range(RETRIES):
             try:
                 await self._open_ble(timeout, retries)
 
-                await self.ble_command.set_third_party_client_info()
-                # Set current dst-aware time. Don't assert on success since some old cameras don't support this command.
-                dt, tz_offset, is_dst = get_current_dst_aware_time()
-                await self.ble_command.set_date_time_tz_dst(date_time=dt, tz_offset=tz_offset, is_dst=is_dst)
-
-                # Find and configure API version
-                version = (await self.ble_command.get_open_gopro_api_version()).data
+                with self._open_timer.phase("init"):
+                    # Set current dst-aware time. Don't assert on success since some old cameras don't support this
+                    # command.
+                    dt, tz_offset, is_dst = get_current_dst_aware_time()
+                    # These are independent so send them together
+                    requests = [
+                        self.ble_command.set_third_party_client_info(),
+                        self.ble_command.set_date_time_tz_dst(date_time=dt, tz_offset=tz_offset, is_dst=is_dst),
+                    ]
+                    # Find and configure API version
+                    if not (version := self._profile.api_version if self._profile else None):
+                        requests.append(self.ble_command.get_open_gopro_api_version())
+                    responses = await asyncio.gather(*requests)
+                    version = version or responses[-1].data
                 if version != self.version:
                     raise InvalidOpenGoProVersion(version)
                 logger.info(f"Using Open GoPro API version {version}")
 
                 # Establish Wifi connection if desired
-                if self._should_enable_wifi:
-                    await self._open_wifi(timeout, retries)
-                else:
-                    # Otherwise, turn off Wifi
-                    logger.info("Turning off the camera's Wifi radio")
-                    await self.ble_command.enable_wifi_ap(enable=False)
+                with self._open_timer.phase("wifi"):
+                    if self._should_enable_wifi:
+                        await self._open_wifi(timeout, retries)
+                    else:
+                        # Otherwise, turn off Wifi
+                        logger.info("Turning off the camera's Wifi radio")
+                        await self.ble_command.enable_wifi_ap(enable=False)
                 self._open = True
+                self._save_profile()
                 return
 
             except Exception as e:  # pylint: disable=broad-exception-caught
                 logger.error(f"Error while opening: {e}")
                 await self.close()
+                if self._profile:
+                    logger.warning("Discarding connection profile and rediscovering the camera")
+                    self._profile = None
+                    self._ble.clear_cached()
                 if retry > RETRIES:
                     raise e
 
@@ -339,6 +449,8 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
         """
         await self._close_wifi()
         await self._close_ble()
+        await self._http_transport.close()
+        self._close_wire_trace()
         self._open = False
 
     def register_update(self, callback: UpdateCb, update: UpdateType) -> None:
@@ -465,7 +577,7 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
         """
         status = (await self.ble_command.cohn_get_status(register=False)).data
         # We need to provision if nor currently provisioned
-        if not status.enabled:
+        if is_provisioning := not status.enabled:
             assert await self._provision_cohn(timeout)
 
         credentials: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
@@ -480,9 +592,14 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
             logger.info("Waiting for COHN to be connected")
             await self.ble_command.cohn_get_status(register=True)
             ip_address, password = await asyncio.wait_for(credentials.get(), timeout)
-            cert = (await self.ble_command.cohn_get_certificate()).data.cert
+            # Provisioning creates a new certificate so only a saved certificate for the same credentials is reused
+            if not is_provisioning and self._profile and (cached := self._profile.cohn) and cached.password == password:
+                cert = cached.certificate
+            else:
+                cert = (await self.ble_command.cohn_get_certificate()).data.cert
             self._cohn = CohnInfo(ip_address, "gopro", password, cert)
             logger.info(f"Using COHN Credentials: {self._cohn}")
+            self._save_profile()
             return True
         except TimeoutError:
             return False
@@ -508,7 +625,7 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
             bool: True if it succeeded,. False otherwise
 
         """
-        return (await self.ble_setting.led.set(66)).ok  # type: ignore
+        return (await self.ble_setting.led.set(KEEP_ALIVE_VALUE)).ok  # type: ignore
 
     @GoProBase._ensure_opened((GoProMessageInterface.BLE,))
     async def connect_to_access_point(self, ssid: str, password: str) -> bool:
@@ -569,28 +686,33 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
     async def _enforce_message_rules(
         self, wrapped: Callable, message: Message, rules: MessageRules = MessageRules(), **kwargs: Any
     ) -> GoProResp:
+        # Reads that the state mirror can answer don't need to wait for the camera
+        if self._state_mirror and (response := self._state_mirror._serve(message)):  # type: ignore
+            return response
         # Acquire ready lock unless we are initializing or this is a Set Shutter Off command
         if self._should_maintain_state and self.is_open and not rules.is_fastpass(**kwargs):
-            logger.trace(f"{wrapped.__name__} acquiring lock")  # type: ignore
-            await self._ready_lock.acquire()
-            logger.trace(f"{wrapped.__name__} has the lock")  # type: ignore
-            self._lock_owner = WirelessGoPro._LockOwner.RULE_ENFORCER
-            response = await wrapped(message, **kwargs)
+            logger.trace("%s acquiring lock", wrapped.__name__)  # type: ignore
+            start = time.perf_counter()
+            await self._acquire_ble_messaging()
+            self._metrics.record(message._identifier, "wait", time.perf_counter() - start)
+            logger.trace("%s has the lock", wrapped.__name__)  # type: ignore
+            try:
+                response = await wrapped(message, **kwargs)
+            finally:
+                # Release the lock since we acquired it
+                logger.trace("%s releasing the lock", wrapped.__name__)  # type: ignore
+                self._release_ble_messaging()
         else:  # Either we're not maintaining state, we're not opened yet, or this is a fastpass message
             response = await wrapped(message, **kwargs)
 
-        # Release the lock if we acquired it
         if self._should_maintain_state:
-            if self._lock_owner is WirelessGoPro._LockOwner.RULE_ENFORCER:
-                logger.trace(f"{wrapped.__name__} releasing the lock")  # type: ignore
-                self._lock_owner = None
-                self._ready_lock.release()
-                logger.trace(f"{wrapped.__name__} released the lock")  # type: ignore
             # Is there any special handling required after receiving the response?
             if rules.should_wait_for_encoding_start(**kwargs):
                 logger.trace("Waiting to receive encoding started.")  # type: ignore
+                start = time.perf_counter()
                 await self._encoding_started.wait()
                 self._encoding_started.clear()
+                self._metrics.record(message._identifier, "encoding", time.perf_counter() - start)
         return response
 
     async def _notify_listeners(self, update: UpdateType, value: Any) -> None:
@@ -633,14 +755,18 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
         # Establish connection, pair, etc.
         await self._ble.open(timeout, retries)
         self._is_ble_connected = True
+        self._last_exchange = time.monotonic()
+        if self._should_maintain_state and self._keep_alive_scheduler:
+            self._keep_alive_scheduler.add(self)
         # Start state maintenance
         if self._should_maintain_state:
-            self._ble_disconnect_event.clear()
-            await self._ready_lock.acquire()
-            encoding = (await self.ble_status.encoding.register_value_update(self._update_internal_state)).data
-            await self._update_internal_state(StatusId.ENCODING, encoding)
-            busy = (await self.ble_status.busy.register_value_update(self._update_internal_state)).data
-            await self._update_internal_state(StatusId.BUSY, busy)
+            with self._open_timer.phase("state"):
+                self._ble_disconnect_event.clear()
+                await self._ready_lock.acquire()
+                encoding = (await self.ble_status.encoding.register_value_update(self._update_internal_state)).data
+                await self._update_internal_state(StatusId.ENCODING, encoding)
+                busy = (await self.ble_status.busy.register_value_update(self._update_internal_state)).data
+                await self._update_internal_state(StatusId.BUSY, busy)
         logger.info("BLE is ready!")
 
     async def _update_internal_state(self, update: UpdateType, value: int) -> None:
@@ -660,7 +786,7 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
             task.cancel()
         self._state_tasks = []
 
-        logger.trace(f"State update received {update.name} ==> {value}")  # type: ignore
+        logger.trace("State update received %s ==> %s", update.name, value)  # type: ignore
         should_notify_encoding = False
         if update == StatusId.ENCODING:
             self._encoding = bool(value)
@@ -668,7 +794,7 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
                 should_notify_encoding = True
         elif update == StatusId.BUSY:
             self._busy = bool(value)
-        logger.trace(f"Current internal states: {self._encoding=} {self._busy=}")  # type: ignore
+        logger.trace("Current internal states: encoding=%s busy=%s", self._encoding, self._busy)  # type: ignore
 
         if self._lock_owner is WirelessGoPro._LockOwner.STATE_MANAGER and await self.is_ready:
             logger.trace("Control releasing lock")  # type: ignore
@@ -687,68 +813,132 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
             logger.trace("Control setting encoded started")  # type: ignore
             self._encoding_started.set()
 
-    async def _route_response(self, response: GoProResp) -> None:
+    async def _route_response(self, response: GoProResp, uuid: BleUUID) -> None:
         """After parsing response, route it to any stakeholders (such as registered listeners)
 
         Args:
             response (GoProResp): parsed response to route
+            uuid (BleUUID): characteristic that the response was received on
         """
-        original_response = deepcopy(response)
+        for update, value in self._dispatch_response(response, uuid):
+            await self._notify_listeners(update, value)
+
+    def _dispatch_response(self, response: GoProResp, uuid: BleUUID) -> list[tuple[UpdateType, Any]]:
+        """Resolve any outstanding request that a parsed response answers and get the updates that it contains
+
+        This does not await so that a batch of notifications can be dispatched without yielding.
+
+        Args:
+            response (GoProResp): parsed response to dispatch
+            uuid (BleUUID): characteristic that the response was received on
+
+        Returns:
+            list[tuple[UpdateType, Any]]: updates to notify registered listeners of, in order
+        """
+        if self._state_mirror:
+            self._state_mirror._ingest(response)
         # We only support queries for either one ID or all ID's. If this is an individual query, extract the value
-        # for cleaner response data
+        # for cleaner response data. The extracted value is resolved in a shallow copy so that the response is still
+        # logged as it was received.
+        resolved = response
         if response._is_query and not response._is_push and len(response.data) == 1:
-            response.data = list(response.data.values())[0]
-
-        # Check if this is the awaited synchronous response (id matches). Note! these have to come in order.
-        if await self._sync_resp_wait_q.peek_front() == response.identifier:
-            logger.info(Logger.build_log_rx_str(original_response, asynchronous=False))
-            # Dequeue it and put this on the ready queue
-            await self._sync_resp_wait_q.get()
-            await self._sync_resp_ready_q.put(response)
-        # If this wasn't the awaited synchronous response...
-        else:
-            logger.info(Logger.build_log_rx_str(original_response, asynchronous=True))
+            resolved = dataclasses.replace(response, data=next(iter(response.data.values())))
+
+        # Check if this is an awaited synchronous response (characteristic and id match an outstanding request)
+        awaited = self._ble_requests.resolve(uuid, resolved)
+        logger.info(DeferredStr(Logger.build_log_rx_str, response, asynchronous=not awaited))
         if response._is_push:
-            for update_id, value in response.data.items():
-                await self._notify_listeners(update_id, value)
-        elif isinstance(response.identifier, ActionId):
-            await self._notify_listeners(response.identifier, response.data)
+            return list(response.data.items())
+        if isinstance(response.identifier, ActionId):
+            return [(response.identifier, response.data)]
+        return []
 
     def _notification_handler(self, handle: int, data: bytearray) -> None:
         """Receive notifications from the BLE controller.
 
+        This is called from the BLE controller's thread so it only buffers the notification for the event loop.
+
         Args:
             handle (int): Attribute handle that notification was received on.
             data (bytearray): Bytestream that was received.
         """
+        if self._wire_trace:
+            self._wire_trace.ble_notification(handle, data)
+        self._notifications.put(self._loop, handle, data)
+
+    def _ingest_notifications(self, batch: list[Notification]) -> None:
+        """Accumulate a batch of received notifications and dispatch each response that they complete
+
+        Notifications are accumulated in the order that they were received. Requests are resolved immediately while
+        registered listeners are notified (in order) from one task per batch so that a listener can send BLE
+        messages without blocking ingestion. A notification that can not be handled is logged and its partial
+        response discarded without affecting the rest of the batch.
 
-        async def _async_notification_handler() -> None:
+        Args:
+            batch (list[Notification]): attribute handle and data of each received notification
+        """
+        self._metrics.record_depth("ble_notifications", len(batch))
+        updates: list[tuple[UpdateType, Any]] = []
+        for handle, data in batch:
+            try:
+                uuid = self._ble.gatt_db.handle2uuid(handle)
+            except KeyError:
+                logger.error(f"Dropping notification received on unknown handle {handle}")
+                continue
             # Responses we don't care about. For now, just the BLE-spec defined battery characteristic
-            if (uuid := self._ble.gatt_db.handle2uuid(handle)) == GoProUUID.BATT_LEVEL:
-                return
-            logger.debug(f'Received response on BleUUID [{uuid}]: {data.hex(":")}')
+            if uuid == GoProUUID.BATT_LEVEL:
+                continue
+            logger.debug("Received response on BleUUID [%s]: %s", uuid, DeferredStr(data.hex, ":"))
             # Add to response dict if not already there
-            if uuid not in self._active_builders:
+            if (builder := self._active_builders.get(uuid)) is None:
                 builder = BleRespBuilder()
                 builder.set_uuid(uuid)
                 self._active_builders[uuid] = builder
-            # Accumulate the packet
-            self._active_builders[uuid].accumulate(data)
-            if (builder := self._active_builders[uuid]).is_finished_accumulating:
-                logger.trace(f"Finished accumulating on {uuid}")  # type: ignore
+            try:
+                # Accumulate the packet
+                builder.accumulate(data)
+                if not builder.is_finished_accumulating:
+                    continue
+                logger.trace("Finished accumulating on %s", uuid)  # type: ignore
                 # Clear active response from response dict
                 del self._active_builders[uuid]
-                await self._route_response(builder.build())
+                start = time.perf_counter()
+                response = builder.build()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.exception(f"Dropping response on {uuid} that failed to parse: {repr(e)}")
+                self._active_builders.pop(uuid, None)
+                continue
+            self._metrics.record(response.identifier, "parse", time.perf_counter() - start)
+            updates.extend(self._dispatch_response(response, uuid))
+        if updates and self._listeners:
+            task = asyncio.create_task(self._notify_all_listeners(updates))
+            self._listener_tasks.add(task)
+            task.add_done_callback(self._listener_tasks.discard)
+
+    async def _notify_all_listeners(self, updates: list[tuple[UpdateType, Any]]) -> None:
+        """Notify all registered listeners of each update in order
 
-        asyncio.run_coroutine_threadsafe(_async_notification_handler(), self._loop)
+        Args:
+            updates (list[tuple[UpdateType, Any]]): updates to notify
+        """
+        for update, value in updates:
+            try:
+                await self._notify_listeners(update, value)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.exception(f"Listener failed to handle {update}: {repr(e)}")
 
     async def _close_ble(self) -> None:
         """Terminate BLE connection if it is connected"""
         if self._should_maintain_state:
-            self._keep_alive_task.cancel()
+            if self._keep_alive_scheduler:
+                self._keep_alive_scheduler.remove(self)
+            else:
+                self._keep_alive_task.cancel()
         if self.is_ble_connected and self._ble is not None:
             await self._ble.close()
             await self._ble_disconnect_event.wait()
+        await self._notifications.stop()
+        self._active_builders.clear()
 
     def _disconnect_handler(self, _: Any) -> None:
         """Disconnect callback from BLE controller
@@ -757,6 +947,8 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
             ConnectionTerminated: We entered this callback in an unexpected state.
         """
         self._is_ble_connected = False
+        if self._state_mirror:
+            self._state_mirror._invalidate()
         if self._ble_disconnect_event.is_set():
             raise ConnectionTerminated("BLE connection terminated unexpectedly.")
         self._ble_disconnect_event.set()
@@ -766,27 +958,114 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
     async def _send_ble_message(
         self, message: BleMessage, rules: MessageRules = MessageRules(), **kwargs: Any
     ) -> GoProResp:
-        # Store information on the response we are expecting
-        await self._sync_resp_wait_q.put(message._identifier)
-        logger.info(Logger.build_log_tx_str(pretty_print(message._as_dict(**kwargs))))
+        start = time.perf_counter()
+        async with self._ble_requests.slot(message._uuid):
+            slotted = time.perf_counter()
+            self._metrics.record(message._identifier, "slot", slotted - start)
+            if self._metrics.enabled:
+                self._metrics.record_depth("ble_requests", self._ble_requests.outstanding)
+            # Store information on the response we are expecting
+            response_future = self._ble_requests.expect(message._uuid, message._identifier)
+            logger.info(DeferredStr(lambda: Logger.build_log_tx_str(pretty_print(message._as_dict(**kwargs)))))
+
+            # Fragment data and write it
+            for packet in self._fragment(message._build_data(**kwargs)):
+                logger.debug("Writing to [%s] UUID: %s", message._uuid.name, DeferredStr(packet.hex, ":"))
+                await self._ble.write(message._uuid, packet)
+            written = time.perf_counter()
+            self._metrics.record(message._identifier, "transmit", written - slotted)
+
+            # Wait to be notified that response was received
+            response = await self._wait_for_ble_response(response_future)
+            self._metrics.record(message._identifier, "response", time.perf_counter() - written)
 
-        # Fragment data and write it
-        for packet in self._fragment(message._build_data(**kwargs)):
-            logger.debug(f"Writing to [{message._uuid.name}] UUID: {packet.hex(':')}")
-            await self._ble.write(message._uuid, packet)
+        # Check status
+        if not response.ok:
+            logger.warning(f"Received non-success status: {response.status}")
+
+        return response
+
+    async def _wait_for_ble_response(self, response_future: asyncio.Future[GoProResp]) -> GoProResp:
+        """Wait for the response to a written request
+
+        Args:
+            response_future (asyncio.Future[GoProResp]): future from the request multiplexer
+
+        Raises:
+            ResponseTimeout: did not receive a response in time
 
-        # Wait to be notified that response was received
+        Returns:
+            GoProResp: response
+        """
         try:
-            response = await asyncio.wait_for(self._sync_resp_ready_q.get(), WirelessGoPro.WRITE_TIMEOUT)
-        except queue.Empty as e:
+            response = await asyncio.wait_for(response_future, WirelessGoPro.WRITE_TIMEOUT)
+            self._last_exchange = time.monotonic()
+            return response
+        except asyncio.TimeoutError as e:
             logger.error(f"Response timeout of {WirelessGoPro.WRITE_TIMEOUT} seconds!")
             raise ResponseTimeout(WirelessGoPro.WRITE_TIMEOUT) from e
+        finally:
+            self._ble_requests.discard(response_future)
 
-        # Check status
-        if not response.ok:
-            logger.warning(f"Received non-success status: {response.status}")
+    async def _acquire_ble_messaging(self) -> None:
+        """Wait until the camera is ready and take control of BLE messaging as the rule enforcer
 
-        return response
+        Messages that are already in flight are joined (so that they are pipelined) as long as the camera is still
+        ready. Otherwise, this waits for the ready lock. Each call must be followed by _release_ble_messaging.
+        """
+        if not self._should_maintain_state:
+            return
+        if not (self._lock_owner is WirelessGoPro._LockOwner.RULE_ENFORCER and await self.is_ready):
+            start = time.perf_counter()
+            await self._ready_lock.acquire()
+            self._ready_lock_acquired = time.perf_counter()
+            self._metrics.record_lock("ready_lock", "wait", self._ready_lock_acquired - start)
+            self._lock_owner = WirelessGoPro._LockOwner.RULE_ENFORCER
+        self._ble_messaging_count += 1
+
+    def _release_ble_messaging(self) -> None:
+        """Release control of BLE messaging taken by _acquire_ble_messaging
+
+        The ready lock is released once the last message that joined it is released.
+        """
+        if self._should_maintain_state and self._lock_owner is WirelessGoPro._LockOwner.RULE_ENFORCER:
+            self._ble_messaging_count -= 1
+            if not self._ble_messaging_count:
+                self._metrics.record_lock("ready_lock", "hold", time.perf_counter() - self._ready_lock_acquired)
+                self._lock_owner = None
+                self._ready_lock.release()
+
+    @GoProBase._ensure_opened((GoProMessageInterface.BLE,))
+    async def _send_armed_ble_message(self, message: BleMessage, packets: list[bytes]) -> GoProResp:
+        """Write the pre-fragmented packets of a message and wait for its response, bypassing message rules
+
+        This must only be used while holding a slot of the message's characteristic from the request multiplexer. A
+        message that can change the camera's state must also hold BLE messaging from _acquire_ble_messaging while one
+        that can't (i.e. a keep alive) may be sent without waiting for the camera to be ready. Waiting for the response
+        raises ResponseTimeout if it is not received in time.
+
+        Args:
+            message (BleMessage): message that the packets were built from
+            packets (list[bytes]): packets from _fragment(message._build_data(...))
+
+        Returns:
+            GoProResp: response
+        """
+        response_future = self._ble_requests.expect(message._uuid, message._identifier)
+        for packet in packets:
+            await self._ble.write(message._uuid, packet)
+        return await self._wait_for_ble_response(response_future)
+
+    async def _send_keep_alive(self) -> bool:
+        """Send a keep alive for the keep alive scheduler
+
+        Keep alives don't change the camera's state so this does not wait for the camera to be ready.
+
+        Returns:
+            bool: True if it succeeded, False otherwise
+        """
+        async with self._ble_requests.slot(self._keep_alive_message._uuid):
+            return (await self._send_armed_ble_message(self._keep_alive_message, self._keep_alive_packets)).ok
 
     @GoProBase._ensure_opened((GoProMessageInterface.BLE,))
     @enforce_message_rules
@@ -794,7 +1073,7 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
         self, message: BleMessage, rules: MessageRules = MessageRules(), **kwargs: Any
     ) -> GoProResp:
         received_data = await self._ble.read(message._uuid)
-        logger.debug(f"Reading from {message._uuid.name}")
+        logger.debug("Reading from %s", message._uuid.name)
         builder = BleRespBuilder()
         builder.set_uuid(message._uuid)
         builder.set_packet(received_data)
@@ -838,15 +1117,23 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
         Raises:
             ConnectFailed: Was not able to establish the Wifi Connection
         """
-        logger.info("Discovering Wifi AP info and enabling via BLE")
-        password = (await self.ble_command.get_wifi_password()).data
-        ssid = (await self.ble_command.get_wifi_ssid()).data
+        if self._profile and self._profile.ssid and self._profile.password:
+            logger.info("Using Wifi AP info from connection profile and enabling via BLE")
+            ssid, password = self._profile.ssid, self._profile.password
+            is_cached = True
+        else:
+            logger.info("Discovering Wifi AP info and enabling via BLE")
+            ssid, password = await self._get_ap_credentials()
+            is_cached = False
         for retry in range(1, retries):
             try:
                 assert (await self.ble_command.enable_wifi_ap(enable=True)).ok
 
                 async def _wait_for_camera_wifi_ready() -> None:
                     logger.debug("Waiting for camera wifi ready status")
+                    if self._state_mirror and self._state_mirror.is_live:
+                        await self._state_mirror.wait_for(lambda state: bool(state.statuses.get(StatusId.AP_MODE)))
+                        return
                     while not (await self.ble_status.ap_mode.get_value()).data:
                         await asyncio.sleep(0.200)
 
@@ -857,8 +1144,66 @@ class WirelessGoPro(GoProBase[WirelessApi], GoProWirelessInterface):
                 logger.warning(f"Wifi connection failed. Retrying #{retry}")
                 # In case camera Wifi is in strange disable, reset it
                 assert (await self.ble_command.enable_wifi_ap(enable=False)).ok
+                # The credentials may have changed (i.e. camera was reset) since they were saved
+                if is_cached:
+                    ssid, password = await self._get_ap_credentials()
+                    is_cached = False
         else:
             raise ConnectFailed("Wifi Connection failed", timeout, retries)
+        self._ap_credentials = (ssid, password)
+
+    async def _get_ap_credentials(self) -> tuple[str, str]:
+        """Read the access point SSID and password from the camera
+
+        Returns:
+            tuple[str, str]: (SSID, password)
+        """
+        ssid, password = await asyncio.gather(self.ble_command.get_wifi_ssid(), self.ble_command.get_wifi_password())
+        return ssid.data, password.data
+
+    def _load_profile(self) -> ConnectionProfile | None:
+        """Find the connection profile of the target and prepare the BLE client to connect without discovery
+
+        Returns:
+            ConnectionProfile | None: profile or None if warm start is not enabled or no profile matches
+        """
+        if not self._profiles:
+            return None
+        target = self._ble.target
+        if not (
+            profile := (
+                self._profiles.find(target) if isinstance(target, Pattern) else self._profiles.load(str(target))
+            )
+        ):
+            return None
+        logger.info(f"Warm-starting from connection profile of {profile.identifier}")
+        gatt_db: GattDB | None = None
+        if profile.gatt_db:
+            try:
+                gatt_db = GattDB.from_dict(profile.gatt_db, GoProUUID)
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                # i.e. stored in a previous format. Characteristics will be discovered instead.
+                logger.warning(f"Ignoring invalid GATT table in connection profile: {repr(e)}")
+        if profile.address is not None:
+            self._ble.use_cached(profile.address, profile.identifier, gatt_db)
+        return profile
+
+    def _save_profile(self) -> None:
+        """Save everything that was discovered while opening to warm-start the next open"""
+        if not self._profiles:
+            return
+        previous = self._profile
+        ssid, password = self._ap_credentials or ((previous.ssid, previous.password) if previous else (None, None))
+        self._profile = ConnectionProfile(
+            identifier=self.identifier,
+            address=self._ble.address,
+            gatt_db=self._ble.gatt_db.as_dict(),
+            api_version=self.version,
+            ssid=ssid,
+            password=password,
+            cohn=CohnProfile.from_cohn_info(self._cohn) if self._cohn else previous.cohn if previous else None,
+        )
+        self._profiles.save(self._profile)
 
     async def _close_wifi(self) -> None:
         """Terminate the Wifi connection."""
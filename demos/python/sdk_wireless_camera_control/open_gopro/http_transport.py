@@ -0,0 +1,278 @@
+# http_transport.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Asynchronous HTTP transports used to send HTTP messages to a GoPro"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Final, TypeVar
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class HttpTransport(ABC):
+    """Interface for an asynchronous HTTP transport
+
+    A transport is owned by one GoPro instance and is expected to maintain any connection state (i.e. pooled
+    keep-alive connections) for the lifetime of that instance.
+    """
+
+    @abstractmethod
+    async def get(self, url: str, *, timeout: float, **kwargs: Any) -> requests.Response:
+        """Send an HTTP GET request
+
+        Args:
+            url (str): full URL to request
+            timeout (float): time in seconds to wait for the response
+            **kwargs (Any): additional request arguments (headers, verify, etc.)
+
+        Returns:
+            requests.Response: received response
+        """
+
+    @abstractmethod
+    async def put(self, url: str, *, timeout: float, **kwargs: Any) -> requests.Response:
+        """Send an HTTP PUT request
+
+        Args:
+            url (str): full URL to request
+            timeout (float): time in seconds to wait for the response
+            **kwargs (Any): additional request arguments (json, headers, verify, etc.)
+
+        Returns:
+            requests.Response: received response
+        """
+
+    @abstractmethod
+    async def probe(self, url: str, *, timeout: float, **kwargs: Any) -> tuple[int | None, bool]:
+        """Find the size of a resource and whether it can be requested in byte ranges
+
+        Args:
+            url (str): full URL to request
+            timeout (float): time in seconds to wait for the response
+            **kwargs (Any): additional request arguments (headers, verify, etc.)
+
+        Returns:
+            tuple[int | None, bool]: size in bytes (None if unknown) and whether range requests are supported
+        """
+
+    @abstractmethod
+    async def download(
+        self,
+        url: str,
+        file: Path,
+        *,
+        timeout: float,
+        byte_range: tuple[int, int] | None = None,
+        on_chunk: Callable[[int], None] | None = None,
+        **kwargs: Any,
+    ) -> Path:
+        """Stream the body of an HTTP GET request to a file
+
+        If a byte range is requested, the file must already exist and the range is written at its offset in the file.
+        Otherwise the file is (re)created.
+
+        Args:
+            url (str): full URL to request
+            file (Path): local file to write the body to
+            timeout (float): time in seconds to wait for each chunk of the response
+            byte_range (tuple[int, int] | None): inclusive (first, last) byte range to request. Defaults to None
+                (request the entire resource).
+            on_chunk (Callable[[int], None] | None): called with the size of each chunk after it is written. This
+                may be called from a different thread. Defaults to None.
+            **kwargs (Any): additional request arguments (headers, verify, etc.)
+
+        Returns:
+            Path: the file that was written to
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release all connections held by the transport"""
+
+
+class RequestsHttpTransport(HttpTransport):
+    """HTTP transport that uses a pooled requests session without blocking the event loop
+
+    All requests are sent from a dedicated worker thread pool so that the event loop (and therefore BLE notification
+    handling for this and any other cameras) is never stalled. Connections are kept alive and re-used via the
+    session's connection pool. The amount of simultaneous requests sent to any one host is capped.
+
+    Attributes:
+        DEFAULT_MAX_CONCURRENCY (Final[int]): default maximum amount of simultaneous requests per host
+        DEFAULT_CHUNK_SIZE (Final[int]): default chunk size in bytes to use when streaming to a file
+
+    Args:
+        max_concurrency (int): maximum amount of simultaneous requests per host. Defaults to
+            DEFAULT_MAX_CONCURRENCY.
+        chunk_size (int): chunk size in bytes to use when streaming to a file. Defaults to DEFAULT_CHUNK_SIZE.
+
+    Raises:
+        ValueError: max_concurrency is less than 1
+    """
+
+    DEFAULT_MAX_CONCURRENCY: Final[int] = 4
+    DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._max_concurrency = max_concurrency
+        self._chunk_size = chunk_size
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._executor: ThreadPoolExecutor | None = None
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def max_concurrency(self) -> int:
+        """The maximum amount of simultaneous requests per host
+
+        Returns:
+            int: request limit
+        """
+        return self._max_concurrency
+
+    async def get(self, url: str, *, timeout: float, **kwargs: Any) -> requests.Response:
+        """Send a GET request from a worker thread"""
+        return await self._run(url, self._request, "GET", url, timeout=timeout, **kwargs)
+
+    async def put(self, url: str, *, timeout: float, **kwargs: Any) -> requests.Response:
+        """Send a PUT request from a worker thread"""
+        return await self._run(url, self._request, "PUT", url, timeout=timeout, **kwargs)
+
+    async def probe(self, url: str, *, timeout: float, **kwargs: Any) -> tuple[int | None, bool]:
+        """Probe a resource's size and range support from a worker thread"""
+        return await self._run(url, self._probe, url, timeout=timeout, **kwargs)
+
+    async def download(
+        self,
+        url: str,
+        file: Path,
+        *,
+        timeout: float,
+        byte_range: tuple[int, int] | None = None,
+        on_chunk: Callable[[int], None] | None = None,
+        **kwargs: Any,
+    ) -> Path:
+        """Stream a resource (or a byte range of it) to a file from a worker thread"""
+        return await self._run(url, self._download, url, file, byte_range, on_chunk, timeout=timeout, **kwargs)
+
+    async def close(self) -> None:
+        """Close the session and shut down the worker threads"""
+        self._session.close()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Blocking request. Must only be called from a worker thread.
+
+        Args:
+            method (str): HTTP method
+            url (str): full URL to request
+            **kwargs (Any): request arguments
+
+        Returns:
+            requests.Response: received response
+        """
+        response = self._session.request(method, url, **kwargs)
+        # Read the body here so the connection is returned to the pool from the worker thread
+        _ = response.content
+        return response
+
+    def _probe(self, url: str, **kwargs: Any) -> tuple[int | None, bool]:
+        """Blocking probe for resource size and range support. Must only be called from a worker thread.
+
+        Args:
+            url (str): full URL to request
+            **kwargs (Any): request arguments
+
+        Returns:
+            tuple[int | None, bool]: size in bytes (None if unknown) and whether range requests are supported
+        """
+        headers = {**kwargs.pop("headers", {}), "Range": "bytes=0-0"}
+        # If the range is not honored, only the headers are read and the connection is discarded.
+        with self._session.get(url, stream=True, headers=headers, **kwargs) as response:
+            response.raise_for_status()
+            if response.status_code == 206 and (content_range := response.headers.get("Content-Range")):
+                _ = response.content  # Consume the single byte so the connection is returned to the pool
+                total = content_range.rpartition("/")[2]
+                return (int(total) if total.isdigit() else None), True
+            length = response.headers.get("Content-Length")
+            return (int(length) if length and length.isdigit() else None), False
+
+    def _download(
+        self,
+        url: str,
+        file: Path,
+        byte_range: tuple[int, int] | None,
+        on_chunk: Callable[[int], None] | None,
+        **kwargs: Any,
+    ) -> Path:
+        """Blocking streamed download. Must only be called from a worker thread.
+
+        Args:
+            url (str): full URL to request
+            file (Path): file to write body to
+            byte_range (tuple[int, int] | None): inclusive byte range to request or None for entire resource
+            on_chunk (Callable[[int], None] | None): called with the size of each written chunk
+            **kwargs (Any): request arguments
+
+        Raises:
+            requests.HTTPError: the server did not honor the requested byte range
+
+        Returns:
+            Path: the file that was written
+        """
+        if byte_range:
+            kwargs["headers"] = {**kwargs.get("headers", {}), "Range": f"bytes={byte_range[0]}-{byte_range[1]}"}
+        with self._session.get(url, stream=True, **kwargs) as response:
+            response.raise_for_status()
+            if byte_range and response.status_code != 206:
+                raise requests.HTTPError(f"Range request not honored: {response.status_code}", response=response)
+            with open(file, "r+b" if byte_range else "wb") as f:
+                if byte_range:
+                    f.seek(byte_range[0])
+                logger.debug(f"receiving stream to {file}...")
+                for chunk in response.iter_content(chunk_size=self._chunk_size):
+                    f.write(chunk)
+                    if on_chunk:
+                        on_chunk(len(chunk))
+        return file
+
+    async def _run(self, url: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking function in the worker pool, respecting the per-host concurrency cap
+
+        Args:
+            url (str): URL used to identify the host
+            func (Callable[..., T]): blocking function to run
+            *args (Any): positional arguments to pass to function
+            **kwargs (Any): keyword arguments to pass to function
+
+        Returns:
+            T: return value of function
+        """
+        if not self._executor:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency, thread_name_prefix="GoProHttp")
+        host = urlsplit(url).netloc
+        if not (limit := self._host_limits.get(host)):
+            limit = self._host_limits[host] = asyncio.Semaphore(self._max_concurrency)
+        async with limit:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
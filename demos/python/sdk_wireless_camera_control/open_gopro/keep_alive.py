@@ -0,0 +1,188 @@
+# keep_alive.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Send the BLE keep alives of many cameras from one scheduler
+
+Share one scheduler between the cameras by passing it to each of them:
+
+>>> scheduler = KeepAliveScheduler(interval=3)
+>>> fleet = GoProFleet(WirelessGoPro(target, keep_alive_scheduler=scheduler) for target in targets)
+>>> async with fleet:
+>>>     ...
+>>> print(scheduler.stats)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from open_gopro.gopro_wireless import WirelessGoPro
+
+logger = logging.getLogger(__name__)
+
+KEEP_ALIVE_VALUE: Final = 66
+"""LED setting value that the camera treats as a keep alive"""
+
+
+@dataclass(frozen=True)
+class KeepAliveStats:
+    """Keep alive scheduler instrumentation"""
+
+    cameras: int  #: cameras currently scheduled
+    sent: int  #: keep alives that were sent
+    suppressed: int  #: keep alives that were not needed because the camera had a recent exchange
+    failed: int  #: sent keep alives that did not receive a successful response
+
+
+class KeepAliveScheduler:
+    """Send the keep alives of many cameras from one task with a timer wheel
+
+    A camera is due a keep alive a jittered interval after its last successful BLE exchange (of any message). Each
+    due camera that has had an exchange since it was scheduled is rescheduled without sending a keep alive. Keep alives
+    do not wait for the camera to be ready (i.e. for the ready lock) since they don't change the camera's state.
+
+    Cameras are stored in the slot of the wheel that they are due in. The wheel has a slot per tick of the longest
+    interval and the task wakes once per tick (only while there are cameras) to handle its current slot, so the cost is
+    independent of how many cameras there are.
+
+    Args:
+        interval (float): most seconds without an exchange before sending a keep alive. Defaults to 3.
+        jitter (float): fraction of the interval to randomly send keep alives early by, to spread the keep alives
+            of cameras that became idle at the same time. Defaults to 0.1.
+        tick (float): resolution (in seconds) of the timer wheel. Defaults to 0.1.
+    """
+
+    def __init__(self, interval: float = 3, jitter: float = 0.1, tick: float = 0.1) -> None:
+        self._interval = interval
+        self._jitter = jitter
+        self._tick = tick
+        self._slots: list[set[WirelessGoPro]] = [set() for _ in range(math.ceil(interval / tick) + 1)]
+        self._cursor = 0
+        self._cursor_time = 0.0
+        # Camera --> index of the slot it is stored in
+        self._scheduled: dict[WirelessGoPro, int] = {}
+        self._in_flight: set[WirelessGoPro] = set()
+        self._send_tasks: set[asyncio.Task] = set()
+        self._task: asyncio.Task | None = None
+        self._sent = 0
+        self._suppressed = 0
+        self._failed = 0
+
+    @property
+    def interval(self) -> float:
+        """Most seconds without an exchange before a keep alive is sent
+
+        Returns:
+            float: interval
+        """
+        return self._interval
+
+    @property
+    def stats(self) -> KeepAliveStats:
+        """Get the scheduler instrumentation
+
+        Returns:
+            KeepAliveStats: current statistics
+        """
+        return KeepAliveStats(
+            cameras=len(self._scheduled), sent=self._sent, suppressed=self._suppressed, failed=self._failed
+        )
+
+    def add(self, gopro: WirelessGoPro) -> None:
+        """Start sending a camera's keep alives. This must be called from the event loop.
+
+        Args:
+            gopro (WirelessGoPro): camera to keep alive
+        """
+        if not self._task or self._task.done():
+            self._cursor_time = time.monotonic()
+            self._task = asyncio.create_task(self._run())
+        self._schedule(gopro, gopro._last_exchange + self._jittered())
+
+    def remove(self, gopro: WirelessGoPro) -> None:
+        """Stop sending a camera's keep alives. The scheduler task is stopped once there are no cameras.
+
+        Args:
+            gopro (WirelessGoPro): camera to stop keeping alive
+        """
+        if (slot := self._scheduled.pop(gopro, None)) is not None:
+            self._slots[slot].discard(gopro)
+        if not self._scheduled and self._task:
+            self._task.cancel()
+            self._task = None
+
+    def _jittered(self) -> float:
+        """Get a jittered interval
+
+        Returns:
+            float: seconds in [(1 - jitter) * interval, interval]
+        """
+        return self._interval * (1 - self._jitter * random.random())
+
+    def _schedule(self, gopro: WirelessGoPro, due: float) -> None:
+        """Store a camera in the slot of the wheel that it is due in (the next slot if it is already due)
+
+        Args:
+            gopro (WirelessGoPro): camera to schedule
+            due (float): monotonic time that the camera is due
+        """
+        if (previous := self._scheduled.get(gopro)) is not None:
+            self._slots[previous].discard(gopro)
+        ticks = min(max(1, math.ceil((due - self._cursor_time) / self._tick)), len(self._slots) - 1)
+        slot = (self._cursor + ticks) % len(self._slots)
+        self._slots[slot].add(gopro)
+        self._scheduled[gopro] = slot
+
+    async def _run(self) -> None:
+        """Advance the wheel once per tick, handling the cameras in each slot that is reached"""
+        while True:
+            await asyncio.sleep(max(0.0, self._cursor_time + self._tick - time.monotonic()))
+            # Catch up on any ticks that were missed while the event loop was busy
+            while self._cursor_time + self._tick <= time.monotonic():
+                self._cursor_time += self._tick
+                self._cursor = (self._cursor + 1) % len(self._slots)
+                due, self._slots[self._cursor] = self._slots[self._cursor], set()
+                for gopro in due:
+                    self._handle(gopro)
+
+    def _handle(self, gopro: WirelessGoPro) -> None:
+        """Send a due camera's keep alive if it has not had a recent exchange and reschedule it
+
+        Args:
+            gopro (WirelessGoPro): due camera
+        """
+        now = time.monotonic()
+        if now - gopro._last_exchange < self._interval:
+            self._suppressed += 1
+            self._schedule(gopro, gopro._last_exchange + self._jittered())
+            return
+        if gopro.is_ble_connected and gopro not in self._in_flight:
+            self._sent += 1
+            self._in_flight.add(gopro)
+            task = asyncio.create_task(self._send(gopro))
+            self._send_tasks.add(task)
+            task.add_done_callback(self._send_tasks.discard)
+        self._schedule(gopro, now + self._jittered())
+
+    async def _send(self, gopro: WirelessGoPro) -> None:
+        """Send one camera's keep alive
+
+        Args:
+            gopro (WirelessGoPro): camera to send to
+        """
+        try:
+            if not await gopro._send_keep_alive():
+                self._failed += 1
+                logger.error(f"Failed to send keep alive to {gopro.identifier}")
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self._failed += 1
+            logger.error(f"Failed to send keep alive: {repr(e)}")
+        finally:
+            self._in_flight.discard(gopro)
@@ -0,0 +1,39 @@
+# lazy.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Lazily loaded package exports (PEP 562) so that importing a package does not import all of its modules"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build a package's module level __getattr__ and __dir__ that import exports on first access
+
+    Each export is imported from its module the first time that it is accessed and then set on the package so that
+    subsequent accesses are normal attribute lookups.
+
+    >>> __getattr__, __dir__ = lazy_exports(__name__, {"WiredGoPro": ".gopro_wired"})
+
+    Args:
+        package (str): name of the package (i.e. __name__)
+        exports (dict[str, str]): export name to (absolute or package relative) name of the module that defines it
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]: __getattr__ and __dir__ to set on the package
+    """
+
+    def __getattr__(name: str) -> Any:  # pylint: disable=invalid-name
+        if (module := exports.get(name)) is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:  # pylint: disable=invalid-name
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
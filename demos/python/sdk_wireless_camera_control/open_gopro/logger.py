@@ -5,13 +5,35 @@
 
 from __future__ import annotations
 
-import http.client as http_client
 import logging
 from pathlib import Path
-from typing import Any, Final
+from typing import Any, Callable, Final
 
-from rich import traceback
-from rich.logging import RichHandler
+
+class DeferredStr:
+    """A log message (or argument) that is only built if a handler emits the record
+
+    The logging module only converts a message to a string when a handler formats the record so this moves the
+    cost of building expensive messages (i.e. pretty printing a response) off of the path where the record is dropped.
+
+    >>> logger.info(DeferredStr(Logger.build_log_rx_str, response, asynchronous=True))
+    >>> logger.debug("Received %s", DeferredStr(data.hex, ":"))
+
+    Args:
+        build (Callable[..., Any]): called with the following arguments to build the string
+        *args (Any): positional arguments to pass to build
+        **kwargs (Any): keyword arguments to pass to build
+    """
+
+    __slots__ = ("_build", "_args", "_kwargs")
+
+    def __init__(self, build: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self._build = build
+        self._args = args
+        self._kwargs = kwargs
+
+    def __str__(self) -> str:
+        return str(self._build(*self._args, **self._kwargs))
 
 
 class Logger:
@@ -71,9 +93,15 @@ class Logger:
         self.modules = modules or self.modules
         self.handlers: list[logging.Handler] = []
 
+        # Imported here since they are only needed once logging is set up and are slow to import
+        # pylint: disable=import-outside-toplevel
+        import http.client as http_client
+
+        from rich import traceback
+        from rich.logging import RichHandler
+
         # monkey-patch a `print` global into the http.client module; all calls to
-        # print() in that module will then use our logger's debug method
-        http_client.HTTPConnection.debuglevel = 1
+        # print() in that module will then use our logger's debug method. It only prints once a handler emits DEBUG.
         http_client.print = lambda *args: logging.getLogger("http.client").debug(" ".join(args))  # type: ignore
 
         self.file_handler: logging.Handler | None
@@ -133,6 +161,18 @@ class Logger:
             l = logging.getLogger(module)
             l.setLevel(logging.TRACE)  # type: ignore
             l.addHandler(handler)
+        self.update_http_debug_level()
+
+    def update_http_debug_level(self) -> None:
+        """Have http.client print each request / response only if a handler will emit them
+
+        This must be called after changing the level of a handler.
+        """
+        import http.client as http_client  # pylint: disable=import-outside-toplevel
+
+        http_client.HTTPConnection.debuglevel = int(
+            "http.client" in self.modules and any(handler.level <= logging.DEBUG for handler in self.handlers)
+        )
 
     # From https://stackoverflow.com/questions/2183233/how-to-add-a-custom-loglevel-to-pythons-logging-facility/35804945#35804945
     @staticmethod
@@ -244,8 +284,9 @@ def set_file_logging_level(level: int) -> None:
     Args:
         level (int): level to set
     """
-    if fh := Logger.get_instance().file_handler:
+    if fh := (instance := Logger.get_instance()).file_handler:
         fh.setLevel(level)
+        instance.update_http_debug_level()
 
 
 def set_stream_logging_level(level: int) -> None:
@@ -254,7 +295,8 @@ def set_stream_logging_level(level: int) -> None:
     Args:
         level (int): level to set
     """
-    Logger.get_instance().stream_handler.setLevel(level)
+    (instance := Logger.get_instance()).stream_handler.setLevel(level)
+    instance.update_http_debug_level()
 
 
 def set_logging_level(level: int) -> None:
@@ -0,0 +1,178 @@
+# media_catalog.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Persistent per-camera catalog of media that supports incremental media list sync"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from open_gopro.models import MediaItem, MediaList, MediaPath
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MediaListDiff:
+    """Changes between a catalog and a fresh media list"""
+
+    added: list[MediaItem] = field(default_factory=list)  #: items that were not in the catalog
+    modified: list[MediaItem] = field(default_factory=list)  #: items whose modified time changed
+    removed: list[str] = field(default_factory=list)  #: camera paths of items that are no longer on the camera
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+
+class MediaCatalog:
+    """SQLite-backed catalog of the media on one camera
+
+    Each item is keyed by its camera path (directory/filename) and stores the modified time and size last seen on
+    the camera. Every sync is numbered so that the items that first appeared after any previous sync can be
+    queried. Many cameras can share the same database file.
+
+    Membership checks are answered from an in-memory index that is kept in sync with the database.
+
+    Args:
+        database (Path | str): location of SQLite database. Use ":memory:" for a non-persistent catalog.
+        camera (str): identifier of the camera that this catalog tracks (i.e. GoPro.identifier)
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS media (
+            camera TEXT NOT NULL,
+            path TEXT NOT NULL,
+            mod TEXT NOT NULL,
+            size INTEGER,
+            first_sync INTEGER NOT NULL,
+            PRIMARY KEY (camera, path)
+        );
+        CREATE INDEX IF NOT EXISTS media_first_sync ON media (camera, first_sync);
+        CREATE TABLE IF NOT EXISTS syncs (
+            camera TEXT NOT NULL,
+            sync INTEGER NOT NULL,
+            timestamp REAL NOT NULL,
+            PRIMARY KEY (camera, sync)
+        );
+    """
+
+    def __init__(self, database: Path | str, camera: str) -> None:
+        self._camera = camera
+        self._db = sqlite3.connect(str(database))
+        self._db.executescript(MediaCatalog._SCHEMA)
+        # path --> modified time
+        self._index: dict[str, str] = dict(
+            self._db.execute("SELECT path, mod FROM media WHERE camera = ?", (camera,)).fetchall()
+        )
+        self._last_sync: int = self._db.execute(
+            "SELECT COALESCE(MAX(sync), 0) FROM syncs WHERE camera = ?", (camera,)
+        ).fetchone()[0]
+
+    def __contains__(self, key: MediaItem | MediaPath | str) -> bool:
+        if isinstance(key, MediaItem):
+            return self._index.get(key.filename) == key.modified_time
+        return str(key) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def last_sync(self) -> int:
+        """Number of the most recent sync (0 if never synced)
+
+        Returns:
+            int: sync number
+        """
+        return self._last_sync
+
+    def diff(self, media_list: MediaList) -> MediaListDiff:
+        """Compare a media list against the catalog without modifying the catalog
+
+        Args:
+            media_list (MediaList): fresh media list from the camera
+
+        Returns:
+            MediaListDiff: changes since the last sync
+        """
+        diff = MediaListDiff()
+        for item in media_list.files:
+            if (mod := self._index.get(item.filename)) is None:
+                diff.added.append(item)
+            elif mod != item.modified_time:
+                diff.modified.append(item)
+        diff.removed = [path for path in self._index if path not in media_list]
+        return diff
+
+    def sync(self, media_list: MediaList) -> MediaListDiff:
+        """Update the catalog from a fresh media list
+
+        Only the changed items are written to the database.
+
+        Args:
+            media_list (MediaList): fresh media list from the camera
+
+        Returns:
+            MediaListDiff: changes that were applied
+        """
+        diff = self.diff(media_list)
+        sync = self._last_sync + 1
+        with self._db:
+            self._db.executemany(
+                "INSERT INTO media (camera, path, mod, size, first_sync) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (camera, path) DO UPDATE SET mod = excluded.mod, size = excluded.size",
+                [
+                    (self._camera, item.filename, item.modified_time, _size(item), sync)
+                    for item in diff.added + diff.modified
+                ],
+            )
+            self._db.executemany(
+                "DELETE FROM media WHERE camera = ? AND path = ?", [(self._camera, path) for path in diff.removed]
+            )
+            self._db.execute("INSERT INTO syncs VALUES (?, ?, ?)", (self._camera, sync, time.time()))
+        for item in diff.added + diff.modified:
+            self._index[item.filename] = item.modified_time
+        for path in diff.removed:
+            del self._index[path]
+        self._last_sync = sync
+        logger.debug(
+            f"Synced {self._camera} catalog #{sync}: {len(diff.added)} added, {len(diff.modified)} modified, "
+            f"{len(diff.removed)} removed"
+        )
+        return diff
+
+    def added_since(self, sync: int) -> list[str]:
+        """Get the camera paths of items that first appeared after a given sync
+
+        Args:
+            sync (int): sync number to compare against (i.e. a previous value of last_sync)
+
+        Returns:
+            list[str]: camera paths, in the order they were cataloged
+        """
+        return [
+            row[0]
+            for row in self._db.execute(
+                "SELECT path FROM media WHERE camera = ? AND first_sync > ? ORDER BY first_sync, rowid",
+                (self._camera, sync),
+            )
+        ]
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self._db.close()
+
+
+def _size(item: MediaItem) -> int | None:
+    """Get the size of a media item if it is known
+
+    Args:
+        item (MediaItem): media item
+
+    Returns:
+        int | None: size in bytes or None if unknown
+    """
+    return int(item.file_size) if item.file_size else None
@@ -12,6 +12,7 @@ from .general import (
     WebcamResponse,
 )
 from .media_list import (
+    CompactMediaList,
     GroupedMediaItem,
     MediaItem,
     MediaList,
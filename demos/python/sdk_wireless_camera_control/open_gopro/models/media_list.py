@@ -6,7 +6,8 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Any
+from array import array
+from typing import Any, Iterator
 
 from pydantic import Field, PrivateAttr, field_validator
 
@@ -116,6 +117,7 @@ class MediaItem(CustomBaseModel):
     filename: str = Field(alias="n")  #: Name of media item
     creation_timestamp: str = Field(alias="cre")  #: Creation time in seconds since epoch
     modified_time: str = Field(alias="mod")  #: Time file was last modified in seconds since epoch
+    file_size: str | None = Field(alias="s", default=None)  #: File size in bytes
     low_res_video_size: str | None = Field(alias="glrv", default=None)  #: Low resolution video size
     lrv_file_size: str | None = Field(alias="ls", default=None)  #: Low resolution file size
     session_id: str | None = Field(alias="id", default=None)  # Media list session identifier
@@ -163,6 +165,7 @@ class MediaList(CustomBaseModel):
     identifier: str = Field(alias="id")  #: String identifier of this media list
     media: list[MediaFileSystem]  #: Media filesystem(s)
     _files: list[MediaItem] = PrivateAttr(default_factory=list)
+    _index: dict[str, MediaItem] = PrivateAttr(default_factory=dict)
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
@@ -171,11 +174,23 @@ class MediaList(CustomBaseModel):
             for media in directory.file_system:
                 media.filename = f"{directory.directory}/{media.filename}"
                 self._files.append(media)
+                self._index[media.filename] = media
 
     def __contains__(self, key: MediaItem | MediaPath | str) -> bool:
         if isinstance(key, MediaItem):
-            return key in self.files
-        return str(key) in [m.filename for m in self.files]
+            return self._index.get(key.filename) == key
+        return str(key) in self._index
+
+    def get(self, key: MediaPath | str) -> MediaItem | None:
+        """Get a media item by its camera path
+
+        Args:
+            key (MediaPath | str): camera path (folder/file) of media item
+
+        Returns:
+            MediaItem | None: media item if it is in this media list, None otherwise
+        """
+        return self._index.get(str(key))
 
     @property
     def files(self) -> list[MediaItem]:
@@ -185,3 +200,92 @@ class MediaList(CustomBaseModel):
             list[MediaItem]: all media items in this media list
         """
         return self._files
+
+
+class CompactMediaList:
+    """Compact, fast to build alternative to MediaList
+
+    The media list is stored as column arrays (camera paths, sizes, timestamps and group identifiers) built in a
+    single pass over the JSON response without any per-item validation. MediaItem / GroupedMediaItem models are only
+    built (and then cached) when an item is accessed.
+
+    Args:
+        identifier (str): String identifier of this media list
+        media (list[JsonDict]): raw media filesystem(s) of the media list JSON
+    """
+
+    __slots__ = ("identifier", "paths", "sizes", "created", "modified", "group_ids", "_raw", "_items", "_index")
+
+    def __init__(self, identifier: str, media: list[JsonDict]) -> None:
+        self.identifier = identifier
+        self.paths: list[str] = []  #: camera path of each item
+        self.sizes = array("q")  #: size in bytes of each item (-1 if unknown)
+        self.created = array("q")  #: creation time in seconds since epoch of each item
+        self.modified = array("q")  #: modified time in seconds since epoch of each item
+        self.group_ids: list[str | None] = []  #: group identifier of each item (None if not grouped)
+        self._raw: list[JsonDict] = []
+        for directory in media:
+            prefix = directory["d"] + "/"
+            items: list[JsonDict] = directory["fs"]
+            self._raw.extend(items)
+            self.paths.extend(prefix + item["n"] for item in items)
+            self.sizes.extend(int(item.get("s") or -1) for item in items)
+            self.created.extend(int(item["cre"]) for item in items)
+            self.modified.extend(int(item["mod"]) for item in items)
+            self.group_ids.extend(item.get("g") for item in items)
+        self._items: list[MediaItem | None] = [None] * len(self.paths)
+        self._index = {path: i for i, path in enumerate(self.paths)}
+
+    @classmethod
+    def from_json(cls, data: JsonDict) -> CompactMediaList:
+        """Build a compact media list directly from the camera's media list JSON
+
+        Args:
+            data (JsonDict): media list JSON
+
+        Returns:
+            CompactMediaList: compact media list
+        """
+        return cls(data["id"], data["media"])
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __getitem__(self, index: int) -> MediaItem:
+        if (item := self._items[index]) is None:
+            raw = self._raw[index]
+            item = (GroupedMediaItem if "g" in raw else MediaItem)(**raw)
+            item.filename = self.paths[index]
+            self._items[index] = item
+        return item
+
+    def __iter__(self) -> Iterator[MediaItem]:
+        return (self[i] for i in range(len(self)))
+
+    def __contains__(self, key: MediaItem | MediaPath | str) -> bool:
+        if isinstance(key, MediaItem):
+            return (index := self._index.get(key.filename)) is not None and self[index] == key
+        return str(key) in self._index
+
+    def __str__(self) -> str:
+        return f"CompactMediaList(id={self.identifier}, items={len(self)})"
+
+    def get(self, key: MediaPath | str) -> MediaItem | None:
+        """Get a media item by its camera path
+
+        Args:
+            key (MediaPath | str): camera path (folder/file) of media item
+
+        Returns:
+            MediaItem | None: media item if it is in this media list, None otherwise
+        """
+        return None if (index := self._index.get(str(key))) is None else self[index]
+
+    @property
+    def files(self) -> list[MediaItem]:
+        """Get all media items. This builds every item that has not yet been accessed.
+
+        Returns:
+            list[MediaItem]: all media items in this media list
+        """
+        return list(self)
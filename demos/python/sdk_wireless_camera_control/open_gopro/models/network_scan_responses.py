@@ -8,9 +8,8 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import asdict, dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from bleak.backends.scanner import AdvertisementData
 from construct import (
     Adapter,
     BitStruct,
@@ -29,6 +28,9 @@ from construct import (
 
 from open_gopro.util import deeply_update_dict
 
+if TYPE_CHECKING:
+    from bleak.backends.scanner import AdvertisementData
+
 logger = logging.getLogger(__name__)
 
 
@@ -0,0 +1,287 @@
+# offload.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Bulk media offload from many cameras"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Final, Iterable, TypeAlias
+
+from open_gopro.constants import Toggle
+from open_gopro.downloader import DownloadProgress, RangedDownloader
+from open_gopro.gopro_base import GoProBase
+from open_gopro.models import MediaItem
+
+logger = logging.getLogger(__name__)
+
+OffloadProgressCb: TypeAlias = Callable[[str, DownloadProgress], None]
+"""Callback definition for offload progress reports: (camera identifier, progress of one file)"""
+
+
+@dataclass
+class CameraOffloadStats:
+    """Offload statistics for one camera"""
+
+    identifier: str  #: camera identifier
+    files: int = 0  #: files that were downloaded
+    bytes: int = 0  #: bytes that were downloaded
+    skipped: int = 0  #: files that were already in the local catalog
+    deleted: int = 0  #: files that were deleted from the camera after being verified
+    failed: list[str] = field(default_factory=list)  #: camera paths of files that failed to download
+    error: str | None = None  #: why the camera's offload stopped early (None if it ran to completion)
+    elapsed: float = 0.0  #: seconds spent offloading this camera
+
+    @property
+    def throughput(self) -> float:
+        """Average download throughput for this camera
+
+        Returns:
+            float: throughput in bytes / second
+        """
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class OffloadStats:
+    """Aggregate offload statistics across all cameras"""
+
+    cameras: dict[str, CameraOffloadStats] = field(default_factory=dict)  #: per-camera statistics
+    elapsed: float = 0.0  #: seconds spent offloading all cameras
+
+    @property
+    def files(self) -> int:
+        """Total files downloaded
+
+        Returns:
+            int: file count
+        """
+        return sum(camera.files for camera in self.cameras.values())
+
+    @property
+    def bytes(self) -> int:
+        """Total bytes downloaded
+
+        Returns:
+            int: byte count
+        """
+        return sum(camera.bytes for camera in self.cameras.values())
+
+    @property
+    def failed(self) -> int:
+        """Total files that failed to download
+
+        Returns:
+            int: file count
+        """
+        return sum(len(camera.failed) for camera in self.cameras.values())
+
+    @property
+    def errors(self) -> dict[str, str]:
+        """Errors of the cameras whose offload stopped early
+
+        Returns:
+            dict[str, str]: camera identifier to error
+        """
+        return {identifier: camera.error for identifier, camera in self.cameras.items() if camera.error}
+
+    @property
+    def throughput(self) -> float:
+        """Aggregate download throughput
+
+        Returns:
+            float: throughput in bytes / second
+        """
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+
+class MediaOffloader:
+    """Offload new media from many cameras into a local catalog with bounded concurrency
+
+    The local catalog is the destination directory, where each camera's files are stored as
+    ``<destination>/<camera identifier>/<camera path>``. Each camera's media list is diffed against the catalog and
+    only files that are missing, incomplete (a resume manifest exists) or of the wrong size are downloaded.
+
+    Downloads from all cameras run concurrently, limited both globally and per camera. Each camera's downloads are
+    also bounded by its HTTP transport's per-host concurrency cap. A WirelessGoPro that maintains state runs them
+    concurrently as long as the camera stays ready (i.e. not encoding or busy).
+
+    A camera that fails (i.e. drops off of the network) does not affect the offload of the other cameras. Its error
+    is recorded in its statistics.
+
+    Attributes:
+        DEFAULT_MAX_CONCURRENCY (Final[int]): default maximum simultaneous file downloads across all cameras
+        DEFAULT_PER_CAMERA_CONCURRENCY (Final[int]): default maximum simultaneous file downloads from any one camera
+
+    Args:
+        gopros (Iterable[GoProBase]): opened cameras to offload
+        destination (Path): root directory of the local catalog
+        max_concurrency (int): maximum simultaneous file downloads across all cameras. Defaults to
+            DEFAULT_MAX_CONCURRENCY.
+        per_camera_concurrency (int): maximum simultaneous file downloads from any one camera. Defaults to
+            DEFAULT_PER_CAMERA_CONCURRENCY.
+        delete_after (bool): delete each file from the camera once it has been downloaded and verified.
+            Defaults to False.
+        turbo (bool): enable turbo transfer mode on each camera for the duration of its offload. Defaults to True.
+        progress_cb (OffloadProgressCb | None): callback to receive per-file download progress. Defaults to None.
+    """
+
+    DEFAULT_MAX_CONCURRENCY: Final[int] = 8
+    DEFAULT_PER_CAMERA_CONCURRENCY: Final[int] = 2
+
+    def __init__(
+        self,
+        gopros: Iterable[GoProBase],
+        destination: Path,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        per_camera_concurrency: int = DEFAULT_PER_CAMERA_CONCURRENCY,
+        delete_after: bool = False,
+        turbo: bool = True,
+        progress_cb: OffloadProgressCb | None = None,
+    ) -> None:
+        self._gopros = list(gopros)
+        self._destination = destination
+        self._max_concurrency = max_concurrency
+        self._per_camera_concurrency = per_camera_concurrency
+        self._delete_after = delete_after
+        self._turbo = turbo
+        self._progress_cb = progress_cb
+
+    def local_file(self, gopro: GoProBase, item: MediaItem) -> Path:
+        """Get the catalog location of a camera's media item
+
+        Args:
+            gopro (GoProBase): camera that owns the item
+            item (MediaItem): media item
+
+        Returns:
+            Path: local file location
+        """
+        return self._destination / gopro.identifier / item.filename
+
+    def is_cataloged(self, gopro: GoProBase, item: MediaItem) -> bool:
+        """Is a camera's media item already completely stored in the local catalog?
+
+        Args:
+            gopro (GoProBase): camera that owns the item
+            item (MediaItem): media item
+
+        Returns:
+            bool: True if stored, False otherwise
+        """
+        file = self.local_file(gopro, item)
+        if not file.exists() or RangedDownloader.manifest_path(file).exists():
+            return False
+        return item.file_size is None or file.stat().st_size == int(item.file_size)
+
+    async def run(self) -> OffloadStats:
+        """Offload all cameras
+
+        Returns:
+            OffloadStats: statistics of the offload
+        """
+        start = time.perf_counter()
+        limit = asyncio.Semaphore(self._max_concurrency)
+        stats = OffloadStats()
+        for camera_stats in await asyncio.gather(*[self._offload_camera(gopro, limit) for gopro in self._gopros]):
+            stats.cameras[camera_stats.identifier] = camera_stats
+        stats.elapsed = time.perf_counter() - start
+        logger.info(
+            f"Offloaded {stats.files} files ({stats.bytes} bytes) from {len(stats.cameras)} cameras in "
+            f"{stats.elapsed:.1f} seconds ({stats.throughput / 1e6:.2f} MB/s). {stats.failed} failed."
+        )
+        if errors := stats.errors:
+            logger.error(f"Offload stopped early on {len(errors)} cameras: {errors}")
+        return stats
+
+    async def _offload_camera(self, gopro: GoProBase, limit: asyncio.Semaphore) -> CameraOffloadStats:
+        """Offload all new media from one camera, recording (rather than raising) any failure
+
+        Args:
+            gopro (GoProBase): camera to offload
+            limit (asyncio.Semaphore): global download limit
+
+        Returns:
+            CameraOffloadStats: statistics of this camera's offload
+        """
+        start = time.perf_counter()
+        stats = CameraOffloadStats(gopro.identifier)
+        try:
+            await self._offload_media(gopro, limit, stats)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error(f"{gopro.identifier}: offload failed: {repr(e)}")
+            stats.error = repr(e)
+        stats.elapsed = time.perf_counter() - start
+        return stats
+
+    async def _offload_media(self, gopro: GoProBase, limit: asyncio.Semaphore, stats: CameraOffloadStats) -> None:
+        """Download (and optionally delete) all of a camera's media that is not yet cataloged
+
+        Args:
+            gopro (GoProBase): camera to offload
+            limit (asyncio.Semaphore): global download limit
+            stats (CameraOffloadStats): statistics to update
+        """
+        media_list = (await gopro.http_command.get_media_list()).data
+        pending = [item for item in media_list.files if not self.is_cataloged(gopro, item)]
+        stats.skipped = len(media_list.files) - len(pending)
+        logger.info(f"{gopro.identifier}: {len(pending)} files to offload, {stats.skipped} already cataloged")
+        if not pending:
+            return
+
+        camera_limit = asyncio.Semaphore(self._per_camera_concurrency)
+
+        async def offload_item(item: MediaItem) -> None:
+            async with camera_limit, limit:
+                local_file = self.local_file(gopro, item)
+                try:
+                    local_file.parent.mkdir(parents=True, exist_ok=True)
+                    await gopro.http_command.download_file(
+                        camera_file=item.filename,
+                        local_file=local_file,
+                        expected_size=int(item.file_size) if item.file_size else None,
+                        progress_cb=(
+                            (lambda progress: self._progress_cb(gopro.identifier, progress))  # type: ignore
+                            if self._progress_cb
+                            else None
+                        ),
+                    )
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error(f"{gopro.identifier}: failed to download {item.filename}: {repr(e)}")
+                    stats.failed.append(item.filename)
+                    return
+                stats.files += 1
+                stats.bytes += local_file.stat().st_size
+                if self._delete_after:
+                    try:
+                        if (await gopro.http_command.delete_file(path=item.filename)).ok:
+                            stats.deleted += 1
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        logger.error(f"{gopro.identifier}: failed to delete {item.filename}: {repr(e)}")
+
+        if self._turbo:
+            await self._set_turbo_mode(gopro, Toggle.ENABLE)
+        try:
+            await asyncio.gather(*[offload_item(item) for item in pending])
+        finally:
+            if self._turbo:
+                await self._set_turbo_mode(gopro, Toggle.DISABLE)
+
+    @staticmethod
+    async def _set_turbo_mode(gopro: GoProBase, mode: Toggle) -> None:
+        """Set a camera's turbo transfer mode, logging (rather than raising) failures since it is only an optimization
+
+        Args:
+            gopro (GoProBase): camera to configure
+            mode (Toggle): turbo transfer mode
+        """
+        try:
+            if not (await gopro.http_command.set_turbo_mode(mode=mode)).ok:
+                logger.warning(f"{gopro.identifier}: camera rejected turbo transfer mode {mode.name}")
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"{gopro.identifier}: failed to set turbo transfer mode {mode.name}: {repr(e)}")
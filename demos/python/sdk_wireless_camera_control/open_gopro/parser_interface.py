@@ -8,7 +8,7 @@ from __future__ import annotations
 import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import Any, Callable, ClassVar, Generic, Protocol, TypeVar, cast
+from typing import Any, Callable, ClassVar, Generic, Protocol, TypeAlias, TypeVar, cast
 
 from open_gopro.constants import ActionId, FeatureId
 from open_gopro.types import JsonDict, ResponseType
@@ -18,6 +18,9 @@ logger = logging.getLogger(__name__)
 T_co = TypeVar("T_co", covariant=True)
 T = TypeVar("T")
 
+BytesDecoder: TypeAlias = Callable[[bytes | bytearray | memoryview], Any]
+"""Function that parses a bytes-like object"""
+
 ########################################################################################
 ####### Transformers
 ########################################################################################
@@ -79,6 +82,16 @@ class JsonParser(BaseParser[JsonDict, T_co]):
 class BytesParser(BaseParser[bytes, T_co]):
     """Bytes to Target Type Parser Interface"""
 
+    def decoder(self) -> BytesDecoder:
+        """Get a function that performs the same parsing as parse with as little per-call overhead as possible
+
+        Subclasses should specialize this for simple types. By default, this calls parse with the data as bytes.
+
+        Returns:
+            BytesDecoder: decoding function
+        """
+        return lambda data: self.parse(bytes(data))
+
 
 class Parser(ABC, Generic[T]):
     """The common monolithic Parser that is used for all byte and json parsing / transforming
@@ -108,11 +121,11 @@ class Parser(ABC, Generic[T]):
         self.json_transformers = json_transformers or []
         self.json_parser = json_parser
 
-    def parse(self, data: bytes | bytearray | JsonDict) -> T:
+    def parse(self, data: bytes | bytearray | memoryview | JsonDict) -> T:
         """Perform the parsing using the stored transformers and parsers
 
         Args:
-            data (bytes | bytearray | JsonDict): input bytes or json to parse
+            data (bytes | bytearray | memoryview | JsonDict): input bytes or json to parse
 
         Raises:
             RuntimeError: attempted to parse bytes when a byte-json adapter does not exist
@@ -121,14 +134,13 @@ class Parser(ABC, Generic[T]):
             T: final parsed output
         """
         parsed_json: JsonDict
-        if isinstance(data, (bytes, bytearray)):
-            data = bytes(data)
+        if isinstance(data, (bytes, bytearray, memoryview)):
             if not self.byte_json_adapter:
                 raise RuntimeError("Can not parse bytes without Json Adapter")
-            # Filter bytes
+            # Filter bytes, passing the output of each transformer to the next
             parsed_bytes = bytes(data)
             for byte_transformer in self.byte_transformers:
-                parsed_bytes = byte_transformer.transform(data)
+                parsed_bytes = byte_transformer.transform(parsed_bytes)
             parsed_json = self.byte_json_adapter.parse(parsed_bytes)
         else:
             parsed_json = data
@@ -139,6 +151,19 @@ class Parser(ABC, Generic[T]):
             return self.json_parser.parse(parsed_json)
         return cast(T, parsed_json)
 
+    def compile(self) -> BytesDecoder:
+        """Get a function that performs the same parsing as parse for bytes input with as little overhead as possible
+
+        If this parser consists of only a bytes json adapter, the adapter's specialized decoder is returned.
+        Otherwise the full parse pipeline is used.
+
+        Returns:
+            BytesDecoder: decoding function
+        """
+        if self.byte_json_adapter and not (self.byte_transformers or self.json_transformers or self.json_parser):
+            return self.byte_json_adapter.decoder()
+        return self.parse
+
 
 ########################################################################################
 ####### Builders
@@ -189,10 +214,29 @@ class GlobalParsers:
     """Parsers that relate globally to ID's as opposed to contextualized per-message
 
     This is intended to be used as a singleton, i.e. not instantiated
+
+    Modules that define many parsers can defer adding them until a global parser is first needed (see defer).
     """
 
     _feature_action_id_map: ClassVar[dict[FeatureId, list[ActionId]]] = defaultdict(list)
     _global_parsers: ClassVar[dict[ResponseType, Parser]] = {}
+    _decode_tables: ClassVar[dict[type, tuple[tuple[Any, BytesDecoder | None] | None, ...]]] = {}
+    _loaders: ClassVar[list[Callable[[], None]]] = []
+
+    @classmethod
+    def defer(cls, loader: Callable[[], None]) -> None:
+        """Add a function that adds global parsers which will be called before a global parser is first accessed
+
+        Args:
+            loader (Callable[[], None]): function that adds global parsers
+        """
+        cls._loaders.append(loader)
+
+    @classmethod
+    def _load(cls) -> None:
+        """Call (and remove) all deferred loaders"""
+        while cls._loaders:
+            cls._loaders.pop(0)()
 
     @classmethod
     def add_feature_action_id_mapping(cls, feature_id: FeatureId, action_id: ActionId) -> None:
@@ -213,6 +257,7 @@ class GlobalParsers:
             parser (Parser): parser to add
         """
         cls._global_parsers[identifier] = parser
+        cls._decode_tables.clear()
 
     @classmethod
     def get_query_container(cls, identifier: ResponseType) -> Callable | None:
@@ -231,6 +276,7 @@ class GlobalParsers:
         Returns:
             Callable | None: container if found else None
         """
+        cls._load()
         try:
             parser_builder = cast(BytesParserBuilder, cls._global_parsers[identifier].byte_json_adapter)
             return lambda data, parse=parser_builder.parse, build=parser_builder.build: parse(build(data))
@@ -249,4 +295,30 @@ class GlobalParsers:
         Returns:
             Parser | None: parser if found, else None
         """
+        cls._load()
         return cls._global_parsers.get(identifier)
+
+    @classmethod
+    def get_decode_table(cls, id_type: type[T]) -> tuple[tuple[T, BytesDecoder | None] | None, ...]:
+        """Get the table used to decode TLV parameters of an ID type (i.e. StatusId or SettingId)
+
+        The table is indexed by the raw ID byte. Each entry is either None if the byte is not a member of the ID
+        type, or the ID and its compiled decoder (None if there is no global parser for the ID).
+
+        The table is built once and rebuilt after any global parser is added.
+
+        Args:
+            id_type (type[T]): ID enum to build table for
+
+        Returns:
+            tuple[tuple[T, BytesDecoder | None] | None, ...]: decode table
+        """
+        cls._load()
+        if (table := cls._decode_tables.get(id_type)) is None:
+            entries: list[tuple[Any, BytesDecoder | None] | None] = [None] * 256
+            for identifier in id_type:  # type: ignore
+                if 0 <= identifier < len(entries):
+                    parser = cls._global_parsers.get(identifier)
+                    entries[identifier] = (identifier, parser.compile() if parser else None)
+            table = cls._decode_tables[id_type] = tuple(entries)
+        return table
@@ -5,25 +5,32 @@
 
 from __future__ import annotations
 
+import base64
 import datetime
 import logging
+import struct
 from dataclasses import asdict
-from typing import Any, Generic, TypeVar
+from typing import Any, Callable, ClassVar, Generic, TypeAlias, TypeVar, cast
 
 import google.protobuf.json_format
-from construct import Construct, Flag, Int16sb, Int16ub
+from construct import Construct, Flag, FormatField, Int16sb, Int16ub
 from google.protobuf import descriptor
-from google.protobuf.json_format import MessageToDict as ProtobufToDict
 
 from open_gopro.enum import GoProIntEnum, enum_factory
-from open_gopro.parser_interface import BytesBuilder, BytesParser, BytesParserBuilder
+from open_gopro.parser_interface import (
+    BytesBuilder,
+    BytesDecoder,
+    BytesParser,
+    BytesParserBuilder,
+)
 from open_gopro.types import Protobuf
 from open_gopro.util import is_dataclass_instance, pretty_print, to_dict
 
 logger = logging.getLogger(__name__)
 
 ProtobufPrinter = google.protobuf.json_format._Printer  # type: ignore # noqa
-original_field_to_json = ProtobufPrinter._FieldToJsonObject
+
+_FieldConverter: TypeAlias = Callable[[Any], Any]
 
 
 class ProtobufDictProxy(dict):
@@ -83,6 +90,19 @@ class GoProEnumByteParserBuilder(BytesParserBuilder):
         """
         return self._container(data[0])
 
+    def decoder(self) -> BytesDecoder:  # noqa: D102
+        members = self._container._value2member_map_
+        container = self._container
+
+        def decode(data: bytes | bytearray | memoryview) -> GoProIntEnum:
+            try:
+                return members[data[0]]  # type: ignore
+            except KeyError:
+                # Defer to the enum so that the error (or missing value handling) is unchanged
+                return container(data[0])
+
+        return decode
+
     def build(self, *args: Any, **_: Any) -> bytes:
         """Build bytes from GoPro Enum
 
@@ -104,45 +124,169 @@ class ProtobufByteParser(BytesParser):
 
     Args:
         proto (type[Protobuf]): protobuf definition to parse (a proxy) into
+        raw (bool): return the protobuf message itself instead of a proxy. Defaults to False.
     """
 
-    def __init__(self, proto: type[Protobuf]) -> None:
-        class Closure(BytesParser[dict]):
-            """Parse bytes into a dict using the protobuf"""
-
-            protobuf = proto
-
-            # pylint: disable=not-callable
-            def parse(self, data: bytes) -> Any:
-                response: Protobuf = self.protobuf().FromString(bytes(data))
-
-                # TODO can wetranslate from Protobuf enums without relying on Protobuf internal implementation?
-                # Monkey patch the field-to-json function to use our enum translation
-                ProtobufPrinter._FieldToJsonObject = lambda self, field, value: (
-                    enum_factory(field.enum_type)(value)
-                    if field.cpp_type == descriptor.FieldDescriptor.CPPTYPE_ENUM
-                    else original_field_to_json(self, field, value)
-                )
-                as_dict = ProtobufToDict(response, preserving_proto_field_name=True)
-                # For any unset fields, use None
-                for key in response.DESCRIPTOR.fields_by_name:
-                    if key not in as_dict:
-                        as_dict[key] = None
-                # Proxy as an object
-                return ProtobufDictProxy.from_proto(as_dict)
-
-        self._proto_parser = Closure()
+    def __init__(self, proto: type[Protobuf], raw: bool = False) -> None:
+        self._proto = proto
+        self._raw = raw
+        self._converter: _ProtobufConverter | None = None
 
-    def parse(self, data: bytes) -> dict:
+    def parse(self, data: bytes) -> Any:
         """Parse the bytes into a Protobuf Proxy
 
         Args:
             data (bytes): bytes to parse
 
         Returns:
-            dict: protobuf proxy dict which provides attribute access
+            Any: protobuf proxy dict which provides attribute access (or the protobuf message if raw)
+        """
+        response = self._proto.FromString(bytes(data))
+        if self._raw:
+            return response
+        if not (converter := self._converter):
+            # The upb descriptors mirror the pure Python descriptors
+            converter = self._converter = _ProtobufConverter.get(cast(descriptor.Descriptor, self._proto.DESCRIPTOR))
+        proxy = converter.convert(response)
+        # For any unset fields, use None
+        for name in converter.field_names:
+            if name not in proxy:
+                proxy[name] = None
+        return proxy
+
+
+class _GoProEnumPrinter(ProtobufPrinter):  # type: ignore
+    """Protobuf JSON printer that translates enum values into GoPro enums"""
+
+    def _FieldToJsonObject(self, field: descriptor.FieldDescriptor, value: Any) -> Any:  # noqa: N802
+        if field.cpp_type == descriptor.FieldDescriptor.CPPTYPE_ENUM:
+            return _ProtobufConverter.enum(cast(descriptor.EnumDescriptor, field.enum_type))(value)
+        return super()._FieldToJsonObject(field, value)
+
+
+class _ProtobufConverter:
+    """Convert protobuf messages of one type into proxies
+
+    The per-field conversions are compiled once from the message descriptor and the output matches
+    MessageToDict (using proto field names) except that enums are GoPro enums and nested messages are proxies.
+    Message types that have map fields or extensions, or are well known types, use the (slower) protobuf printer.
+
+    Args:
+        message_descriptor (descriptor.Descriptor): descriptor of message type to convert
+    """
+
+    _converters: ClassVar[dict[descriptor.Descriptor, _ProtobufConverter]] = {}
+    _enums: ClassVar[dict[descriptor.EnumDescriptor, type[GoProIntEnum]]] = {}
+    _printer = _GoProEnumPrinter(preserving_proto_field_name=True)
+    # Scalar types whose JSON representation is the value itself
+    _IDENTITY_TYPES = (
+        descriptor.FieldDescriptor.CPPTYPE_BOOL,
+        descriptor.FieldDescriptor.CPPTYPE_INT32,
+        descriptor.FieldDescriptor.CPPTYPE_UINT32,
+    )
+
+    def __init__(self, message_descriptor: descriptor.Descriptor) -> None:
+        self.field_names = tuple(field.name for field in message_descriptor.fields)
+        self._use_printer = (
+            message_descriptor.full_name.startswith("google.protobuf.")
+            or bool(message_descriptor.extension_ranges)
+            or any(
+                field.message_type and field.message_type.GetOptions().map_entry for field in message_descriptor.fields
+            )
+        )
+        self._fields: dict[descriptor.FieldDescriptor, tuple[str, _FieldConverter]] = {}
+        for field in message_descriptor.fields:
+            convert = self._compile_field(field)
+            if field.is_repeated:
+                convert = self._compile_repeated(convert)
+            self._fields[field] = (field.name, convert)
+
+    @classmethod
+    def get(cls, message_descriptor: descriptor.Descriptor) -> _ProtobufConverter:
+        """Get the (cached) converter for a message type
+
+        Args:
+            message_descriptor (descriptor.Descriptor): descriptor of message type
+
+        Returns:
+            _ProtobufConverter: converter
+        """
+        if (converter := cls._converters.get(message_descriptor)) is None:
+            converter = cls._converters[message_descriptor] = cls(message_descriptor)
+        return converter
+
+    @classmethod
+    def enum(cls, enum_descriptor: descriptor.EnumDescriptor) -> type[GoProIntEnum]:
+        """Get the (cached) GoPro enum for a protobuf enum
+
+        Args:
+            enum_descriptor (descriptor.EnumDescriptor): protobuf enum descriptor
+
+        Returns:
+            type[GoProIntEnum]: GoPro enum
+        """
+        if (gopro_enum := cls._enums.get(enum_descriptor)) is None:
+            gopro_enum = cls._enums[enum_descriptor] = enum_factory(enum_descriptor)
+        return gopro_enum
+
+    @staticmethod
+    def _compile_repeated(convert: _FieldConverter) -> _FieldConverter:
+        """Build the function to convert all values of a repeated field
+
+        Args:
+            convert (_FieldConverter): function to convert a single value
+
+        Returns:
+            _FieldConverter: conversion function
+        """
+
+        def convert_repeated(values: Any) -> list:
+            return [convert(value) for value in values]
+
+        return convert_repeated
+
+    def _compile_field(self, field: descriptor.FieldDescriptor) -> _FieldConverter:
+        """Build the function to convert a single value of a field
+
+        Args:
+            field (descriptor.FieldDescriptor): field to convert
+
+        Returns:
+            _FieldConverter: conversion function
+        """
+        if field.cpp_type == descriptor.FieldDescriptor.CPPTYPE_ENUM:
+            return _ProtobufConverter.enum(cast(descriptor.EnumDescriptor, field.enum_type))
+        if field.cpp_type == descriptor.FieldDescriptor.CPPTYPE_MESSAGE:
+            message_type = cast(descriptor.Descriptor, field.message_type)
+
+            def convert_message(value: Protobuf) -> ProtobufDictProxy:
+                # Resolve lazily to support recursive message types
+                return _ProtobufConverter.get(message_type).convert(value)
+
+            return convert_message
+        if field.type == descriptor.FieldDescriptor.TYPE_BYTES:
+            return lambda value: base64.b64encode(value).decode("utf-8")
+        if field.cpp_type in _ProtobufConverter._IDENTITY_TYPES or field.cpp_type == field.CPPTYPE_STRING:
+            return lambda value: value
+        return lambda value: _ProtobufConverter._printer._FieldToJsonObject(field, value)
+
+    def convert(self, message: Protobuf) -> ProtobufDictProxy:
+        """Convert a message into a proxy of its set fields
+
+        Args:
+            message (Protobuf): message to convert
+
+        Returns:
+            ProtobufDictProxy: proxy of message
         """
-        return self._proto_parser.parse(data)
+        if self._use_printer:
+            return ProtobufDictProxy.from_proto(_ProtobufConverter._printer._MessageToJsonObject(message))
+        proxy = ProtobufDictProxy()
+        fields = self._fields
+        for field, value in message.ListFields():
+            name, convert = fields[field]
+            proxy[name] = convert(value)
+        return proxy
 
 
 class DateTimeByteParserBuilder(BytesParser, BytesBuilder):
@@ -191,6 +335,7 @@ class ConstructByteParserBuilder(BytesParserBuilder):
     """
 
     def __init__(self, construct: Construct) -> None:
+        self._definition = construct
         self._construct = self._construct_adapter_factory(construct)
 
     @classmethod
@@ -228,6 +373,14 @@ class ConstructByteParserBuilder(BytesParserBuilder):
         """
         return self._construct.parse(data)
 
+    def decoder(self) -> BytesDecoder:  # noqa: D102
+        if self._definition is Flag:
+            return lambda data: data[0] != 0
+        if isinstance(self._definition, FormatField):
+            unpack = struct.Struct(self._definition.fmtstr).unpack_from
+            return lambda data: unpack(data)[0]
+        return super().decoder()
+
     def build(self, obj: Construct) -> bytes:
         """Built bytes from filled out construct container
 
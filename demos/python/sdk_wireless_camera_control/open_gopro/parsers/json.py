@@ -37,7 +37,7 @@ class CameraStateJsonParser(JsonParser):
         parsed: dict = {}
         # Parse status and settings values into nice human readable things
         for name, id_map in [("status", StatusId), ("settings", SettingId)]:
-            for k, v in data[name].items():
+            for k, v in data.get(name, {}).items():
                 try:
                     identifier = cast(ResponseType, id_map(int(k)))
                     if not (parser_builder := GlobalParsers.get_query_container(identifier)):
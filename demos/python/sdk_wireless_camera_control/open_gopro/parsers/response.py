@@ -34,6 +34,22 @@ HDR_MASK: Final = 0b01100000
 GEN_LEN_MASK: Final = 0b00011111
 EXT_13_BYTE0_MASK: Final = 0b00011111
 
+_STATUS_QUERY_IDS: Final = frozenset(
+    (
+        QueryCmdId.GET_STATUS_VAL,
+        QueryCmdId.REG_STATUS_VAL_UPDATE,
+        QueryCmdId.UNREG_STATUS_VAL_UPDATE,
+        QueryCmdId.STATUS_VAL_PUSH,
+    )
+)
+_CAPABILITY_QUERY_IDS: Final = frozenset(
+    (
+        QueryCmdId.GET_CAPABILITIES_VAL,
+        QueryCmdId.REG_CAPABILITIES_UPDATE,
+        QueryCmdId.SETTING_CAPABILITY_PUSH,
+    )
+)
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -227,29 +243,39 @@ class BleRespBuilder(RespBuilder[bytearray]):
         This is mutually exclusive with accumulate. It should be used in any case where the response follows
         the packet fragmentation scheme.
 
+        The response buffer is preallocated from the length in the first packet's header and each packet's payload
+        is copied (through a memoryview) directly into its place in the buffer.
+
         Args:
             data (bytes): byte level BLE data
+
+        Raises:
+            ResponseParseError: the packet has the reserved header
         """
-        buf = bytearray(data)
-        if buf[0] & CONT_MASK:
-            buf.pop(0)
+        view = memoryview(data)
+        if data[0] & CONT_MASK:
+            payload = view[1:]
         else:
-            # This is a new packet so start with an empty byte array
-            self._packet = bytearray([])
-            hdr = GoProBlePacketHeader((buf[0] & HDR_MASK) >> 5)
+            hdr = GoProBlePacketHeader((data[0] & HDR_MASK) >> 5)
             if hdr is GoProBlePacketHeader.GENERAL:
-                self._bytes_remaining = buf[0] & GEN_LEN_MASK
-                buf = buf[1:]
+                length = data[0] & GEN_LEN_MASK
+                payload = view[1:]
             elif hdr is GoProBlePacketHeader.EXT_13:
-                self._bytes_remaining = ((buf[0] & EXT_13_BYTE0_MASK) << 8) + buf[1]
-                buf = buf[2:]
+                length = ((data[0] & EXT_13_BYTE0_MASK) << 8) + data[1]
+                payload = view[2:]
             elif hdr is GoProBlePacketHeader.EXT_16:
-                self._bytes_remaining = (buf[1] << 8) + buf[2]
-                buf = buf[3:]
-
-        # Append payload to buffer and update remaining / complete
-        self._packet.extend(buf)
-        self._bytes_remaining -= len(buf)
+                length = (data[1] << 8) + data[2]
+                payload = view[3:]
+            else:
+                raise ResponseParseError("BLE packet", bytearray(data), msg=f"Invalid packet header {hdr.name}")
+            # This is a new packet so allocate the entire response
+            self._packet = bytearray(length)
+            self._bytes_remaining = length
+
+        # Copy payload into its place in the buffer and update remaining / complete
+        offset = len(self._packet) - self._bytes_remaining
+        self._packet[offset : offset + len(payload)] = payload
+        self._bytes_remaining -= len(payload)
 
         if self._bytes_remaining < 0:
             logger.error("received too much data. parsing is in unknown state")
@@ -309,14 +335,16 @@ class BleRespBuilder(RespBuilder[bytearray]):
         Returns:
             GoProResp: built response
         """
+        # Walk the packet by offset so that neither the packet nor its parameters are copied
+        buf = memoryview(self._packet)
+        offset = 0
         try:
             self._identifier = self.get_response_identifier(self._uuid, self._packet)
-            buf = self._packet
 
             if not self._is_direct_read:  # length byte
-                buf.pop(0)
+                offset += 1
             if self._is_protobuf:  # feature ID byte
-                buf.pop(0)
+                offset += 1
 
             parsed: Any = None
             query_type: type[StatusId] | type[SettingId] | StatusId | SettingId | None = None
@@ -325,12 +353,7 @@ class BleRespBuilder(RespBuilder[bytearray]):
                 if isinstance(self._identifier, (SettingId, StatusId)):
                     query_type = self._identifier
                 elif isinstance(self._identifier, QueryCmdId):
-                    if self._identifier in [
-                        QueryCmdId.GET_STATUS_VAL,
-                        QueryCmdId.REG_STATUS_VAL_UPDATE,
-                        QueryCmdId.UNREG_STATUS_VAL_UPDATE,
-                        QueryCmdId.STATUS_VAL_PUSH,
-                    ]:
+                    if self._identifier in _STATUS_QUERY_IDS:
                         query_type = StatusId
                     elif self._identifier is QueryCmdId.GET_SETTING_NAME:
                         raise NotImplementedError
@@ -340,56 +363,55 @@ class BleRespBuilder(RespBuilder[bytearray]):
             # Query (setting get value, status get value, etc.)
             if query_type:
                 camera_state: CameraState = defaultdict(list)
-                self._status = ErrorCode(buf[0])
-                buf = buf[1:]
+                is_capability = self._identifier in _CAPABILITY_QUERY_IDS
+                decode_table = GlobalParsers.get_decode_table(
+                    query_type if isinstance(query_type, type) else type(query_type)
+                )
+                self._status = ErrorCode(buf[offset])
+                offset += 1
                 # Parse all parameters
-                while len(buf) != 0:
-                    param_len = buf[1]
-                    try:
-                        param_id = query_type(buf[0])  # type: ignore
-                    except ValueError:
-                        # We don't handle this entity. Ensure to advance past the value.
-                        buf = buf[2 + param_len :]
+                while offset < len(buf):
+                    param_len = buf[offset + 1]
+                    value_start = offset + 2
+                    offset = value_start + param_len
+                    if not (entry := decode_table[buf[value_start - 2]]):
+                        # We don't handle this entity. We have already advanced past the value.
                         continue
-                    buf = buf[2:]
+                    param_id, decode = entry
                     # Special case where we register for a push notification for something that does not yet have a value
                     if param_len == 0:
                         camera_state[param_id] = []
                         continue
-                    param_val = buf[:param_len]
-                    buf = buf[param_len:]
+                    param_val = buf[value_start:offset]
 
                     # Add parsed value to response's data dict
                     try:
-                        if not (parser := GlobalParsers.get_parser(param_id)):
+                        if not decode:
                             # We don't have defined params for all ID's yet. Just store raw bytes
                             logger.warning(f"No parser defined for {param_id}")
                             camera_state[param_id] = param_val.hex(":")
                             continue
                         # These can be more than 1 value so use a list
-                        if self._identifier in [
-                            QueryCmdId.GET_CAPABILITIES_VAL,
-                            QueryCmdId.REG_CAPABILITIES_UPDATE,
-                            QueryCmdId.SETTING_CAPABILITY_PUSH,
-                        ]:
-                            # Parse using parser from global map and append
-                            camera_state[param_id].append(parser.parse(param_val))
+                        if is_capability:
+                            # Parse using decoder compiled from global parser and append
+                            camera_state[param_id].append(decode(param_val))
                         else:
-                            # Parse using parser from map and set
-                            camera_state[param_id] = parser.parse(param_val)
+                            # Parse using decoder compiled from global parser and set
+                            camera_state[param_id] = decode(param_val)
                     except ValueError:
                         # This is the case where we receive a value that is not defined in our params.
                         # This shouldn't happen and means the documentation needs to be updated. However, it
                         # isn't functionally critical
-                        logger.warning(f"{param_id} does not contain a value {param_val}")
-                        camera_state[param_id] = param_val
+                        raw_val = bytearray(param_val)
+                        logger.warning(f"{param_id} does not contain a value {raw_val}")
+                        camera_state[param_id] = raw_val
                 parsed = camera_state
 
             else:  # Commands,  Protobuf, and direct Reads
                 if is_cmd := isinstance(self._identifier, CmdId):
                     # All (non-protobuf) commands have a status
-                    self._status = ErrorCode(buf[0])
-                    buf = buf[1:]
+                    self._status = ErrorCode(buf[offset])
+                    offset += 1
                 # Use parser if explicitly passed otherwise get global parser
                 if not (parser := self._parser or GlobalParsers.get_parser(self._identifier)) and not is_cmd:
                     error_msg = f"No parser exists for {self._identifier}"
@@ -397,7 +419,7 @@ class BleRespBuilder(RespBuilder[bytearray]):
                     raise ResponseParseError(str(self._identifier), self._packet, msg=error_msg)
                 # Parse payload if a parser was found.
                 if parser:
-                    parsed = parser.parse(buf)
+                    parsed = parser.parse(buf[offset:])
 
                 # TODO make status checking an abstract method of a shared base class
                 # Attempt to determine and / or extract status (we already got command status above)
@@ -406,14 +428,14 @@ class BleRespBuilder(RespBuilder[bytearray]):
                     self._status = ErrorCode.SUCCESS
                 # Check for result field in protobuf's
                 elif self._is_protobuf and "result" in parsed:
-                    self._status = (
-                        ErrorCode.SUCCESS
-                        if parsed.get("result") == EnumResultGeneric.RESULT_SUCCESS
-                        else ErrorCode.ERROR
-                    )
+                    # Parsed is either a proxy dict or, if the parser was configured to do so, the raw protobuf
+                    result = parsed.get("result") if isinstance(parsed, dict) else parsed.result
+                    self._status = ErrorCode.SUCCESS if result == EnumResultGeneric.RESULT_SUCCESS else ErrorCode.ERROR
         except Exception as e:
             self._state = RespBuilder._State.ERROR
-            raise ResponseParseError(str(self._identifier), buf) from e
+            raise ResponseParseError(str(self._identifier), bytearray(buf[offset:])) from e
+        finally:
+            buf.release()
 
         # Recursively scrub away parsing artifacts
         self._state = RespBuilder._State.PARSED
@@ -3,69 +3,130 @@
 
 """Protobufs that will be needed by the user.
 
-They are imported here so they can be imported from open_gopro.proto
+They are exported here so they can be imported from open_gopro.proto. Each protobuf module is only imported when one
+of its exports is first accessed since building the protobuf descriptors is slow.
 """
-from open_gopro.proto.cohn_pb2 import (
-    EnumCOHNNetworkState,
-    EnumCOHNStatus,
-    NotifyCOHNStatus,
-    RequestClearCOHNCert,
-    RequestCOHNCert,
-    RequestCreateCOHNCert,
-    RequestGetCOHNStatus,
-    RequestSetCOHNSetting,
-    ResponseCOHNCert,
-)
-from open_gopro.proto.live_streaming_pb2 import (
-    EnumLens,
-    EnumLiveStreamStatus,
-    EnumRegisterLiveStreamStatus,
-    EnumWindowSize,
-    NotifyLiveStreamStatus,
-    RequestGetLiveStreamStatus,
-    RequestSetLiveStreamMode,
-)
-from open_gopro.proto.media_pb2 import (
-    RequestGetLastCapturedMedia,
-    ResponseLastCapturedMedia,
-)
-from open_gopro.proto.network_management_pb2 import (
-    EnumProvisioning,
-    EnumScanEntryFlags,
-    EnumScanning,
-    NotifProvisioningState,
-    NotifStartScanning,
-    RequestConnect,
-    RequestConnectNew,
-    RequestGetApEntries,
-    RequestReleaseNetwork,
-    RequestStartScan,
-    ResponseConnect,
-    ResponseConnectNew,
-    ResponseGetApEntries,
-    ResponseStartScanning,
-)
-from open_gopro.proto.preset_status_pb2 import (
-    EnumPresetGroup,
-    EnumPresetIcon,
-    EnumPresetTitle,
-    NotifyPresetStatus,
-    Preset,
-    PresetGroup,
-    PresetSetting,
-    RequestCustomPresetUpdate,
-)
-from open_gopro.proto.request_get_preset_status_pb2 import (
-    EnumRegisterPresetStatus,
-    RequestGetPresetStatus,
-)
-from open_gopro.proto.response_generic_pb2 import (
-    EnumResultGeneric,
-    Media,
-    ResponseGeneric,
-)
-from open_gopro.proto.set_camera_control_status_pb2 import (
-    EnumCameraControlStatus,
-    RequestSetCameraControlStatus,
+
+from typing import TYPE_CHECKING
+
+from open_gopro.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from open_gopro.proto.cohn_pb2 import (
+        EnumCOHNNetworkState,
+        EnumCOHNStatus,
+        NotifyCOHNStatus,
+        RequestClearCOHNCert,
+        RequestCOHNCert,
+        RequestCreateCOHNCert,
+        RequestGetCOHNStatus,
+        RequestSetCOHNSetting,
+        ResponseCOHNCert,
+    )
+    from open_gopro.proto.live_streaming_pb2 import (
+        EnumLens,
+        EnumLiveStreamStatus,
+        EnumRegisterLiveStreamStatus,
+        EnumWindowSize,
+        NotifyLiveStreamStatus,
+        RequestGetLiveStreamStatus,
+        RequestSetLiveStreamMode,
+    )
+    from open_gopro.proto.media_pb2 import (
+        RequestGetLastCapturedMedia,
+        ResponseLastCapturedMedia,
+    )
+    from open_gopro.proto.network_management_pb2 import (
+        EnumProvisioning,
+        EnumScanEntryFlags,
+        EnumScanning,
+        NotifProvisioningState,
+        NotifStartScanning,
+        RequestConnect,
+        RequestConnectNew,
+        RequestGetApEntries,
+        RequestReleaseNetwork,
+        RequestStartScan,
+        ResponseConnect,
+        ResponseConnectNew,
+        ResponseGetApEntries,
+        ResponseStartScanning,
+    )
+    from open_gopro.proto.preset_status_pb2 import (
+        EnumPresetGroup,
+        EnumPresetIcon,
+        EnumPresetTitle,
+        NotifyPresetStatus,
+        Preset,
+        PresetGroup,
+        PresetSetting,
+        RequestCustomPresetUpdate,
+    )
+    from open_gopro.proto.request_get_preset_status_pb2 import (
+        EnumRegisterPresetStatus,
+        RequestGetPresetStatus,
+    )
+    from open_gopro.proto.response_generic_pb2 import (
+        EnumResultGeneric,
+        Media,
+        ResponseGeneric,
+    )
+    from open_gopro.proto.set_camera_control_status_pb2 import (
+        EnumCameraControlStatus,
+        RequestSetCameraControlStatus,
+    )
+    from open_gopro.proto.turbo_transfer_pb2 import RequestSetTurboActive
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "EnumCOHNNetworkState": ".cohn_pb2",
+        "EnumCOHNStatus": ".cohn_pb2",
+        "NotifyCOHNStatus": ".cohn_pb2",
+        "RequestClearCOHNCert": ".cohn_pb2",
+        "RequestCOHNCert": ".cohn_pb2",
+        "RequestCreateCOHNCert": ".cohn_pb2",
+        "RequestGetCOHNStatus": ".cohn_pb2",
+        "RequestSetCOHNSetting": ".cohn_pb2",
+        "ResponseCOHNCert": ".cohn_pb2",
+        "EnumLens": ".live_streaming_pb2",
+        "EnumLiveStreamStatus": ".live_streaming_pb2",
+        "EnumRegisterLiveStreamStatus": ".live_streaming_pb2",
+        "EnumWindowSize": ".live_streaming_pb2",
+        "NotifyLiveStreamStatus": ".live_streaming_pb2",
+        "RequestGetLiveStreamStatus": ".live_streaming_pb2",
+        "RequestSetLiveStreamMode": ".live_streaming_pb2",
+        "RequestGetLastCapturedMedia": ".media_pb2",
+        "ResponseLastCapturedMedia": ".media_pb2",
+        "EnumProvisioning": ".network_management_pb2",
+        "EnumScanEntryFlags": ".network_management_pb2",
+        "EnumScanning": ".network_management_pb2",
+        "NotifProvisioningState": ".network_management_pb2",
+        "NotifStartScanning": ".network_management_pb2",
+        "RequestConnect": ".network_management_pb2",
+        "RequestConnectNew": ".network_management_pb2",
+        "RequestGetApEntries": ".network_management_pb2",
+        "RequestReleaseNetwork": ".network_management_pb2",
+        "RequestStartScan": ".network_management_pb2",
+        "ResponseConnect": ".network_management_pb2",
+        "ResponseConnectNew": ".network_management_pb2",
+        "ResponseGetApEntries": ".network_management_pb2",
+        "ResponseStartScanning": ".network_management_pb2",
+        "EnumPresetGroup": ".preset_status_pb2",
+        "EnumPresetIcon": ".preset_status_pb2",
+        "EnumPresetTitle": ".preset_status_pb2",
+        "NotifyPresetStatus": ".preset_status_pb2",
+        "Preset": ".preset_status_pb2",
+        "PresetGroup": ".preset_status_pb2",
+        "PresetSetting": ".preset_status_pb2",
+        "RequestCustomPresetUpdate": ".preset_status_pb2",
+        "EnumRegisterPresetStatus": ".request_get_preset_status_pb2",
+        "RequestGetPresetStatus": ".request_get_preset_status_pb2",
+        "EnumResultGeneric": ".response_generic_pb2",
+        "Media": ".response_generic_pb2",
+        "ResponseGeneric": ".response_generic_pb2",
+        "EnumCameraControlStatus": ".set_camera_control_status_pb2",
+        "RequestSetCameraControlStatus": ".set_camera_control_status_pb2",
+        "RequestSetTurboActive": ".turbo_transfer_pb2",
+    },
 )
-from open_gopro.proto.turbo_transfer_pb2 import RequestSetTurboActive
@@ -0,0 +1,301 @@
+# state_mirror.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Local mirror of a wireless camera's state that is kept up to date from BLE push notifications"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Final, Mapping
+
+from open_gopro.api.builders import BleSettingFacade, BleStatusFacade
+from open_gopro.communicator_interface import BleMessage
+from open_gopro.constants import ErrorCode, QueryCmdId, SettingId, StatusId
+from open_gopro.exceptions import GoProError
+from open_gopro.models import GoProResp
+
+if TYPE_CHECKING:
+    from open_gopro.gopro_wireless import WirelessGoPro
+
+logger = logging.getLogger(__name__)
+
+_STATUS_IDS: Final = frozenset(
+    (QueryCmdId.GET_STATUS_VAL, QueryCmdId.REG_STATUS_VAL_UPDATE, QueryCmdId.STATUS_VAL_PUSH)
+)
+_SETTING_IDS: Final = frozenset(
+    (QueryCmdId.GET_SETTING_VAL, QueryCmdId.REG_SETTING_VAL_UPDATE, QueryCmdId.SETTING_VAL_PUSH)
+)
+_CAPABILITY_IDS: Final = frozenset(
+    (QueryCmdId.GET_CAPABILITIES_VAL, QueryCmdId.REG_CAPABILITIES_UPDATE, QueryCmdId.SETTING_CAPABILITY_PUSH)
+)
+
+
+@dataclass(frozen=True)
+class CameraStateSnapshot:
+    """Immutable view of the mirrored camera state at one version"""
+
+    #: Incremented each time that a received response changes the mirrored state
+    version: int
+    #: Last received value of each status
+    statuses: dict[StatusId, Any] = field(default_factory=dict)
+    #: Last received value of each setting
+    settings: dict[SettingId, Any] = field(default_factory=dict)
+    #: Last received supported values of each setting
+    capabilities: dict[SettingId, list[Any]] = field(default_factory=dict)
+
+
+class CameraStateMirror:
+    """Mirror of all statuses, settings, and (optionally) setting capabilities maintained from push notifications
+
+    Once attached, the camera pushes every change so status / setting value reads (i.e.
+    `gopro.ble_status.encoding.get_value()`) are answered locally without a BLE round trip. A read is only sent to
+    the camera if the value has never been received, or if it was last received longer ago than max_staleness.
+
+    Code that needs to wait for the camera to reach a state should use wait_for instead of polling.
+
+    >>> mirror = CameraStateMirror(gopro)
+    >>> await mirror.attach()
+    >>> await mirror.wait_for(lambda state: not state.statuses[StatusId.BUSY], timeout=5)
+
+    Args:
+        gopro (WirelessGoPro): camera to mirror
+        max_staleness (float | None): seconds since a value was last received after which it is read from the
+            camera instead. Defaults to None (values are kept up to date by pushes so are always trusted).
+        capabilities (bool): also mirror setting capabilities. Defaults to True.
+    """
+
+    def __init__(self, gopro: WirelessGoPro, max_staleness: float | None = None, capabilities: bool = True) -> None:
+        self._gopro = gopro
+        self._max_staleness = max_staleness
+        self._mirror_capabilities = capabilities
+        self._live = False
+        self._version = 0
+        self._statuses: dict[StatusId, Any] = {}
+        self._settings: dict[SettingId, Any] = {}
+        self._capabilities: dict[SettingId, list[Any]] = {}
+        # (response group, ID) --> perf_counter time when its value was last received
+        self._received: dict[tuple[frozenset[QueryCmdId], StatusId | SettingId], float] = {}
+        self._snapshot: CameraStateSnapshot | None = None
+        self._changed = asyncio.Event()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def is_live(self) -> bool:
+        """Is the mirror currently being updated by push notifications?
+
+        Returns:
+            bool: True if attached to a connected camera, False otherwise
+        """
+        return self._live
+
+    @property
+    def version(self) -> int:
+        """Version of the mirrored state, incremented each time that it changes
+
+        Returns:
+            int: current version
+        """
+        return self._version
+
+    @property
+    def hits(self) -> int:
+        """Number of reads that have been answered locally
+
+        Returns:
+            int: read count
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of reads that had to be sent to the camera
+
+        Returns:
+            int: read count
+        """
+        return self._misses
+
+    @property
+    def snapshot(self) -> CameraStateSnapshot:
+        """Get the current mirrored state
+
+        Returns:
+            CameraStateSnapshot: copy of the state at the current version
+        """
+        if self._snapshot is None:
+            self._snapshot = CameraStateSnapshot(
+                self._version, dict(self._statuses), dict(self._settings), dict(self._capabilities)
+            )
+        return self._snapshot
+
+    async def attach(self) -> None:
+        """Register for all push notifications and start answering reads locally
+
+        Raises:
+            GoProError: the camera rejected a registration
+        """
+        self._gopro._state_mirror = self
+        registrations = [
+            self._gopro.ble_command.register_for_all_statuses,
+            self._gopro.ble_command.register_for_all_settings,
+        ]
+        if self._mirror_capabilities:
+            registrations.append(self._gopro.ble_command.register_for_all_capabilities)
+        # The current values are received in each registration response
+        for register in registrations:
+            if not (response := await register(callback=self._on_update)).ok:
+                await self.detach()
+                raise GoProError(f"Failed to attach camera state mirror: {response.status}")
+        self._live = True
+        logger.info(f"Camera state mirror attached at version {self._version}")
+
+    async def detach(self) -> None:
+        """Unregister from push notifications and stop answering reads locally"""
+        self._live = False
+        if self._gopro._state_mirror is self:
+            self._gopro._state_mirror = None
+        if not self._gopro.is_ble_connected:
+            return
+        unregistrations = [
+            self._gopro.ble_command.unregister_for_all_statuses,
+            self._gopro.ble_command.unregister_for_all_settings,
+        ]
+        if self._mirror_capabilities:
+            unregistrations.append(self._gopro.ble_command.unregister_for_all_capabilities)
+        for unregister in unregistrations:
+            await unregister(callback=self._on_update)
+
+    async def wait_for(
+        self, predicate: Callable[[CameraStateSnapshot], bool], timeout: float | None = None
+    ) -> CameraStateSnapshot:
+        """Wait until the mirrored state satisfies a condition
+
+        The predicate is checked immediately and then again each time that the state changes.
+
+        Args:
+            predicate (Callable[[CameraStateSnapshot], bool]): condition to wait for
+            timeout (float | None): seconds to wait before raising asyncio.TimeoutError. Defaults to None (wait
+                forever).
+
+        Returns:
+            CameraStateSnapshot: first state that satisfied the condition
+        """
+
+        async def _wait() -> CameraStateSnapshot:
+            while not predicate(snapshot := self.snapshot):
+                await self._changed.wait()
+            return snapshot
+
+        return await asyncio.wait_for(_wait(), timeout)
+
+    def _invalidate(self) -> None:
+        """Stop answering reads locally since push notifications are no longer being received (i.e. disconnect)"""
+        if self._live:
+            logger.info("Camera state mirror is no longer live")
+        self._live = False
+
+    def _serve(self, message: BleMessage) -> GoProResp | None:
+        """Answer a status / setting read from the mirror if possible
+
+        Args:
+            message (BleMessage): message that is about to be sent
+
+        Returns:
+            GoProResp | None: locally built response, or None if the message must be sent to the camera
+        """
+        match message:
+            case BleStatusFacade.BleStatusMessageBase(_identifier=QueryCmdId.GET_STATUS_VAL):
+                return self._lookup(message, message._status_id, _STATUS_IDS, self._statuses)
+            case BleSettingFacade.BleSettingMessageBase(_identifier=QueryCmdId.GET_SETTING_VAL):
+                return self._lookup(message, message._setting_id, _SETTING_IDS, self._settings)
+            case BleSettingFacade.BleSettingMessageBase(_identifier=QueryCmdId.GET_CAPABILITIES_VAL):
+                return self._lookup(message, message._setting_id, _CAPABILITY_IDS, self._capabilities)
+            case _:
+                return None
+
+    def _lookup(
+        self,
+        message: BleMessage,
+        identifier: StatusId | SettingId,
+        group: frozenset[QueryCmdId],
+        values: Mapping[Any, Any],
+    ) -> GoProResp | None:
+        """Build the local response to a status / setting read if its value is mirrored and fresh
+
+        Args:
+            message (BleMessage): message that is about to be sent
+            identifier (StatusId | SettingId): status / setting being read
+            group (frozenset[QueryCmdId]): response group that the value is received in
+            values (Mapping[Any, Any]): mirrored values of the status / setting's type
+
+        Returns:
+            GoProResp | None: locally built response, or None if the message must be sent to the camera
+        """
+        if not self._live or identifier not in values or not self._is_fresh(group, identifier):
+            self._misses += 1
+            return None
+        self._hits += 1
+        return GoProResp(
+            protocol=GoProResp.Protocol.BLE,
+            status=ErrorCode.SUCCESS,
+            data=values[identifier],
+            identifier=message._identifier,
+        )
+
+    def _is_fresh(self, group: frozenset[QueryCmdId], identifier: StatusId | SettingId) -> bool:
+        """Was this value received recently enough to be answered locally?
+
+        Args:
+            group (frozenset[QueryCmdId]): response group that the value is received in
+            identifier (StatusId | SettingId): status / setting
+
+        Returns:
+            bool: True if fresh, False otherwise
+        """
+        if self._max_staleness is None:
+            return True
+        return time.perf_counter() - self._received[(group, identifier)] < self._max_staleness
+
+    def _ingest(self, response: GoProResp) -> None:
+        """Update the mirror from a received query response or push notification
+
+        Args:
+            response (GoProResp): parsed response (before its data is reduced to a single value)
+        """
+        if not response.ok or not isinstance(response.data, dict):
+            return
+        for group, values in (
+            (_STATUS_IDS, self._statuses),
+            (_SETTING_IDS, self._settings),
+            (_CAPABILITY_IDS, self._capabilities),
+        ):
+            if response.identifier in group:
+                break
+        else:
+            return
+        received_at = time.perf_counter()
+        changed = False
+        for identifier, value in response.data.items():
+            # IDs that were registered before they have a value are received as an empty list
+            if value == [] and group is not _CAPABILITY_IDS:
+                continue
+            self._received[(group, identifier)] = received_at
+            if identifier not in values or values[identifier] != value:
+                values[identifier] = list(value) if group is _CAPABILITY_IDS else value
+                changed = True
+        if changed:
+            self._version += 1
+            self._snapshot = None
+            self._changed.set()
+            self._changed = asyncio.Event()
+
+    async def _on_update(self, *_: Any) -> None:
+        """Listener that push notifications are registered with.
+
+        Values are ingested from the complete response (see _ingest) since capability and setting value pushes are
+        notified to listeners identically.
+        """
@@ -0,0 +1,399 @@
+# sync_shutter.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Fire the shutter of many cameras at the same time and measure how closely they started encoding"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import statistics
+import time
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from typing import Any, Final, Iterable
+
+from construct import Int8ub
+
+from open_gopro.api.builders import BleWriteCommand
+from open_gopro.constants import CmdId, GoProUUID, StatusId, Toggle
+from open_gopro.exceptions import InvalidConfiguration
+from open_gopro.gopro_wireless import WirelessGoPro
+from open_gopro.models import GoProResp
+from open_gopro.types import UpdateType
+
+logger = logging.getLogger(__name__)
+
+SHUTTER_COMMAND: Final = BleWriteCommand(GoProUUID.CQ_COMMAND, CmdId.SET_SHUTTER, param_builder=Int8ub)
+
+
+@dataclass(frozen=True)
+class SkewStats:
+    """Statistics of when an event occurred on each camera relative to the earliest camera"""
+
+    offsets: list[float]  #: seconds after the earliest camera for each camera that the event occurred on
+
+    @classmethod
+    def from_times(cls, times: Iterable[float | None]) -> SkewStats:
+        """Build the statistics from per-camera event times
+
+        Args:
+            times (Iterable[float | None]): perf_counter time of the event on each camera. None if it did not occur.
+
+        Returns:
+            SkewStats: statistics of the times that occurred
+        """
+        occurred = [t for t in times if t is not None]
+        earliest = min(occurred, default=0.0)
+        return cls([t - earliest for t in occurred])
+
+    @property
+    def max(self) -> float:
+        """Spread between the earliest and latest camera
+
+        Returns:
+            float: skew in seconds
+        """
+        return max(self.offsets, default=0.0)
+
+    @property
+    def mean(self) -> float:
+        """Mean offset from the earliest camera
+
+        Returns:
+            float: offset in seconds
+        """
+        return statistics.fmean(self.offsets) if self.offsets else 0.0
+
+    @property
+    def stdev(self) -> float:
+        """Population standard deviation of the offsets
+
+        Returns:
+            float: standard deviation in seconds
+        """
+        return statistics.pstdev(self.offsets) if self.offsets else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Export the statistics
+
+        Returns:
+            dict[str, float]: count, max, mean and stdev (in seconds)
+        """
+        return {"count": len(self.offsets), "max": self.max, "mean": self.mean, "stdev": self.stdev}
+
+
+@dataclass
+class CameraTrigger:
+    """Timing of one camera's synchronized shutter"""
+
+    gopro: WirelessGoPro  #: camera that was triggered
+    write_started: float = 0.0  #: perf_counter time when the shutter write was started
+    write_completed: float = 0.0  #: perf_counter time when the shutter write returned
+    encoding_started: float | None = None  #: perf_counter time when the encoding started push was received
+    response: GoProResp | None = None  #: response to the shutter command
+    error: BaseException | None = None  #: exception raised while triggering this camera
+
+
+@dataclass
+class SynchronizedCaptureResult:
+    """Outcome of a synchronized shutter across cameras"""
+
+    release: float  #: perf_counter time when the writes were released
+    cameras: list[CameraTrigger] = field(default_factory=list)  #: per-camera timings, in the order of the cameras
+
+    @property
+    def ok(self) -> bool:
+        """Was the shutter set successfully on every camera?
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return all(camera.error is None and camera.response and camera.response.ok for camera in self.cameras)
+
+    @property
+    def write_skew(self) -> SkewStats:
+        """Skew of the shutter writes being started
+
+        Returns:
+            SkewStats: statistics
+        """
+        return SkewStats.from_times(camera.write_started for camera in self.cameras)
+
+    @property
+    def encoding_skew(self) -> SkewStats:
+        """Skew of the cameras reporting that they started encoding
+
+        Returns:
+            SkewStats: statistics over the cameras that reported encoding started
+        """
+        return SkewStats.from_times(camera.encoding_started for camera in self.cameras)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Export the skew statistics
+
+        Returns:
+            dict[str, Any]: per-camera offsets and aggregate statistics (in seconds)
+        """
+        return {
+            "cameras": len(self.cameras),
+            "ok": self.ok,
+            "write_skew": self.write_skew.as_dict(),
+            "encoding_skew": self.encoding_skew.as_dict(),
+            "release_latency": [camera.write_started - self.release for camera in self.cameras],
+            "encoding_latency": [
+                camera.encoding_started - camera.write_started if camera.encoding_started is not None else None
+                for camera in self.cameras
+            ],
+        }
+
+
+class SynchronizedShutter:
+    """Set the shutter of many cameras with as little skew as possible
+
+    Arming waits until each camera is ready, takes control of its BLE messaging and of its command characteristic's
+    pipeline slot, builds and fragments the shutter packets, and registers for the encoding status. Firing then
+    releases every camera's writes at a single scheduled event loop time, bypassing the per-message rules (locking,
+    waiting for encoding) that a normal set_shutter would go through. When starting encoding, the time each camera
+    reports that encoding started is measured from its encoding status push.
+
+    The cameras must be opened WirelessGoPro's (a GoProFleet of them can be passed directly).
+
+    Attributes:
+        DEFAULT_LEAD_TIME (Final[float]): default seconds between starting to fire and the writes being released
+        DEFAULT_ENCODING_TIMEOUT (Final[float]): default seconds to wait for each camera to report encoding started
+        DEFAULT_READY_TIMEOUT (Final[float]): default seconds to wait for every camera to be ready when arming
+
+    Args:
+        gopros (Iterable[WirelessGoPro]): cameras to trigger
+        lead_time (float): seconds between starting to fire and the writes being released. This allows every
+            camera's write to be scheduled before any is released. Defaults to DEFAULT_LEAD_TIME.
+        encoding_timeout (float): seconds to wait for each camera to report encoding started. Defaults to
+            DEFAULT_ENCODING_TIMEOUT.
+        ready_timeout (float): seconds to wait for every camera to be ready when arming (and for each camera to
+            unregister from the encoding status when disarming). Defaults to DEFAULT_READY_TIMEOUT.
+
+    Raises:
+        InvalidConfiguration: a camera is not a WirelessGoPro
+    """
+
+    DEFAULT_LEAD_TIME: Final[float] = 0.05
+    DEFAULT_ENCODING_TIMEOUT: Final[float] = 5.0
+    DEFAULT_READY_TIMEOUT: Final[float] = 10.0
+
+    def __init__(
+        self,
+        gopros: Iterable[WirelessGoPro],
+        lead_time: float = DEFAULT_LEAD_TIME,
+        encoding_timeout: float = DEFAULT_ENCODING_TIMEOUT,
+        ready_timeout: float = DEFAULT_READY_TIMEOUT,
+    ) -> None:
+        self._gopros = list(gopros)
+        if not all(isinstance(gopro, WirelessGoPro) for gopro in self._gopros):
+            raise InvalidConfiguration("Synchronized shutter requires a BLE connection to every camera")
+        self._lead_time = lead_time
+        self._encoding_timeout = encoding_timeout
+        self._ready_timeout = ready_timeout
+        self._shutter: Toggle | None = None
+        self._packets: list[list[bytes]] = []
+        self._triggers: list[CameraTrigger] = []
+        self._encoding_events: list[asyncio.Event] = []
+        self._listeners: list[Any] = []
+        # Which cameras the encoding status listener was registered on
+        self._registered: list[bool] = []
+        # Per-camera messaging control that is held from arming until the camera's shutter response is received
+        self._held: list[AsyncExitStack] = []
+
+    @property
+    def is_armed(self) -> bool:
+        """Is the shutter armed and ready to fire?
+
+        Returns:
+            bool: True if armed, False otherwise
+        """
+        return self._shutter is not None
+
+    async def arm(self, shutter: Toggle = Toggle.ENABLE) -> None:
+        """Prepare every camera to set the shutter
+
+        If not every camera is ready within the ready timeout, asyncio.TimeoutError is raised. If any camera fails to be
+        prepared, the cameras that were already prepared are released.
+
+        Args:
+            shutter (Toggle): shutter value to set. Defaults to Toggle.ENABLE.
+        """
+        if self.is_armed:
+            return
+        self._triggers = [CameraTrigger(gopro) for gopro in self._gopros]
+        self._encoding_events = [asyncio.Event() for _ in self._gopros]
+        self._listeners = [self._build_listener(index) for index in range(len(self._gopros))]
+        self._registered = [False for _ in self._gopros]
+        self._held = [AsyncExitStack() for _ in self._gopros]
+        tasks = [asyncio.create_task(self._prepare(index, shutter)) for index in range(len(self._gopros))]
+        prepared = False
+        try:
+            await asyncio.wait_for(asyncio.gather(*tasks), self._ready_timeout)
+            prepared = True
+        finally:
+            if not prepared:
+                await self._abort_arm(tasks)
+        self._packets = [list(gopro._fragment(SHUTTER_COMMAND._build_data(shutter=shutter))) for gopro in self._gopros]
+        self._shutter = shutter
+        logger.info(f"Armed synchronized shutter {shutter.name} on {len(self._gopros)} cameras")
+
+    async def disarm(self) -> None:
+        """Release the cameras without firing"""
+        await self._release()
+        self._shutter = None
+
+    async def fire(self) -> SynchronizedCaptureResult:
+        """Release the armed shutter writes at one scheduled time and wait for the results
+
+        Raises:
+            RuntimeError: the shutter is not armed
+
+        Returns:
+            SynchronizedCaptureResult: per-camera timings and skew statistics
+        """
+        if not self.is_armed:
+            raise RuntimeError("Synchronized shutter must be armed before being fired")
+        loop = asyncio.get_running_loop()
+        released = asyncio.Event()
+        result = SynchronizedCaptureResult(0.0, self._triggers)
+
+        def release() -> None:
+            result.release = time.perf_counter()
+            released.set()
+
+        loop.call_at(loop.time() + self._lead_time, release)
+        try:
+            await asyncio.gather(*[self._trigger(index, released) for index in range(len(self._gopros))])
+            if self._shutter is Toggle.ENABLE:
+                await asyncio.gather(*[self._wait_for_encoding(index) for index in range(len(self._gopros))])
+        finally:
+            await self.disarm()
+        logger.info(f"Synchronized shutter results: {result.as_dict()}")
+        return result
+
+    async def capture(self, shutter: Toggle = Toggle.ENABLE) -> SynchronizedCaptureResult:
+        """Arm and then immediately fire
+
+        Args:
+            shutter (Toggle): shutter value to set. Defaults to Toggle.ENABLE.
+
+        Returns:
+            SynchronizedCaptureResult: per-camera timings and skew statistics
+        """
+        await self.arm(shutter)
+        return await self.fire()
+
+    async def _prepare(self, index: int, shutter: Toggle) -> None:
+        """Register for one camera's encoding status (if starting encoding) and then take control of it
+
+        Args:
+            index (int): index of camera
+            shutter (Toggle): shutter value that will be set
+        """
+        gopro = self._gopros[index]
+        if shutter is Toggle.ENABLE:
+            response = await gopro.ble_status.encoding.register_value_update(self._listeners[index])
+            self._registered[index] = response.ok
+        await self._hold(gopro, self._held[index])
+
+    async def _abort_arm(self, tasks: list[asyncio.Task]) -> None:
+        """Stop preparing the cameras and release the ones that were already prepared
+
+        Args:
+            tasks (list[asyncio.Task]): per-camera prepare tasks
+        """
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._release()
+
+    async def _release(self) -> None:
+        """Release every camera's messaging control and unregister from its encoding status"""
+        for held in self._held:
+            await held.aclose()
+        registered = [index for index, is_registered in enumerate(self._registered) if is_registered]
+        self._registered = [False for _ in self._gopros]
+        results = await asyncio.gather(*[self._unregister(index) for index in registered], return_exceptions=True)
+        for index, result in zip(registered, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to unregister camera {index} from encoding status: {repr(result)}")
+
+    async def _unregister(self, index: int) -> None:
+        """Unregister the encoding status listener from one camera
+
+        The camera sends status pushes per status rather than per listener so the camera is only told to stop
+        sending them if nothing else is listening. A camera that maintains state always listens for encoding itself.
+
+        Args:
+            index (int): index of camera
+        """
+        gopro, listener = self._gopros[index], self._listeners[index]
+        gopro.unregister_update(listener, StatusId.ENCODING)
+        if not gopro._listeners.get(StatusId.ENCODING):
+            await asyncio.wait_for(gopro.ble_status.encoding.unregister_value_update(listener), self._ready_timeout)
+
+    @staticmethod
+    async def _hold(gopro: WirelessGoPro, held: AsyncExitStack) -> None:
+        """Take control of one camera's BLE messaging and shutter characteristic
+
+        Args:
+            gopro (WirelessGoPro): camera to hold
+            held (AsyncExitStack): stack to release the camera with
+        """
+        await gopro._acquire_ble_messaging()
+        held.callback(gopro._release_ble_messaging)
+        await held.enter_async_context(gopro._ble_requests.slot(SHUTTER_COMMAND._uuid))
+
+    def _build_listener(self, index: int) -> Any:
+        """Build the encoding status listener for one camera
+
+        Args:
+            index (int): index of camera
+
+        Returns:
+            Any: listener to register
+        """
+
+        async def on_encoding(_: UpdateType, value: Any) -> None:
+            if value and self._triggers[index].encoding_started is None:
+                self._triggers[index].encoding_started = time.perf_counter()
+                self._encoding_events[index].set()
+
+        return on_encoding
+
+    async def _trigger(self, index: int, released: asyncio.Event) -> None:
+        """Write one camera's shutter packets once released and release its messaging once the response is received
+
+        Args:
+            index (int): index of camera
+            released (asyncio.Event): set when the writes are released
+        """
+        gopro, trigger = self._gopros[index], self._triggers[index]
+        await released.wait()
+        trigger.write_started = time.perf_counter()
+        try:
+            trigger.response = await gopro._send_armed_ble_message(SHUTTER_COMMAND, self._packets[index])
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error(f"Failed to trigger camera {index}: {repr(e)}")
+            trigger.error = e
+        finally:
+            trigger.write_completed = time.perf_counter()
+            # Release immediately so that state management can process the encoding update
+            await self._held[index].aclose()
+
+    async def _wait_for_encoding(self, index: int) -> None:
+        """Wait for one camera to report that encoding started
+
+        Args:
+            index (int): index of camera
+        """
+        if self._triggers[index].error is not None:
+            return
+        try:
+            await asyncio.wait_for(self._encoding_events[index].wait(), self._encoding_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Camera {index} did not report encoding started within {self._encoding_timeout} seconds")
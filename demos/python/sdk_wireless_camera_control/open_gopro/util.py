@@ -11,10 +11,12 @@ import enum
 import logging
 import subprocess
 import sys
+import time
+from contextlib import contextmanager
 from dataclasses import is_dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Generic, Iterator, TypeVar
 
 import pytz
 from construct import Container
@@ -256,6 +258,39 @@ class SnapshotQueue(asyncio.Queue, Generic[T]):
             return None if self.empty() else self._queue[0]  # type: ignore
 
 
+class PhaseTimer:
+    """Measure how long each named phase of an operation takes
+
+    >>> timer = PhaseTimer()
+    >>> with timer.phase("connect"):
+    >>>     await connect()
+    >>> print(timer.durations)
+    """
+
+    def __init__(self) -> None:
+        self.durations: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase, adding to its duration if it has already been timed
+
+        Args:
+            name (str): phase name
+
+        Yields:
+            None: the phase is timed until the context exits
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name] = self.durations.get(name, 0.0) + time.perf_counter() - start
+
+    def reset(self) -> None:
+        """Clear all durations"""
+        self.durations = {}
+
+
 def add_cli_args_and_parse(
     parser: argparse.ArgumentParser,
     bluetooth: bool = True,
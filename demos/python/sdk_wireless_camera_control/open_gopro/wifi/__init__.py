@@ -6,6 +6,14 @@
 isort:skip_file
 """
 
+from typing import TYPE_CHECKING
+
+from open_gopro.lazy import lazy_exports
 from .controller import SsidState, WifiController
 from .client import WifiClient
-from .adapters import WifiCli
+
+# The adapter is imported on first access so that it is only loaded if it is used
+if TYPE_CHECKING:
+    from .adapters import WifiCli
+
+__getattr__, __dir__ = lazy_exports(__name__, {"WifiCli": ".adapters"})
@@ -0,0 +1,391 @@
+# wire_trace.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Record the BLE / HTTP traffic of a camera to a binary wire trace and re-serve it offline
+
+A trace is an append-only file that starts with MAGIC and is followed by frames. Each frame is a little-endian
+header (seconds since the trace was started as a double, FrameKind as a byte, channel as a ushort, and length of the
+data as a uint) followed by its data. A trace that was not closed cleanly is read up to its last complete frame.
+
+Record by passing `wire_trace` (a file or WireTraceRecorder) to a GoPro:
+
+>>> async with WirelessGoPro(wire_trace="session.gpwt") as gopro:
+>>>     ...
+
+Replay by using the ReplayBleController (see open_gopro.ble.adapters.replay) and / or ReplayHttpTransport:
+
+>>> gopro = WiredGoPro("123", http_transport=ReplayHttpTransport("session.gpwt", speed=math.inf))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import enum
+import json
+import logging
+import math
+import struct
+import threading
+import time
+import weakref
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Final, Sequence
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from open_gopro.exceptions import DownloadFailed
+from open_gopro.http_transport import HttpTransport
+
+if TYPE_CHECKING:
+    from open_gopro.ble import GattDB
+
+logger = logging.getLogger(__name__)
+
+MAGIC: Final = b"GPWT\x01"
+_HEADER: Final = struct.Struct("<dBHI")
+_HTTP_META: Final = struct.Struct("<I")
+
+
+def _path(url: str) -> str:
+    """Get the path and query of a URL
+
+    Args:
+        url (str): URL
+
+    Returns:
+        str: path (with query if there is one)
+    """
+    parts = urlsplit(url)
+    return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+class FrameKind(enum.IntEnum):
+    """Type of traffic that a frame contains"""
+
+    CONNECT = 0  #: Connected device and its GATT table (as JSON)
+    BLE_WRITE = 1  #: Data written to the channel's attribute handle
+    BLE_NOTIFICATION = 2  #: Notification received on the channel's attribute handle
+    BLE_READ = 3  #: Data read from the channel's attribute handle
+    HTTP = 4  #: HTTP exchange (request / response metadata as JSON followed by the response body)
+
+
+@dataclass(frozen=True)
+class TraceFrame:
+    """A timestamped frame of a wire trace"""
+
+    timestamp: float  #: seconds since the trace was started
+    kind: FrameKind  #: type of traffic
+    channel: int  #: attribute handle of BLE frames. Otherwise 0.
+    data: bytes  #: frame data
+
+    @property
+    def http(self) -> tuple[dict[str, Any], bytes]:
+        """Get the request / response metadata and response body of an HTTP frame
+
+        Returns:
+            tuple[dict[str, Any], bytes]: metadata (method, path, status, reason, headers, encoding, and latency)
+                and body
+        """
+        (length,) = _HTTP_META.unpack_from(self.data)
+        meta_end = _HTTP_META.size + length
+        return json.loads(self.data[_HTTP_META.size : meta_end]), self.data[meta_end:]
+
+
+class WireTraceRecorder:
+    """Append timestamped frames to a wire trace file. This is thread-safe.
+
+    Frames are buffered and written when the buffer is full or the recorder is flushed. The file is closed when the
+    recorder is closed or garbage collected.
+
+    Args:
+        file (Path | str): trace file to create (or overwrite)
+    """
+
+    def __init__(self, file: Path | str) -> None:
+        self.file = Path(file)
+        self._file = open(self.file, "wb")  # pylint: disable=consider-using-with
+        self._file.write(MAGIC)
+        self._finalizer = weakref.finalize(self, self._file.close)
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._frames = 0
+
+    def __enter__(self) -> WireTraceRecorder:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    @property
+    def frames(self) -> int:
+        """Get the amount of frames that have been recorded
+
+        Returns:
+            int: frame count
+        """
+        return self._frames
+
+    def record(self, kind: FrameKind, channel: int, data: bytes) -> None:
+        """Append a frame timestamped with the current time
+
+        Frames that are recorded after the recorder is closed are dropped.
+
+        Args:
+            kind (FrameKind): type of traffic
+            channel (int): attribute handle of BLE frames. Otherwise 0.
+            data (bytes): frame data
+        """
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(_HEADER.pack(time.perf_counter() - self._start, kind, channel, len(data)))
+            self._file.write(data)
+            self._frames += 1
+
+    def ble_connect(self, device: str, gatt_db: GattDB) -> None:
+        """Record the connected device and its GATT table
+
+        Args:
+            device (str): connected device
+            gatt_db (GattDB): discovered (or cached) GATT table
+        """
+        self.record(FrameKind.CONNECT, 0, json.dumps({"device": device, "gatt_db": gatt_db.as_dict()}).encode())
+
+    def ble_write(self, handle: int, data: bytes | bytearray) -> None:
+        """Record data written to an attribute
+
+        Args:
+            handle (int): attribute handle
+            data (bytes | bytearray): written data
+        """
+        self.record(FrameKind.BLE_WRITE, handle, bytes(data))
+
+    def ble_notification(self, handle: int, data: bytes | bytearray) -> None:
+        """Record a received notification
+
+        Args:
+            handle (int): attribute handle
+            data (bytes | bytearray): notified data
+        """
+        self.record(FrameKind.BLE_NOTIFICATION, handle, bytes(data))
+
+    def ble_read(self, handle: int, data: bytes | bytearray) -> None:
+        """Record data read from an attribute
+
+        Args:
+            handle (int): attribute handle
+            data (bytes | bytearray): read data
+        """
+        self.record(FrameKind.BLE_READ, handle, bytes(data))
+
+    def http(self, method: str, url: str, response: requests.Response, latency: float) -> None:
+        """Record an HTTP exchange
+
+        Only the path and query of the URL are recorded so that the trace can be replayed against any address.
+
+        Args:
+            method (str): HTTP method
+            url (str): requested URL
+            response (requests.Response): received response
+            latency (float): seconds from sending the request until the response was received
+        """
+        meta = json.dumps(
+            {
+                "method": method,
+                "path": _path(url),
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": dict(response.headers),
+                "encoding": response.encoding,
+                "latency": latency,
+            }
+        ).encode()
+        self.record(FrameKind.HTTP, 0, _HTTP_META.pack(len(meta)) + meta + response.content)
+
+    def flush(self) -> None:
+        """Write all buffered frames to the file"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Write all buffered frames and close the file"""
+        with self._lock:
+            self._finalizer()
+
+
+def read_trace(file: Path | str) -> list[TraceFrame]:
+    """Read all complete frames of a wire trace
+
+    Args:
+        file (Path | str): trace file
+
+    Raises:
+        ValueError: file is not a wire trace
+
+    Returns:
+        list[TraceFrame]: frames in the order that they were recorded
+    """
+    buffer = memoryview(Path(file).read_bytes())
+    if bytes(buffer[: len(MAGIC)]) != MAGIC:
+        raise ValueError(f"{file} is not a wire trace")
+    frames: list[TraceFrame] = []
+    offset = len(MAGIC)
+    while offset + _HEADER.size <= len(buffer):
+        timestamp, kind, channel, length = _HEADER.unpack_from(buffer, offset)
+        if (end := offset + _HEADER.size + length) > len(buffer):
+            logger.warning(f"Ignoring truncated frame at offset {offset} of {file}")
+            break
+        frames.append(TraceFrame(timestamp, FrameKind(kind), channel, bytes(buffer[offset + _HEADER.size : end])))
+        offset = end
+    return frames
+
+
+def load_frames(trace: Path | str | Sequence[TraceFrame]) -> Sequence[TraceFrame]:
+    """Get the frames of a trace that is either a file or already read
+
+    Args:
+        trace (Path | str | Sequence[TraceFrame]): trace file or frames
+
+    Returns:
+        Sequence[TraceFrame]: frames
+    """
+    return read_trace(trace) if isinstance(trace, (Path, str)) else trace
+
+
+class RecordingHttpTransport(HttpTransport):
+    """Record each GET / PUT exchange of another transport to a wire trace
+
+    File downloads (and their probes) are passed through without being recorded.
+
+    Args:
+        transport (HttpTransport): transport to send requests with
+        recorder (WireTraceRecorder): recorder to record exchanges to
+    """
+
+    def __init__(self, transport: HttpTransport, recorder: WireTraceRecorder) -> None:
+        self._transport = transport
+        self._recorder = recorder
+
+    async def get(self, url: str, *, timeout: float, **kwargs: Any) -> requests.Response:  # noqa: D102
+        return await self._record("GET", url, self._transport.get, timeout=timeout, **kwargs)
+
+    async def put(self, url: str, *, timeout: float, **kwargs: Any) -> requests.Response:  # noqa: D102
+        return await self._record("PUT", url, self._transport.put, timeout=timeout, **kwargs)
+
+    async def probe(self, url: str, *, timeout: float, **kwargs: Any) -> tuple[int | None, bool]:  # noqa: D102
+        return await self._transport.probe(url, timeout=timeout, **kwargs)
+
+    async def download(
+        self,
+        url: str,
+        file: Path,
+        *,
+        timeout: float,
+        byte_range: tuple[int, int] | None = None,
+        on_chunk: Callable[[int], None] | None = None,
+        **kwargs: Any,
+    ) -> Path:
+        """Download with the wrapped transport without recording the exchange"""
+        return await self._transport.download(
+            url, file, timeout=timeout, byte_range=byte_range, on_chunk=on_chunk, **kwargs
+        )
+
+    async def close(self) -> None:  # noqa: D102
+        await self._transport.close()
+
+    async def _record(self, method: str, url: str, send: Callable, **kwargs: Any) -> requests.Response:
+        """Send a request and record the exchange
+
+        Args:
+            method (str): HTTP method
+            url (str): full URL to request
+            send (Callable): transport method to send the request with
+            **kwargs (Any): request arguments
+
+        Returns:
+            requests.Response: received response
+        """
+        start = time.perf_counter()
+        response = await send(url, **kwargs)
+        self._recorder.http(method, url, response, time.perf_counter() - start)
+        return response
+
+
+class ReplayHttpTransport(HttpTransport):
+    """Answer GET / PUT requests with the HTTP exchanges of a wire trace
+
+    Requests are matched by method, path, and query. Repeated requests are answered with their recorded responses in
+    order and the last recorded response is re-used once they are exhausted. Requests that were not recorded are
+    answered with 404. File downloads are not recorded so they fail with DownloadFailed.
+
+    Args:
+        trace (Path | str | Sequence[TraceFrame]): trace file or frames to replay
+        speed (float): how much faster than recorded to respond (i.e. 1.0 for the recorded latency, math.inf for no
+            latency). Defaults to 1.0.
+    """
+
+    def __init__(self, trace: Path | str | Sequence[TraceFrame], speed: float = 1.0) -> None:
+        self._speed = speed
+        self._responses: dict[tuple[str, str], deque[tuple[dict[str, Any], bytes]]] = defaultdict(deque)
+        for frame in load_frames(trace):
+            if frame.kind is FrameKind.HTTP:
+                meta, body = frame.http
+                self._responses[(meta["method"], meta["path"])].append((meta, body))
+
+    async def get(self, url: str, *, timeout: float, **kwargs: Any) -> requests.Response:  # noqa: D102
+        return await self._replay("GET", url)
+
+    async def put(self, url: str, *, timeout: float, **kwargs: Any) -> requests.Response:  # noqa: D102
+        return await self._replay("PUT", url)
+
+    async def probe(self, url: str, *, timeout: float, **kwargs: Any) -> tuple[int | None, bool]:
+        """Fail with DownloadFailed since file downloads are not recorded in wire traces"""
+        raise DownloadFailed(_path(url), "file downloads are not recorded in wire traces")
+
+    async def download(
+        self,
+        url: str,
+        file: Path,
+        *,
+        timeout: float,
+        byte_range: tuple[int, int] | None = None,
+        on_chunk: Callable[[int], None] | None = None,
+        **kwargs: Any,
+    ) -> Path:
+        """Fail with DownloadFailed since file downloads are not recorded in wire traces"""
+        raise DownloadFailed(_path(url), "file downloads are not recorded in wire traces")
+
+    async def close(self) -> None:  # noqa: D102
+        return
+
+    async def _replay(self, method: str, url: str) -> requests.Response:
+        """Build the recorded response to a request after its recorded latency
+
+        Args:
+            method (str): HTTP method
+            url (str): full URL that was requested
+
+        Returns:
+            requests.Response: recorded response
+        """
+        path = _path(url)
+        response = requests.Response()
+        response.url = url
+        if not (recorded := self._responses.get((method, path))):
+            logger.warning(f"No recorded response to {method} {path}")
+            response.status_code, response.reason, response._content = 404, "Not Found", b""
+            return response
+        meta, body = recorded.popleft() if len(recorded) > 1 else recorded[0]
+        if math.isfinite(self._speed):
+            await asyncio.sleep(meta["latency"] / self._speed)
+        response.status_code = meta["status"]
+        response.reason = meta["reason"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response.encoding = meta["encoding"]
+        response._content = body
+        return response
@@ -0,0 +1,205 @@
+# wired_readiness.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Track whether a wired camera is ready to receive commands without polling its complete state"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Final
+
+from open_gopro.constants import SettingId, StatusId
+from open_gopro.types import CameraState, ResponseType
+
+if TYPE_CHECKING:
+    from open_gopro.gopro_wired import WiredGoPro
+
+logger = logging.getLogger(__name__)
+
+READY_STATE: Final[CameraState] = {StatusId.ENCODING: False, StatusId.BUSY: False}
+"""State that the camera must be in to receive rule-enforced commands"""
+
+
+class WiredReadiness:
+    """Cached, adaptively polled camera state used to enforce message rules on a wired camera
+
+    Only the statuses / settings that are being waited for are polled, using a camera state subset query. If the
+    camera does not support these, the complete camera state is polled instead.
+
+    Each polled value is cached and trusted for a freshness window so that back-to-back commands do not each need
+    to poll the camera. The cache is invalidated whenever a command fails, since this may be because the camera
+    became busy, and whenever a command that can change the camera's state (anything but a message whose rules mark
+    it as read only, such as getting the media list) succeeds, since the camera may now be encoding or busy. While
+    waiting for a state, the camera is polled with exponential backoff between the minimum and maximum poll period.
+
+    Attributes:
+        DEFAULT_FRESHNESS (Final[float]): default seconds that a polled value is trusted
+        DEFAULT_MIN_POLL_PERIOD (Final[float]): default initial poll period when waiting for a state
+        DEFAULT_MAX_POLL_PERIOD (Final[float]): default maximum poll period when waiting for a state
+        BACKOFF (Final[float]): factor that the poll period is multiplied by after each poll
+        RATE_WINDOW (Final[int]): amount of most recent commands that the command rate is measured over
+
+    Args:
+        gopro (WiredGoPro): camera to track
+        freshness (float): seconds that a polled value is trusted. Set to 0 to always poll. Defaults to
+            DEFAULT_FRESHNESS.
+        min_poll_period (float): initial poll period when waiting for a state. Defaults to DEFAULT_MIN_POLL_PERIOD.
+        max_poll_period (float): maximum poll period when waiting for a state. Defaults to
+            DEFAULT_MAX_POLL_PERIOD.
+    """
+
+    DEFAULT_FRESHNESS: Final[float] = 0.5
+    DEFAULT_MIN_POLL_PERIOD: Final[float] = 0.05
+    DEFAULT_MAX_POLL_PERIOD: Final[float] = 2.0
+    BACKOFF: Final[float] = 2.0
+    RATE_WINDOW: Final[int] = 32
+
+    def __init__(
+        self,
+        gopro: WiredGoPro,
+        freshness: float = DEFAULT_FRESHNESS,
+        min_poll_period: float = DEFAULT_MIN_POLL_PERIOD,
+        max_poll_period: float = DEFAULT_MAX_POLL_PERIOD,
+    ) -> None:
+        self._gopro = gopro
+        self._freshness = freshness
+        self._min_poll_period = min(min_poll_period, max_poll_period)
+        self._max_poll_period = max_poll_period
+        self._state: CameraState = {}
+        # ID --> perf_counter time when its value was polled
+        self._polled: dict[ResponseType, float] = {}
+        self._supports_subset: bool | None = None
+        self._completions: deque[float] = deque(maxlen=WiredReadiness.RATE_WINDOW)
+        self._polls = 0
+
+    @property
+    def state(self) -> CameraState:
+        """The last polled value of each tracked status / setting
+
+        Returns:
+            CameraState: cached state
+        """
+        return dict(self._state)
+
+    @property
+    def polls(self) -> int:
+        """Number of times that the camera has been polled
+
+        Returns:
+            int: poll count
+        """
+        return self._polls
+
+    @property
+    def command_rate(self) -> float:
+        """Rate that rule-enforced commands have recently been completed at
+
+        Returns:
+            float: commands / second over the last RATE_WINDOW commands (0 if less than 2 have completed)
+        """
+        if len(self._completions) < 2 or not (elapsed := self._completions[-1] - self._completions[0]):
+            return 0.0
+        return (len(self._completions) - 1) / elapsed
+
+    def is_fresh(self, check: CameraState) -> bool:
+        """Are the cached values of all of these statuses / settings still trusted?
+
+        Args:
+            check (CameraState): statuses / settings to check
+
+        Returns:
+            bool: True if all are fresh, False otherwise
+        """
+        now = time.perf_counter()
+        return all(now - self._polled.get(key, -float("inf")) < self._freshness for key in check)
+
+    def matches(self, check: CameraState) -> bool:
+        """Do the cached values of all of these statuses / settings equal the desired values?
+
+        Args:
+            check (CameraState): dict{setting / status: value} of desired values
+
+        Returns:
+            bool: True if all match, False otherwise
+        """
+        return all(self._state.get(key) == value for key, value in check.items())
+
+    def invalidate(self) -> None:
+        """Stop trusting all cached values so that the next wait polls the camera"""
+        self._polled.clear()
+
+    def command_completed(self, ok: bool, read_only: bool = False) -> None:
+        """Record that a rule-enforced command has completed
+
+        Args:
+            ok (bool): did the command succeed?
+            read_only (bool): does the command only read from the camera (see MessageRules.is_read_only)? Defaults
+                to False.
+        """
+        self._completions.append(time.perf_counter())
+        if not ok or not read_only:
+            self.invalidate()
+
+    async def refresh(self, check: CameraState | None = None) -> CameraState:
+        """Poll the current values of some statuses / settings from the camera
+
+        Args:
+            check (CameraState | None): statuses / settings to poll. Defaults to None (READY_STATE).
+
+        Returns:
+            CameraState: updated cached state
+        """
+        if check is None:
+            check = READY_STATE
+        self._polls += 1
+        polled_at = time.perf_counter()
+        if self._supports_subset is not False:
+            state = (
+                await self._gopro.http_command.get_camera_state_subset(
+                    statuses=[key for key in check if isinstance(key, StatusId)],
+                    settings=[key for key in check if isinstance(key, SettingId)],
+                )
+            ).data
+            if all(key in state for key in check):
+                self._supports_subset = True
+                return self._update(state, polled_at)
+            logger.info("Camera does not support camera state subsets. Polling complete camera state instead.")
+            self._supports_subset = False
+        return self._update((await self._gopro.http_command.get_camera_state()).data, polled_at)
+
+    async def wait_for(self, check: CameraState) -> None:
+        """Wait until some statuses / settings are all equal to desired values
+
+        Returns immediately if the cached values are fresh and match.
+
+        Args:
+            check (CameraState): dict{setting / status: value} of settings / statuses and values to wait for
+        """
+        if self.is_fresh(check) and self.matches(check):
+            return
+        period = self._min_poll_period
+        while True:
+            await self.refresh(check)
+            if self.matches(check):
+                return
+            logger.trace(f"Not ready ==> {check} (polling again in {period:.2f} seconds)")  # type: ignore
+            await asyncio.sleep(period)
+            period = min(period * WiredReadiness.BACKOFF, self._max_poll_period)
+
+    def _update(self, state: CameraState, polled_at: float) -> CameraState:
+        """Store polled values in the cache
+
+        Args:
+            state (CameraState): polled state
+            polled_at (float): perf_counter time that the poll was started
+
+        Returns:
+            CameraState: updated cached state
+        """
+        self._state.update(state)
+        for key in state:
+            self._polled[key] = polled_at
+        return self._state
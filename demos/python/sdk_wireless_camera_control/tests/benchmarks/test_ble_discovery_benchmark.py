@@ -0,0 +1,78 @@
+# test_ble_discovery_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Measure handling the advertisements of a 30 camera rig with the discovery service
+
+Compared to parsing each advertisement with the construct structures (as the scanner demo does).
+
+Run with: pytest tests/benchmarks/test_ble_discovery_benchmark.py -s
+"""
+
+import logging
+import random
+import time
+
+from open_gopro.ble import Advertisement
+from open_gopro.ble_discovery import (
+    GOPRO_COMPANY_ID,
+    GOPRO_SERVICE_DATA_UUID,
+    DiscoveryService,
+)
+from open_gopro.models.network_scan_responses import (
+    manuf_data_struct,
+    service_data_struct,
+)
+
+CAMERAS = 30
+ADVERTISEMENTS = 60_000
+# Fraction of advertisements whose status changed since the camera's previous one
+CHANGE_RATE = 0.02
+
+
+def build_advertisements() -> list[Advertisement]:
+    rng = random.Random(0)
+    status = {camera: bytearray(rng.randbytes(12)) for camera in range(CAMERAS)}
+    advertisements = []
+    for _ in range(ADVERTISEMENTS):
+        camera = rng.randrange(CAMERAS)
+        if rng.random() < CHANGE_RATE:
+            status[camera][11] ^= 0x08  # Toggle offload busy
+        advertisements.append(
+            Advertisement(
+                f"AA:BB:CC:DD:EE:{camera:02X}",
+                f"GoPro {camera:04}",
+                {GOPRO_COMPANY_ID: bytes(status[camera])},
+                {GOPRO_SERVICE_DATA_UUID: bytes(4) + f"{camera:04}".encode()},
+                -60,
+            )
+        )
+    return advertisements
+
+
+def test_advertisement_handling():
+    advertisements = build_advertisements()
+
+    start = time.perf_counter()
+    for advertisement in advertisements:
+        manuf_data_struct.parse(advertisement.manufacturer_data[GOPRO_COMPANY_ID])
+        service_data_struct.parse(advertisement.service_data[GOPRO_SERVICE_DATA_UUID])
+    parse_all = time.perf_counter() - start
+
+    discovery = DiscoveryService(None)  # type: ignore
+    logging.getLogger("open_gopro.ble_discovery").disabled = True
+    try:
+        start = time.perf_counter()
+        for advertisement in advertisements:
+            discovery._handle_advertisement(advertisement.address, advertisement)
+        incremental = time.perf_counter() - start
+    finally:
+        logging.getLogger("open_gopro.ble_discovery").disabled = False
+
+    stats = discovery.stats
+    print(f"\n{ADVERTISEMENTS} advertisements from {CAMERAS} cameras:")
+    print(f"  construct parse of each: {parse_all / ADVERTISEMENTS * 1e6:.2f} us / advertisement")
+    print(f"  discovery service: {incremental / ADVERTISEMENTS * 1e6:.2f} us / advertisement ({stats})")
+    print(f"  speedup: {parse_all / incremental:.1f}x")
+    assert stats.cameras == CAMERAS
+    assert stats.duplicates > stats.decoded
+    assert incremental < parse_all
@@ -0,0 +1,94 @@
+# test_ble_fragment_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Compare fragmenting BLE payloads with construct against integer header packing and memoization
+
+Run with: pytest tests/benchmarks/test_ble_fragment_benchmark.py -s
+"""
+
+import time
+from typing import Callable, Iterable, Iterator
+
+from construct import Bit, BitsInteger, BitStruct, Const, Construct, Padding
+
+from open_gopro.ble_fragment import _fragment, fragment
+from open_gopro.models import GoProBlePacketHeader
+
+PAYLOADS = {
+    # Keep alive
+    "small (3 bytes)": bytes([0x5B, 0x01, 0x42]),
+    "13-bit (200 bytes)": bytes(range(200)),
+    "16-bit (10,000 bytes)": bytes(10_000),
+}
+ITERATIONS = {"small (3 bytes)": 100_000, "13-bit (200 bytes)": 20_000, "16-bit (10,000 bytes)": 1_000}
+
+
+def construct_fragment(data: bytes) -> Iterator[bytes]:
+    """Previous behavior: build the header definitions with construct and re-slice the data for each packet"""
+    MAX_BLE_PKT_LEN = 20
+
+    extended_13_header = BitStruct(
+        "continuation" / Const(0, Bit),
+        "header" / Const(GoProBlePacketHeader.EXT_13.value, BitsInteger(2)),
+        "length" / BitsInteger(13),
+    )
+
+    extended_16_header = BitStruct(
+        "continuation" / Const(0, Bit),
+        "header" / Const(GoProBlePacketHeader.EXT_16.value, BitsInteger(2)),
+        "padding" / Padding(5),
+        "length" / BitsInteger(16),
+    )
+
+    continuation_header = BitStruct(
+        "continuation" / Const(1, Bit),
+        "padding" / Padding(7),
+    )
+
+    header: Construct
+    if (data_len := len(data)) < (2**13 - 1):
+        header = extended_13_header
+    elif data_len < (2**16 - 1):
+        header = extended_16_header
+    else:
+        raise ValueError(f"Data length {data_len} is too long")
+
+    while data:
+        if header == continuation_header:
+            packet = bytearray(header.build({}))
+        else:
+            packet = bytearray(header.build({"length": data_len}))
+            header = continuation_header
+
+        bytes_remaining = MAX_BLE_PKT_LEN - len(packet)
+        current, data = (data[:bytes_remaining], data[bytes_remaining:])
+        packet.extend(current)
+        yield bytes(packet)
+
+
+def time_fragment(fragmenter: Callable[[bytes], Iterable[bytes]], payload: bytes, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for _ in fragmenter(payload):
+            pass
+    return (time.perf_counter() - start) / iterations
+
+
+def test_ble_fragment():
+    print()
+    for name, payload in PAYLOADS.items():
+        iterations = ITERATIONS[name]
+        assert list(construct_fragment(payload)) == list(fragment(payload))
+        legacy = time_fragment(construct_fragment, payload, max(iterations // 20, 10))
+        packed = time_fragment(_fragment, payload, iterations)
+        memoized = time_fragment(fragment, payload, iterations)
+        print(
+            f"{name:>22}: construct {legacy * 1e6:9.1f} µs, packed {packed * 1e6:7.2f} µs ({legacy / packed:5.1f}x), "
+            f"memoized {memoized * 1e6:7.2f} µs ({legacy / memoized:6.1f}x)"
+        )
+        assert packed < legacy
+        assert memoized < legacy
+
+    # A constant payload is only fragmented once
+    keep_alive = PAYLOADS["small (3 bytes)"]
+    assert fragment(keep_alive) is fragment(bytearray(keep_alive))
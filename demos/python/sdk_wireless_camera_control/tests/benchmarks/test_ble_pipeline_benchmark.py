@@ -0,0 +1,69 @@
+# test_ble_pipeline_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Compare pipelined BLE requests against sending one request at a time
+
+Run with: pytest tests/benchmarks/test_ble_pipeline_benchmark.py -s
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+import pytest
+
+from open_gopro.constants import GoProUUID
+from open_gopro.gopro_base import GoProBase
+from open_gopro.gopro_wireless import WirelessGoPro
+from tests.mocks import MockPipelineGoPro
+
+# One BLE connection interval per write
+WRITE_LATENCY = 0.0075
+# Camera processing time per request
+PROCESSING_LATENCY = 0.03
+ROUNDS = 10
+
+
+def mixed_batch(gopro: WirelessGoPro) -> list[Callable[[], Awaitable[Any]]]:
+    """A command, setting, status query and protobuf request, repeated for each round"""
+    return [
+        request
+        for _ in range(ROUNDS)
+        for request in (
+            gopro.ble_command.set_third_party_client_info,
+            lambda: gopro.ble_setting.led.set(66),  # type: ignore
+            gopro.ble_status.encoding.get_value,
+            gopro.ble_command.scan_wifi_networks,
+        )
+    ]
+
+
+@pytest.mark.timeout(120)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("depth", [1, 4])
+async def test_pipelined_throughput(depth: int):
+    GoProBase.HTTP_GET_RETRIES = 1  # type: ignore
+    gopro = MockPipelineGoPro(WRITE_LATENCY, PROCESSING_LATENCY, maintain_state=True, ble_pipeline_depth=depth)
+    await gopro.open()
+    batch = mixed_batch(gopro)
+
+    # Sending one at a time is equivalent to the previous single outstanding response queue
+    start = time.perf_counter()
+    for request in batch:
+        assert (await request()).ok
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[request() for request in batch])
+    pipelined = time.perf_counter() - start
+    gopro.close()
+
+    assert all(result.ok for result in results)
+    print(
+        f"\n{len(batch)} mixed requests, depth {depth} | sequential {sequential:.2f} s "
+        f"({len(batch) / sequential:.0f} req/s), pipelined {pipelined:.2f} s ({len(batch) / pipelined:.0f} req/s, "
+        f"{sequential / pipelined:.1f}x)"
+    )
+    # The busiest characteristic bounds the pipelined time
+    assert pipelined < sequential / 2
+    assert gopro._ble_requests.depth(GoProUUID.CQ_COMMAND) == depth
@@ -0,0 +1,144 @@
+# test_ble_response_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Compare BLE response reassembly / TLV decoding against the previous copy-and-pop implementation
+
+Run with: pytest tests/benchmarks/test_ble_response_benchmark.py
+"""
+
+import time
+from collections import defaultdict
+from typing import Any, Callable
+
+import pytest
+
+from open_gopro.communicator_interface import GoProBle
+from open_gopro.constants import ErrorCode, GoProUUID, StatusId
+from open_gopro.models import GoProBlePacketHeader
+from open_gopro.parser_interface import GlobalParsers
+from open_gopro.parsers.response import (
+    CONT_MASK,
+    EXT_13_BYTE0_MASK,
+    GEN_LEN_MASK,
+    HDR_MASK,
+    BleRespBuilder,
+)
+from tests.unit.test_responses import test_complex_write_receive
+
+
+class LegacyBleRespBuilder(BleRespBuilder):
+    """The previous implementation, which copies each packet and re-slices the buffer for each parameter"""
+
+    def accumulate(self, data: bytes) -> None:
+        buf = bytearray(data)
+        if buf[0] & CONT_MASK:
+            buf.pop(0)
+        else:
+            self._packet = bytearray([])
+            hdr = GoProBlePacketHeader((buf[0] & HDR_MASK) >> 5)
+            if hdr is GoProBlePacketHeader.GENERAL:
+                self._bytes_remaining = buf[0] & GEN_LEN_MASK
+                buf = buf[1:]
+            elif hdr is GoProBlePacketHeader.EXT_13:
+                self._bytes_remaining = ((buf[0] & EXT_13_BYTE0_MASK) << 8) + buf[1]
+                buf = buf[2:]
+            elif hdr is GoProBlePacketHeader.EXT_16:
+                self._bytes_remaining = (buf[1] << 8) + buf[2]
+                buf = buf[3:]
+        self._packet.extend(buf)
+        self._bytes_remaining -= len(buf)
+        if self._bytes_remaining == 0:
+            self._state = BleRespBuilder._State.ACCUMULATED
+
+    def build(self) -> Any:  # Status responses only
+        buf = self._packet
+        buf.pop(0)
+        camera_state: Any = defaultdict(list)
+        self._status = ErrorCode(buf[0])
+        buf = buf[1:]
+        while len(buf) != 0:
+            param_len = buf[1]
+            try:
+                param_id = StatusId(buf[0])
+            except ValueError:
+                buf = buf[2 + param_len :]
+                continue
+            buf = buf[2:]
+            if param_len == 0:
+                camera_state[param_id] = []
+                continue
+            param_val = buf[:param_len]
+            buf = buf[param_len:]
+            try:
+                if not (parser := GlobalParsers.get_parser(param_id)):
+                    camera_state[param_id] = param_val.hex(":")
+                    continue
+                camera_state[param_id] = parser.parse(param_val)
+            except ValueError:
+                camera_state[param_id] = param_val
+        return camera_state
+
+
+def reassemble(payload: bytes) -> bytes:
+    builder = BleRespBuilder()
+    builder.set_uuid(GoProUUID.CQ_QUERY_RESP)
+    for idx in range(0, len(payload), 20):
+        builder.accumulate(payload[idx : idx + 20])
+    return bytes(builder._packet)
+
+
+def time_stream(factory: Callable[[], BleRespBuilder], packets: list[bytes], iterations: int) -> tuple[float, Any]:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        builder = factory()
+        builder.set_uuid(GoProUUID.CQ_QUERY_RESP)
+        for packet in packets:
+            builder.accumulate(packet)
+        result = builder.build()
+    return time.perf_counter() - start, result
+
+
+# Recorded "get all statuses" response, optionally repeated to emulate much larger pushes
+RECORDED_PAYLOAD = reassemble(test_complex_write_receive)
+
+
+@pytest.mark.timeout(300)
+@pytest.mark.parametrize("repeat", [1, 8, 60])
+def test_ble_status_response(repeat: int):
+    payload = RECORDED_PAYLOAD[:2] + RECORDED_PAYLOAD[2:] * repeat
+    packets = list(GoProBle._fragment(payload))
+    iterations = max(20, 2000 // repeat)
+
+    legacy_time, legacy = time_stream(LegacyBleRespBuilder, packets, iterations)
+    new_time, new = time_stream(BleRespBuilder, packets, iterations)
+
+    print(
+        f"\n{len(payload)} byte response in {len(packets)} packets | legacy {legacy_time / iterations * 1e6:.0f} us, "
+        f"new {new_time / iterations * 1e6:.0f} us ({legacy_time / new_time:.1f}x)"
+    )
+    assert new.data == legacy
+    assert new_time < legacy_time * 1.2
+
+
+@pytest.mark.timeout(300)
+def test_ble_reassembly():
+    payload = RECORDED_PAYLOAD[:2] + RECORDED_PAYLOAD[2:] * 60
+    packets = list(GoProBle._fragment(payload))
+    iterations = 200
+
+    timings: dict[str, float] = {}
+    for factory in (LegacyBleRespBuilder, BleRespBuilder):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            builder = factory()
+            for packet in packets:
+                builder.accumulate(packet)
+            assert builder.is_finished_accumulating
+        timings[factory.__name__] = time.perf_counter() - start
+        assert builder._packet == payload
+
+    legacy_time, new_time = timings["LegacyBleRespBuilder"], timings["BleRespBuilder"]
+    print(
+        f"\nReassemble {len(packets)} packets | legacy {legacy_time / iterations * 1e6:.0f} us, "
+        f"new {new_time / iterations * 1e6:.0f} us ({legacy_time / new_time:.1f}x)"
+    )
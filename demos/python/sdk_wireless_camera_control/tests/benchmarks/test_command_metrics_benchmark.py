@@ -0,0 +1,84 @@
+# test_command_metrics_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Measure the overhead of per-command metrics when disabled and enabled
+
+Run with: pytest tests/benchmarks/test_command_metrics_benchmark.py -s
+"""
+
+import contextlib
+import logging
+import re
+import time
+from typing import Iterator
+
+import pytest
+
+from open_gopro import WirelessGoPro
+from open_gopro.command_metrics import CommandMetrics, to_openmetrics
+from tests.mocks import MockCameraBleController, MockWifiController
+
+COMMANDS = 2_000
+CALLS = 1_000_000
+# Instrumentation calls while sending a BLE setting (when disabled)
+CALLS_PER_COMMAND = 10
+
+
+@contextlib.contextmanager
+def quiet_logging() -> Iterator[None]:
+    """Replace the root handlers (i.e. pytest's log capture) so that each message is not formatted"""
+    root = logging.getLogger()
+    handlers = root.handlers
+    root.handlers = [logging.NullHandler()]
+    try:
+        yield
+    finally:
+        root.handlers = handlers
+
+
+async def time_commands(enabled: bool) -> tuple[float, WirelessGoPro]:
+    gopro = WirelessGoPro(
+        target=re.compile("GoPro 1234"),
+        ble_adapter=MockCameraBleController,
+        wifi_adapter=MockWifiController,
+        enable_wifi=False,
+        command_metrics=enabled,
+    )
+    await gopro.open(timeout=1, retries=2)
+    gopro.command_metrics.reset()
+    start = time.perf_counter()
+    for _ in range(COMMANDS):
+        await gopro.ble_setting.led.set(2)  # type: ignore
+    elapsed = (time.perf_counter() - start) / COMMANDS
+    await gopro.close()
+    return elapsed, gopro
+
+
+def time_disabled_record() -> float:
+    metrics = CommandMetrics()
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        metrics.record("command", "phase", 0.0)
+    return (time.perf_counter() - start) / CALLS
+
+
+@pytest.mark.asyncio
+async def test_command_metrics_overhead():
+    with quiet_logging():
+        disabled, _ = await time_commands(False)
+        enabled, gopro = await time_commands(True)
+    record = time_disabled_record()
+    snapshot = gopro.command_metrics.snapshot()
+    export_start = time.perf_counter()
+    exposition = to_openmetrics({"1234": snapshot})
+    export = time.perf_counter() - export_start
+
+    print(f"\nper command: disabled {disabled * 1e6:.0f} µs, enabled {enabled * 1e6:.0f} µs")
+    print(f"disabled record call: {record * 1e9:.0f} ns ({CALLS_PER_COMMAND * record / disabled:.3%} of a command)")
+    for phase in ("wait", "slot", "transmit", "response", "parse", "total"):
+        histogram = snapshot.commands[("SettingId.LED", phase)]
+        print(f"{phase:>9}: p50 {histogram.percentile(50) * 1e6:6.0f} µs, p99 {histogram.percentile(99) * 1e6:6.0f} µs")
+    print(f"OpenMetrics export: {len(exposition.splitlines())} lines in {export * 1e3:.2f} ms")
+    assert snapshot.commands[("SettingId.LED", "total")].count == COMMANDS
+    # Disabled instrumentation is a negligible part of sending a command
+    assert CALLS_PER_COMMAND * record < disabled * 0.01
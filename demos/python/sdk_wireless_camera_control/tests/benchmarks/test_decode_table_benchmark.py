@@ -0,0 +1,79 @@
+# test_decode_table_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Compare decoding a camera state dump with the compiled decode table against per-parameter global parsers
+
+Run with: pytest tests/benchmarks/test_decode_table_benchmark.py
+"""
+
+import time
+from typing import Any
+
+from open_gopro.api.ble_statuses import BleStatuses
+from open_gopro.constants import StatusId
+from open_gopro.parser_interface import GlobalParsers
+from tests.benchmarks.test_ble_response_benchmark import RECORDED_PAYLOAD
+from tests.mocks import MockBleCommunicator
+
+
+def tlv_parameters(payload: bytes) -> list[tuple[int, bytes]]:
+    parameters: list[tuple[int, bytes]] = []
+    offset = 2  # Skip the query ID and status
+    while offset < len(payload):
+        param_len = payload[offset + 1]
+        parameters.append((payload[offset], payload[offset + 2 : offset + 2 + param_len]))
+        offset += 2 + param_len
+    return parameters
+
+
+def decode_with_parsers(parameters: list[tuple[int, bytes]]) -> dict[Any, Any]:
+    state: dict[Any, Any] = {}
+    for raw_id, value in parameters:
+        try:
+            param_id = StatusId(raw_id)
+        except ValueError:
+            continue
+        if parser := GlobalParsers.get_parser(param_id):
+            try:
+                state[param_id] = parser.parse(value)
+            except ValueError:
+                state[param_id] = value
+    return state
+
+
+def decode_with_table(parameters: list[tuple[int, bytes]]) -> dict[Any, Any]:
+    state: dict[Any, Any] = {}
+    table = GlobalParsers.get_decode_table(StatusId)
+    for raw_id, value in parameters:
+        if not (entry := table[raw_id]):
+            continue
+        param_id, decode = entry
+        if decode:
+            try:
+                state[param_id] = decode(value)
+            except ValueError:
+                state[param_id] = value
+    return state
+
+
+def test_decode_camera_state_dump():
+    BleStatuses(MockBleCommunicator("2.0"))
+    parameters = tlv_parameters(RECORDED_PAYLOAD)
+    iterations = 2000
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        expected = decode_with_parsers(parameters)
+    parser_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        decoded = decode_with_table(parameters)
+    table_time = time.perf_counter() - start
+
+    print(
+        f"\nDecode {len(parameters)} statuses | global parsers {parser_time / iterations * 1e6:.0f} us, "
+        f"decode table {table_time / iterations * 1e6:.0f} us ({parser_time / table_time:.1f}x)"
+    )
+    assert decoded == expected
+    assert table_time < parser_time
@@ -0,0 +1,73 @@
+# test_frame_source_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Measure handing decoded 1080p frames to the application through the shared memory frame ring
+
+Compared to pickling each frame (as a multiprocessing.Queue does). Also measures the end to end latency of decoding
+a synthetic video in a separate process.
+
+Run with: pytest tests/benchmarks/test_frame_source_benchmark.py -s
+"""
+
+import pickle
+import time
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+from open_gopro.frame_source import FrameRing, FrameSource
+
+HANDOFFS = 300
+VIDEO_FRAMES = 300
+
+
+def test_frame_handoff():
+    image = np.random.default_rng(0).integers(0, 255, (1080, 1920, 3), np.uint8)
+
+    start = time.perf_counter()
+    for _ in range(HANDOFFS):
+        pickle.loads(pickle.dumps(image, protocol=pickle.HIGHEST_PROTOCOL))
+    pickled = (time.perf_counter() - start) / HANDOFFS
+
+    ring = FrameRing(slots=4, max_resolution=(1920, 1080))
+    try:
+        start = time.perf_counter()
+        for _ in range(HANDOFFS):
+            sequence = ring.write(image, time.monotonic(), 0)
+            ring.read(sequence)
+        shared = (time.perf_counter() - start) / HANDOFFS
+    finally:
+        ring.close()
+
+    print(f"\n1080p frame hand off: pickled={pickled * 1e3:.2f} ms, shared memory ring={shared * 1e3:.2f} ms")
+    assert shared < pickled * 1.5
+
+
+def test_decode_latency(tmp_path: Path):
+    path = tmp_path / "synthetic.avi"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter.fourcc(*"MJPG"), 30, (1280, 720))
+    for index in range(VIDEO_FRAMES):
+        image = np.zeros((720, 1280, 3), np.uint8)
+        cv2.putText(image, str(index), (100, 400), cv2.FONT_HERSHEY_SIMPLEX, 8, (255, 255, 255), 10)
+        writer.write(image)
+    writer.release()
+
+    print()
+    for use_process in (True, False):
+        start = time.perf_counter()
+        with FrameSource(str(path), use_process=use_process) as source:
+            while source.read(timeout=5):
+                pass
+            stats = source.stats
+        elapsed = time.perf_counter() - start
+        latency = stats.latency
+        print(
+            f"{'process' if use_process else 'thread'}: {stats.decoded / elapsed:.0f} fps decoded, "
+            f"{stats.delivered} delivered, {stats.dropped} dropped, "
+            f"latency p50={latency.percentile(50) * 1e3:.2f} ms p99={latency.percentile(99) * 1e3:.2f} ms"
+        )
+        assert stats.decoded == VIDEO_FRAMES
+        assert stats.delivered + stats.dropped == VIDEO_FRAMES
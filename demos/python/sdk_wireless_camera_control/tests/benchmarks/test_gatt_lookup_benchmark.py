@@ -0,0 +1,100 @@
+# test_gatt_lookup_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Compare the notification path GATT lookups (handle --> BleUUID and BleUUID --> handle) against searching the table
+
+Run with: pytest tests/benchmarks/test_gatt_lookup_benchmark.py -s
+"""
+
+import json
+import time
+
+from open_gopro.ble import (
+    BleUUID,
+    Characteristic,
+    CharProps,
+    Descriptor,
+    GattDB,
+    Service,
+    UUIDs,
+)
+from open_gopro.constants import GoProUUID
+
+ITERATIONS = 100_000
+
+
+def build_camera_gatt_db() -> GattDB:
+    """Build a table with the camera's services where each service's characteristics follow it in the UUID class"""
+    services: list[Service] = []
+    handle = 1
+    for name, ble_uuid in [*vars(UUIDs).items(), *vars(GoProUUID).items()]:
+        if not isinstance(ble_uuid, BleUUID) or (not services and not name.startswith("S_")):
+            continue
+        if name.startswith("S_"):
+            services.append(Service(ble_uuid, handle))
+            handle += 1
+            continue
+        # Declaration, value, and CCCD
+        services[-1].characteristics = [  # type: ignore
+            Characteristic(
+                handle + 1,
+                ble_uuid,
+                CharProps.NOTIFY | CharProps.WRITE_YES_RSP,
+                init_descriptors=[Descriptor(handle + 2, UUIDs.CLIENT_CHAR_CONFIG, bytes([1, 0]))],
+            )
+        ]
+        handle += 3
+    return GattDB(services)
+
+
+def search_handle2uuid(db: GattDB, handle: int) -> BleUUID:
+    """Previous behavior: search each characteristic of each service"""
+    for service in db.services.values():
+        for char in service.characteristics.values():
+            if char.handle == handle:
+                return char.uuid
+    raise KeyError(handle)
+
+
+def search_uuid2handle(db: GattDB, ble_uuid: BleUUID) -> int:
+    """Previous behavior: search each characteristic of each service"""
+    for service in db.services.values():
+        for char in service.characteristics.values():
+            if char.uuid == ble_uuid:
+                return char.handle
+    raise KeyError(ble_uuid)
+
+
+def time_lookups(lookup, keys: list) -> float:
+    start = time.perf_counter()
+    for i in range(ITERATIONS):
+        lookup(keys[i % len(keys)])
+    return (time.perf_counter() - start) / ITERATIONS
+
+
+def test_gatt_lookup():
+    db = build_camera_gatt_db()
+    # Notifications are received on the response characteristics
+    responses = [GoProUUID.CQ_COMMAND_RESP, GoProUUID.CQ_SETTINGS_RESP, GoProUUID.CQ_QUERY_RESP]
+    handles = [db.uuid2handle(ble_uuid) for ble_uuid in responses]
+    assert [search_handle2uuid(db, handle) for handle in handles] == responses
+
+    timings = {
+        "handle2uuid": (
+            time_lookups(lambda handle: search_handle2uuid(db, handle), handles),
+            time_lookups(db.handle2uuid, handles),
+        ),
+        "uuid2handle": (
+            time_lookups(lambda ble_uuid: search_uuid2handle(db, ble_uuid), responses),
+            time_lookups(db.uuid2handle, responses),
+        ),
+    }
+
+    compact = json.dumps(db.as_dict())
+
+    print(f"\n{len(db.characteristics)} characteristics in {len(db.services)} services")
+    for name, (searched, indexed) in timings.items():
+        print(f"{name}: search {searched * 1e9:.0f} ns, index {indexed * 1e9:.0f} ns ({searched / indexed:.1f}x)")
+    print(f"serialized table: {len(compact)} bytes")
+    for searched, indexed in timings.values():
+        assert indexed < searched
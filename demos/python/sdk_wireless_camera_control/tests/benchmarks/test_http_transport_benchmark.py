@@ -0,0 +1,87 @@
+# test_http_transport_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Compare the pooled asynchronous HTTP transport against blocking per-request requests calls
+
+Run with: pytest tests/benchmarks/test_http_transport_benchmark.py
+"""
+
+import asyncio
+import time
+
+import pytest
+import requests
+
+from open_gopro.http_transport import RequestsHttpTransport
+from tests.mocks import MockHttpServer
+
+SEQUENTIAL_REQUESTS = 200
+CONCURRENT_REQUESTS = 20
+SERVER_DELAY = 0.05
+
+
+async def measure_loop_lag(stop: asyncio.Event) -> float:
+    """Return the worst-case delay of a 1 ms sleep while requests are in flight"""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        worst = max(worst, time.perf_counter() - start)
+    return worst
+
+
+@pytest.mark.timeout(60)
+@pytest.mark.asyncio
+async def test_sequential_latency():
+    with MockHttpServer() as server:
+        url = server.base_url + "gopro/camera/state"
+        start = time.perf_counter()
+        for _ in range(SEQUENTIAL_REQUESTS):
+            requests.get(url, timeout=1)
+        blocking = (time.perf_counter() - start) / SEQUENTIAL_REQUESTS
+        blocking_connections = len(server.connections)
+        server.connections.clear()
+
+        transport = RequestsHttpTransport()
+        start = time.perf_counter()
+        for _ in range(SEQUENTIAL_REQUESTS):
+            await transport.get(url, timeout=1)
+        pooled = (time.perf_counter() - start) / SEQUENTIAL_REQUESTS
+        await transport.close()
+
+    print(f"\nblocking: {blocking * 1000:.3f} ms / request over {blocking_connections} connections")
+    print(f"pooled:   {pooled * 1000:.3f} ms / request over {len(server.connections)} connections")
+    assert len(server.connections) == 1
+
+
+@pytest.mark.timeout(60)
+@pytest.mark.asyncio
+async def test_concurrent_throughput():
+    with MockHttpServer(delay=SERVER_DELAY) as server:
+        url = server.base_url + "gopro/camera/state"
+
+        async def blocking_get() -> None:
+            requests.get(url, timeout=1)
+
+        stop = asyncio.Event()
+        lag = asyncio.create_task(measure_loop_lag(stop))
+        start = time.perf_counter()
+        await asyncio.gather(*[blocking_get() for _ in range(CONCURRENT_REQUESTS)])
+        blocking = time.perf_counter() - start
+        stop.set()
+        blocking_lag = await lag
+
+        transport = RequestsHttpTransport()
+        stop.clear()
+        lag = asyncio.create_task(measure_loop_lag(stop))
+        start = time.perf_counter()
+        await asyncio.gather(*[transport.get(url, timeout=1) for _ in range(CONCURRENT_REQUESTS)])
+        pooled = time.perf_counter() - start
+        stop.set()
+        pooled_lag = await lag
+        await transport.close()
+
+    print(f"\nblocking: {CONCURRENT_REQUESTS / blocking:.1f} requests / s, worst loop lag {blocking_lag * 1000:.1f} ms")
+    print(f"pooled:   {CONCURRENT_REQUESTS / pooled:.1f} requests / s, worst loop lag {pooled_lag * 1000:.1f} ms")
+    assert pooled < blocking
+    assert pooled_lag < SERVER_DELAY
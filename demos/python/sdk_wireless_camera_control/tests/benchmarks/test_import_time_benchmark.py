@@ -0,0 +1,41 @@
+# test_import_time_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Track the time to import the package and each camera class in a new interpreter against a budget
+
+Run with: pytest tests/benchmarks/test_import_time_benchmark.py -s
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parents[2]
+RUNS = 5
+
+# Import statement --> budget in seconds. The budgets are loose since they are measured on shared CI machines.
+BUDGETS = {
+    "import open_gopro": 0.25,
+    "from open_gopro import WiredGoPro": 1.5,
+    "from open_gopro import WirelessGoPro": 2.0,
+}
+
+
+def import_time(statement: str) -> float:
+    script = f"import time\nstart = time.perf_counter()\n{statement}\nprint(time.perf_counter() - start)"
+    output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True, capture_output=True, text=True)
+    return float(output.stdout.splitlines()[-1])
+
+
+@pytest.mark.timeout(120)
+def test_import_time():
+    # Best of several runs to reduce the noise from disk caching and other processes
+    timings = {statement: min(import_time(statement) for _ in range(RUNS)) for statement in BUDGETS}
+
+    print()
+    for statement, elapsed in timings.items():
+        print(f"{statement:>40}: {elapsed * 1000:6.0f} ms (budget {BUDGETS[statement] * 1000:.0f} ms)")
+    for statement, elapsed in timings.items():
+        assert elapsed < BUDGETS[statement], statement
@@ -0,0 +1,101 @@
+# test_keep_alive_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Compare a keep alive task per camera with one shared keep alive scheduler for a fleet
+
+Half of the cameras have continuous traffic (i.e. are being polled) and half are idle.
+
+Run with: pytest tests/benchmarks/test_keep_alive_benchmark.py -s
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from open_gopro.keep_alive import KeepAliveScheduler
+
+INTERVAL = 0.1
+TRAFFIC_PERIOD = 0.02
+DURATION = 1.0
+
+
+class FakeCamera:
+    """Only what the scheduler uses from a WirelessGoPro"""
+
+    def __init__(self, identifier: str) -> None:
+        self.identifier = identifier
+        self.is_ble_connected = True
+        self._last_exchange = time.monotonic()
+        self.keep_alives = 0
+
+    async def _send_keep_alive(self) -> bool:
+        self.keep_alives += 1
+        self._last_exchange = time.monotonic()
+        return True
+
+
+async def traffic(cameras: list[FakeCamera]) -> None:
+    while True:
+        for camera in cameras:
+            camera._last_exchange = time.monotonic()
+        await asyncio.sleep(TRAFFIC_PERIOD)
+
+
+async def per_camera_tasks(cameras: list[FakeCamera]) -> int:
+    """The behavior without a scheduler: each camera sends a keep alive every interval. Returns the wakeups."""
+    wakeups = 0
+
+    async def periodic(camera: FakeCamera) -> None:
+        nonlocal wakeups
+        while True:
+            await camera._send_keep_alive()
+            await asyncio.sleep(INTERVAL)
+            wakeups += 1
+
+    tasks = [asyncio.create_task(periodic(camera)) for camera in cameras]
+    await asyncio.sleep(DURATION)
+    for task in tasks:
+        task.cancel()
+    return wakeups
+
+
+async def shared_scheduler(cameras: list[FakeCamera]) -> int:
+    """Returns the wakeups"""
+    scheduler = KeepAliveScheduler(interval=INTERVAL, tick=INTERVAL / 10)
+    for camera in cameras:
+        scheduler.add(camera)  # type: ignore
+    await asyncio.sleep(DURATION)
+    stats = scheduler.stats
+    print(f"    sent={stats.sent} suppressed={stats.suppressed}")
+    for camera in cameras:
+        scheduler.remove(camera)  # type: ignore
+    return round(DURATION / scheduler._tick)
+
+
+async def run(cameras: int, approach) -> tuple[int, int, int, float]:
+    fleet = [FakeCamera(str(i)) for i in range(cameras)]
+    busy, idle = fleet[: cameras // 2], fleet[cameras // 2 :]
+    traffic_task = asyncio.create_task(traffic(busy))
+    start = time.process_time()
+    wakeups = await approach(fleet)
+    cpu = time.process_time() - start
+    traffic_task.cancel()
+    return sum(c.keep_alives for c in busy), sum(c.keep_alives for c in idle), wakeups, cpu
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cameras", [40, 1000])
+async def test_keep_alive_scheduler(cameras: int):
+    print(f"\n{cameras} cameras for {DURATION}s with a {INTERVAL}s interval:")
+    results = {}
+    for name, approach in (("per camera tasks", per_camera_tasks), ("shared scheduler", shared_scheduler)):
+        busy, idle, wakeups, cpu = results[name] = await run(cameras, approach)
+        print(f"  {name}: keep alives busy={busy} idle={idle}, timer wakeups={wakeups}, cpu={cpu * 1e3:.1f} ms")
+
+    legacy, shared = results["per camera tasks"], results["shared scheduler"]
+    # Busy cameras never need a keep alive
+    assert shared[0] == 0 < legacy[0]
+    # Idle cameras still get keep alives at least every interval
+    assert shared[1] >= cameras // 2 * (DURATION / INTERVAL - 2)
+    assert shared[2] < legacy[2]
@@ -0,0 +1,107 @@
+# test_logging_overhead_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Compare the CPU time per BLE command spent on logging at INFO and WARNING against eagerly built log messages
+
+Run with: pytest tests/benchmarks/test_logging_overhead_benchmark.py -s
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from copy import deepcopy
+from typing import Any, Iterator
+
+import pytest
+
+from open_gopro.ble import BleUUID
+from open_gopro.communicator_interface import BleMessage, MessageRules
+from open_gopro.constants import ActionId
+from open_gopro.gopro_base import GoProBase
+from open_gopro.logger import Logger
+from open_gopro.models import GoProResp
+from open_gopro.util import pretty_print
+from tests.mocks import MockPipelineGoPro
+
+COMMANDS = 500
+
+logger = logging.getLogger("open_gopro.gopro_wireless")
+
+
+class EagerLoggingGoPro(MockPipelineGoPro):
+    """The previous implementation, which builds each Tx / Rx message (deep copying the response) before logging"""
+
+    async def _send_ble_message(
+        self, message: BleMessage, rules: MessageRules = MessageRules(), **kwargs: Any
+    ) -> GoProResp:
+        async with self._ble_requests.slot(message._uuid):
+            response_future = self._ble_requests.expect(message._uuid, message._identifier)
+            logger.info(Logger.build_log_tx_str(pretty_print(message._as_dict(**kwargs))))
+            for packet in self._fragment(message._build_data(**kwargs)):
+                logger.debug(f"Writing to [{message._uuid.name}] UUID: {packet.hex(':')}")
+                await self._ble.write(message._uuid, packet)
+            return await self._wait_for_ble_response(response_future)
+
+    def _dispatch_response(self, response: GoProResp, uuid: BleUUID) -> list:
+        original_response = deepcopy(response)
+        if response._is_query and not response._is_push and len(response.data) == 1:
+            response.data = list(response.data.values())[0]
+        if self._ble_requests.resolve(uuid, response):
+            logger.info(Logger.build_log_rx_str(original_response, asynchronous=False))
+        else:
+            logger.info(Logger.build_log_rx_str(original_response, asynchronous=True))
+        if response._is_push:
+            return list(response.data.items())
+        if isinstance(response.identifier, ActionId):
+            return [(response.identifier, response.data)]
+        return []
+
+
+class FormattingHandler(logging.Handler):
+    """Format each emitted record (as a file or stream handler would) and discard it"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.format(record)
+
+
+@contextmanager
+def only_handler(level: int) -> Iterator[None]:
+    """Replace the root handlers (i.e. pytest's log capture) with a formatting handler at the given level"""
+    root = logging.getLogger()
+    handlers = root.handlers
+    root.handlers = [FormattingHandler(level)]
+    try:
+        yield
+    finally:
+        root.handlers = handlers
+
+
+async def cpu_per_command(gopro: MockPipelineGoPro, level: int) -> float:
+    with only_handler(level):
+        start = time.process_time()
+        for _ in range(COMMANDS):
+            assert (await gopro.ble_status.encoding.get_value()).ok
+        return (time.process_time() - start) / COMMANDS
+
+
+@pytest.mark.timeout(300)
+@pytest.mark.asyncio
+async def test_logging_overhead():
+    GoProBase.HTTP_GET_RETRIES = 1  # type: ignore
+    timings: dict[str, dict[str, float]] = {}
+    for name, factory in (("eager", EagerLoggingGoPro), ("deferred", MockPipelineGoPro)):
+        gopro = factory(write_latency=0, processing_latency=0)
+        await gopro.open()
+        timings[name] = {
+            logging.getLevelName(level): await cpu_per_command(gopro, level)
+            for level in (logging.INFO, logging.WARNING)
+        }
+        gopro.close()
+
+    print()
+    for name, levels in timings.items():
+        print(f"{name:>8}: " + ", ".join(f"{level} {cpu * 1e6:.0f} us" for level, cpu in levels.items()))
+    eager, deferred = timings["eager"]["WARNING"], timings["deferred"]["WARNING"]
+    print(f"per-command CPU at WARNING: {eager / deferred:.1f}x less")
+    assert deferred < eager
+    assert timings["deferred"]["WARNING"] < timings["deferred"]["INFO"]
@@ -0,0 +1,57 @@
+# test_media_list_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Compare building / querying the compact media list against the pydantic media list
+
+Run with: pytest tests/benchmarks/test_media_list_benchmark.py
+"""
+
+import time
+
+import pytest
+
+from open_gopro.models import CompactMediaList, MediaList
+from open_gopro.types import JsonDict
+
+
+def build_media_list_json(count: int) -> JsonDict:
+    files: list[JsonDict] = []
+    for i in range(count):
+        if i % 50 == 0:
+            files.append(
+                {"n": f"G{i:07}.JPG", "g": str(i), "b": "1", "l": "30", "cre": "1657016833", "mod": "1657016833"}
+                | {"s": "170696972", "t": "b", "m": []}
+            )
+        else:
+            files.append({"n": f"GX{i:06}.MP4", "cre": "1657013171", "mod": "1657013171", "s": "41702381"})
+    return {"id": "1", "media": [{"d": f"{100 + i}GOPRO", "fs": files[i : i + 9999]} for i in range(0, count, 9999)]}
+
+
+@pytest.mark.timeout(300)
+@pytest.mark.parametrize("count", [1_000, 10_000, 100_000])
+def test_media_list_build(count: int):
+    data = build_media_list_json(count)
+
+    start = time.perf_counter()
+    media_list = MediaList(**data)
+    pydantic_build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compact = CompactMediaList.from_json(data)
+    compact_build = time.perf_counter() - start
+
+    paths = [f"100GOPRO/GX{i:06}.MP4" for i in range(1, min(count, 9999), 7) if i % 50]
+    start = time.perf_counter()
+    assert all(path in media_list for path in paths)
+    pydantic_lookup = time.perf_counter() - start
+    start = time.perf_counter()
+    assert all(path in compact for path in paths)
+    compact_lookup = time.perf_counter() - start
+
+    print(
+        f"\n{count} items | build: pydantic {pydantic_build * 1000:.1f} ms, compact {compact_build * 1000:.1f} ms "
+        f"({pydantic_build / compact_build:.1f}x) | {len(paths)} lookups: pydantic {pydantic_lookup * 1000:.2f} ms, "
+        f"compact {compact_lookup * 1000:.2f} ms"
+    )
+    assert len(compact) == len(media_list.files) == count
+    assert compact_build < pydantic_build
@@ -0,0 +1,119 @@
+# test_notification_ingest_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Flood a camera with status pushes from the BLE thread and compare batched ingestion against a task per packet
+
+Run with: pytest tests/benchmarks/test_notification_ingest_benchmark.py -s
+"""
+
+import asyncio
+import logging
+import threading
+import time
+
+import pytest
+
+from open_gopro.communicator_interface import GoProBle
+from open_gopro.constants import GoProUUID, QueryCmdId, StatusId
+from open_gopro.parsers.response import BleRespBuilder
+from tests.benchmarks.test_ble_response_benchmark import RECORDED_PAYLOAD
+from tests.mocks import MockPipelineGoPro
+
+PUSHES = 500
+
+logger = logging.getLogger("open_gopro.gopro_wireless")
+
+
+class LegacyIngestGoPro(MockPipelineGoPro):
+    """The previous implementation, which schedules a coroutine in the event loop for each packet"""
+
+    def _notification_handler(self, handle: int, data: bytearray) -> None:
+        async def _async_notification_handler() -> None:
+            if (uuid := self._ble.gatt_db.handle2uuid(handle)) == GoProUUID.BATT_LEVEL:
+                return
+            logger.debug(f'Received response on BleUUID [{uuid}]: {data.hex(":")}')
+            if uuid not in self._active_builders:
+                builder = BleRespBuilder()
+                builder.set_uuid(uuid)
+                self._active_builders[uuid] = builder
+            self._active_builders[uuid].accumulate(data)
+            if (builder := self._active_builders[uuid]).is_finished_accumulating:
+                logger.trace(f"Finished accumulating on {uuid}")  # type: ignore
+                del self._active_builders[uuid]
+                await self._route_response(builder.build(), uuid)
+
+        asyncio.run_coroutine_threadsafe(_async_notification_handler(), self._loop)
+
+
+async def flood(gopro: MockPipelineGoPro, packets: list[bytes]) -> tuple[float, float]:
+    """Notify each packet of PUSHES responses from another thread
+
+    Returns:
+        tuple[float, float]: time spent in the notification callback and time until every response was parsed
+    """
+    gopro._loop = asyncio.get_running_loop()
+    gopro._ble._gatt_table.handle2uuid = gopro._mock_uuid
+    handle = MockPipelineGoPro._RESPONSE_HANDLES[GoProUUID.CQ_QUERY]
+    received = 0
+    done = asyncio.Event()
+
+    # Only the ingestion stage is measured: routing (i.e. logging) each parsed response is the same for both
+    def count(response, _) -> list:
+        nonlocal received
+        assert StatusId.ENCODING in response.data
+        if (received := received + 1) == PUSHES:
+            done.set()
+        return []
+
+    gopro._dispatch_response = count  # type: ignore
+
+    callback_time = 0.0
+
+    def notify() -> None:
+        nonlocal callback_time
+        for _ in range(PUSHES):
+            for packet in packets:
+                start = time.perf_counter()
+                gopro._notification_handler(handle, bytearray(packet))
+                callback_time += time.perf_counter() - start
+
+    start = time.perf_counter()
+    thread = threading.Thread(target=notify)
+    thread.start()
+    await asyncio.wait_for(done.wait(), 120)
+    elapsed = time.perf_counter() - start
+    thread.join()
+    await gopro._notifications.stop()
+    return callback_time, elapsed
+
+
+# Encoding / busy changes (one packet) and the recorded "get all statuses" response pushed as a status update
+SMALL_PUSH = bytes(
+    [QueryCmdId.STATUS_VAL_PUSH.value, 0x00, StatusId.ENCODING.value, 0x01, 0x01, StatusId.BUSY.value, 0x01, 0x00]
+)
+FULL_PUSH = bytes([QueryCmdId.STATUS_VAL_PUSH.value]) + RECORDED_PAYLOAD[1:]
+
+
+@pytest.mark.timeout(300)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("payload", [SMALL_PUSH, FULL_PUSH], ids=["small", "full"])
+async def test_notification_flood(payload: bytes):
+    packets = list(GoProBle._fragment(payload))
+
+    legacy_callback, legacy_time = await flood(LegacyIngestGoPro(write_latency=0, processing_latency=0), packets)
+    gopro = MockPipelineGoPro(write_latency=0, processing_latency=0)
+    new_callback, new_time = await flood(gopro, packets)
+    stats = gopro.notification_stats
+
+    count = PUSHES * len(packets)
+    print(
+        f"\n{PUSHES} pushes of {len(packets)} packets | callback: legacy {legacy_callback / count * 1e6:.1f} us, "
+        f"batched {new_callback / count * 1e6:.1f} us ({legacy_callback / new_callback:.1f}x) | total: legacy "
+        f"{legacy_time * 1000:.0f} ms, batched {new_time * 1000:.0f} ms ({legacy_time / new_time:.1f}x)"
+    )
+    print(
+        f"{stats.batches} batches of {stats.mean_batch_size:.0f} packets, max depth {stats.max_depth}, "
+        f"drain latency mean {stats.mean_latency * 1000:.2f} ms / max {stats.max_latency * 1000:.2f} ms"
+    )
+    assert stats.packets == count
+    assert new_callback < legacy_callback
@@ -0,0 +1,51 @@
+# test_offload_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Compare the bulk media offloader against downloading one file at a time from each camera
+
+Run with: pytest tests/benchmarks/test_offload_benchmark.py
+"""
+
+import time
+from contextlib import ExitStack
+from pathlib import Path
+
+import pytest
+
+from open_gopro.offload import MediaOffloader
+from tests.mocks import MockHttpGoPro, MockHttpServer
+
+CAMERAS = 8
+FILES_PER_CAMERA = 10
+FILE_SIZE = 2 * 1024 * 1024
+# Emulate per-request camera latency
+SERVER_DELAY = 0.02
+
+
+@pytest.mark.timeout(120)
+@pytest.mark.asyncio
+async def test_offload_throughput(tmp_path: Path):
+    files = {f"100GOPRO/GX01{i:04}.MP4": bytes([i]) * FILE_SIZE for i in range(FILES_PER_CAMERA)}
+    with ExitStack() as stack:
+        gopros = [
+            MockHttpGoPro(
+                stack.enter_context(MockHttpServer(files=dict(files), delay=SERVER_DELAY)), f"C35013245{i:05}"
+            )
+            for i in range(CAMERAS)
+        ]
+
+        start = time.perf_counter()
+        for gopro in gopros:
+            for item in (await gopro.http_command.get_media_list()).data.files:
+                local_file = tmp_path / "sequential" / gopro.identifier / item.filename
+                local_file.parent.mkdir(parents=True, exist_ok=True)
+                await gopro.http_command.download_file(camera_file=item.filename, local_file=local_file)
+        sequential = time.perf_counter() - start
+
+        stats = await MediaOffloader(gopros, tmp_path / "offload", max_concurrency=16, per_camera_concurrency=4).run()
+
+    total = CAMERAS * FILES_PER_CAMERA * FILE_SIZE
+    print(f"\nsequential: {total / sequential / 1e6:.1f} MB/s")
+    print(f"offloader:  {stats.throughput / 1e6:.1f} MB/s ({stats.files} files in {stats.elapsed:.2f} s)")
+    assert stats.files == CAMERAS * FILES_PER_CAMERA
+    assert stats.elapsed < sequential
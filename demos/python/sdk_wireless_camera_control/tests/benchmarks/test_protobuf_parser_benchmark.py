@@ -0,0 +1,110 @@
+# test_protobuf_parser_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Compare the compiled protobuf parser against MessageToDict-based translation for every message in open_gopro.proto
+
+Run with: pytest tests/benchmarks/test_protobuf_parser_benchmark.py
+"""
+
+import time
+from typing import Any
+
+import pytest
+from google.protobuf import descriptor
+from google.protobuf.json_format import MessageToDict
+
+import open_gopro.proto
+from open_gopro.enum import enum_factory
+from open_gopro.parsers.bytes import (
+    ProtobufByteParser,
+    ProtobufDictProxy,
+    ProtobufPrinter,
+)
+from open_gopro.types import Protobuf
+
+original_field_to_json = ProtobufPrinter._FieldToJsonObject
+
+
+def legacy_parse(proto: type[Protobuf], data: bytes) -> Any:
+    """The previous implementation, which patches the printer and rebuilds enums for every message"""
+    response: Protobuf = proto().FromString(bytes(data))
+    ProtobufPrinter._FieldToJsonObject = lambda self, field, value: (
+        enum_factory(field.enum_type)(value)
+        if field.cpp_type == descriptor.FieldDescriptor.CPPTYPE_ENUM
+        else original_field_to_json(self, field, value)
+    )
+    try:
+        as_dict = MessageToDict(response, preserving_proto_field_name=True)
+    finally:
+        ProtobufPrinter._FieldToJsonObject = original_field_to_json
+    for key in response.DESCRIPTOR.fields_by_name:
+        if key not in as_dict:
+            as_dict[key] = None
+    return ProtobufDictProxy.from_proto(as_dict)
+
+
+def populate(message: Protobuf, depth: int = 0) -> Protobuf:
+    """Set every field of a message (repeated fields get 3 values) so that it exercises every conversion"""
+    for field in message.DESCRIPTOR.fields:
+        repeated = field.label == descriptor.FieldDescriptor.LABEL_REPEATED
+        if field.cpp_type == descriptor.FieldDescriptor.CPPTYPE_MESSAGE:
+            if depth < 3:
+                for _ in range(3 if repeated else 1):
+                    populate(
+                        getattr(message, field.name).add() if repeated else getattr(message, field.name), depth + 1
+                    )
+            continue
+        if field.cpp_type == descriptor.FieldDescriptor.CPPTYPE_ENUM:
+            value: Any = field.enum_type.values[-1].number
+        elif field.type == descriptor.FieldDescriptor.TYPE_BYTES:
+            value = b"\x00\x01\x02"
+        elif field.cpp_type == descriptor.FieldDescriptor.CPPTYPE_STRING:
+            value = "GoPro"
+        elif field.cpp_type == descriptor.FieldDescriptor.CPPTYPE_BOOL:
+            value = True
+        else:
+            value = 42
+        if repeated:
+            getattr(message, field.name).extend([value] * 3)
+        else:
+            setattr(message, field.name, value)
+    return message
+
+
+MESSAGES = sorted(
+    (
+        proto
+        for proto in vars(open_gopro.proto).values()
+        if isinstance(proto, type) and isinstance(getattr(proto, "DESCRIPTOR", None), descriptor.Descriptor)
+    ),
+    key=lambda proto: proto.__name__,
+)
+
+
+@pytest.mark.timeout(300)
+@pytest.mark.parametrize("proto", MESSAGES, ids=lambda proto: proto.__name__)
+def test_protobuf_parse(proto: type[Protobuf]):
+    data = populate(proto()).SerializeToString()
+    parser = ProtobufByteParser(proto)
+    raw_parser = ProtobufByteParser(proto, raw=True)
+    iterations = 500
+
+    timings: dict[str, float] = {}
+    for name, parse in (
+        ("legacy", lambda: legacy_parse(proto, data)),
+        ("compiled", lambda: parser.parse(data)),
+        ("raw", lambda: raw_parser.parse(data)),
+    ):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            parse()
+        timings[name] = time.perf_counter() - start
+
+    print(
+        f"\n{proto.__name__} ({len(data)} bytes) | legacy {timings['legacy'] / iterations * 1e6:.0f} us, "
+        f"compiled {timings['compiled'] / iterations * 1e6:.1f} us ({timings['legacy'] / timings['compiled']:.0f}x), "
+        f"raw {timings['raw'] / iterations * 1e6:.1f} us"
+    )
+    assert parser.parse(data) == legacy_parse(proto, data)
+    assert raw_parser.parse(data) == proto.FromString(data)
+    assert timings["compiled"] < timings["legacy"]
@@ -0,0 +1,51 @@
+# test_state_mirror_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Compare status / setting read latency over BLE against reads answered by the camera state mirror
+
+Run with: pytest tests/benchmarks/test_state_mirror_benchmark.py -s
+"""
+
+import time
+
+import pytest
+
+from open_gopro.gopro_base import GoProBase
+from open_gopro.state_mirror import CameraStateMirror
+from tests.mocks import MockPipelineGoPro
+
+# One BLE connection interval per write
+WRITE_LATENCY = 0.0075
+# Camera processing time per request
+PROCESSING_LATENCY = 0.03
+READS = 20
+
+
+async def time_reads(gopro: MockPipelineGoPro) -> float:
+    start = time.perf_counter()
+    for _ in range(READS):
+        assert (await gopro.ble_status.encoding.get_value()).ok
+        assert (await gopro.ble_setting.led.get_value()).ok
+    return (time.perf_counter() - start) / (READS * 2)
+
+
+@pytest.mark.timeout(120)
+@pytest.mark.asyncio
+async def test_mirrored_read_latency():
+    GoProBase.HTTP_GET_RETRIES = 1  # type: ignore
+    gopro = MockPipelineGoPro(WRITE_LATENCY, PROCESSING_LATENCY, maintain_state=True)
+    await gopro.open()
+    wire = await time_reads(gopro)
+
+    mirror = CameraStateMirror(gopro)
+    await mirror.attach()
+    mirrored = await time_reads(gopro)
+    gopro.close()
+
+    print(
+        f"\nBLE read {wire * 1000:.1f} ms, mirrored read {mirrored * 1000:.3f} ms "
+        f"({mirror.hits} hits, {mirror.misses} misses)"
+    )
+    # Only the first read of each value is sent to the camera
+    assert mirror.misses == 2
+    assert mirrored < wire / 10
@@ -0,0 +1,54 @@
+# test_warm_start_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Compare the per-phase latency of a cold open against an open that is warm-started from a connection profile
+
+Run with: pytest tests/benchmarks/test_warm_start_benchmark.py -s
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from open_gopro.gopro_base import GoProBase
+from tests.mocks import MockWarmStartGoPro
+
+LATENCIES = dict(
+    # One BLE connection interval per write
+    write_latency=0.0075,
+    # Camera processing time per request
+    processing_latency=0.03,
+    scan_latency=1.0,
+    connect_latency=0.5,
+    # Service discovery and reading every descriptor
+    discover_latency=0.6,
+    # Direct characteristic read
+    read_latency=0.05,
+)
+
+
+async def time_open(profiles: Path) -> tuple[float, dict[str, float]]:
+    gopro = MockWarmStartGoPro(maintain_state=True, connection_profiles=profiles, **LATENCIES)
+    start = time.perf_counter()
+    await gopro.open()
+    elapsed = time.perf_counter() - start
+    gopro.close()
+    return elapsed, gopro.open_phase_durations
+
+
+@pytest.mark.timeout(60)
+@pytest.mark.asyncio
+async def test_warm_start_latency(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(GoProBase, "HTTP_GET_RETRIES", 1)
+    cold, cold_phases = await time_open(tmp_path)
+    warm, warm_phases = await time_open(tmp_path)
+
+    print(f"\n{'phase':>15} {'cold (ms)':>10} {'warm (ms)':>10}")
+    for phase in cold_phases:
+        warm_ms = f"{warm_phases[phase] * 1000:10.1f}" if phase in warm_phases else f"{'skipped':>10}"
+        print(f"{phase:>15} {cold_phases[phase] * 1000:10.1f} {warm_ms}")
+    print(f"{'total':>15} {cold * 1000:10.1f} {warm * 1000:10.1f} ({cold / warm:.1f}x)")
+    assert warm_phases["init"] < cold_phases["init"]
+    assert warm_phases["wifi"] < cold_phases["wifi"]
+    assert warm < cold / 2
@@ -0,0 +1,108 @@
+# test_wire_trace_replay_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Measure the cost of recording a status push storm to a wire trace and how fast it can be replayed
+
+Run with: pytest tests/benchmarks/test_wire_trace_replay_benchmark.py -s
+"""
+
+import asyncio
+import contextlib
+import functools
+import logging
+import math
+import re
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+from open_gopro import WirelessGoPro
+from open_gopro.ble.adapters import ReplayBleController
+from open_gopro.communicator_interface import GoProBle
+from open_gopro.constants import GoProUUID, QueryCmdId, StatusId
+from open_gopro.wire_trace import WireTraceRecorder, read_trace
+from tests.mocks import MockCameraBleController, MockWifiController
+
+PUSHES = 5_000
+# Encoding, busy, and battery percentage in one push
+PUSH = bytes([QueryCmdId.STATUS_VAL_PUSH, 0x00, StatusId.ENCODING, 1, 1, StatusId.BUSY, 1, 0, 70, 1, 100])
+
+
+@contextlib.contextmanager
+def quiet_logging() -> Iterator[None]:
+    """Replace the root handlers (i.e. pytest's log capture) so that each push is not formatted"""
+    root = logging.getLogger()
+    handlers = root.handlers
+    root.handlers = [logging.NullHandler()]
+    try:
+        yield
+    finally:
+        root.handlers = handlers
+
+
+def build_gopro(ble_adapter: Any, **kwargs: Any) -> WirelessGoPro:
+    return WirelessGoPro(
+        target=re.compile("GoPro 1234"),
+        ble_adapter=ble_adapter,
+        wifi_adapter=MockWifiController,
+        enable_wifi=False,
+        maintain_state=False,
+        **kwargs,
+    )
+
+
+async def run_storm(gopro: WirelessGoPro, push: bool) -> float:
+    """Open, receive all of the pushes, and close. Returns the seconds from the first push until the last was handled"""
+    received = 0
+    done = asyncio.Event()
+
+    async def on_busy(*_: Any) -> None:
+        nonlocal received
+        received += 1
+        if received == PUSHES:
+            done.set()
+
+    await gopro.open(timeout=1, retries=2)
+    gopro.register_update(on_busy, StatusId.BUSY)
+    await gopro.ble_status.busy.register_value_update(on_busy)
+    start = time.perf_counter()
+    if push:
+        controller = gopro._ble._controller
+        assert isinstance(controller, MockCameraBleController)
+        for _ in range(PUSHES):
+            controller.push(GoProUUID.CQ_QUERY_RESP, PUSH)
+    await asyncio.wait_for(done.wait(), 60)
+    elapsed = time.perf_counter() - start
+    await gopro.close()
+    return elapsed
+
+
+@pytest.mark.asyncio
+async def test_wire_trace_replay(tmp_path: Path):
+    trace = tmp_path / "storm.gpwt"
+    with quiet_logging():
+        untraced = await run_storm(build_gopro(MockCameraBleController), push=True)
+        traced = await run_storm(build_gopro(MockCameraBleController, wire_trace=trace), push=True)
+        frames = read_trace(trace)
+        replayed = await run_storm(
+            build_gopro(functools.partial(ReplayBleController, trace=frames, speed=math.inf)), push=False
+        )
+
+    (packet,) = GoProBle._fragment(PUSH)
+    with WireTraceRecorder(tmp_path / "recorder.gpwt") as recorder:
+        start = time.perf_counter()
+        for _ in range(PUSHES):
+            recorder.ble_notification(1, packet)
+        record = (time.perf_counter() - start) / PUSHES
+
+    size = trace.stat().st_size
+    print(f"\n{PUSHES} pushes of {len(PUSH)} bytes")
+    print(f"live: {PUSHES / untraced:,.0f} pushes/s, recording: {PUSHES / traced:,.0f} pushes/s")
+    print(f"recording overhead: {(traced - untraced) / PUSHES * 1e6:.1f} µs per push, {record * 1e6:.2f} µs per frame")
+    print(f"trace: {len(frames)} frames, {size:,} bytes ({size / len(frames):.1f} bytes per frame)")
+    print(f"replay: {PUSHES / replayed:,.0f} pushes/s")
+    assert sum(frame.data == packet for frame in frames) == PUSHES
+    # Recording a notification costs much less than handling it
+    assert record < untraced / PUSHES
@@ -0,0 +1,69 @@
+# test_wired_readiness_benchmark.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Compare wired per-command latency when polling the complete camera state before every command against the
+cached status subset readiness
+
+Run with: pytest tests/benchmarks/test_wired_readiness_benchmark.py -s
+"""
+
+import time
+from typing import Any
+
+import pytest
+from construct import StringError
+
+from open_gopro.constants import SettingId, StatusId
+from open_gopro.parser_interface import GlobalParsers
+from tests.mocks import MockHttpGoPro, MockHttpServer
+
+COMMANDS = 50
+# Emulate per-request USB camera latency
+SERVER_DELAY = 0.005
+
+
+def value_for(identifier: StatusId | SettingId) -> Any:
+    """Get a value that the camera state parser accepts (numeric unless the ID is a string)"""
+    if parser_builder := GlobalParsers.get_query_container(identifier):
+        try:
+            parser_builder(0)
+        except StringError:
+            return "GoPro"
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+    return 0
+
+
+FULL_STATE = {
+    "status": {str(status.value): value_for(status) for status in StatusId},
+    "settings": {str(setting.value): value_for(setting) for setting in SettingId},
+}
+
+
+async def time_commands(server: MockHttpServer, **kwargs) -> tuple[float, float]:
+    gopro = MockHttpGoPro(server, "C3501324500711", maintain_state=True, **kwargs)
+    start = time.perf_counter()
+    for i in range(COMMANDS):
+        assert (await gopro.http_command.set_digital_zoom(percent=i)).ok
+    elapsed = time.perf_counter() - start
+    await gopro.close()
+    return elapsed / COMMANDS, gopro.command_rate
+
+
+@pytest.mark.timeout(120)
+@pytest.mark.asyncio
+async def test_wired_command_latency():
+    timings: dict[str, tuple[float, float]] = {}
+    # Previous behavior: complete state before every command
+    with MockHttpServer(delay=SERVER_DELAY, state=FULL_STATE, state_subsets=False) as server:
+        timings["complete state"] = await time_commands(server, state_freshness=0)
+    with MockHttpServer(delay=SERVER_DELAY, state=FULL_STATE) as server:
+        timings["status subset"] = await time_commands(server, state_freshness=0)
+    with MockHttpServer(delay=SERVER_DELAY, state=FULL_STATE) as server:
+        timings["cached subset"] = await time_commands(server)
+
+    print(f"\n{len(FULL_STATE['status'])} statuses, {len(FULL_STATE['settings'])} settings")
+    for name, (latency, rate) in timings.items():
+        print(f"{name:>15}: {latency * 1000:.1f} ms / command ({rate:.0f} commands / s)")
+    assert timings["status subset"][0] < timings["complete state"][0]
+    assert timings["cached subset"][0] < timings["status subset"][0]
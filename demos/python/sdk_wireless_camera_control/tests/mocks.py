@@ -2,10 +2,16 @@
 # This copyright was auto-generated on Thu Mar 20 21:57:17 UTC 2025
 
 import asyncio
+import json
 import re
+import threading
+import time
+from collections import Counter
 from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any, Generic, Optional, Pattern
+from urllib.parse import parse_qs, urlsplit
 
 from open_gopro import WiredGoPro, WirelessGoPro
 from open_gopro.api import (
@@ -21,8 +27,12 @@ from open_gopro.ble import (
     BleDevice,
     BleHandle,
     BleUUID,
+    Characteristic,
+    CharProps,
     DisconnectHandlerType,
+    GattDB,
     NotiHandlerType,
+    Service,
 )
 from open_gopro.communicator_interface import (
     BleMessage,
@@ -224,6 +234,7 @@ class MockWiredGoPro(WiredGoPro):
         self.http_command.wired_usb_control = self._mock_empty_return
         self.http_command.get_open_gopro_api_version = self._mock_get_version
         self.http_command.get_camera_state = self._mock_get_state
+        self.http_command.get_camera_state_subset = self._mock_get_state
         self.http_command.set_third_party_client_info = self._mock_empty_return
         self.state_response: CameraState = {}
 
@@ -241,13 +252,14 @@ class MockWiredGoPro(WiredGoPro):
 
 
 class MockWirelessGoPro(WirelessGoPro):
-    def __init__(self, test_version: str) -> None:
+    def __init__(self, test_version: str, maintain_state: bool = False, **kwargs: Any) -> None:
         super().__init__(
             target=re.compile("device"),
             ble_adapter=MockBleController,
             wifi_adapter=MockWifiController,
             enable_wifi=True,
-            maintain_state=False,
+            maintain_state=maintain_state,
+            **kwargs,
         )
         self._test_version = test_version
         self._api.ble_command.get_open_gopro_api_version = self._mock_version
@@ -325,6 +337,192 @@ class MockWirelessGoPro(WirelessGoPro):
 _test_response_id = CmdId.SET_SHUTTER
 
 
+class MockShutterGoPro(MockWirelessGoPro):
+    """Simulate a camera's shutter timing
+
+    Each write takes write_latency to be received by the camera. Once the shutter command is received, it is
+    responded to and encoding starts (and is pushed) after encoding_latency.
+    """
+
+    _HANDLE_TO_UUID = {1: GoProUUID.CQ_COMMAND_RESP, 2: GoProUUID.CQ_QUERY_RESP}
+
+    def __init__(self, write_latency: float, encoding_latency: float) -> None:
+        super().__init__("2.0")
+        self.write_latency = write_latency
+        self.encoding_latency = encoding_latency
+        self.received: list[float] = []
+        self.encoding_started: float | None = None
+        self._ble.write = self._simulate_write
+
+    def _mock_uuid(self, handle: int) -> BleUUID:
+        return self._HANDLE_TO_UUID[handle]
+
+    async def _simulate_write(self, uuid: BleUUID, data: bytes) -> None:
+        await asyncio.sleep(self.write_latency)
+        self.received.append(time.perf_counter())
+        # Set shutter response: success
+        self._notification_handler(1, bytearray([0x02, CmdId.SET_SHUTTER.value, 0x00]))
+        if data[-1]:
+            asyncio.get_running_loop().call_later(self.encoding_latency, self._push_encoding)
+
+    def _push_encoding(self) -> None:
+        self.encoding_started = time.perf_counter()
+        # Status value push: encoding = 1
+        self._notification_handler(2, bytearray([0x05, 0x93, 0x00, StatusId.ENCODING.value, 0x01, 0x01]))
+
+
+class MockPipelineGoPro(MockWirelessGoPro):
+    """Simulate a camera's BLE request timing
+
+    Writes are serialized on the link and each take write_latency. Each characteristic's requests are then
+    processed in order, taking processing_latency to respond. Different characteristics are processed concurrently.
+    Every request must fit in one packet. Every request succeeds and every queried ID has a value of 0.
+    """
+
+    _RESPONSE_HANDLES = {
+        GoProUUID.CQ_COMMAND: 1,
+        GoProUUID.CQ_SETTINGS: 2,
+        GoProUUID.CQ_QUERY: 3,
+        GoProUUID.CM_NET_MGMT_COMM: 4,
+    }
+    _HANDLE_TO_UUID = {
+        1: GoProUUID.CQ_COMMAND_RESP,
+        2: GoProUUID.CQ_SETTINGS_RESP,
+        3: GoProUUID.CQ_QUERY_RESP,
+        4: GoProUUID.CN_NET_MGMT_RESP,
+    }
+
+    def __init__(self, write_latency: float, processing_latency: float, **kwargs: Any) -> None:
+        super().__init__("2.0", keep_alive_interval=3600, **kwargs)
+        self.write_latency = write_latency
+        self.processing_latency = processing_latency
+        self.writes: list[tuple[BleUUID, float]] = []
+        self._link = asyncio.Lock()
+        self._processors: dict[BleUUID, asyncio.Lock] = {uuid: asyncio.Lock() for uuid in self._RESPONSE_HANDLES}
+        self._tasks: set[asyncio.Task] = set()
+        self._ble.write = self._simulate_write
+        # Responses are received while opening (before the gatt table is patched after BLE is opened)
+        self._ble._controller.gatt_db.handle2uuid = self._mock_uuid
+        self._ble._gatt_table.handle2uuid = self._mock_uuid
+
+    async def _send_ble_message(
+        self, message: BleMessage, rules: MessageRules = MessageRules(), **kwargs: Any
+    ) -> GoProResp:
+        return await WirelessGoPro._send_ble_message(self, message, rules, **kwargs)
+
+    def _mock_uuid(self, handle: int) -> BleUUID:
+        return self._HANDLE_TO_UUID[handle]
+
+    async def _simulate_write(self, uuid: BleUUID, data: bytes) -> None:
+        async with self._link:
+            await asyncio.sleep(self.write_latency)
+        self.writes.append((uuid, time.perf_counter()))
+        task = asyncio.create_task(self._process(uuid, bytes(data)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _process(self, uuid: BleUUID, data: bytes) -> None:
+        async with self._processors[uuid]:
+            await asyncio.sleep(self.processing_latency)
+            self._notification_handler(self._RESPONSE_HANDLES[uuid], self._build_response(uuid, data))
+
+    @staticmethod
+    def _build_response(uuid: BleUUID, packet: bytes) -> bytearray:
+        # Strip the extended 13-bit header that requests are always fragmented with
+        data = packet[2 : 2 + (((packet[0] & 0x1F) << 8) | packet[1])]
+        match uuid:
+            case GoProUUID.CQ_QUERY:
+                payload = bytearray([data[0], 0x00])
+                for query_id in data[1:]:
+                    payload += bytearray([query_id, 0x01, 0x00])
+            case GoProUUID.CM_NET_MGMT_COMM:
+                # Feature ID, response action ID, protobuf with result = RESULT_SUCCESS
+                payload = bytearray([data[0], data[1] | 0x80, 0x08, 0x01])
+            case _:
+                payload = bytearray([data[0], 0x00])
+        return bytearray([len(payload)]) + payload
+
+    def close(self) -> None:
+        if self._should_maintain_state:
+            self._keep_alive_task.cancel()
+
+
+class MockWarmStartGoPro(MockPipelineGoPro):
+    """Simulate the latency of each phase of opening a camera
+
+    Scanning, connecting, discovering characteristics, and reading each access point credential take a fixed time.
+    The discovered GATT table contains the characteristics that the camera responds on.
+    """
+
+    ADDRESS = "device_address"
+
+    def __init__(
+        self,
+        write_latency: float = 0.0,
+        processing_latency: float = 0.0,
+        scan_latency: float = 0.0,
+        connect_latency: float = 0.0,
+        discover_latency: float = 0.0,
+        read_latency: float = 0.0,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(write_latency, processing_latency, **kwargs)
+        self.scan_latency = scan_latency
+        self.connect_latency = connect_latency
+        self.discover_latency = discover_latency
+        self.read_latency = read_latency
+        self.calls: Counter[str] = Counter()
+        self.fail_cached_connect = False
+        controller = self._ble._controller
+        self._mock_scan_device = controller.scan
+        controller.scan = self._timed_scan
+        controller.connect = self._timed_connect
+        controller.discover_chars = self._timed_discover
+        controller.get_address = lambda _: self.ADDRESS
+
+    async def _timed_scan(self, *args: Any) -> str:
+        self.calls["scan"] += 1
+        await asyncio.sleep(self.scan_latency)
+        return await self._mock_scan_device(*args)
+
+    async def _timed_connect(self, disconnect_cb: DisconnectHandlerType, device: Any, timeout: int) -> str:
+        self.calls["connect"] += 1
+        await asyncio.sleep(self.connect_latency)
+        if device == self.ADDRESS and self.fail_cached_connect:
+            raise ConnectFailed("forced cached connect fail from test", timeout, 1)
+        return "connected_device"
+
+    async def _timed_discover(self, *_: Any) -> GattDB:
+        self.calls["discover"] += 1
+        await asyncio.sleep(self.discover_latency)
+        return GattDB(
+            [
+                Service(
+                    GoProUUID.S_CONTROL_QUERY,
+                    start_handle=0,
+                    init_chars=[
+                        Characteristic(handle, uuid, CharProps.NOTIFY) for handle, uuid in self._HANDLE_TO_UUID.items()
+                    ],
+                )
+            ]
+        )
+
+    async def _mock_version(self) -> DataPatch:
+        self.calls["version"] += 1
+        await asyncio.sleep(self.write_latency + self.processing_latency)
+        return DataPatch("2.0")
+
+    async def _mock_password(self) -> DataPatch:
+        self.calls["password"] += 1
+        await asyncio.sleep(self.read_latency)
+        return DataPatch("password")
+
+    async def _mock_ssid(self) -> DataPatch:
+        self.calls["ssid"] += 1
+        await asyncio.sleep(self.read_latency)
+        return DataPatch("ssid")
+
+
 class MockGoProMaintainBle(WirelessGoPro):
     def __init__(self) -> None:
         super().__init__(
@@ -341,10 +539,11 @@ class MockGoProMaintainBle(WirelessGoPro):
         self.ble_status.busy.register_value_update = self._mock_register_busy
         self.ble_setting.led.set = self._mock_led_set
         self._open_wifi = self._mock_open_wifi
-        self._sync_resp_ready_q.get = self._mock_q_get
+        self._wait_for_ble_response = self._mock_wait_for_response
         self.generic_spy: asyncio.Queue[Any] = asyncio.Queue()
 
-    async def _mock_q_get(self, *args, **kwargs):
+    async def _mock_wait_for_response(self, response_future: asyncio.Future) -> GoProResp:
+        self._ble_requests.discard(response_future)
         return mock_good_response
 
     async def _mock_led_set(self, *args):
@@ -368,3 +567,220 @@ class MockGoProMaintainBle(WirelessGoPro):
 
     async def _mock_get_version(self) -> DataPatch:
         return DataPatch("2.0")
+
+
+class MockHttpServer:
+    """Local stand-in for the camera's HTTP server
+
+    Serves a small JSON body for GET / PUT and a binary body (with optional byte range support) for any path starting
+    with "videos/". If files (camera path --> contents) are passed, they are served instead of the body and the media
+    list and delete file endpoints are emulated. If a camera state (status / settings JSON) is passed, it is served
+    for the camera state endpoint, filtered by any status / setting query parameters if state_subsets is True.
+    Tracks the amount of TCP connections and the maximum amount of concurrent requests.
+    """
+
+    def __init__(
+        self,
+        delay: float = 0,
+        body: bytes = b"",
+        supports_ranges: bool = True,
+        files: dict[str, bytes] | None = None,
+        state: dict[str, dict[str, int]] | None = None,
+        state_subsets: bool = True,
+    ) -> None:
+        self.delay = delay
+        self.body = body
+        self.supports_ranges = supports_ranges
+        self.files = files
+        self.state = state
+        self.state_subsets = state_subsets
+        self.paths: list[str] = []
+        self.ranges: list[tuple[int, int]] = []
+        self.connections: set[int] = set()
+        self.max_in_flight = 0
+        self.requests = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args: Any) -> None: ...
+
+            def _respond(self) -> None:
+                with server._lock:
+                    server.connections.add(self.client_address[1])
+                    server.paths.append(self.path)
+                    server.requests += 1
+                    server._in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server._in_flight)
+                try:
+                    if length := int(self.headers.get("Content-Length", 0)):
+                        self.rfile.read(length)
+                    if server.delay:
+                        time.sleep(server.delay)
+                    status, headers = 200, {}
+                    if self.path.startswith("/videos/"):
+                        body = server.body
+                        if server.files is not None:
+                            body = server.files.get(self.path.removeprefix("/videos/DCIM/"), b"")
+                        data, content_type = body, "application/octet-stream"
+                        if server.supports_ranges and (byte_range := self.headers.get("Range")):
+                            first, last = (int(x) for x in byte_range.removeprefix("bytes=").split("-"))
+                            with server._lock:
+                                server.ranges.append((first, last))
+                            data = body[first : last + 1]
+                            status, headers = 206, {"Content-Range": f"bytes {first}-{last}/{len(body)}"}
+                    elif server.state is not None and self.path.startswith("/gopro/camera/state"):
+                        data, content_type = json.dumps(server.camera_state(self.path)).encode(), "application/json"
+                    elif server.files is not None and self.path == "/gopro/media/list":
+                        data, content_type = json.dumps(server.media_list()).encode(), "application/json"
+                    elif server.files is not None and self.path.startswith("/gopro/media/delete/file?path="):
+                        server.files.pop(self.path.partition("=")[2], None)
+                        data, content_type = b"{}", "application/json"
+                    else:
+                        data, content_type = json.dumps({"path": self.path}).encode(), "application/json"
+                    self.send_response(status)
+                    for key, value in headers.items():
+                        self.send_header(key, value)
+                    self.send_header("Content-Type", content_type)
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                finally:
+                    with server._lock:
+                        server._in_flight -= 1
+
+            do_GET = _respond
+            do_PUT = _respond
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._server.handle_error = lambda *_: None  # type: ignore  # Clients may reset discarded connections
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/"
+
+    def media_list(self) -> dict[str, Any]:
+        directories: dict[str, list[dict[str, str]]] = {}
+        for path, contents in (self.files or {}).items():
+            directory, _, name = path.partition("/")
+            directories.setdefault(directory, []).append(
+                {"n": name, "cre": "1696600109", "mod": "1696600109", "s": str(len(contents))}
+            )
+        return {"id": "1", "media": [{"d": d, "fs": fs} for d, fs in directories.items()]}
+
+    def camera_state(self, path: str) -> dict[str, dict[str, int]]:
+        assert self.state is not None
+        query = parse_qs(urlsplit(path).query)
+        if not (self.state_subsets and query):
+            return self.state
+        return {
+            "status": {k: v for k, v in self.state["status"].items() if k in query.get("status", [])},
+            "settings": {k: v for k, v in self.state["settings"].items() if k in query.get("setting", [])},
+        }
+
+    def __enter__(self) -> "MockHttpServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class MockHttpGoPro(WiredGoPro):
+    """Fake camera whose HTTP interface is served by a MockHttpServer"""
+
+    def __init__(self, server: MockHttpServer, serial: str, maintain_state: bool = False, **kwargs: Any) -> None:
+        super().__init__(serial=serial, maintain_state=maintain_state, **kwargs)
+        self.server = server
+        self._open = True
+
+    @property
+    def _base_url(self) -> str:
+        return self.server.base_url
+
+
+class MockCameraBleController(BLEController[str, str]):
+    """Fake camera at the BLE controller level (i.e. beneath the GoPro's BLE client)
+
+    Every request succeeds, the Open GoPro version is 2.0, and every queried ID has a value of 0. Responses are
+    notified on the matching response characteristic. Every request must fit in one packet.
+    """
+
+    DEVICE = "AA:BB:CC:DD:EE:FF: GoPro 1234"
+    _RESPONSE_UUIDS = {
+        GoProUUID.CQ_COMMAND: GoProUUID.CQ_COMMAND_RESP,
+        GoProUUID.CQ_SETTINGS: GoProUUID.CQ_SETTINGS_RESP,
+        GoProUUID.CQ_QUERY: GoProUUID.CQ_QUERY_RESP,
+        GoProUUID.CM_NET_MGMT_COMM: GoProUUID.CN_NET_MGMT_RESP,
+    }
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        uuids = [*self._RESPONSE_UUIDS.keys(), *self._RESPONSE_UUIDS.values()]
+        self.gatt_db = GattDB(
+            [
+                Service(
+                    GoProUUID.S_CONTROL_QUERY,
+                    start_handle=0,
+                    init_chars=[
+                        Characteristic(handle, uuid, CharProps.NOTIFY | CharProps.WRITE_YES_RSP)
+                        for handle, uuid in enumerate(uuids, start=1)
+                    ],
+                )
+            ]
+        )
+        self.writes: list[tuple[BleUUID, bytes]] = []
+        self._handler: Optional[NotiHandlerType] = None
+        self._disconnect_cb: Optional[DisconnectHandlerType] = None
+
+    async def read(self, handle: str, uuid: BleUUID) -> bytes:
+        return bytes()
+
+    async def write(self, handle: str, uuid: BleUUID, data: bytes) -> None:
+        self.writes.append((uuid, bytes(data)))
+        if data[0] & 0x80:  # Continuation packet
+            return
+        response = MockPipelineGoPro._build_response(uuid, data)
+        if uuid == GoProUUID.CQ_COMMAND and response[1] == CmdId.GET_THIRD_PARTY_API_VERSION:
+            # Major and minor version are each length-value encoded
+            payload = bytearray([CmdId.GET_THIRD_PARTY_API_VERSION, 0x00, 0x01, 0x02, 0x01, 0x00])
+            response = bytearray([len(payload)]) + payload
+        asyncio.get_running_loop().call_soon(self.notify, self._RESPONSE_UUIDS[uuid], response)
+
+    async def scan(self, token: Pattern, timeout: int = 5, service_uuids: Optional[list[BleUUID]] = None) -> str:
+        if not token.search(self.DEVICE):
+            raise FailedToFindDevice
+        return self.DEVICE
+
+    async def connect(self, disconnect_cb: DisconnectHandlerType, device: str, timeout: int = 15) -> str:
+        self._disconnect_cb = disconnect_cb
+        return device
+
+    async def pair(self, handle: str) -> None:
+        return
+
+    async def enable_notifications(self, handle: str, handler: NotiHandlerType) -> None:
+        self._handler = handler
+
+    async def discover_chars(self, handle: str, uuids: Any = None) -> GattDB:
+        return self.gatt_db
+
+    async def disconnect(self, handle: str) -> None:
+        if self._disconnect_cb:
+            self._disconnect_cb(handle)
+
+    def notify(self, uuid: BleUUID, data: bytes) -> None:
+        assert self._handler
+        self._handler(self.gatt_db.uuid2handle(uuid), bytearray(data))
+
+    def push(self, uuid: BleUUID, payload: bytes) -> None:
+        """Send an asynchronous message (i.e. a status push), fragmenting it as the camera would"""
+        for packet in GoProBle._fragment(payload):
+            self.notify(uuid, packet)
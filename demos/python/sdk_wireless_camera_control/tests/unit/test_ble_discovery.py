@@ -0,0 +1,135 @@
+# test_ble_discovery.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of continuous BLE discovery"""
+
+import asyncio
+import random
+import re
+from typing import Any, Optional
+
+import pytest
+
+from open_gopro import WirelessGoPro
+from open_gopro.ble import Advertisement, AdvertisementHandlerType, BleUUID
+from open_gopro.ble_discovery import (
+    GOPRO_COMPANY_ID,
+    GOPRO_SERVICE_DATA_UUID,
+    DiscoveryService,
+    decode_manufacturer_data,
+)
+from open_gopro.exceptions import FailedToFindDevice
+from open_gopro.models.network_scan_responses import manuf_data_struct
+from tests.mocks import MockCameraBleController, MockWifiController
+
+# Manufacturer data from test_ble_advertisement_parsing
+MANUFACTURER_DATA = bytes([0x02, 0x01, 0x38, 0x33, 0x00, 0xB3, 0xFE, 0x2A, 0x79, 0xDC, 0xEB, 0x0F])
+SERVICE_DATA = bytes([0xF7, 0xA9, 0x76, 0x88]) + b"1058"
+
+
+class MockDiscoveryBleController(MockCameraBleController):
+    """Fake cameras that can only be found by continuous discovery"""
+
+    handler: Optional[AdvertisementHandlerType] = None
+
+    async def scan(self, *args: Any, **kwargs: Any) -> str:
+        raise AssertionError("Discovered cameras must not be scanned for")
+
+    async def discover(self, handler: AdvertisementHandlerType, service_uuids: Optional[list[BleUUID]] = None) -> None:
+        MockDiscoveryBleController.handler = handler
+        await asyncio.Future()
+
+    @classmethod
+    def advertise(cls, address: str, name: Optional[str] = None, manufacturer_data: bytes = MANUFACTURER_DATA) -> None:
+        assert cls.handler
+        advertisement = Advertisement(
+            address,
+            name,
+            {GOPRO_COMPANY_ID: manufacturer_data},
+            {GOPRO_SERVICE_DATA_UUID: SERVICE_DATA} if name else {},
+            -50,
+        )
+        cls.handler(f"{address}: {name}", advertisement)
+
+
+def test_decode_manufacturer_data_matches_construct():
+    rng = random.Random(0)
+    for data in [MANUFACTURER_DATA, *(rng.randbytes(12) for _ in range(100))]:
+        expected = manuf_data_struct.parse(data)
+        status = decode_manufacturer_data(data)
+        assert status.schema_version == expected.schema_version
+        assert status.camera_id == expected.camera_id
+        assert status.id_hash == expected.id_hash
+        for name in ("processor_state", "wifi_ap_state", "peripheral_pairing_state", "central_role_enabled"):
+            assert getattr(status, name) == expected.camera_status[name]
+        assert status.is_new_media_available == expected.camera_status.is_new_media_available
+        for name in ("cnc", "ble_metadata", "wideband_audio", "concurrent_master_slave", "onboarding"):
+            assert getattr(status, f"supports_{name}") == expected.camera_capabilities[name]
+        assert status.supports_new_media_available == expected.camera_capabilities.new_media_available
+        for name in ("available", "new_media_available", "battery_ok", "sd_card_ok", "busy", "paused"):
+            assert getattr(status, f"is_media_upload_{name}") == expected.media_offload_status[name]
+    with pytest.raises(ValueError):
+        decode_manufacturer_data(MANUFACTURER_DATA[:-1])
+
+
+@pytest.mark.asyncio
+async def test_registry_and_claims():
+    async with DiscoveryService(MockDiscoveryBleController()) as discovery:
+        await asyncio.sleep(0)
+        # The advertisement is received before the scan response (with the name)
+        MockDiscoveryBleController.advertise("AA")
+        claim = asyncio.create_task(discovery.claim(re.compile("GoPro 1058"), timeout=1))
+        await asyncio.sleep(0)
+        assert not claim.done()
+        MockDiscoveryBleController.advertise("AA", "GoPro 1058")
+        for _ in range(10):
+            MockDiscoveryBleController.advertise("AA", "GoPro 1058")
+        camera = await claim
+
+        assert camera.address == "AA" and camera.claimed
+        assert camera.ap_mac_address == "f7:a9:76:88" and camera.partial_serial_number == "1058"
+        assert camera.busy is True and camera.is_new_media_available is False
+        assert discovery.stats.advertisements == 12
+        assert discovery.stats.decoded == 2 and discovery.stats.duplicates == 10
+
+        # Status changes are decoded
+        MockDiscoveryBleController.advertise("AA", "GoPro 1058", MANUFACTURER_DATA[:-1] + b"\x00")
+        assert camera.busy is False
+        assert discovery.stats.decoded == 3
+
+        # A claimed camera can't be claimed again until it is released
+        with pytest.raises(FailedToFindDevice):
+            await discovery.claim(re.compile("GoPro"), timeout=0.05)
+        discovery.release(camera)
+        assert await discovery.claim(re.compile("GoPro"), timeout=0.05) is camera
+    assert not discovery.is_running
+    assert len(discovery.cameras) == 1
+
+
+@pytest.mark.asyncio
+async def test_wireless_gopros_claim_from_discovery():
+    discovery = DiscoveryService(MockDiscoveryBleController())
+    await discovery.start()
+    await asyncio.sleep(0)
+    gopros = [
+        WirelessGoPro(
+            target=re.compile(f"GoPro {serial}"),
+            ble_adapter=MockDiscoveryBleController,
+            wifi_adapter=MockWifiController,
+            enable_wifi=False,
+            ble_discovery=discovery,
+        )
+        for serial in ("1111", "2222")
+    ]
+    opens = asyncio.gather(*(gopro.open(timeout=1, retries=2) for gopro in gopros))
+    await asyncio.sleep(0)
+    for address, serial in (("AA", "2222"), ("BB", "1111")):
+        MockDiscoveryBleController.advertise(address, f"GoPro {serial}")
+    await opens
+
+    assert [gopro.identifier for gopro in gopros] == ["BB: GoPro 1111", "AA: GoPro 2222"]
+    assert all(camera.claimed for camera in discovery.cameras)
+    for gopro in gopros:
+        await gopro.close()
+    assert not any(camera.claimed for camera in discovery.cameras)
+    await discovery.stop()
@@ -0,0 +1,67 @@
+# test_ble_fragment.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of BLE fragmentation"""
+
+from typing import Iterator
+
+import pytest
+from construct import Bit, BitsInteger, BitStruct, Const, Padding
+
+from open_gopro.ble_fragment import MAX_BLE_PKT_LEN, MAX_CACHED_LEN, fragment
+from open_gopro.models import GoProBlePacketHeader
+from open_gopro.parsers.response import BleRespBuilder
+
+
+def construct_fragment(data: bytes) -> Iterator[bytes]:
+    """Previous construct-based fragmentation"""
+    extended_13_header = BitStruct(
+        "continuation" / Const(0, Bit),
+        "header" / Const(GoProBlePacketHeader.EXT_13.value, BitsInteger(2)),
+        "length" / BitsInteger(13),
+    )
+    extended_16_header = BitStruct(
+        "continuation" / Const(0, Bit),
+        "header" / Const(GoProBlePacketHeader.EXT_16.value, BitsInteger(2)),
+        "padding" / Padding(5),
+        "length" / BitsInteger(16),
+    )
+    continuation_header = BitStruct("continuation" / Const(1, Bit), "padding" / Padding(7))
+    header = extended_13_header if len(data) < 2**13 - 1 else extended_16_header
+    data_len = len(data)
+    while data:
+        if header == continuation_header:
+            packet = bytearray(header.build({}))
+        else:
+            packet = bytearray(header.build({"length": data_len}))
+            header = continuation_header
+        current, data = data[: MAX_BLE_PKT_LEN - len(packet)], data[MAX_BLE_PKT_LEN - len(packet) :]
+        packet.extend(current)
+        yield bytes(packet)
+
+
+@pytest.mark.parametrize("length", [0, 1, 17, 18, 19, 37, 38, 100, MAX_CACHED_LEN + 1, 8190, 8191, 10_000, 65_534])
+def test_matches_construct(length: int):
+    payload = bytes(i & 0xFF for i in range(length))
+    packets = fragment(payload)
+    assert list(packets) == list(construct_fragment(payload))
+    assert fragment(bytearray(payload)) == packets
+    assert all(len(packet) <= MAX_BLE_PKT_LEN for packet in packets)
+
+
+def test_reassembles():
+    payload = bytes(range(200))
+    builder = BleRespBuilder()
+    for packet in fragment(payload):
+        builder.accumulate(bytearray(packet))
+    assert builder.is_finished_accumulating
+    assert bytes(builder._packet) == payload
+
+
+def test_constant_payloads_are_memoized():
+    keep_alive = bytes([0x5B, 0x01, 0x42])
+    assert fragment(keep_alive) is fragment(bytearray(keep_alive))
+    long_payload = bytes(MAX_CACHED_LEN + 1)
+    assert fragment(long_payload) is not fragment(long_payload)
+    with pytest.raises(ValueError):
+        fragment(bytes(2**16 - 1))
@@ -0,0 +1,116 @@
+# test_ble_ingest.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of batched BLE notification ingestion"""
+
+import asyncio
+import threading
+
+import pytest
+
+from open_gopro.ble_ingest import Notification, NotificationIngest
+from open_gopro.communicator_interface import GoProBle
+from open_gopro.constants import GoProUUID, QueryCmdId, StatusId
+from tests.mocks import MockPipelineGoPro
+
+
+@pytest.mark.asyncio
+async def test_drained_in_order_in_batches():
+    loop = asyncio.get_running_loop()
+    received: list[Notification] = []
+    ingest = NotificationIngest(received.extend)
+
+    def flood() -> None:
+        for i in range(1000):
+            ingest.put(loop, i % 3, bytearray(i.to_bytes(2, "big")))
+
+    thread = threading.Thread(target=flood)
+    thread.start()
+    thread.join()
+    while len(received) < 1000:
+        await asyncio.sleep(0.01)
+
+    assert received == [(i % 3, bytearray(i.to_bytes(2, "big"))) for i in range(1000)]
+    stats = ingest.stats
+    assert stats.packets == 1000 and stats.depth == 0
+    # Everything was put before the loop could drain
+    assert stats.batches == 1000 // NotificationIngest.DEFAULT_MAX_BATCH + 1 and stats.max_depth == 1000
+    assert 0 < stats.mean_latency <= stats.max_latency
+    await ingest.stop()
+
+
+@pytest.mark.asyncio
+async def test_handler_failure_does_not_stop_consumer():
+    loop = asyncio.get_running_loop()
+    received: list[Notification] = []
+
+    def handler(batch: list[Notification]) -> None:
+        received.extend(batch)
+        raise RuntimeError("failed")
+
+    ingest = NotificationIngest(handler)
+    for i in range(2):
+        ingest.put(loop, i, bytearray())
+        await asyncio.sleep(0.01)
+    assert [handle for handle, _ in received] == [0, 1]
+    assert ingest.stats.batches == 2
+    await ingest.stop()
+
+
+@pytest.mark.asyncio
+async def test_interleaved_responses_accumulated_per_characteristic():
+    gopro = MockPipelineGoPro(write_latency=0, processing_latency=0)
+    gopro._loop = asyncio.get_running_loop()
+    gopro._ble._gatt_table.handle2uuid = gopro._mock_uuid
+    updates: list[tuple] = []
+
+    async def on_status(update, value) -> None:
+        updates.append((update, value))
+
+    gopro._register_update(on_status, GoProBle._CompositeRegisterType.ALL_STATUSES)
+    query_handle = MockPipelineGoPro._RESPONSE_HANDLES[GoProUUID.CQ_QUERY]
+    command_handle = MockPipelineGoPro._RESPONSE_HANDLES[GoProUUID.CQ_COMMAND]
+    payload = bytearray([QueryCmdId.STATUS_VAL_PUSH.value, 0x00])
+    for status in (StatusId.ENCODING, StatusId.BUSY, StatusId.OVERHEATING) * 4:
+        payload += bytearray([status.value, 0x01, 0x01])
+    packets = list(GoProBle._fragment(payload))
+    assert len(packets) > 1
+    # A complete command response arrives between the push's packets
+    gopro._notification_handler(query_handle, bytearray(packets[0]))
+    gopro._notification_handler(command_handle, bytearray([0x02, 0x01, 0x00]))
+    for packet in packets[1:]:
+        gopro._notification_handler(query_handle, bytearray(packet))
+    await asyncio.sleep(0.01)
+
+    assert updates == [(StatusId.ENCODING, True), (StatusId.BUSY, True), (StatusId.OVERHEATING, True)]
+    assert gopro.notification_stats.packets == len(packets) + 1
+    assert not gopro._active_builders
+    await gopro._notifications.stop()
+
+
+@pytest.mark.asyncio
+async def test_bad_notification_does_not_drop_batch():
+    gopro = MockPipelineGoPro(write_latency=0, processing_latency=0)
+    gopro._loop = asyncio.get_running_loop()
+    gopro._ble._gatt_table.handle2uuid = gopro._mock_uuid
+    updates: list[tuple] = []
+
+    async def on_status(update, value) -> None:
+        updates.append((update, value))
+
+    gopro._register_update(on_status, GoProBle._CompositeRegisterType.ALL_STATUSES)
+    query_handle = MockPipelineGoPro._RESPONSE_HANDLES[GoProUUID.CQ_QUERY]
+    push = bytearray([0x05, QueryCmdId.STATUS_VAL_PUSH.value, 0x00, StatusId.ENCODING.value, 0x01, 0x01])
+    gopro._ingest_notifications(
+        [
+            (query_handle, push),
+            (0xFFFF, bytearray([0x01, 0x00])),  # Unknown handle
+            (query_handle, bytearray([0x60, 0x00])),  # Reserved header
+            (query_handle, push),
+        ]
+    )
+    await asyncio.sleep(0.01)
+
+    assert updates == [(StatusId.ENCODING, True), (StatusId.ENCODING, True)]
+    assert not gopro._active_builders
+    await gopro._notifications.stop()
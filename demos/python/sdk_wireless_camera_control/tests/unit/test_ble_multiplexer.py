@@ -0,0 +1,130 @@
+# test_ble_multiplexer.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of pipelined BLE requests"""
+
+import asyncio
+
+import pytest
+
+from open_gopro.ble_multiplexer import BleRequestMultiplexer
+from open_gopro.constants import (
+    CmdId,
+    ErrorCode,
+    GoProUUID,
+    QueryCmdId,
+    SettingId,
+    StatusId,
+)
+from open_gopro.gopro_base import GoProBase
+from open_gopro.models import GoProResp
+from tests.mocks import MockPipelineGoPro
+
+
+def build_response(identifier) -> GoProResp:
+    return GoProResp(protocol=GoProResp.Protocol.BLE, status=ErrorCode.SUCCESS, data=None, identifier=identifier)
+
+
+@pytest.mark.asyncio
+async def test_resolve_out_of_order():
+    requests = BleRequestMultiplexer()
+    command = requests.expect(GoProUUID.CQ_COMMAND, CmdId.SET_SHUTTER)
+    setting = requests.expect(GoProUUID.CQ_SETTINGS, SettingId.LED)
+    assert requests.outstanding == 2
+
+    assert requests.resolve(GoProUUID.CQ_SETTINGS_RESP, build_response(SettingId.LED))
+    assert setting.done() and not command.done()
+    # Same identifier but on a different characteristic is not awaited
+    assert not requests.resolve(GoProUUID.CQ_SETTINGS_RESP, build_response(CmdId.SET_SHUTTER))
+    assert requests.resolve(GoProUUID.CQ_COMMAND_RESP, build_response(CmdId.SET_SHUTTER))
+    assert command.result().identifier is CmdId.SET_SHUTTER
+    assert requests.outstanding == 0
+
+
+@pytest.mark.asyncio
+async def test_resolve_same_identifier_in_order():
+    requests = BleRequestMultiplexer()
+    first = requests.expect(GoProUUID.CQ_QUERY, QueryCmdId.GET_STATUS_VAL)
+    second = requests.expect(GoProUUID.CQ_QUERY, QueryCmdId.GET_STATUS_VAL)
+    first_response = build_response(QueryCmdId.GET_STATUS_VAL)
+    assert requests.resolve(GoProUUID.CQ_QUERY_RESP, first_response)
+    assert first.result() is first_response and not second.done()
+
+    # A discarded (i.e. timed out) request is no longer matched
+    requests.discard(second)
+    assert not requests.resolve(GoProUUID.CQ_QUERY_RESP, build_response(QueryCmdId.GET_STATUS_VAL))
+
+
+@pytest.mark.asyncio
+async def test_resolve_response_identified_by_other_enum():
+    requests = BleRequestMultiplexer()
+    register = requests.expect(GoProUUID.CQ_QUERY, CmdId.REGISTER_ALL_STATUSES)
+    assert requests.resolve(GoProUUID.CQ_QUERY_RESP, build_response(QueryCmdId.REG_STATUS_VAL_UPDATE))
+    assert register.result().identifier is QueryCmdId.REG_STATUS_VAL_UPDATE
+
+
+@pytest.mark.asyncio
+async def test_slot_depth():
+    requests = BleRequestMultiplexer(depth=1, depths={GoProUUID.CQ_QUERY: 2})
+    assert requests.depth(GoProUUID.CQ_COMMAND) == 1
+    assert requests.depth(GoProUUID.CQ_QUERY) == 2
+
+    async with requests.slot(GoProUUID.CQ_QUERY), requests.slot(GoProUUID.CQ_QUERY):
+        with pytest.raises(asyncio.TimeoutError):
+            async with asyncio.timeout(0.05):
+                async with requests.slot(GoProUUID.CQ_QUERY):
+                    pass
+        # Other characteristics are independent
+        async with requests.slot(GoProUUID.CQ_COMMAND):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_pipelined_mixed_requests():
+    GoProBase.HTTP_GET_RETRIES = 1  # type: ignore
+    gopro = MockPipelineGoPro(write_latency=0.005, processing_latency=0.05, maintain_state=True)
+    await gopro.open()
+
+    results = await asyncio.gather(
+        gopro.ble_command.set_third_party_client_info(),
+        gopro.ble_setting.led.set(66),  # type: ignore
+        gopro.ble_status.encoding.get_value(),
+        gopro.ble_command.scan_wifi_networks(),
+    )
+    assert all(result.ok for result in results)
+    assert results[2].data == 0
+    # All requests were written before the first response was received
+    first, *_, last = gopro.writes[-4:]
+    assert last[1] - first[1] < gopro.processing_latency
+    assert gopro._ble_requests.outstanding == 0
+    gopro.close()
+
+
+@pytest.mark.asyncio
+async def test_pipelined_requests_honor_busy():
+    GoProBase.HTTP_GET_RETRIES = 1  # type: ignore
+    gopro = MockPipelineGoPro(write_latency=0.005, processing_latency=0.05, maintain_state=True)
+    await gopro.open()
+    assert await gopro.is_ready
+
+    in_flight = [
+        asyncio.create_task(gopro.ble_command.set_third_party_client_info()),
+        asyncio.create_task(gopro.ble_setting.led.set(66)),  # type: ignore
+    ]
+    await asyncio.sleep(0.02)
+    # Camera becomes busy while requests are in flight
+    busy = asyncio.create_task(gopro._update_internal_state(StatusId.BUSY, 1))
+    await asyncio.sleep(0)
+    blocked = asyncio.create_task(gopro.ble_status.encoding.get_value())
+
+    # In flight requests complete but no new requests are sent while busy
+    assert all(result.ok for result in await asyncio.gather(*in_flight))
+    await busy
+    written = len(gopro.writes)
+    await asyncio.sleep(0.1)
+    assert not blocked.done()
+    assert len(gopro.writes) == written
+
+    await gopro._update_internal_state(StatusId.BUSY, 0)
+    assert (await blocked).ok
+    gopro.close()
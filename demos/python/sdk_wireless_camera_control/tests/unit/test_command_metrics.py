@@ -0,0 +1,121 @@
+# test_command_metrics.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of per-command metrics"""
+
+import re
+from typing import Any
+
+import pytest
+import requests
+
+from open_gopro import WirelessGoPro
+from open_gopro.command_metrics import LatencyHistogram, to_openmetrics
+from open_gopro.constants import QueryCmdId
+from open_gopro.gopro_base import GoProBase
+from open_gopro.http_transport import RequestsHttpTransport
+from tests.mocks import (
+    MockCameraBleController,
+    MockHttpGoPro,
+    MockHttpServer,
+    MockWifiController,
+)
+
+SERIAL = "C3501324500711"
+
+
+class FlakyHttpTransport(RequestsHttpTransport):
+    """Fail the next GETs"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.failures = 0
+
+    async def get(self, url: str, *, timeout: float, **kwargs: Any) -> requests.Response:
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("flaky")
+        return await super().get(url, timeout=timeout, **kwargs)
+
+
+def test_histogram_precision():
+    histogram = LatencyHistogram()
+    values = [i * 1e-5 for i in range(1, 10_001)]
+    for value in values:
+        histogram.record(value)
+
+    assert histogram.count == len(values)
+    assert histogram.min == values[0] and histogram.max == values[-1]
+    assert histogram.mean == pytest.approx(sum(values) / len(values))
+    for percentile in (1, 50, 90, 99, 99.9):
+        exact = values[int(len(values) * percentile / 100) - 1]
+        assert histogram.percentile(percentile) == pytest.approx(exact, rel=1 / 2 ** (histogram.SUB_BUCKET_BITS - 1))
+    assert histogram.percentile(100) == values[-1]
+    # Small values are counted exactly
+    assert histogram.cumulative((0.0001, 0.1, 1.0)) == [10, pytest.approx(10_000, rel=0.04), 10_000]
+
+    other = LatencyHistogram()
+    other.record(5.0)
+    histogram.merge(other)
+    assert histogram.count == len(values) + 1 and histogram.max == 5.0
+    with pytest.raises(ValueError):
+        histogram.merge(LatencyHistogram(resolution=1))
+
+
+@pytest.mark.asyncio
+async def test_wireless_metrics():
+    gopro = WirelessGoPro(
+        target=re.compile("GoPro 1234"),
+        ble_adapter=MockCameraBleController,
+        wifi_adapter=MockWifiController,
+        enable_wifi=False,
+        command_metrics=True,
+    )
+    await gopro.open(timeout=1, retries=2)
+    opened = gopro.command_metrics.snapshot()
+    assert opened.commands[(str(QueryCmdId.REG_STATUS_VAL_UPDATE), "parse")].count >= 2
+    gopro.command_metrics.reset()
+    for _ in range(3):
+        assert (await gopro.ble_setting.led.set(2)).ok  # type: ignore
+    await gopro.close()
+
+    snapshot = gopro.command_metrics.snapshot()
+    phases = {phase for command, phase in snapshot.commands if command == "SettingId.LED"}
+    assert phases == {"wait", "slot", "transmit", "response", "parse", "total"}
+    total = snapshot.commands[("SettingId.LED", "total")]
+    assert total.count == 3
+    assert total.max >= snapshot.commands[("SettingId.LED", "response")].max
+    assert {"wait", "hold"} <= {kind for lock, kind in snapshot.locks if lock == "ready_lock"}
+    assert {"messages", "ble_requests", "ble_notifications"} <= set(snapshot.depths)
+    assert not snapshot.retries
+
+    exposition = to_openmetrics({"1234": snapshot})
+    assert exposition.endswith("# EOF\n")
+    assert 'gopro_command_seconds_count{camera="1234",command="SettingId.LED",phase="total"} 3' in exposition
+    assert 'gopro_command_seconds_bucket{camera="1234",command="SettingId.LED",phase="total",le="+Inf"} 3' in exposition
+    assert 'gopro_lock_seconds_count{camera="1234",lock="ready_lock",kind="hold"}' in exposition
+
+
+@pytest.mark.asyncio
+async def test_wired_metrics(monkeypatch):
+    monkeypatch.setattr(GoProBase, "HTTP_GET_RETRIES", 2)
+    with MockHttpServer() as server:
+        transport = FlakyHttpTransport()
+        gopro = MockHttpGoPro(server, SERIAL, http_transport=transport)
+        # Nothing is collected until enabled
+        assert (await gopro.http_command.set_digital_zoom(percent=1)).ok
+        assert gopro.command_metrics.snapshot().commands == {}
+
+        gopro.command_metrics.enabled = True
+        transport.failures = 1
+        assert (await gopro.http_command.set_digital_zoom(percent=2)).ok
+        await gopro.close()
+
+    snapshot = gopro.command_metrics.snapshot()
+    assert {phase for _, phase in snapshot.commands} == {"transmit", "parse", "total"}
+    assert snapshot.retries == {"Camera Digital Zoom": 1}
+    assert snapshot.commands[("Camera Digital Zoom", "total")].count == 1
+    assert gopro.command_metrics.in_flight == 0
+
+    gopro.command_metrics.reset()
+    assert gopro.command_metrics.snapshot().commands == {}
@@ -0,0 +1,111 @@
+# test_connection_profile.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of connection profiles and warm-started opens"""
+
+import json
+import re
+import stat
+from pathlib import Path
+
+import pytest
+
+from open_gopro.ble import Characteristic, CharProps, Descriptor, GattDB, Service, UUIDs
+from open_gopro.connection_profile import ConnectionProfile, ConnectionProfileStore
+from open_gopro.constants import GoProUUID
+from open_gopro.gopro_base import GoProBase
+from tests.mocks import MockWarmStartGoPro
+
+
+@pytest.fixture(autouse=True)
+def single_http_attempt(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(GoProBase, "HTTP_GET_RETRIES", 1)
+
+
+async def open_gopro(profiles: Path, **kwargs) -> MockWarmStartGoPro:
+    gopro = MockWarmStartGoPro(maintain_state=True, connection_profiles=profiles, **kwargs)
+    await gopro.open()
+    gopro.close()
+    return gopro
+
+
+def test_gatt_db_round_trip():
+    db = GattDB(
+        [
+            Service(
+                GoProUUID.S_CONTROL_QUERY,
+                start_handle=1,
+                end_handle=10,
+                init_chars=[
+                    Characteristic(
+                        2,
+                        GoProUUID.CQ_QUERY_RESP,
+                        CharProps.NOTIFY | CharProps.READ,
+                        init_descriptors=[Descriptor(4, UUIDs.CLIENT_CHAR_CONFIG, bytes([1, 0]))],
+                    )
+                ],
+            )
+        ]
+    )
+    rebuilt = GattDB.from_dict(json.loads(json.dumps(db.as_dict())), GoProUUID)
+
+    char = rebuilt.characteristics[GoProUUID.CQ_QUERY_RESP]
+    # Known UUIDs are rebuilt as the same objects so that their names are kept
+    assert next(iter(rebuilt.services)) is GoProUUID.S_CONTROL_QUERY
+    assert rebuilt.handle2uuid(2) is GoProUUID.CQ_QUERY_RESP
+    assert char.props == CharProps.NOTIFY | CharProps.READ
+    assert char.descriptor_handle == 3
+    assert char.cccd_handle == 4
+    assert char.descriptors[UUIDs.CLIENT_CHAR_CONFIG].value == bytes([1, 0])
+
+
+def test_store_find(tmp_path: Path):
+    store = ConnectionProfileStore(tmp_path)
+    store.save(ConnectionProfile("AA:BB: GoPro 1234", address="AA:BB"))
+    store.save(ConnectionProfile("CC:DD: GoPro 5678", address="CC:DD"))
+    (tmp_path / "invalid.json").write_text("{")
+
+    assert store.find().address == "CC:DD"  # type: ignore
+    assert store.find(re.compile("GoPro 1234")).address == "AA:BB"  # type: ignore
+    assert store.find(re.compile("GoPro 0000")) is None
+    store.remove("CC:DD: GoPro 5678")
+    assert store.load("CC:DD: GoPro 5678") is None
+    assert store.find().address == "AA:BB"  # type: ignore
+
+
+def test_store_saves_owner_only(tmp_path: Path):
+    store = ConnectionProfileStore(tmp_path)
+    store.save(ConnectionProfile("AA:BB: GoPro 1234", address="AA:BB", password="password"))
+    (path,) = tmp_path.glob("*.json")
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert store.load("AA:BB: GoPro 1234").password == "password"  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_warm_open_skips_discovery(tmp_path: Path):
+    cold = await open_gopro(tmp_path)
+    assert cold.calls == {"scan": 1, "connect": 1, "discover": 1, "version": 1, "password": 1, "ssid": 1}
+    profile = ConnectionProfileStore(tmp_path).load(cold.identifier)
+    assert profile
+    assert profile.address == MockWarmStartGoPro.ADDRESS
+    assert (profile.api_version, profile.ssid, profile.password) == ("2.0", "ssid", "password")
+
+    warm = await open_gopro(tmp_path)
+    assert warm.calls == {"connect": 1}
+    assert warm.identifier == cold.identifier
+    assert warm._ble.gatt_db.uuid2handle(GoProUUID.CQ_QUERY_RESP) == 3
+    assert {"scan", "discover"}.isdisjoint(warm.open_phase_durations)
+    assert {"scan", "connect", "discover", "init", "wifi"} <= set(cold.open_phase_durations)
+
+
+@pytest.mark.asyncio
+async def test_warm_open_falls_back_to_scan(tmp_path: Path):
+    await open_gopro(tmp_path)
+    gopro = MockWarmStartGoPro(maintain_state=True, connection_profiles=tmp_path)
+    gopro.fail_cached_connect = True
+    await gopro.open()
+    gopro.close()
+
+    # The cached address failed so the camera was scanned for and discovered
+    assert gopro.calls["connect"] == 2
+    assert gopro.calls["scan"] == gopro.calls["discover"] == 1
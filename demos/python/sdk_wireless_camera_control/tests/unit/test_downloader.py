@@ -0,0 +1,119 @@
+# test_downloader.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of the ranged media downloader"""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from open_gopro.downloader import DownloadProgress, RangedDownloader
+from open_gopro.exceptions import DownloadFailed
+from open_gopro.http_transport import RequestsHttpTransport
+from tests.mocks import MockHttpServer
+
+BODY = bytes(range(256)) * 4096  # 1 MiB
+PART_SIZE = 128 * 1024
+FILE_URL = "videos/DCIM/100GOPRO/GX010001.MP4"
+
+
+@pytest.mark.asyncio
+async def test_parallel_ranged_download(tmp_path: Path):
+    reports: list[DownloadProgress] = []
+    with MockHttpServer(body=BODY, delay=0.05) as server:
+        transport = RequestsHttpTransport(max_concurrency=4)
+        downloader = RangedDownloader(transport, part_size=PART_SIZE, progress_cb=reports.append)
+        file = await downloader.download(server.base_url + FILE_URL, tmp_path / "out.mp4", timeout=2)
+        await transport.close()
+
+    assert file.read_bytes() == BODY
+    # Probe plus each part
+    assert len(server.ranges) == 1 + len(BODY) // PART_SIZE
+    assert server.max_in_flight == 4
+    assert reports[-1].downloaded == reports[-1].total == len(BODY)
+    assert reports[-1].throughput > 0
+    assert not RangedDownloader.manifest_path(file).exists()
+
+
+@pytest.mark.asyncio
+async def test_download_without_range_support(tmp_path: Path):
+    with MockHttpServer(body=BODY, supports_ranges=False) as server:
+        transport = RequestsHttpTransport()
+        downloader = RangedDownloader(transport, part_size=PART_SIZE)
+        file = await downloader.download(server.base_url + FILE_URL, tmp_path / "out.mp4", timeout=2)
+        await transport.close()
+
+    assert file.read_bytes() == BODY
+    assert server.requests == 2
+
+
+@pytest.mark.asyncio
+async def test_resume_download(tmp_path: Path):
+    file = tmp_path / "out.mp4"
+    with MockHttpServer(body=BODY) as server:
+        url = server.base_url + FILE_URL
+        # Simulate a previous attempt that completed the first two parts
+        with open(file, "wb") as f:
+            f.write(BODY[: 2 * PART_SIZE])
+            f.truncate(len(BODY))
+        RangedDownloader.manifest_path(file).write_text(
+            json.dumps({"url": url, "size": len(BODY), "part_size": PART_SIZE, "completed": [0, 1]})
+        )
+        reports: list[DownloadProgress] = []
+        transport = RequestsHttpTransport()
+        downloader = RangedDownloader(transport, part_size=PART_SIZE, progress_cb=reports.append)
+        await downloader.download(url, file, timeout=2)
+        await transport.close()
+
+    assert file.read_bytes() == BODY
+    assert (0, PART_SIZE - 1) not in server.ranges
+    assert len(server.ranges) == 1 + len(BODY) // PART_SIZE - 2
+    assert reports[-1].resumed == 2 * PART_SIZE
+
+
+@pytest.mark.asyncio
+async def test_size_mismatch(tmp_path: Path):
+    with MockHttpServer(body=BODY) as server:
+        transport = RequestsHttpTransport()
+        downloader = RangedDownloader(transport, part_size=PART_SIZE)
+        with pytest.raises(DownloadFailed):
+            await downloader.download(
+                server.base_url + FILE_URL, tmp_path / "out.mp4", timeout=2, expected_size=len(BODY) + 1
+            )
+        await transport.close()
+
+
+class FailingPartTransport(RequestsHttpTransport):
+    """Fails one part and records which parts finished"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.finished: list[tuple[int, int]] = []
+
+    async def probe(self, url: str, *, timeout: float, **kwargs: Any) -> tuple[int | None, bool]:
+        return len(BODY), True
+
+    async def download(self, url: str, file: Path, *, timeout: float, **kwargs: Any) -> Path:
+        first, last = kwargs["byte_range"]
+        if first == PART_SIZE:
+            raise DownloadFailed(str(file), "part failed")
+        await asyncio.sleep(0.1)
+        self.finished.append((first, last))
+        return file
+
+
+@pytest.mark.asyncio
+async def test_failed_part_cancels_other_parts(tmp_path: Path):
+    transport = FailingPartTransport()
+    downloader = RangedDownloader(transport, part_size=PART_SIZE)
+    file = tmp_path / "out.mp4"
+    with pytest.raises(DownloadFailed):
+        await downloader.download("http://camera/" + FILE_URL, file, timeout=2)
+    await asyncio.sleep(0.2)
+
+    assert not transport.finished
+    assert json.loads(RangedDownloader.manifest_path(file).read_text())["completed"] == []
+    await transport.close()
@@ -0,0 +1,58 @@
+# test_fleet.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of the multi-camera fleet controller"""
+
+import asyncio
+from contextlib import ExitStack
+
+import pytest
+
+from open_gopro.constants import Toggle
+from open_gopro.fleet import GoProFleet
+from open_gopro.gopro_base import GoProBase
+from tests.mocks import MockHttpGoPro, MockHttpServer, MockWirelessGoPro
+
+
+@pytest.mark.asyncio
+async def test_fleet_ble_fan_out():
+    GoProBase.HTTP_GET_RETRIES = 1  # type: ignore
+    gopros = [MockWirelessGoPro("2.0") for _ in range(5)]
+    fleet = GoProFleet(gopros, max_open_concurrency=2)
+
+    opened = await fleet.open()
+    assert opened.ok
+    assert all(gopro.is_ble_connected for gopro in gopros)
+
+    result = await fleet.ble_command.set_shutter(shutter=Toggle.ENABLE)
+    assert result.ok
+    assert len(result) == 5
+    assert [camera.gopro for camera in result] == gopros
+    assert all(latency >= 0 for latency in result.latencies)
+    assert result.skew >= 0
+
+    # Nested attributes are resolved per camera
+    result = await fleet.ble_setting.led.set(value=0)
+    assert result.ok
+
+    for gopro in gopros:
+        gopro.close()
+
+
+@pytest.mark.asyncio
+async def test_fleet_http_fan_out_with_timeout():
+    with ExitStack() as stack:
+        servers = [stack.enter_context(MockHttpServer(delay=delay)) for delay in (0.0, 0.0, 0.5)]
+        gopros = [MockHttpGoPro(server, serial=f"C35013245007{i}") for i, server in enumerate(servers)]
+        fleet = GoProFleet(gopros, timeout=0.25)
+        result = await fleet.http_command.set_shutter(shutter=Toggle.ENABLE)
+        assert (await fleet.close()).ok
+
+    assert not result.ok
+    assert [camera.ok for camera in result] == [True, True, False]
+    assert result.failed[0].gopro is gopros[2]
+    assert isinstance(result.failed[0].error, asyncio.TimeoutError)
+    assert result.failed[0].identifier == "C350132450072"
+    # The failed camera does not contribute to the skew
+    assert result.skew < 0.25
+    assert result.dispatch_skew < 0.25
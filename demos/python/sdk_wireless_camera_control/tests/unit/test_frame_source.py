@@ -0,0 +1,98 @@
+# test_frame_source.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of the shared memory frame source"""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+from open_gopro import frame_source
+from open_gopro.frame_source import FrameRing, FrameSource
+
+FRAMES = 30
+
+
+def stalled_decode(*_: Any) -> None:
+    """Decoder that is blocked (i.e. waiting for a stalled stream) and never checks whether it should stop"""
+    time.sleep(60)
+
+
+@pytest.fixture(scope="module")
+def video(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Synthetic video whose frames have the brightness of their index * 8"""
+    path = tmp_path_factory.mktemp("video") / "synthetic.avi"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter.fourcc(*"MJPG"), 30, (320, 240))
+    for index in range(FRAMES):
+        writer.write(np.full((240, 320, 3), index * 8, np.uint8))
+    writer.release()
+    return path
+
+
+def test_ring_drops_oldest():
+    ring = FrameRing(slots=3, max_resolution=(8, 4))
+    try:
+        for index in range(5):
+            assert ring.write(np.full((2, 4, 3), index, np.uint8), timestamp=index, pts=index / 30) == index
+        assert ring.published == 5
+        # Overwritten frames can't be read
+        assert ring.read(1) is None
+        frame = ring.read(4)
+        assert frame is not None
+        assert frame.image.shape == (2, 4, 3) and (frame.image == 4).all()
+        assert (frame.sequence, frame.timestamp, frame.pts) == (4, 4.0, pytest.approx(4 / 30))
+        # The frame is a copy
+        ring.write(np.zeros((4, 8, 3), np.uint8), timestamp=5, pts=0)
+        ring.write(np.zeros((4, 8, 3), np.uint8), timestamp=6, pts=0)
+        assert (frame.image == 4).all()
+    finally:
+        ring.close()
+
+
+@pytest.mark.parametrize("use_process", [False, True])
+def test_slow_reader_gets_newest_frames(video: Path, use_process: bool):
+    with FrameSource(str(video), slots=2, max_resolution=(160, 120), use_process=use_process) as source:
+        frames = []
+        while frame := source.read(timeout=5):
+            frames.append(frame)
+            time.sleep(0.01)
+        stats = source.stats
+
+    assert source.is_finished
+    assert stats.decoded == FRAMES
+    assert stats.delivered == len(frames)
+    assert stats.delivered + stats.dropped == FRAMES
+    sequences = [frame.sequence for frame in frames]
+    assert sequences == sorted(sequences) and sequences[-1] == FRAMES - 1
+    # Frames larger than the max resolution are downscaled
+    assert frames[-1].image.shape == (120, 160, 3)
+    assert abs(int(frames[-1].image.mean()) - (FRAMES - 1) * 8) <= 4
+    assert stats.latency.count == len(frames)
+    assert all(frame.timestamp <= time.monotonic() for frame in frames)
+
+
+@pytest.mark.asyncio
+async def test_async_frames(video: Path):
+    with FrameSource(str(video), use_process=False) as source:
+        sequences = [frame.sequence async for frame in source.frames(timeout=5)]
+    assert sequences[-1] == FRAMES - 1
+    assert source.stats.delivered == len(sequences)
+
+
+def test_close_terminates_stalled_decoder(video: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(frame_source, "_decode", stalled_decode)
+    monkeypatch.setattr(FrameSource, "STOP_TIMEOUT", 0.1)
+    source = FrameSource(str(video), use_process=True)
+    source.start()
+    decoder = source._decoder
+    assert decoder is not None
+    start = time.monotonic()
+    source.close()
+    assert time.monotonic() - start < 5
+    assert not decoder.is_alive()
@@ -0,0 +1,73 @@
+# test_http_transport.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of the asynchronous HTTP transport"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from open_gopro.http_transport import RequestsHttpTransport
+from tests.mocks import MockHttpServer
+
+
+@pytest.mark.asyncio
+async def test_get_and_put():
+    with MockHttpServer() as server:
+        transport = RequestsHttpTransport()
+        response = await transport.get(server.base_url + "gopro/camera/state", timeout=1)
+        assert response.ok
+        assert response.json() == {"path": "/gopro/camera/state"}
+        response = await transport.put(server.base_url + "gopro/camera/presets", timeout=1, json={"a": 1})
+        assert response.ok
+        await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_connections_are_reused():
+    with MockHttpServer() as server:
+        transport = RequestsHttpTransport(max_concurrency=1)
+        for _ in range(5):
+            assert (await transport.get(server.base_url + "gopro/version", timeout=1)).ok
+        await transport.close()
+    assert server.requests == 5
+    assert len(server.connections) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped_per_host():
+    with MockHttpServer(delay=0.1) as server:
+        transport = RequestsHttpTransport(max_concurrency=2)
+        await asyncio.gather(*[transport.get(server.base_url + "gopro/version", timeout=2) for _ in range(6)])
+        await transport.close()
+    assert server.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_event_loop_is_not_blocked():
+    with MockHttpServer(delay=0.5) as server:
+        transport = RequestsHttpTransport()
+        request = asyncio.create_task(transport.get(server.base_url + "gopro/version", timeout=2))
+        start = time.perf_counter()
+        await asyncio.sleep(0.05)
+        assert time.perf_counter() - start < 0.4
+        assert (await request).ok
+        await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_download(tmp_path: Path):
+    with MockHttpServer(body=b"BINARY DATA" * 10000) as server:
+        transport = RequestsHttpTransport(chunk_size=1024)
+        file = await transport.download(
+            server.base_url + "videos/DCIM/100GOPRO/GX010001.MP4", tmp_path / "out.mp4", timeout=1
+        )
+        await transport.close()
+    assert file.read_bytes() == b"BINARY DATA" * 10000
+
+
+def test_invalid_concurrency():
+    with pytest.raises(ValueError):
+        RequestsHttpTransport(max_concurrency=0)
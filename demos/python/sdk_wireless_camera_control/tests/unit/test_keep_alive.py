@@ -0,0 +1,97 @@
+# test_keep_alive.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of the shared keep alive scheduler"""
+
+import asyncio
+import re
+import time
+
+import pytest
+
+from open_gopro import WirelessGoPro
+from open_gopro.constants import GoProUUID
+from open_gopro.keep_alive import KeepAliveScheduler
+from tests.mocks import MockCameraBleController, MockWifiController
+
+
+class FakeCamera:
+    """Only what the scheduler uses from a WirelessGoPro"""
+
+    def __init__(self, identifier: str, ok: bool = True) -> None:
+        self.identifier = identifier
+        self.is_ble_connected = True
+        self._last_exchange = time.monotonic()
+        self.ok = ok
+        self.keep_alives = 0
+
+    async def _send_keep_alive(self) -> bool:
+        self.keep_alives += 1
+        self._last_exchange = time.monotonic()
+        return self.ok
+
+
+@pytest.mark.asyncio
+async def test_scheduler_suppresses_busy_cameras():
+    scheduler = KeepAliveScheduler(interval=0.1, tick=0.01)
+    idle, busy, failing = FakeCamera("idle"), FakeCamera("busy"), FakeCamera("failing", ok=False)
+    for camera in (idle, busy, failing):
+        scheduler.add(camera)  # type: ignore
+    assert scheduler.stats.cameras == 3
+
+    end = time.monotonic() + 0.5
+    while time.monotonic() < end:
+        busy._last_exchange = time.monotonic()
+        await asyncio.sleep(0.01)
+
+    assert busy.keep_alives == 0
+    # The keep alive is due between (1 - jitter) * interval and interval after the last exchange (plus a tick)
+    assert 3 <= idle.keep_alives <= 6
+    stats = scheduler.stats
+    assert stats.sent == idle.keep_alives + failing.keep_alives
+    assert stats.failed == failing.keep_alives
+    assert stats.suppressed >= 4
+
+    for camera in (idle, busy, failing):
+        scheduler.remove(camera)  # type: ignore
+    assert scheduler.stats.cameras == 0
+    assert scheduler._task is None
+    sent = scheduler.stats.sent
+    await asyncio.sleep(0.2)
+    assert scheduler.stats.sent == sent
+
+
+@pytest.mark.asyncio
+async def test_wireless_gopros_share_scheduler():
+    scheduler = KeepAliveScheduler(interval=0.1, tick=0.01)
+    gopros = [
+        WirelessGoPro(
+            target=re.compile("GoPro 1234"),
+            ble_adapter=MockCameraBleController,
+            wifi_adapter=MockWifiController,
+            enable_wifi=False,
+            keep_alive_scheduler=scheduler,
+        )
+        for _ in range(2)
+    ]
+    for gopro in gopros:
+        await gopro.open(timeout=1, retries=2)
+    assert scheduler.stats.cameras == 2
+    assert not hasattr(gopros[0], "_keep_alive_task")
+
+    # Keep alives don't wait for the camera to be ready
+    await gopros[0]._ready_lock.acquire()
+    assert await asyncio.wait_for(gopros[0]._send_keep_alive(), 1)
+    gopros[0]._ready_lock.release()
+
+    await asyncio.sleep(0.35)
+    for gopro in gopros:
+        keep_alives = [data for uuid, data in gopro._ble._controller.writes if data == gopro._keep_alive_packets[0]]
+        assert all(uuid == GoProUUID.CQ_SETTINGS for uuid, data in gopro._ble._controller.writes if data in keep_alives)
+        assert len(keep_alives) >= 2
+    assert scheduler.stats.sent >= 4 and not scheduler.stats.failed
+
+    for gopro in gopros:
+        await gopro.close()
+    assert scheduler.stats.cameras == 0
+    assert scheduler._task is None
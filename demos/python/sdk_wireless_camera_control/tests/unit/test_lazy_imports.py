@@ -0,0 +1,55 @@
+# test_lazy_imports.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of lazy package exports and deferred global parsers
+
+Each import is checked in a new interpreter since the test session has already imported the entire package.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parents[2]
+
+
+def loaded_after(statements: str, modules: list[str]) -> dict[str, bool]:
+    script = f"import json, sys\n{statements}\nprint(json.dumps({{m: m in sys.modules for m in {modules!r}}}))"
+    output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True, capture_output=True, text=True)
+    return json.loads(output.stdout.splitlines()[-1])
+
+
+def test_import_package_is_lazy():
+    loaded = loaded_after("import open_gopro", ["open_gopro.gopro_base", "open_gopro.models", "rich", "requests"])
+    assert not any(loaded.values())
+
+
+def test_wired_does_not_load_ble():
+    loaded = loaded_after(
+        "from open_gopro import WiredGoPro",
+        ["bleak", "open_gopro.api.ble_commands", "open_gopro.api.ble_settings", "open_gopro.proto.cohn_pb2"],
+    )
+    assert not any(loaded.values())
+
+
+def test_parsers_added_on_first_use():
+    statements = """
+from open_gopro.api import WiredApi
+from open_gopro.constants import SettingId
+from open_gopro.parser_interface import GlobalParsers
+assert "open_gopro.api.ble_settings" not in sys.modules
+assert GlobalParsers.get_query_container(SettingId.LED)(2) == 2
+"""
+    assert loaded_after(statements, ["open_gopro.api.ble_settings"]) == {"open_gopro.api.ble_settings": True}
+
+
+def test_lazy_exports():
+    from open_gopro import proto
+
+    assert "RequestSetTurboActive" in dir(proto)
+    assert proto.RequestSetTurboActive.DESCRIPTOR.name == "RequestSetTurboActive"
+    with pytest.raises(AttributeError):
+        proto.DoesNotExist  # pylint: disable=pointless-statement
@@ -1,6 +1,8 @@
 # test_logging.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
 # This copyright was auto-generated on Wed Mar 27 22:05:49 UTC 2024
 
+import http.client
+import logging
 from typing import Generic, TypeVar
 
 import construct
@@ -26,6 +28,7 @@ from open_gopro.constants import (
     SettingId,
     StatusId,
 )
+from open_gopro.logger import DeferredStr, set_stream_logging_level
 
 dummy_kwargs = {"first": 1, "second": 2}
 
@@ -241,3 +244,42 @@ async def test_http_setting():
     assert d.pop("endpoint") == r"gopro/camera/setting?setting={setting}&option={option}"
     assert_kwargs(d)
     assert not d
+
+
+def test_deferred_str_only_built_when_emitted():
+    built: list[str] = []
+
+    def build(value: int, suffix: str) -> str:
+        built.append(f"{value}{suffix}")
+        return built[-1]
+
+    class Capture(logging.Handler):
+        def __init__(self) -> None:
+            super().__init__(logging.WARNING)
+            self.messages: list[str] = []
+
+        def emit(self, record: logging.LogRecord) -> None:
+            self.messages.append(record.getMessage())
+
+    logger = logging.getLogger("test_deferred_str")
+    logger.propagate = False
+    logger.addHandler(handler := Capture())
+    logger.info(DeferredStr(build, 1, suffix="!"))
+    logger.info("value: %s", DeferredStr(build, 2, suffix="?"))
+    assert not built
+
+    logger.warning(DeferredStr(build, 3, suffix="!"))
+    logger.warning("value: %s", DeferredStr(build, 4, suffix="?"))
+    assert built == ["3!", "4?"]
+    assert handler.messages == ["3!", "value: 4?"]
+
+
+def test_http_debug_follows_handler_levels():
+    # The test session only streams errors
+    assert http.client.HTTPConnection.debuglevel == 0
+    set_stream_logging_level(logging.DEBUG)
+    try:
+        assert http.client.HTTPConnection.debuglevel == 1
+    finally:
+        set_stream_logging_level(logging.ERROR)
+    assert http.client.HTTPConnection.debuglevel == 0
@@ -0,0 +1,61 @@
+# test_media_catalog.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of the persistent media catalog"""
+
+from pathlib import Path
+
+from open_gopro.media_catalog import MediaCatalog
+from open_gopro.models import MediaList
+
+
+def build_media_list(names: list[str], mod: str = "1657013171") -> MediaList:
+    return MediaList(
+        id="1",
+        media=[{"d": "100GOPRO", "fs": [{"n": name, "cre": "1657013171", "mod": mod, "s": "10"} for name in names]}],
+    )
+
+
+def test_incremental_sync(tmp_path: Path):
+    database = tmp_path / "catalog.db"
+    catalog = MediaCatalog(database, "camera")
+    assert catalog.last_sync == 0
+
+    diff = catalog.sync(build_media_list(["GX010001.MP4", "GX010002.MP4"]))
+    assert [item.filename for item in diff.added] == ["100GOPRO/GX010001.MP4", "100GOPRO/GX010002.MP4"]
+    assert "100GOPRO/GX010001.MP4" in catalog
+    first_sync = catalog.last_sync
+
+    # Nothing changed
+    assert not catalog.sync(build_media_list(["GX010001.MP4", "GX010002.MP4"]))
+
+    # One new file, one removed file
+    media_list = build_media_list(["GX010002.MP4", "GX010003.MP4"])
+    diff = catalog.diff(media_list)
+    assert [item.filename for item in diff.added] == ["100GOPRO/GX010003.MP4"]
+    assert diff.removed == ["100GOPRO/GX010001.MP4"]
+    catalog.sync(media_list)
+    assert "100GOPRO/GX010001.MP4" not in catalog
+    assert catalog.added_since(first_sync) == ["100GOPRO/GX010003.MP4"]
+    catalog.close()
+
+    # Catalog persists and is independent per camera
+    catalog = MediaCatalog(database, "camera")
+    assert len(catalog) == 2
+    assert catalog.last_sync == 3
+    assert catalog.added_since(0) == ["100GOPRO/GX010002.MP4", "100GOPRO/GX010003.MP4"]
+    assert not len(MediaCatalog(database, "other camera"))
+
+
+def test_modified_item():
+    catalog = MediaCatalog(":memory:", "camera")
+    catalog.sync(build_media_list(["GX010001.MP4"]))
+    media_list = build_media_list(["GX010001.MP4"], mod="1657013999")
+    item = media_list.files[0]
+    assert item.filename in catalog
+    assert item not in catalog
+    diff = catalog.sync(media_list)
+    assert diff.modified == [item]
+    assert item in catalog
+    # A modified item is not new
+    assert catalog.added_since(1) == []
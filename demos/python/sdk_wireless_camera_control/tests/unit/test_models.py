@@ -5,6 +5,7 @@ from typing import Final
 
 from open_gopro.constants import constants
 from open_gopro.models import (
+    CompactMediaList,
     GroupedMediaItem,
     HttpInvalidSettingResponse,
     MediaItem,
@@ -144,6 +145,33 @@ def test_media_list():
     assert media_list.files[-1].raw == "1"
 
 
+def test_media_list_lookup():
+    media_list = MediaList(**MEDIA_LIST)
+    item = media_list.files[3]
+    assert item in media_list
+    assert item.filename in media_list
+    assert media_list.get(item.filename) is item
+    assert "100GOPRO/GX019999.MP4" not in media_list
+    assert media_list.get("100GOPRO/GX019999.MP4") is None
+
+
+def test_compact_media_list():
+    compact = CompactMediaList.from_json(MEDIA_LIST)
+    media_list = MediaList(**MEDIA_LIST)
+    assert len(compact) == len(media_list.files)
+    assert compact.paths == [item.filename for item in media_list.files]
+    assert compact.sizes[0] == int(media_list.files[0].file_size)
+    assert compact.group_ids.count(None) == len(compact) - 2
+    # Items are only built when accessed
+    assert compact._items.count(None) == len(compact)
+    assert compact.get("100GOPRO/GX010001.MP4") == media_list.files[0]
+    assert compact._items.count(None) == len(compact) - 1
+    assert compact.files == media_list.files
+    assert isinstance(compact[9], GroupedMediaItem)
+    assert media_list.files[5] in compact
+    assert "100GOPRO/GX019999.MP4" not in compact
+
+
 VIDEO_METADATA: Final = {
     "cre": "1656927817",
     "s": "27469309",
@@ -0,0 +1,87 @@
+# test_offload.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of the bulk media offloader"""
+
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from open_gopro.offload import MediaOffloader
+from tests.mocks import MockHttpGoPro, MockHttpServer
+
+
+def build_files(count: int) -> dict[str, bytes]:
+    return {f"100GOPRO/GX01{i:04}.MP4": bytes([i]) * (1000 + i) for i in range(count)}
+
+
+@pytest.mark.asyncio
+async def test_offload_multiple_cameras(tmp_path: Path):
+    with ExitStack() as stack:
+        servers = [stack.enter_context(MockHttpServer(files=build_files(3), delay=0.02)) for _ in range(3)]
+        gopros = [MockHttpGoPro(server, serial=f"C35013245007{i}") for i, server in enumerate(servers)]
+        expected = {gopro.identifier: dict(gopro.server.files) for gopro in gopros}
+
+        # Pretend the first camera's first file was already offloaded
+        cataloged = tmp_path / gopros[0].identifier / "100GOPRO/GX010000.MP4"
+        cataloged.parent.mkdir(parents=True)
+        cataloged.write_bytes(expected[gopros[0].identifier]["100GOPRO/GX010000.MP4"])
+
+        offloader = MediaOffloader(gopros, tmp_path, max_concurrency=4, per_camera_concurrency=1, delete_after=True)
+        stats = await offloader.run()
+
+        assert stats.files == 8
+        assert stats.failed == 0
+        assert stats.cameras[gopros[0].identifier].skipped == 1
+        assert stats.throughput > 0
+        for gopro in gopros:
+            for path, contents in expected[gopro.identifier].items():
+                assert (tmp_path / gopro.identifier / path).read_bytes() == contents
+            # Turbo mode was enabled first and disabled last
+            assert gopro.server.paths[1] == "/gopro/media/turbo_transfer?p=1"
+            assert gopro.server.paths[-1] == "/gopro/media/turbo_transfer?p=0"
+            assert gopro.server.max_in_flight == 1
+        # Downloaded files were deleted. The skipped file was not.
+        assert list(gopros[0].server.files) == ["100GOPRO/GX010000.MP4"]
+        assert not gopros[1].server.files
+
+        # Everything left is now cataloged
+        stats = await MediaOffloader(gopros, tmp_path, turbo=False).run()
+        assert stats.files == 0
+        assert stats.cameras[gopros[0].identifier].skipped == 1
+
+
+@pytest.mark.asyncio
+async def test_offload_failure_is_recorded(tmp_path: Path):
+    with MockHttpServer(files=build_files(2)) as server:
+        gopro = MockHttpGoPro(server, serial="C3501324500711")
+        # Report the wrong size for one file so that verification fails
+        media_list = server.media_list()
+        media_list["media"][0]["fs"][1]["s"] = "1"
+        server.media_list = lambda: media_list
+        offloader = MediaOffloader([gopro], tmp_path, delete_after=True)
+        stats = await offloader.run()
+
+    assert stats.files == 1
+    assert stats.cameras[gopro.identifier].failed == ["100GOPRO/GX010001.MP4"]
+    assert "100GOPRO/GX010001.MP4" in server.files
+
+
+@pytest.mark.asyncio
+async def test_failed_camera_does_not_stop_offload(tmp_path: Path):
+    with ExitStack() as stack:
+        servers = [stack.enter_context(MockHttpServer(files=build_files(2))) for _ in range(3)]
+        gopros = [MockHttpGoPro(server, serial=f"C35013245007{i}") for i, server in enumerate(servers)]
+
+        async def drop_off_network(*_: Any, **__: Any) -> None:
+            raise ConnectionError("Camera is unreachable")
+
+        gopros[1].http_command.get_media_list = drop_off_network  # type: ignore
+        stats = await MediaOffloader(gopros, tmp_path).run()
+
+    assert stats.files == 4
+    assert stats.errors == {gopros[1].identifier: repr(ConnectionError("Camera is unreachable"))}
+    for gopro in (gopros[0], gopros[2]):
+        assert stats.cameras[gopro.identifier].files == 2 and not stats.cameras[gopro.identifier].error
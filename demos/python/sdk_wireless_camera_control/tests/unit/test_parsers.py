@@ -4,15 +4,22 @@
 import pytest
 
 from open_gopro.api.ble_commands import BleCommands
+from open_gopro.api.ble_settings import BleSettings
+from open_gopro.api.ble_statuses import BleStatuses
 from open_gopro.communicator_interface import GoProBle
-from open_gopro.constants import CmdId
+from open_gopro.constants import CmdId, SettingId, StatusId
 from open_gopro.models.network_scan_responses import (
     GoProAdvData,
     adv_data_struct,
     manuf_data_struct,
     scan_response_struct,
 )
-from open_gopro.parser_interface import GlobalParsers, Parser
+from open_gopro.parser_interface import (
+    BytesParser,
+    BytesTransformer,
+    GlobalParsers,
+    Parser,
+)
 from open_gopro.parsers.bytes import BytesParserBuilder, ProtobufByteParser
 from open_gopro.proto import EnumResultGeneric, ResponseGetApEntries
 
@@ -25,6 +32,23 @@ def test_version_response(mock_ble_communicator: GoProBle):
     assert parser.parse(raw_bytes) == "1.2"
 
 
+class StripFirstByte(BytesTransformer):
+    def transform(self, data: bytes) -> bytes:
+        return data[1:]
+
+
+class HexJsonAdapter(BytesParser[dict]):
+    def parse(self, data: bytes) -> dict:
+        return {"hex": data.hex()}
+
+
+def test_byte_transformers_are_chained():
+    parser = Parser[dict](byte_transformers=[StripFirstByte(), StripFirstByte()], byte_json_adapter=HexJsonAdapter())
+    # Each transformer receives the output of the previous one
+    assert parser.parse(bytes([1, 2, 3, 4])) == {"hex": "0304"}
+    assert parser.parse(memoryview(bytes([1, 2, 3, 4]))) == {"hex": "0304"}
+
+
 def test_recursive_protobuf_proxying():
     scan1 = ResponseGetApEntries.ScanEntry(
         ssid="one", signal_strength_bars=0, signal_frequency_mhz=0, scan_entry_flags=0
@@ -216,3 +240,40 @@ def test_serial_number_invalid_model_id(mock_gopro_adv_data: GoProAdvData):
 
     # THEN
     assert serial_number == "XXXX0123456789"
+
+
+def test_decode_table(mock_ble_communicator: GoProBle):
+    BleStatuses(mock_ble_communicator)
+    BleSettings(mock_ble_communicator)
+    for id_type in (StatusId, SettingId):
+        table = GlobalParsers.get_decode_table(id_type)
+        assert len(table) == 256
+        for raw_id, entry in enumerate(table):
+            if raw_id not in id_type:
+                assert entry is None
+                continue
+            identifier, decode = entry
+            assert identifier is id_type(raw_id)
+            if not (parser := GlobalParsers.get_parser(identifier)):
+                assert decode is None
+                continue
+            # The compiled decoder must agree with the full parser, including which values are invalid
+            for data in (b"\x00", b"\x01", b"\x05", b"\x00\x00\x00\x2a", b"\xff\xff\xff\xff"):
+                try:
+                    expected = parser.parse(data)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    with pytest.raises(type(e) if isinstance(e, ValueError) else Exception):
+                        decode(memoryview(data))
+                    continue
+                assert decode(memoryview(data)) == expected
+
+
+def test_protobuf_parser_options():
+    response = ResponseGetApEntries(result=EnumResultGeneric.RESULT_SUCCESS, scan_id=1)
+    raw = response.SerializeToString()
+    parsed = ProtobufByteParser(ResponseGetApEntries).parse(raw)
+    assert parsed.result == EnumResultGeneric.RESULT_SUCCESS
+    assert parsed.entries is None
+    # Enums are translated once per protobuf enum
+    assert type(parsed.result) is type(ProtobufByteParser(ResponseGetApEntries).parse(raw).result)
+    assert ProtobufByteParser(ResponseGetApEntries, raw=True).parse(raw) == response
@@ -5,9 +5,11 @@
 
 # pylint: disable= redefined-outer-name
 
+import pytest
 import requests
 import requests_mock
 
+from open_gopro.communicator_interface import GoProBle
 from open_gopro.constants import (
     ActionId,
     CmdId,
@@ -17,6 +19,7 @@ from open_gopro.constants import (
     SettingId,
     StatusId,
 )
+from open_gopro.exceptions import ResponseParseError
 from open_gopro.parser_interface import Parser
 from open_gopro.parsers.json import CameraStateJsonParser
 from open_gopro.parsers.response import (
@@ -485,6 +488,41 @@ def test_complex_write_command():
     assert len(str(r)) > 0
 
 
+def test_extended_16_reassembly():
+    # Reassemble the recorded response to get its payload
+    builder = BleRespBuilder()
+    builder.set_uuid(GoProUUID.CQ_QUERY_RESP)
+    for idx in range(0, len(test_complex_write_receive), 20):
+        builder.accumulate(test_complex_write_receive[idx : idx + 20])
+    expected = builder.build().data
+    payload = bytes(builder._packet)
+    # Repeat the parameters so that the response needs an extended 16 bit length header
+    payload = payload[:2] + payload[2:] * (8192 // (len(payload) - 2) + 1)
+    assert len(payload) > 8192
+
+    builder = BleRespBuilder()
+    builder.set_uuid(GoProUUID.CQ_QUERY_RESP)
+    for packet in GoProBle._fragment(payload):
+        assert not builder.is_finished_accumulating
+        builder.accumulate(packet)
+    assert builder.is_finished_accumulating
+    assert builder._packet == payload
+    r = builder.build()
+    assert r.ok
+    assert r.data == expected
+
+
+def test_reserved_header_is_rejected():
+    builder = BleRespBuilder()
+    builder.set_uuid(GoProUUID.CQ_COMMAND_RESP)
+    with pytest.raises(ResponseParseError):
+        builder.accumulate(bytearray([0x60, 0x05, 0x00]))
+    # The builder can still accumulate a valid response afterwards
+    builder.accumulate(test_write_recieve)
+    assert builder.is_finished_accumulating
+    assert builder.build().identifier is CmdId.SLEEP
+
+
 test_json = {
     "status": {
         "1": 1,
@@ -7,7 +7,14 @@ import uuid
 
 import pytest
 
-from open_gopro.ble import BleUUID, Characteristic, Descriptor, GattDB, Service
+from open_gopro.ble import (
+    BleUUID,
+    Characteristic,
+    CharProps,
+    Descriptor,
+    GattDB,
+    Service,
+)
 from open_gopro.ble.services import BLE_BASE_UUID, UUIDs, UUIDsMeta
 
 
@@ -120,3 +127,36 @@ def test_gatt_db(mock_gatt_db: GattDB):
     assert uuids == set([mock_gatt_db.handle2uuid(handle) for handle in handles])
 
     mock_gatt_db.dump_to_csv()
+
+
+def test_gatt_db_indexes(mock_gatt_db: GattDB):
+    with pytest.raises(KeyError):
+        mock_gatt_db.handle2uuid(100)
+    assert UUIDs.INF_MODEL_NUM not in mock_gatt_db.characteristics
+
+    # Indexes are rebuilt when services are set
+    mock_gatt_db.services = [
+        Service(UUIDs.S_DEV_INFO, 99, init_chars=[Characteristic(100, UUIDs.INF_MODEL_NUM, CharProps.READ)])
+    ]
+    assert mock_gatt_db.handle2uuid(100) == UUIDs.INF_MODEL_NUM
+    assert mock_gatt_db.uuid2handle(UUIDs.INF_MODEL_NUM) == 100
+
+    # ...and when characteristics are added to a service in the table once reindexed
+    mock_gatt_db.services[UUIDs.S_DEV_INFO].characteristics = [
+        Characteristic(102, UUIDs.INF_SERIAL_NUM, CharProps.READ)
+    ]
+    assert UUIDs.INF_SERIAL_NUM not in mock_gatt_db.characteristics
+    mock_gatt_db.reindex()
+    assert mock_gatt_db.characteristics[UUIDs.INF_SERIAL_NUM].handle == 102
+    assert len(mock_gatt_db.characteristics) == 3
+
+
+def test_gatt_db_compact_form(mock_gatt_db: GattDB):
+    data = mock_gatt_db.as_dict()
+    # Each UUID is only stored once
+    assert len(data["uuids"]) == len({u for u, _ in data["uuids"]})
+    rebuilt = GattDB.from_dict(data)
+    assert rebuilt.as_dict() == data
+    for char in mock_gatt_db.characteristics.values():
+        assert rebuilt.handle2uuid(char.handle) == char.uuid
+        assert rebuilt.characteristics[char.uuid].descriptors.keys() == char.descriptors.keys()
@@ -0,0 +1,125 @@
+# test_state_mirror.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of the push notification camera state mirror"""
+
+import asyncio
+
+import pytest
+
+from open_gopro.api.builders import BleStatusFacade
+from open_gopro.constants import GoProUUID, QueryCmdId, SettingId, StatusId
+from open_gopro.constants.settings import Led
+from open_gopro.gopro_base import GoProBase
+from open_gopro.state_mirror import CameraStateMirror
+from tests.mocks import MockPipelineGoPro
+
+
+async def build_gopro() -> MockPipelineGoPro:
+    GoProBase.HTTP_GET_RETRIES = 1  # type: ignore
+    gopro = MockPipelineGoPro(write_latency=0.001, processing_latency=0.005, maintain_state=True)
+    await gopro.open()
+    return gopro
+
+
+async def push(gopro: MockPipelineGoPro, identifier: QueryCmdId, values: dict[StatusId | SettingId, int]) -> None:
+    payload = bytearray([identifier.value, 0x00])
+    for key, value in values.items():
+        payload += bytearray([key.value, 0x01, value])
+    gopro._notification_handler(
+        MockPipelineGoPro._RESPONSE_HANDLES[GoProUUID.CQ_QUERY], bytearray([len(payload)]) + payload
+    )
+    # Notifications are handled asynchronously
+    await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_reads_answered_from_pushes():
+    gopro = await build_gopro()
+    mirror = CameraStateMirror(gopro)
+    await mirror.attach()
+    assert gopro.state_mirror is mirror and mirror.is_live
+    await push(gopro, QueryCmdId.STATUS_VAL_PUSH, {StatusId.OVERHEATING: 1})
+    await push(gopro, QueryCmdId.SETTING_VAL_PUSH, {SettingId.LED: Led.ALL_OFF})
+    # Capabilities are notified with the same setting ID as values
+    await push(gopro, QueryCmdId.SETTING_CAPABILITY_PUSH, {SettingId.LED: Led.ON})
+    written = len(gopro.writes)
+
+    assert (await gopro.ble_status.overheating.get_value()).data is True
+    assert (await gopro.ble_setting.led.get_value()).data is Led.ALL_OFF
+    assert (await gopro.ble_setting.led.get_capabilities_values()).data == [Led.ON]
+    assert len(gopro.writes) == written
+    assert (mirror.hits, mirror.misses) == (3, 0)
+    assert mirror.snapshot.settings[SettingId.LED] is Led.ALL_OFF
+
+    await mirror.detach()
+    assert gopro.state_mirror is None
+    gopro.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_miss_read_from_camera():
+    gopro = await build_gopro()
+    mirror = CameraStateMirror(gopro)
+    await mirror.attach()
+    written = len(gopro.writes)
+
+    # Never received so it is read from the camera, which then populates the mirror
+    assert (await gopro.ble_status.encoding.get_value()).data is False
+    assert len(gopro.writes) == written + 1
+    assert (await gopro.ble_status.encoding.get_value()).data is False
+    assert len(gopro.writes) == written + 1
+    assert (mirror.hits, mirror.misses) == (1, 1)
+    gopro.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_values_read_from_camera():
+    gopro = await build_gopro()
+    mirror = CameraStateMirror(gopro, max_staleness=0.05)
+    await mirror.attach()
+    await push(gopro, QueryCmdId.STATUS_VAL_PUSH, {StatusId.OVERHEATING: 1})
+    assert (await gopro.ble_status.overheating.get_value()).data is True
+    await asyncio.sleep(0.1)
+    # The camera responds with 0
+    assert (await gopro.ble_status.overheating.get_value()).data is False
+    assert (mirror.hits, mirror.misses) == (1, 1)
+    gopro.close()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_push():
+    gopro = await build_gopro()
+    mirror = CameraStateMirror(gopro)
+    await mirror.attach()
+    version = mirror.version
+
+    waiter = asyncio.create_task(mirror.wait_for(lambda state: bool(state.statuses.get(StatusId.AP_MODE))))
+    await push(gopro, QueryCmdId.STATUS_VAL_PUSH, {StatusId.AP_MODE: 0})
+    assert not waiter.done()
+    await push(gopro, QueryCmdId.STATUS_VAL_PUSH, {StatusId.AP_MODE: 1})
+    snapshot = await asyncio.wait_for(waiter, 1)
+    assert snapshot.statuses[StatusId.AP_MODE] is True
+    assert snapshot.version == mirror.version == version + 2
+
+    # Pushes of unchanged values do not change the version
+    await push(gopro, QueryCmdId.STATUS_VAL_PUSH, {StatusId.AP_MODE: 1})
+    assert mirror.version == snapshot.version
+    with pytest.raises(asyncio.TimeoutError):
+        await mirror.wait_for(lambda state: not state.statuses[StatusId.AP_MODE], timeout=0.05)
+    gopro.close()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_stops_local_reads():
+    gopro = await build_gopro()
+    mirror = CameraStateMirror(gopro)
+    await mirror.attach()
+    await push(gopro, QueryCmdId.STATUS_VAL_PUSH, {StatusId.OVERHEATING: 1})
+    gopro._disconnect_handler(None)
+    assert not mirror.is_live
+    message = BleStatusFacade.BleStatusMessageBase(
+        GoProUUID.CQ_QUERY, QueryCmdId.GET_STATUS_VAL, StatusId.OVERHEATING, lambda *_: bytearray()
+    )
+    assert mirror._serve(message) is None
+    gopro.close()
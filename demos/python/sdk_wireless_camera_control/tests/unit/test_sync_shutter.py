@@ -0,0 +1,99 @@
+# test_sync_shutter.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of the synchronized shutter"""
+
+from typing import Any
+
+import pytest
+
+from open_gopro.constants import StatusId, Toggle
+from open_gopro.exceptions import InvalidConfiguration
+from open_gopro.gopro_base import GoProBase
+from open_gopro.sync_shutter import SkewStats, SynchronizedShutter
+from tests.mocks import MockShutterGoPro, MockWiredGoPro
+
+WRITE_LATENCY = 0.01
+ENCODING_LATENCIES = [0.02, 0.05, 0.08]
+
+
+def test_skew_stats():
+    stats = SkewStats.from_times([2.0, None, 1.0, 1.5])
+    assert stats.offsets == [1.0, 0.0, 0.5]
+    assert stats.max == 1.0
+    assert stats.mean == 0.5
+    assert stats.as_dict()["count"] == 3
+
+
+def test_requires_wireless_gopros():
+    with pytest.raises(InvalidConfiguration):
+        SynchronizedShutter([MockWiredGoPro("2.0")])
+
+
+@pytest.mark.asyncio
+async def test_synchronized_capture():
+    GoProBase.HTTP_GET_RETRIES = 1  # type: ignore
+    gopros = [MockShutterGoPro(WRITE_LATENCY, latency) for latency in ENCODING_LATENCIES]
+    for gopro in gopros:
+        await gopro.open()
+
+    shutter = SynchronizedShutter(gopros)
+    await shutter.arm()
+    assert shutter.is_armed
+    result = await shutter.fire()
+    assert not shutter.is_armed
+
+    assert result.ok
+    # All writes are released together
+    assert result.write_skew.max < 0.005
+    assert all(latency >= 0 for latency in result.as_dict()["release_latency"])
+    # The measured encoding skew reflects each camera's encoding latency
+    assert all(camera.encoding_started is not None for camera in result.cameras)
+    expected = [latency - ENCODING_LATENCIES[0] for latency in ENCODING_LATENCIES]
+    assert result.encoding_skew.offsets == pytest.approx(expected, abs=0.01)
+
+    for gopro in gopros:
+        gopro.close()
+
+
+@pytest.mark.asyncio
+async def test_synchronized_stop_does_not_wait_for_encoding():
+    GoProBase.HTTP_GET_RETRIES = 1  # type: ignore
+    gopros = [MockShutterGoPro(WRITE_LATENCY, 0.01) for _ in range(2)]
+    for gopro in gopros:
+        await gopro.open()
+
+    result = await SynchronizedShutter(gopros).capture(Toggle.DISABLE)
+    assert result.ok
+    assert result.encoding_skew.offsets == []
+
+    for gopro in gopros:
+        gopro.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_arm_releases_cameras():
+    GoProBase.HTTP_GET_RETRIES = 1  # type: ignore
+    gopros = [MockShutterGoPro(WRITE_LATENCY, 0.01) for _ in range(3)]
+    for gopro in gopros:
+        await gopro.open()
+    register = gopros[1].ble_status.encoding.register_value_update
+
+    async def fail_to_register(*_: Any) -> None:
+        raise ConnectionError("Camera disconnected")
+
+    gopros[1].ble_status.encoding.register_value_update = fail_to_register  # type: ignore
+    shutter = SynchronizedShutter(gopros, ready_timeout=1)
+    with pytest.raises(ConnectionError):
+        await shutter.arm()
+    assert not shutter.is_armed
+    assert not any(gopro._listeners.get(StatusId.ENCODING) for gopro in gopros)
+
+    # The cameras that were prepared were released so arming again doesn't wait for them
+    gopros[1].ble_status.encoding.register_value_update = register  # type: ignore
+    result = await shutter.capture()
+    assert result.ok
+    assert not any(gopro._listeners.get(StatusId.ENCODING) for gopro in gopros)
+
+    for gopro in gopros:
+        gopro.close()
@@ -0,0 +1,141 @@
+# test_wire_trace.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of wire trace recording and replay"""
+
+import asyncio
+import functools
+import math
+import re
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from open_gopro import WiredGoPro, WirelessGoPro
+from open_gopro.ble.adapters import ReplayBleController
+from open_gopro.constants import GoProUUID, QueryCmdId, StatusId
+from open_gopro.exceptions import DownloadFailed
+from open_gopro.wire_trace import (
+    MAGIC,
+    FrameKind,
+    ReplayHttpTransport,
+    WireTraceRecorder,
+    read_trace,
+)
+from tests.mocks import (
+    MockCameraBleController,
+    MockHttpGoPro,
+    MockHttpServer,
+    MockWifiController,
+)
+
+SERIAL = "C3501324500711"
+
+
+def build_wireless_gopro(ble_adapter: Any, **kwargs: Any) -> WirelessGoPro:
+    return WirelessGoPro(
+        target=re.compile("GoPro 1234"),
+        ble_adapter=ble_adapter,
+        wifi_adapter=MockWifiController,
+        enable_wifi=False,
+        maintain_state=False,
+        **kwargs,
+    )
+
+
+async def run_wireless_session(gopro: WirelessGoPro, push: bool) -> tuple[list, list]:
+    """Open, send some requests, receive a status push, and close. Returns the responses and pushed values."""
+    pushes: asyncio.Queue = asyncio.Queue()
+
+    async def on_encoding(_: Any, value: Any) -> None:
+        await pushes.put(value)
+
+    await gopro.open(timeout=1, retries=2)
+    # A replayed push can immediately follow the register response so listen before registering
+    gopro.register_update(on_encoding, StatusId.ENCODING)
+    responses = [
+        await gopro.ble_command.get_open_gopro_api_version(),
+        await gopro.ble_setting.led.set(2),  # type: ignore
+        await gopro.ble_status.encoding.register_value_update(on_encoding),
+    ]
+    if push:
+        # Encoding started
+        controller = gopro._ble._controller
+        assert isinstance(controller, MockCameraBleController)
+        controller.push(GoProUUID.CQ_QUERY_RESP, bytes([QueryCmdId.STATUS_VAL_PUSH, 0x00, StatusId.ENCODING, 1, 1]))
+    values = [await asyncio.wait_for(pushes.get(), 1)]
+    await asyncio.sleep(0)
+    values += [pushes.get_nowait() for _ in range(pushes.qsize())]
+    await gopro.close()
+    return responses, values
+
+
+def test_recorder_round_trip(tmp_path: Path):
+    trace = tmp_path / "trace.gpwt"
+    with WireTraceRecorder(trace) as recorder:
+        recorder.ble_write(5, b"\x01\x02")
+        recorder.ble_notification(6, b"\x03")
+        recorder.ble_read(7, b"")
+        assert recorder.frames == 3
+
+    frames = read_trace(trace)
+    assert [(f.kind, f.channel, f.data) for f in frames] == [
+        (FrameKind.BLE_WRITE, 5, b"\x01\x02"),
+        (FrameKind.BLE_NOTIFICATION, 6, b"\x03"),
+        (FrameKind.BLE_READ, 7, b""),
+    ]
+    assert frames[0].timestamp <= frames[1].timestamp <= frames[2].timestamp
+
+    # A trace that was cut off is read up to its last complete frame
+    trace.write_bytes(trace.read_bytes()[:-1])
+    assert len(read_trace(trace)) == 2
+
+    trace.write_bytes(b"not a trace")
+    with pytest.raises(ValueError):
+        read_trace(trace)
+
+
+@pytest.mark.asyncio
+async def test_wireless_record_and_replay(tmp_path: Path):
+    trace = tmp_path / "wireless.gpwt"
+    recorded_responses, recorded_pushes = await run_wireless_session(
+        build_wireless_gopro(MockCameraBleController, wire_trace=trace), push=True
+    )
+    kinds = {frame.kind for frame in read_trace(trace)}
+    assert kinds == {FrameKind.CONNECT, FrameKind.BLE_WRITE, FrameKind.BLE_NOTIFICATION}
+
+    replay = functools.partial(ReplayBleController, trace=trace, speed=math.inf)
+    gopro = build_wireless_gopro(replay)
+    responses, pushes = await run_wireless_session(gopro, push=False)
+    assert gopro._ble._controller.is_finished  # type: ignore
+    assert [(r.ok, r.identifier, r.data) for r in responses] == [
+        (r.ok, r.identifier, r.data) for r in recorded_responses
+    ]
+    assert str(responses[0].data) == "2.0"
+    assert pushes == recorded_pushes == [True]
+
+
+@pytest.mark.asyncio
+async def test_wired_record_and_replay(tmp_path: Path):
+    trace = tmp_path / "wired.gpwt"
+    state = {"status": {str(StatusId.ENCODING.value): 0, str(StatusId.BUSY.value): 0}, "settings": {}}
+    with MockHttpServer(state=state) as server:
+        gopro: WiredGoPro = MockHttpGoPro(server, SERIAL, maintain_state=True, wire_trace=trace)
+        recorded = [(await gopro.http_command.set_digital_zoom(percent=percent)).data for percent in range(3)]
+        await gopro.close()
+    # The recorder that was created from the file is closed with the GoPro
+    assert gopro._wire_trace and gopro._wire_trace._file.closed
+    assert {frame.kind for frame in read_trace(trace)} == {FrameKind.HTTP}
+
+    transport = ReplayHttpTransport(trace, speed=math.inf)
+    gopro = WiredGoPro(SERIAL, maintain_state=True, http_transport=transport)
+    gopro._open = True
+    replayed = [(await gopro.http_command.set_digital_zoom(percent=percent)).data for percent in range(3)]
+    assert replayed == recorded
+    await gopro.close()
+    # Requests that were not recorded are not found
+    assert (await transport.get("http://127.0.0.1/gopro/media/list", timeout=1)).status_code == 404
+    # File downloads are not recorded
+    with pytest.raises(DownloadFailed):
+        await transport.download("http://127.0.0.1/videos/DCIM/100GOPRO/GX010001.MP4", tmp_path / "file", timeout=1)
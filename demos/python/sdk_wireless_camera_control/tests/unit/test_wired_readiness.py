@@ -0,0 +1,99 @@
+# test_wired_readiness.py/Open GoPro, Version 2.0 (C) Copyright 2021 GoPro, Inc. (http://gopro.com/OpenGoPro).
+# This copyright was auto-generated on Sun Oct 18 12:00:00 UTC 2026
+
+"""Unit testing of wired camera readiness tracking"""
+
+import asyncio
+
+import pytest
+
+from open_gopro.constants import SettingId, StatusId
+from tests.mocks import DataPatch, MockHttpGoPro, MockHttpServer
+
+SERIAL = "C3501324500711"
+
+
+def build_state(encoding: int = 0, busy: int = 0) -> dict[str, dict[str, int]]:
+    return {
+        "status": {str(StatusId.ENCODING.value): encoding, str(StatusId.BUSY.value): busy, "2": 4},
+        "settings": {str(SettingId.LED.value): 2},
+    }
+
+
+def state_polls(server: MockHttpServer) -> list[str]:
+    return [path for path in server.paths if path.startswith("/gopro/camera/state")]
+
+
+@pytest.mark.asyncio
+async def test_ready_state_is_cached():
+    with MockHttpServer(state=build_state()) as server:
+        gopro = MockHttpGoPro(server, SERIAL, maintain_state=True, state_freshness=10)
+        for _ in range(3):
+            assert (await gopro.http_command.set_keep_alive()).ok
+        await gopro.close()
+
+    # Only the encoding and busy statuses were polled, and only once
+    assert state_polls(server) == [f"/gopro/camera/state?status={StatusId.ENCODING.value}&status={StatusId.BUSY.value}"]
+    assert gopro._readiness.state == {StatusId.ENCODING: 0, StatusId.BUSY: 0}
+    assert gopro.command_rate > 0
+
+
+@pytest.mark.asyncio
+async def test_state_changing_command_invalidates_cache():
+    with MockHttpServer(state=build_state()) as server:
+        gopro = MockHttpGoPro(server, SERIAL, maintain_state=True, state_freshness=10)
+        assert (await gopro.http_command.set_keep_alive()).ok
+        # The camera may be busy after a successful state changing command so it must be polled again
+        for percent in range(2):
+            assert (await gopro.http_command.set_digital_zoom(percent=percent)).ok
+        assert (await gopro.http_command.set_keep_alive()).ok
+        await gopro.close()
+
+    assert len(state_polls(server)) == 3
+
+
+@pytest.mark.asyncio
+async def test_subset_ignored_by_camera():
+    with MockHttpServer(state=build_state(), state_subsets=False) as server:
+        gopro = MockHttpGoPro(server, SERIAL, maintain_state=True, state_freshness=0)
+        for percent in range(2):
+            assert (await gopro.http_command.set_digital_zoom(percent=percent)).ok
+        await gopro.close()
+
+    # The complete state is returned for each subset query
+    assert len(state_polls(server)) == 2
+    assert SettingId.LED in gopro._readiness.state
+
+
+@pytest.mark.asyncio
+async def test_fall_back_to_complete_state():
+    async def unsupported_subset(**_):
+        return DataPatch({})
+
+    with MockHttpServer(state=build_state()) as server:
+        gopro = MockHttpGoPro(server, SERIAL, maintain_state=True, state_freshness=0)
+        gopro.http_command.get_camera_state_subset = unsupported_subset  # type: ignore
+        for percent in range(2):
+            assert (await gopro.http_command.set_digital_zoom(percent=percent)).ok
+        await gopro.close()
+
+    # After the first subset query fails, only the complete state is polled
+    assert state_polls(server) == ["/gopro/camera/state"] * 2
+    assert gopro._readiness.polls == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_for_ready_with_backoff():
+    with MockHttpServer(state=build_state(busy=1)) as server:
+        gopro = MockHttpGoPro(server, SERIAL, maintain_state=True, poll_period=0.2)
+        command = asyncio.create_task(gopro.http_command.set_digital_zoom(percent=50))
+        await asyncio.sleep(0.5)
+        assert not command.done()
+        assert not [path for path in server.paths if path.startswith("/gopro/camera/digital_zoom")]
+        server.state = build_state()
+        assert (await command).ok
+        await gopro.close()
+
+    # Backing off from 0.05 to 0.2 seconds: 0.05, 0.1, 0.2, 0.2, ...
+    assert 3 <= len(state_polls(server)) <= 6
+    assert gopro._readiness.polls == len(state_polls(server))
@@ -16,7 +16,14 @@ import requests_mock
 
 from open_gopro import constants
 from open_gopro.communicator_interface import HttpMessage
-from open_gopro.constants import ErrorCode, QueryCmdId, SettingId, StatusId, settings
+from open_gopro.constants import (
+    ErrorCode,
+    GoProUUID,
+    QueryCmdId,
+    SettingId,
+    StatusId,
+    settings,
+)
 from open_gopro.constants.statuses import InternalBatteryBars
 from open_gopro.exceptions import GoProNotOpened, ResponseTimeout
 from open_gopro.gopro_wireless import WirelessGoPro
@@ -52,12 +59,7 @@ async def test_lifecycle(mock_wireless_gopro: MockGoProMaintainBle):
     await mock_wireless_gopro._update_internal_state(update=StatusId.BUSY, value=False)
     assert await mock_wireless_gopro.is_ready
 
-    results = await asyncio.gather(
-        mock_wireless_gopro.ble_command.enable_wifi_ap(enable=False),
-        mock_wireless_gopro._sync_resp_ready_q.put(mock_good_response),
-    )
-
-    assert results[0].ok
+    assert (await mock_wireless_gopro.ble_command.enable_wifi_ap(enable=False)).ok
     assert await mock_wireless_gopro.ble_command.get_open_gopro_api_version()
 
     # Ensure keep alive was received and is correct
@@ -77,48 +79,45 @@ async def test_gopro_open(mock_wireless_gopro_basic: WirelessGoPro):
 
 
 @pytest.mark.asyncio
-async def test_http_get(mock_wireless_gopro_basic: WirelessGoPro, monkeypatch):
+async def test_http_get(mock_wireless_gopro_basic: WirelessGoPro):
     message = HttpMessage("gopro/camera/stream/start", None)
-    session = requests.Session()
+    session = mock_wireless_gopro_basic._http_transport._session
     adapter = requests_mock.Adapter()
     session.mount(mock_wireless_gopro_basic._base_url + message._endpoint, adapter)
     adapter.register_uri("GET", mock_wireless_gopro_basic._base_url + message._endpoint, json="{}")
-    monkeypatch.setattr("open_gopro.gopro_base.requests.get", session.get)
     response = await mock_wireless_gopro_basic._get_json(message)
     assert response.ok
 
 
 @pytest.mark.asyncio
-async def test_http_file(mock_wireless_gopro_basic: WirelessGoPro, monkeypatch):
+async def test_http_file(mock_wireless_gopro_basic: WirelessGoPro):
     message = HttpMessage("videos/DCIM/100GOPRO/dummy.MP4", None)
     out_file = Path("test.mp4")
-    session = requests.Session()
+    session = mock_wireless_gopro_basic._http_transport._session
     adapter = requests_mock.Adapter()
     session.mount(mock_wireless_gopro_basic._base_url + message._endpoint, adapter)
     adapter.register_uri("GET", mock_wireless_gopro_basic._base_url + message._endpoint, text="BINARY DATA")
-    monkeypatch.setattr("open_gopro.gopro_base.requests.get", session.get)
     await mock_wireless_gopro_basic._get_stream(message, camera_file=out_file, local_file=out_file)
     assert out_file.exists()
 
 
 @pytest.mark.asyncio
-async def test_http_response_timeout(mock_wireless_gopro_basic: WirelessGoPro, monkeypatch):
+async def test_http_response_timeout(mock_wireless_gopro_basic: WirelessGoPro):
     with pytest.raises(ResponseTimeout):
         message = HttpMessage("gopro/camera/stream/start", None)
-        session = requests.Session()
+        session = mock_wireless_gopro_basic._http_transport._session
         adapter = requests_mock.Adapter()
         session.mount(mock_wireless_gopro_basic._base_url + message._endpoint, adapter)
         adapter.register_uri(
             "GET", mock_wireless_gopro_basic._base_url + message._endpoint, exc=requests.exceptions.ConnectTimeout
         )
-        monkeypatch.setattr("open_gopro.gopro_base.requests.get", session.get)
         await mock_wireless_gopro_basic._get_json(message, timeout=1)
 
 
 @pytest.mark.asyncio
-async def test_http_response_error(mock_wireless_gopro_basic: WirelessGoPro, monkeypatch):
+async def test_http_response_error(mock_wireless_gopro_basic: WirelessGoPro):
     message = HttpMessage("gopro/camera/stream/start", None)
-    session = requests.Session()
+    session = mock_wireless_gopro_basic._http_transport._session
     adapter = requests_mock.Adapter()
     session.mount(mock_wireless_gopro_basic._base_url + message._endpoint, adapter)
     adapter.register_uri(
@@ -128,7 +127,6 @@ async def test_http_response_error(mock_wireless_gopro_basic: WirelessGoPro, mon
         reason="something bad happened",
         json="{}",
     )
-    monkeypatch.setattr("open_gopro.gopro_base.requests.get", session.get)
     response = await mock_wireless_gopro_basic._get_json(message)
     assert not response.ok
 
@@ -170,11 +168,11 @@ async def test_route_all_data(mock_wireless_gopro_basic: WirelessGoPro):
 
     # WHEN
     # Make it appear to be the synchronous response
-    await mock_wireless_gopro_basic._sync_resp_wait_q.put(mock_response)
+    response_future = mock_wireless_gopro_basic._ble_requests.expect(GoProUUID.CQ_QUERY, QueryCmdId.GET_SETTING_VAL)
     # Route the mock response
-    await mock_wireless_gopro_basic._route_response(mock_response)
+    await mock_wireless_gopro_basic._route_response(mock_response, GoProUUID.CQ_QUERY_RESP)
     # Get the routed response
-    routed_response = await mock_wireless_gopro_basic._sync_resp_ready_q.get()
+    routed_response = await response_future
 
     # THEN
     assert routed_response.data == mock_data
@@ -195,11 +193,11 @@ async def test_route_individual_data(mock_wireless_gopro_basic: WirelessGoPro):
 
     # WHEN
     # Make it appear to be the synchronous response
-    await mock_wireless_gopro_basic._sync_resp_wait_q.put(mock_response)
+    response_future = mock_wireless_gopro_basic._ble_requests.expect(GoProUUID.CQ_QUERY, QueryCmdId.GET_SETTING_VAL)
     # Route the mock response
-    await mock_wireless_gopro_basic._route_response(mock_response)
+    await mock_wireless_gopro_basic._route_response(mock_response, GoProUUID.CQ_QUERY_RESP)
     # Get the routed response
-    routed_response = await mock_wireless_gopro_basic._sync_resp_ready_q.get()
+    routed_response = await response_future
 
     # THEN
     assert routed_response.data == 1